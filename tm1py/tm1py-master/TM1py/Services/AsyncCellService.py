@@ -0,0 +1,643 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Union
+
+from mdxpy import MdxBuilder
+
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Services.CellService import CellService
+from TM1py.Utils import (
+    MetadataCache,
+    Utils,
+    add_url_parameters,
+    format_url,
+    require_pandas,
+)
+from TM1py.Utils.LazyImport import lazy_import
+from TM1py.Utils.Utils import (
+    CaseAndSpaceInsensitiveTuplesDict,
+    build_dataframe_from_cellset_dict,
+)
+
+pd = lazy_import("pandas")
+
+
+class AsyncCellService:
+    """asyncio counterpart of CellService for the most common reads and writes.
+    Builds the same requests as CellService, but awaits them on an AsyncRestService
+    """
+
+    def __init__(self, rest: AsyncRestService):
+        self._rest = rest
+
+    async def create_cellset(self, mdx: Union[str, MdxBuilder], sandbox_name: str = None, **kwargs) -> str:
+        """Execute MDX in order to create cellset at server. return the cellset-id
+
+        :param mdx: MDX Query, as string
+        :param sandbox_name: str
+        :return:
+        """
+        url = "/ExecuteMDX"
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        data = {"MDX": mdx.to_mdx() if isinstance(mdx, MdxBuilder) else mdx}
+        response = await self._rest.POST(url=url, data=json.dumps(data, ensure_ascii=False), **kwargs)
+        return response.json()["ID"]
+
+    async def create_cellset_from_view(
+        self, cube_name: str, view_name: str, private: bool, sandbox_name: str = None, **kwargs
+    ) -> str:
+        """create cellset from a cube view. return the cellset-id
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param sandbox_name: str
+        :return:
+        """
+        url = format_url(
+            "/Cubes('{cube_name}')/{views}('{view_name}')/tm1.Execute",
+            cube_name=cube_name,
+            views="PrivateViews" if private else "Views",
+            view_name=view_name,
+        )
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        response = await self._rest.POST(url=url, **kwargs)
+        return response.json()["ID"]
+
+    async def delete_cellset(self, cellset_id: str, sandbox_name: str = None, **kwargs):
+        """Delete a cellset
+
+        :param cellset_id:
+        :param sandbox_name: str
+        :return:
+        """
+        url = "/Cellsets('{}')".format(cellset_id)
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        return await self._rest.DELETE(url, **kwargs)
+
+    async def extract_cellset_raw(
+        self,
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_hierarchies: bool = False,
+        delete_cellset: bool = False,
+        **kwargs,
+    ) -> Dict:
+        """Extract full cellset data and return the raw data from TM1
+
+        :param cellset_id: String; ID of existing cellset
+        :param cell_properties: List of properties to be queried from cells. E.g. ['Value', 'RuleDerived', ...]
+        :param elem_properties: List of properties to be queried from elements. E.g. ['UniqueName','Attributes', ...]
+        :param member_properties: List properties to be queried from the member. E.g. ['Name', 'UniqueName']
+        :param top: Integer limiting the number of cells and the number or rows returned
+        :param skip: Integer limiting the number of cells and the number or rows returned
+        :param skip_contexts:
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_hierarchies: retrieve Hierarchies property on Axes
+        :param delete_cellset: delete cellset after extraction
+        :return: Raw format from TM1.
+        """
+        url = CellService._build_extract_cellset_raw_url(
+            cellset_id,
+            cell_properties,
+            elem_properties,
+            member_properties,
+            top,
+            skip,
+            skip_contexts,
+            skip_zeros,
+            skip_consolidated_cells,
+            skip_rule_derived_cells,
+            sandbox_name,
+            include_hierarchies,
+        )
+        try:
+            response = await self._rest.GET(url=url, **kwargs)
+            return response.json()
+        finally:
+            if delete_cellset:
+                await self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+
+    async def extract_cellset(
+        self,
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        delete_cellset: bool = True,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        skip_sandbox_dimension: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """Execute cellset and return the cells with their properties
+
+        :param cellset_id:
+        :param cell_properties: properties to be queried from the cell. E.g. Value, Ordinal, RuleDerived, ...
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param delete_cellset:
+        :param skip_contexts:
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :param skip_sandbox_dimension: skip sandbox dimension
+        :return: Content in sweet concise structure.
+        """
+        raw_cellset = await self.extract_cellset_raw(
+            cellset_id,
+            cell_properties=list(cell_properties) if cell_properties else ["Value"],
+            elem_properties=["UniqueName"],
+            member_properties=["UniqueName"],
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            delete_cellset=delete_cellset,
+            **kwargs,
+        )
+
+        return Utils.build_content_from_cellset_dict(
+            raw_cellset_as_dict=raw_cellset,
+            top=top,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            skip_sandbox_dimension=skip_sandbox_dimension,
+        )
+
+    async def extract_cellset_values(
+        self,
+        cellset_id: str,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Extract cellset data and return only the cells and values
+
+        :param cellset_id: String; ID of existing cellset
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :param delete_cellset: delete cellset after extraction
+        :return: List of cell values
+        """
+        url = CellService._build_extract_cellset_values_url(
+            cellset_id, sandbox_name, skip_zeros, skip_consolidated_cells, skip_rule_derived_cells
+        )
+        try:
+            response = await self._rest.GET(url=url, **kwargs)
+            return [cell["Value"] for cell in response.json()["Cells"]]
+        finally:
+            if delete_cellset:
+                await self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+
+    async def extract_cellset_composition(self, cellset_id: str, sandbox_name: str = None, **kwargs):
+        """Retrieve composition of dimensions on the axes in the cellset
+
+        :param cellset_id:
+        :param sandbox_name: str
+        :return: cube, titles, rows, columns
+        """
+        url = (
+            "/Cellsets('{}')?$expand="
+            "Cube($select=Name),"
+            "Axes($expand=Hierarchies($select=UniqueName))".format(cellset_id)
+        )
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        response = await self._rest.GET(url=url, **kwargs)
+        return CellService._build_cellset_composition(response.json())
+
+    @require_pandas
+    async def extract_cellset_dataframe(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        delete_cellset: bool = True,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Build pandas data frame from cellset_id. Composition and cells are retrieved concurrently
+
+        :param cellset_id:
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param delete_cellset: delete cellset after extraction
+        :return: Pandas Dataframe
+        """
+        try:
+            (_, _, rows, columns), cellset_dict = await asyncio.gather(
+                self.extract_cellset_composition(cellset_id, sandbox_name=sandbox_name, **kwargs),
+                self.extract_cellset_raw(
+                    cellset_id,
+                    cell_properties=["Value"],
+                    top=top,
+                    skip=skip,
+                    skip_contexts=True,
+                    skip_zeros=skip_zeros,
+                    skip_consolidated_cells=skip_consolidated_cells,
+                    skip_rule_derived_cells=skip_rule_derived_cells,
+                    sandbox_name=sandbox_name,
+                    elem_properties=["Name"],
+                    member_properties=["Name", "Attributes"] if include_attributes else None,
+                    **kwargs,
+                ),
+            )
+        finally:
+            if delete_cellset:
+                await self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+
+        return build_dataframe_from_cellset_dict(
+            row_dimensions=rows,
+            column_dimensions=columns,
+            raw_cellset_as_dict=cellset_dict,
+            top=top,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+        )
+
+    async def execute_mdx(
+        self,
+        mdx: Union[str, MdxBuilder],
+        cell_properties: List[str] = None,
+        top: int = None,
+        skip_contexts: bool = False,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        skip_sandbox_dimension: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """Execute MDX and return the cells with their properties
+
+        :param mdx: MDX Query, as string
+        :param cell_properties: properties to be queried from the cell. E.g. Value, Ordinal, RuleDerived, ...
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :param skip_sandbox_dimension: bool
+        :return: content in sweet concise structure.
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            sandbox_name=sandbox_name,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            skip_sandbox_dimension=skip_sandbox_dimension,
+            **kwargs,
+        )
+
+    async def execute_view(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        cell_properties: Iterable[str] = None,
+        top: int = None,
+        skip_contexts: bool = False,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        element_unique_names: bool = True,
+        skip_cell_properties: bool = False,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        """get view content as dictionary with sweet and concise structure.
+
+        :param cube_name: String
+        :param view_name: String
+        :param private: True (private) or False (public)
+        :param cell_properties: List, cell properties: [Values, Status, HasPicklist, etc.]
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param element_unique_names: '[d1].[h1].[e1]' or 'e1'
+        :param skip_cell_properties: cell values in result dictionary, instead of cell_properties dictionary
+        :return: Dictionary : {([dim1].[elem1], [dim2][elem6]): {'Value':3127.312, 'Ordinal':12}   ....  }
+        """
+        cellset_id = await self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return await self.extract_cellset(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            top=top,
+            skip=skip,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            sandbox_name=sandbox_name,
+            element_unique_names=element_unique_names,
+            skip_cell_properties=skip_cell_properties,
+            **kwargs,
+        )
+
+    async def execute_mdx_values(
+        self,
+        mdx: Union[str, MdxBuilder],
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Optimized for performance. Query only raw cell values.
+        Coordinates are omitted !
+
+        :param mdx: a valid MDX Query
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :return: List of cell values
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset_values(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    async def execute_view_values(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float]]:
+        """Execute view and retrieve only the cell values
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param sandbox_name: str
+        :param skip_zeros: bool
+        :param skip_consolidated_cells: bool
+        :param skip_rule_derived_cells: bool
+        :return: List of cell values
+        """
+        cellset_id = await self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return await self.extract_cellset_values(
+            cellset_id,
+            sandbox_name=sandbox_name,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    @require_pandas
+    async def execute_mdx_dataframe(
+        self,
+        mdx: Union[str, MdxBuilder],
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Get Pandas DataFrame from MDX Query.
+        Dimension columns are categorical, as with `use_columnar` in CellService.execute_mdx_dataframe
+
+        :param mdx: Valid MDX Query
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :return: Pandas Dataframe
+        """
+        cellset_id = await self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return await self.extract_cellset_dataframe(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    @require_pandas
+    async def execute_view_dataframe(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Get Pandas DataFrame from an existing Cube View.
+        Dimension columns are categorical, as with `use_columnar` in CellService.execute_view_dataframe
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :return: Pandas Dataframe
+        """
+        cellset_id = await self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return await self.extract_cellset_dataframe(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            delete_cellset=True,
+            **kwargs,
+        )
+
+    async def get_dimension_names_for_writing(self, cube_name: str, **kwargs) -> List[str]:
+        """Get dimensions of a cube. Skip sandbox dimension
+
+        :param cube_name:
+        :return:
+        """
+
+        async def _load():
+            url = format_url("/Cubes('{}')/Dimensions?$select=Name", cube_name)
+            response = await self._rest.GET(url, **kwargs)
+            return tuple(dimension["Name"] for dimension in response.json()["value"])
+
+        # shares cache entries with CubeService
+        dimension_names = await self._rest.metadata_cache.get_or_load_async(
+            (MetadataCache.CUBE, cube_name, "dimensions"), _load
+        )
+        if dimension_names and dimension_names[0] == CellService.SANDBOX_DIMENSION:
+            return list(dimension_names[1:])
+        return list(dimension_names)
+
+    async def write_value(
+        self,
+        value: Union[str, float],
+        cube_name: str,
+        element_tuple: Iterable,
+        dimensions: Iterable[str] = None,
+        sandbox_name: str = None,
+        **kwargs,
+    ):
+        """Write value into cube at specified coordinates
+
+        :param value: the actual value
+        :param cube_name: name of the target cube
+        :param element_tuple: target coordinates
+        :param dimensions: optional. Dimension names in their natural order. Will speed up the execution!
+        :param sandbox_name: str
+        :return: response
+        """
+        if not dimensions:
+            dimensions = await self.get_dimension_names_for_writing(cube_name=cube_name)
+        url = format_url("/Cubes('{}')/tm1.Update", cube_name)
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        body_as_dict = OrderedDict()
+        body_as_dict["Cells"] = [
+            {
+                "Tuple@odata.bind": [
+                    format_url("Dimensions('{}')/Hierarchies('{}')/Elements('{}')", dim, dim, elem)
+                    for dim, elem in zip(dimensions, element_tuple)
+                ]
+            }
+        ]
+        body_as_dict["Value"] = str(value) if value else ""
+        data = json.dumps(body_as_dict, ensure_ascii=False)
+        return await self._rest.POST(url=url, data=data, **kwargs)
+
+    async def write_values(
+        self,
+        cube_name: str,
+        cellset_as_dict: Dict,
+        dimensions: Iterable[str] = None,
+        sandbox_name: str = None,
+        changeset: str = None,
+        **kwargs,
+    ) -> str:
+        """Write values to a cube
+
+        Supports spreading shortcuts
+
+        :param cube_name: name of the cube
+        :param cellset_as_dict: {(elem_a, elem_b, elem_c): 243, (elem_d, elem_e, elem_f) : 109}
+        :param dimensions: optional. Dimension names in their natural order. Will speed up the execution!
+        :param sandbox_name: str
+        :param changeset: str
+        :return: changeset
+        """
+        if not dimensions:
+            dimensions = await self.get_dimension_names_for_writing(cube_name=cube_name, **kwargs)
+        url = format_url("/Cubes('{}')/tm1.Update", cube_name)
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        url = add_url_parameters(url, **{"!ChangeSet": changeset})
+
+        updates = CellService._build_write_values_body(cellset_as_dict, dimensions)
+        await self._rest.POST(url=url, data=updates, **kwargs)
+
+        return changeset
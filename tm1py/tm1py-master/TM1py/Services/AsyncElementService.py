@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, List, Tuple
+
+from TM1py.Exceptions import TM1pyRestException
+from TM1py.Objects import Element
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Utils import CaseAndSpaceInsensitiveDict, MetadataCache, format_url
+
+
+class AsyncElementService:
+    """asyncio counterpart of ElementService for the most common element reads"""
+
+    def __init__(self, rest: AsyncRestService):
+        self._rest = rest
+
+    async def get(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> Element:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements('{}')?$expand=*", dimension_name, hierarchy_name, element_name
+        )
+        response = await self._rest.GET(url, **kwargs)
+        return Element.from_dict(response.json())
+
+    async def exists(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> bool:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements('{}')", dimension_name, hierarchy_name, element_name
+        )
+        try:
+            await self._rest.GET(url, **kwargs)
+            return True
+        except TM1pyRestException as e:
+            if e.status_code == 404:
+                return False
+            raise e
+
+    async def get_elements(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[Element]:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements?select=Name,Type", dimension_name, hierarchy_name
+        )
+        response = await self._rest.GET(url, **kwargs)
+        return [Element.from_dict(element) for element in response.json()["value"]]
+
+    async def get_element_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
+        """Get all element names
+
+        :param dimension_name:
+        :param hierarchy_name:
+        :return: List of element names
+        """
+        url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name", dimension_name, hierarchy_name)
+        response = await self._rest.GET(url, **kwargs)
+        return [e["Name"] for e in response.json()["value"]]
+
+    async def get_leaf_element_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name&$filter=Type ne 3",
+            dimension_name,
+            hierarchy_name,
+        )
+        response = await self._rest.GET(url, **kwargs)
+        return [e["Name"] for e in response.json()["value"]]
+
+    async def get_consolidated_element_names(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[str]:
+        url = format_url(
+            "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name&$filter=Type eq 3",
+            dimension_name,
+            hierarchy_name,
+        )
+        response = await self._rest.GET(url, **kwargs)
+        return [e["Name"] for e in response.json()["value"]]
+
+    async def get_number_of_elements(self, dimension_name: str, hierarchy_name: str, **kwargs) -> int:
+        url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements/$count", dimension_name, hierarchy_name)
+        response = await self._rest.GET(url, **kwargs)
+        return int(response.text)
+
+    async def get_edges(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Dict[Tuple[str, str], int]:
+        async def _load():
+            url = format_url(
+                "/Dimensions('{}')/Hierarchies('{}')/Edges?select=ParentName,ComponentName,Weight",
+                dimension_name,
+                hierarchy_name,
+            )
+            response = await self._rest.GET(url, **kwargs)
+            return tuple(
+                ((edge["ParentName"], edge["ComponentName"]), edge["Weight"]) for edge in response.json()["value"]
+            )
+
+        edges = await self._rest.metadata_cache.get_or_load_async(
+            (MetadataCache.DIMENSION, dimension_name, "edges", hierarchy_name), _load
+        )
+        return dict(edges)
+
+    async def get_element_types(
+        self, dimension_name: str, hierarchy_name: str, skip_consolidations: bool = False, **kwargs
+    ) -> CaseAndSpaceInsensitiveDict:
+        async def _load():
+            url = format_url(
+                "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name,Type", dimension_name, hierarchy_name
+            )
+            if skip_consolidations:
+                url += "&$filter=Type ne 3"
+            response = await self._rest.GET(url, **kwargs)
+            return tuple((element["Name"], element["Type"]) for element in response.json()["value"])
+
+        element_types = await self._rest.metadata_cache.get_or_load_async(
+            (MetadataCache.DIMENSION, dimension_name, "element_types", hierarchy_name, skip_consolidations), _load
+        )
+
+        result = CaseAndSpaceInsensitiveDict()
+        for element_name, element_type in element_types:
+            result[element_name] = element_type
+        return result
+
+    async def get_parents(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> List[str]:
+        url = format_url(
+            "/Dimensions('{dimension_name}')/Hierarchies('{hierarchy_name}')/Elements('{element_name}')/Parents"
+            "?$select=Name",
+            dimension_name=dimension_name,
+            hierarchy_name=hierarchy_name,
+            element_name=element_name,
+        )
+        response = await self._rest.GET(url=url, **kwargs)
+        return [record["Name"] for record in response.json()["value"]]
@@ -0,0 +1,946 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import functools
+import json
+import warnings
+from io import BytesIO
+from typing import Callable, Dict, Optional, Union
+
+from TM1py.Exceptions import TM1pyRestException
+from TM1py.Exceptions.Exceptions import TM1pyTimeout, TM1pyVersionDeprecationException
+from TM1py.Services.RestService import AuthenticationMode, RestService
+from TM1py.Utils import CaseAndSpaceInsensitiveSet, verify_version
+from TM1py.Utils.LazyImport import is_installed, lazy_import
+
+httpx = lazy_import("httpx")
+_has_httpx = is_installed("httpx")
+
+
+class AsyncRestService:
+    """Low level asyncio communication with TM1 instance through HTTP.
+    Counterpart of RestService with awaitable
+        - GET
+        - POST
+        - PATCH
+        - PUT
+        - DELETE
+    Takes the same kwargs as RestService. Many requests can be in flight concurrently on one TM1 session
+    without blocking a thread per request.
+    Integrated login (WIA) is not supported.
+    Based on httpx module
+
+    >>> async with AsyncRestService(address='', port=8001, user='admin', password='apple', ssl=False) as tm1_rest:
+    >>>     response = await tm1_rest.GET("/Configuration/ServerName/$value")
+    """
+
+    # Configuration, authentication and URL handling are borrowed from RestService.
+    # It is not subclassed, so that its blocking requests based methods are not available here
+    HEADERS = RestService.HEADERS
+    DEFAULT_CONNECTION_POOL_SIZE = RestService.DEFAULT_CONNECTION_POOL_SIZE
+    DEFAULT_POOL_CONNECTIONS = RestService.DEFAULT_POOL_CONNECTIONS
+
+    _configure = RestService._configure
+    _determine_verify = RestService._determine_verify
+    _determine_auth_mode = RestService._determine_auth_mode
+    _determine_ssl_based_on_base_url = RestService._determine_ssl_based_on_base_url
+    _handle_proxies = RestService._handle_proxies
+    _construct_service_and_auth_root = RestService._construct_service_and_auth_root
+    _construct_ibm_cloud_service_and_auth_root = RestService._construct_ibm_cloud_service_and_auth_root
+    _construct_pa_proxy_service_and_auth_root = RestService._construct_pa_proxy_service_and_auth_root
+    _construct_s2s_service_and_auth_root = RestService._construct_s2s_service_and_auth_root
+    _construct_v11_service_and_auth_root = RestService._construct_v11_service_and_auth_root
+    _construct_all_version_service_and_auth_root_from_base_url = (
+        RestService._construct_all_version_service_and_auth_root_from_base_url
+    )
+    _set_session_id_cookie = RestService._set_session_id_cookie
+    _url_and_body = RestService._url_and_body
+    # blocking token retrieval. Only called through _run_blocking
+    _generate_cpd_access_token = RestService._generate_cpd_access_token
+    _generate_ibm_iam_cloud_access_token = RestService._generate_ibm_iam_cloud_access_token
+
+    _build_authorization_token = staticmethod(RestService._build_authorization_token)
+    _extract_tm1_session_id_from_set_cookie_header = staticmethod(
+        RestService._extract_tm1_session_id_from_set_cookie_header
+    )
+    translate_to_boolean = staticmethod(RestService.translate_to_boolean)
+    b64_decode_password = staticmethod(RestService.b64_decode_password)
+    disable_http_warnings = staticmethod(RestService.disable_http_warnings)
+
+    handle_logging = RestService.handle_logging
+    get_http_header = RestService.get_http_header
+    add_http_header = RestService.add_http_header
+    remove_http_header = RestService.remove_http_header
+    add_compact_json_header = RestService.add_compact_json_header
+    wait_time_generator = RestService.wait_time_generator
+
+    metadata_cache = RestService.metadata_cache
+    mdx_result_cache = RestService.mdx_result_cache
+    json_decoder = RestService.json_decoder
+    instrumentation = RestService.instrumentation
+    version = RestService.version
+    session_id = RestService.session_id
+
+    def __init__(self, **kwargs):
+        """Create an instance of AsyncRestService. Session is started in `open` or when entering the context manager
+
+        :param kwargs: See RestService for all supported arguments
+        """
+        if not _has_httpx:
+            raise ImportError("AsyncRestService requires httpx")
+
+        self._configure(**kwargs)
+
+        if self._auth_mode == AuthenticationMode.WIA:
+            raise ValueError("'integrated_login' is not supported by AsyncRestService")
+
+        self._s = self._build_client()
+        # created lazily, as it must be bound to the running event loop
+        self._connect_lock = None
+        # incremented with every (re)connect, to avoid redundant reconnects from concurrent requests
+        self._session_generation = 0
+
+    def _build_client(self) -> "httpx.AsyncClient":
+        verify = self._ssl_context if self._ssl_context else self._verify
+        limits = httpx.Limits(
+            max_connections=self._connection_pool_size, max_keepalive_connections=self._connection_pool_size
+        )
+
+        mounts = None
+        if self._proxies:
+            mounts = {
+                f"{scheme}://": httpx.AsyncHTTPTransport(proxy=proxy, verify=verify, cert=self._cert, limits=limits)
+                for scheme, proxy in self._proxies.items()
+            }
+
+        return httpx.AsyncClient(verify=verify, cert=self._cert, limits=limits, timeout=None, mounts=mounts)
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        try:
+            await self.logout()
+        except Exception as e:
+            warnings.warn(f"Logout Failed due to Exception: {e}")
+
+    def __enter__(self):
+        raise TypeError("AsyncRestService must be used with 'async with'")
+
+    async def open(self):
+        """First contact with TM1: start session and retrieve version"""
+        await self.connect()
+        if not self._version:
+            await self.set_version()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        data: str = "",
+        encoding="utf-8",
+        async_requests_mode: Optional[bool] = None,
+        return_async_id=False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """
+        Execute a request to TM1 REST API
+        """
+        if not self._instrumentation.enabled:
+            return await self._request(
+                method=method,
+                url=url,
+                data=data,
+                encoding=encoding,
+                async_requests_mode=async_requests_mode,
+                return_async_id=return_async_id,
+                timeout=timeout,
+                cancel_at_timeout=cancel_at_timeout,
+                idempotent=idempotent,
+                verify_response=verify_response,
+                **kwargs,
+            )
+
+        # requests of concurrent tasks interleave in one thread, so retries can not be attributed
+        with self._instrumentation.track(
+            method=method,
+            url=url,
+            data=data,
+            encoding=encoding,
+            async_requests_mode=return_async_id
+            or (self._async_requests_mode if async_requests_mode is None else async_requests_mode),
+            register=False,
+        ) as record:
+            response = await self._request(
+                method=method,
+                url=url,
+                data=data,
+                encoding=encoding,
+                async_requests_mode=async_requests_mode,
+                return_async_id=return_async_id,
+                timeout=timeout,
+                cancel_at_timeout=cancel_at_timeout,
+                idempotent=idempotent,
+                verify_response=verify_response,
+                **kwargs,
+            )
+            if isinstance(response, httpx.Response):
+                # httpx includes the download of the body in response.elapsed
+                record.set_response(
+                    status_code=response.status_code,
+                    bytes_received=(
+                        int(response.headers.get("Content-Length", 0))
+                        if kwargs.get("stream")
+                        else len(response.content)
+                    ),
+                )
+            return response
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: str = "",
+        encoding="utf-8",
+        async_requests_mode: Optional[bool] = None,
+        return_async_id=False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        # invalidate before and after the request: reads that run while the request is processed
+        # may cache the state from before the change
+        relative_url = url
+        self._metadata_cache.invalidate_for_request(method=method, url=relative_url)
+        url, data = self._url_and_body(url=url, data=data, encoding=encoding)
+
+        timeout = timeout if timeout else self._timeout
+
+        # Determine async mode
+        if return_async_id:
+            async_requests_mode = True
+        elif async_requests_mode is None:
+            async_requests_mode = self._async_requests_mode
+
+        try:
+            return await self._execute_and_verify(
+                method=method,
+                url=url,
+                data=data,
+                timeout=timeout,
+                async_requests_mode=async_requests_mode,
+                cancel_at_timeout=cancel_at_timeout,
+                return_async_id=return_async_id,
+                encoding=encoding,
+                verify_response=verify_response,
+                **kwargs,
+            )
+
+        except httpx.TimeoutException:
+            if cancel_at_timeout or (cancel_at_timeout is None and self._cancel_at_timeout):
+                await self.cancel_running_operation()
+            raise TM1pyTimeout(method=method, url=url, timeout=timeout)
+
+        except (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError) as e:
+            # connection was aborted by remote end
+            if not self._re_connect_on_remote_disconnect:
+                raise e
+
+            return await self._handle_remote_disconnect(
+                e,
+                method,
+                url,
+                data,
+                timeout,
+                idempotent,
+                async_requests_mode,
+                cancel_at_timeout,
+                return_async_id,
+                encoding,
+                verify_response=verify_response,
+                **kwargs,
+            )
+
+        finally:
+            self._metadata_cache.invalidate_for_request(method=method, url=relative_url)
+            self._mdx_result_cache.invalidate_for_request(method=method, url=relative_url)
+
+    async def _execute_and_verify(
+        self,
+        method: str,
+        url: str,
+        data: bytes,
+        timeout: float,
+        async_requests_mode: bool,
+        cancel_at_timeout: bool,
+        return_async_id: bool,
+        encoding: str,
+        verify_response: bool,
+        **kwargs,
+    ):
+        if not async_requests_mode:
+            response = await self._execute_sync_request(method=method, url=url, data=data, timeout=timeout, **kwargs)
+        else:
+            response = await self._execute_async_request(
+                method=method,
+                url=url,
+                data=data,
+                timeout=timeout,
+                cancel_at_timeout=cancel_at_timeout,
+                return_async_id=return_async_id,
+                **kwargs,
+            )
+
+        # If async_id is returned as string, return it directly
+        if return_async_id and isinstance(response, str):
+            return response
+
+        response.encoding = encoding
+        if verify_response:
+            if response.is_error:
+                # body of streamed responses must be read before it can be reported
+                await response.aread()
+            self.verify_response(response=response)
+        return self._json_decoder.install(response)
+
+    def _build_timeout(self, timeout: float) -> "httpx.Timeout":
+        # waiting for a free connection in the pool doesn't count towards the timeout
+        return httpx.Timeout(timeout, pool=None)
+
+    async def _send(
+        self, method: str, url: str, data: bytes, timeout: float, headers: Dict = None, stream: bool = False, **kwargs
+    ) -> "httpx.Response":
+        request = self._s.build_request(
+            method=method, url=url, content=data, headers=headers, timeout=self._build_timeout(timeout)
+        )
+        return await self._s.send(request, stream=stream)
+
+    async def _execute_sync_request(self, method: str, url: str, data: bytes, timeout: float, **kwargs):
+        """
+        Execute a request with session timeout handling
+        """
+        generation = self._session_generation
+        response = await self._send(method=method, url=url, data=data, timeout=timeout, **kwargs)
+
+        # Handle session timeout
+        if self._re_connect_on_session_timeout and response.status_code == 401:
+            await response.aclose()
+            await self._reconnect(generation)
+            response = await self._send(method=method, url=url, data=data, timeout=timeout, **kwargs)
+
+        return response
+
+    async def _execute_async_request(
+        self,
+        method: str,
+        url: str,
+        data: bytes,
+        timeout: float,
+        cancel_at_timeout: bool,
+        return_async_id: bool,
+        **kwargs,
+    ):
+        """
+        Execute a request with 'Prefer: respond-async' header and poll for the response
+        """
+        http_headers = kwargs.get("headers", dict())
+        http_headers.update({"Prefer": "respond-async"})
+        kwargs["headers"] = http_headers
+
+        response = await self._execute_sync_request(method=method, url=url, data=data, timeout=timeout, **kwargs)
+        if response.is_error:
+            await response.aread()
+        self.verify_response(response=response)
+
+        if "Location" in response.headers and "'" in response.headers.get("Location", ""):
+            async_id = response.headers.get("Location").split("'")[1]
+            if return_async_id:
+                return async_id
+
+            response = await self._poll_async_response(async_id, timeout, cancel_at_timeout, method, url)
+            response = self._transform_async_response(response)
+
+        return response
+
+    async def _poll_async_response(
+        self, async_id: str, timeout: float, cancel_at_timeout: bool, method: str, url: str
+    ) -> "httpx.Response":
+        """
+        Poll for async operation completion without blocking the event loop
+        """
+        for wait in self.wait_time_generator(timeout):
+            response = await self.retrieve_async_response(async_id)
+            if response.status_code in [200, 201]:
+                return response
+            await asyncio.sleep(wait)
+
+        # Timeout reached
+        if cancel_at_timeout or (cancel_at_timeout is None and self._cancel_at_timeout):
+            await self.cancel_async_operation(async_id)
+        raise TM1pyTimeout(method=method, url=url, timeout=timeout)
+
+    async def _handle_remote_disconnect(
+        self,
+        original_error,
+        method: str,
+        url: str,
+        data: bytes,
+        timeout: float,
+        idempotent: bool,
+        async_requests_mode: bool,
+        cancel_at_timeout: bool,
+        return_async_id: bool,
+        encoding: str,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """
+        Handle remote disconnect errors with reconnection and retry logic using exponential backoff.
+        Mirrors RestService._handle_remote_disconnect
+        """
+        warnings.warn(f"Connection aborted due to remote disconnect: {original_error}")
+
+        for attempt in range(1, self._remote_disconnect_max_retries + 1):
+            current_delay = min(
+                self._remote_disconnect_retry_delay * (self._remote_disconnect_backoff_factor ** (attempt - 1)),
+                self._remote_disconnect_max_delay,
+            )
+
+            warnings.warn(
+                f"Retry attempt {attempt}/{self._remote_disconnect_max_retries} after {current_delay:.1f}s delay..."
+            )
+
+            await asyncio.sleep(current_delay)
+
+            try:
+                await self._reconnect(self._session_generation)
+
+                # Only retry if idempotent
+                if not idempotent:
+                    warnings.warn(
+                        f"Successfully reconnected but not retrying {method.upper()} request (idempotent={idempotent})"
+                    )
+                    raise original_error
+
+                warnings.warn(f"Successfully reconnected. Retrying {method.upper()} request...")
+
+                return await self._execute_and_verify(
+                    method=method,
+                    url=url,
+                    data=data,
+                    timeout=timeout,
+                    async_requests_mode=async_requests_mode,
+                    cancel_at_timeout=cancel_at_timeout,
+                    return_async_id=return_async_id,
+                    encoding=encoding,
+                    verify_response=verify_response,
+                    **kwargs,
+                )
+
+            except TM1pyTimeout:
+                raise
+            except TM1pyRestException:
+                raise
+            except Exception as retry_error:
+                if retry_error is original_error:
+                    raise
+                warnings.warn(f"Retry attempt {attempt}/{self._remote_disconnect_max_retries} failed: {retry_error}")
+                continue
+
+        warnings.warn(f"All {self._remote_disconnect_max_retries} retry attempts failed after remote disconnect")
+        raise original_error
+
+    async def _reconnect(self, generation: int):
+        """Re-establish the session unless a concurrent request already did so
+
+        :param generation: session generation that was used for the failed request
+        """
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if generation == self._session_generation:
+                await self.connect()
+
+    async def connect(self):
+        if "session_id" in self._kwargs:
+            self._set_session_id_cookie()
+        else:
+            await self._start_session(
+                user=self._kwargs.get("user", None),
+                password=self._kwargs.get("password", None),
+                namespace=self._kwargs.get("namespace", None),
+                gateway=self._kwargs.get("gateway", None),
+                cam_passport=self._kwargs.get("cam_passport", None),
+                decode_b64=self.translate_to_boolean(self._kwargs.get("decode_b64", False)),
+                impersonate=self._kwargs.get("impersonate", None),
+                application_client_id=self._kwargs.get("application_client_id", None),
+                application_client_secret=self._kwargs.get("application_client_secret", None),
+            )
+        self._session_generation += 1
+
+    @staticmethod
+    async def _run_blocking(func: Callable, *args):
+        """Run blocking function (e.g. token retrieval through requests) in the default executor"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    async def _start_session(
+        self,
+        user: str,
+        password: str,
+        decode_b64: bool = False,
+        namespace: str = None,
+        gateway: str = None,
+        cam_passport: str = None,
+        impersonate: str = None,
+        application_client_id: str = None,
+        application_client_secret: str = None,
+    ):
+        """perform a simple GET request (Ask for the TM1 Version) to start a session
+
+        Authorization header is only sent with the authentication request, so that concurrent requests
+        don't accidentally start additional sessions while reconnecting
+        """
+        headers = dict(self._headers)
+        auth = None
+        jwt = None
+
+        if self._auth_mode == AuthenticationMode.SERVICE_TO_SERVICE:
+            auth = httpx.BasicAuth(application_client_id, application_client_secret)
+
+        elif self._auth_mode == AuthenticationMode.PA_PROXY:
+            credentials = {"username": user, "password": password}
+            jwt = await self._run_blocking(self._generate_cpd_access_token, credentials)
+
+        elif self._auth_mode == AuthenticationMode.IBM_CLOUD_API_KEY:
+            access_token = await self._run_blocking(self._generate_ibm_iam_cloud_access_token)
+            headers["Authorization"] = "Bearer " + access_token
+
+        elif self._auth_mode == AuthenticationMode.ACCESS_TOKEN:
+            headers["Authorization"] = "Bearer " + self._kwargs.get("access_token")
+
+        # v11 authorization (Basic, CAM) through Headers. CAM SSO requires a blocking request to the gateway
+        else:
+            headers["Authorization"] = await self._run_blocking(
+                self._build_authorization_token,
+                user,
+                self.b64_decode_password(password) if decode_b64 else password,
+                namespace,
+                gateway,
+                cam_passport,
+                self._verify,
+                self._cert,
+            )
+
+        if impersonate:
+            if self._auth_mode.use_v12_auth:
+                raise TM1pyVersionDeprecationException("User Impersonation", "12")
+            self.add_http_header("TM1-Impersonate", impersonate)
+            headers["TM1-Impersonate"] = impersonate
+
+        timeout = self._build_timeout(self._timeout)
+        if self._auth_mode == AuthenticationMode.SERVICE_TO_SERVICE:
+            response = await self._s.post(
+                url=self._auth_url, headers=headers, json={"User": user}, auth=auth, timeout=timeout
+            )
+            self.verify_response(response)
+            if "TM1SessionId" not in self._s.cookies:
+                # if session had incorrect domain due to CP4D extract it and add it to cookie jar
+                self._s.cookies.set(
+                    "TM1SessionId",
+                    self._extract_tm1_session_id_from_set_cookie_header(auth_response_headers=response.headers),
+                )
+                warnings.warn(
+                    "TM1SessionId has failed to be automatically added to the session cookies, future requests "
+                    "using this AsyncTM1Service will use the session id extracted from the first response "
+                    "Check the tm1-gateway domain settings are correct"
+                    "in the container orchestrator "
+                )
+
+        elif self._auth_mode == AuthenticationMode.PA_PROXY:
+            response = await self._s.post(
+                url=self._auth_url,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                content=f"jwt={jwt}",
+                timeout=timeout,
+            )
+            self.verify_response(response)
+            self.add_http_header("ba-sso-authenticity", response.cookies["ba-sso-csrf"])
+
+        else:
+            response = await self._s.get(url=self._auth_url, headers=headers, timeout=timeout)
+            self.verify_response(response)
+            self._version = response.text
+
+        # If the TM1 REST API is routed through a reverse proxy that alters the expected URL,
+        # we explicitly re-set the 'TM1SessionId' cookie to maintain session continuity.
+        session_id = response.cookies.get("TM1SessionId")
+        if session_id is not None:
+            self._s.cookies.delete("TM1SessionId")
+            self._s.cookies.set("TM1SessionId", session_id)
+
+    async def GET(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = True,
+        verify_response: bool = True,
+        stream: bool = False,
+        **kwargs,
+    ):
+        """Perform a GET request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :param stream: If True the response body is not downloaded immediately and can be consumed incrementally.
+        Caller is responsible to close the response with `await response.aclose()`.
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="get",
+            headers={**self._headers, **headers} if headers else dict(self._headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout if timeout else self._timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+            stream=stream,
+        )
+
+    async def POST(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a POST request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="post",
+            headers={**self._headers, **headers} if headers else dict(self._headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout if timeout else self._timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def PATCH(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a PATCH request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="patch",
+            headers={**self._headers, **headers} if headers else dict(self._headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout if timeout else self._timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def PUT(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a PUT request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="put",
+            headers={**self._headers, **headers} if headers else dict(self._headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout if timeout else self._timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def DELETE(
+        self,
+        url: str,
+        data: Union[str, bytes, BytesIO] = "",
+        headers: Dict = None,
+        async_requests_mode: bool = None,
+        return_async_id: bool = False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        encoding: str = "utf-8",
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        """Perform a DELETE request against TM1 instance
+        :param url:
+        :param data: the payload
+        :param headers: custom headers
+        :param async_requests_mode: changes internal REST execution mode to avoid 60s timeout on IBM cloud
+        :param return_async_id: If True function will return async_id after initiation and not await the execution
+        :param timeout: Number of seconds that the client will wait to receive the first byte.
+        :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
+        :param encoding:
+        :return: response object or async_id
+        """
+        return await self.request(
+            method="delete",
+            headers={**self._headers, **headers} if headers else dict(self._headers),
+            url=url,
+            data=data,
+            async_requests_mode=async_requests_mode,
+            return_async_id=return_async_id,
+            timeout=timeout if timeout else self._timeout,
+            cancel_at_timeout=cancel_at_timeout,
+            encoding=encoding,
+            idempotent=idempotent,
+            verify_response=verify_response,
+        )
+
+    async def logout(self, timeout: float = None, **kwargs):
+        """End TM1 Session and HTTP session"""
+        try:
+            await self.POST(
+                "/ActiveSession/tm1.Close",
+                "",
+                headers={"Connection": "close"},
+                timeout=timeout,
+                async_requests_mode=False,
+                **kwargs,
+            )
+        finally:
+            await self._s.aclose()
+
+    async def is_connected(self) -> bool:
+        """Check if Connection to TM1 Server is established.
+        :Returns:
+            Boolean
+        """
+        try:
+            await self.GET("/Configuration/ServerName/$value")
+            return True
+        except Exception:
+            return False
+
+    async def set_version(self):
+        url = "/Configuration/ProductVersion/$value"
+        response = await self.GET(url=url)
+        self._version = response.text
+
+    async def get_api_metadata(self) -> dict:
+        """Get API Metadata
+
+        :return: Dictionary
+        """
+        url = "/$metadata"
+        response = await self.GET(url=url)
+        return json.loads(response.content.decode("utf-8"))
+
+    async def _get_active_user_groups(self) -> CaseAndSpaceInsensitiveSet:
+        response = await self.GET("/ActiveUser/Groups")
+        return CaseAndSpaceInsensitiveSet(*[group["Name"] for group in response.json()["value"]])
+
+    async def get_is_admin(self) -> bool:
+        """Awaitable counterpart of RestService.is_admin. Result is cached
+
+        :return: True if the user is member of the ADMIN group
+        """
+        if self._is_admin is None:
+            self._is_admin = "ADMIN" in await self._get_active_user_groups()
+
+        return self._is_admin
+
+    async def get_is_data_admin(self) -> bool:
+        """Awaitable counterpart of RestService.is_data_admin. Result is cached
+
+        :return: True if the user is member of the Admin or DataAdmin group
+        """
+        if self._is_data_admin is None:
+            groups = await self._get_active_user_groups()
+            self._is_data_admin = any(g in groups for g in ["Admin", "DataAdmin"])
+
+        return self._is_data_admin
+
+    async def get_is_security_admin(self) -> bool:
+        """Awaitable counterpart of RestService.is_security_admin. Result is cached
+
+        :return: True if the user is member of the Admin or SecurityAdmin group
+        """
+        if self._is_security_admin is None:
+            groups = await self._get_active_user_groups()
+            self._is_security_admin = any(g in groups for g in ["Admin", "SecurityAdmin"])
+
+        return self._is_security_admin
+
+    async def get_is_ops_admin(self) -> bool:
+        """Awaitable counterpart of RestService.is_ops_admin. Result is cached
+
+        :return: True if the user is member of the Admin or OperationsAdmin group
+        """
+        if self._is_ops_admin is None:
+            groups = await self._get_active_user_groups()
+            self._is_ops_admin = any(g in groups for g in ["Admin", "OperationsAdmin"])
+
+        return self._is_ops_admin
+
+    async def get_sandboxing_disabled(self) -> bool:
+        """Awaitable counterpart of RestService.sandboxing_disabled. Result is cached
+
+        :return: value of DisableSandboxing in the active configuration
+        """
+        if verify_version(required_version="12", version=self.version):
+            self._sandboxing_disabled = False
+
+        elif self._sandboxing_disabled is None:
+            response = await self.GET("/ActiveConfiguration/Administration/DisableSandboxing")
+            self._sandboxing_disabled = response.json().get("value", False)
+
+        return self._sandboxing_disabled
+
+    @staticmethod
+    def verify_response(response: "httpx.Response"):
+        """check if Status Code is OK
+        :Parameters:
+            `response`: httpx.Response
+                the response that is returned from a method call
+        :Exceptions:
+            TM1pyException, raises TM1pyException when Code is not 200, 204 etc.
+        """
+        if response.is_error:
+            raise TM1pyRestException(
+                response.text, status_code=response.status_code, reason=response.reason_phrase, headers=response.headers
+            )
+
+    async def retrieve_async_response(self, async_id: str, **kwargs) -> "httpx.Response":
+        url = f"/_async('{async_id}')"
+        return await self.GET(url, async_requests_mode=False, **kwargs)
+
+    async def cancel_async_operation(self, async_id: str, **kwargs):
+        url = f"/_async('{async_id}')"
+        await self.DELETE(url, async_requests_mode=False, **kwargs)
+
+    async def cancel_running_operation(self):
+        url = (
+            "/ActiveSession/Threads?$filter=Function ne 'GET /ActiveSession/Threads' "
+            "and Function ne 'GET /api/v1/ActiveSession/Threads' and State ne 'Idle'"
+        )
+        response = await self.GET(url)
+        threads = response.json()["value"]
+
+        # if more than one thread is running in session, operation can not be identified unambiguously
+        if not len(threads) == 1:
+            return
+
+        await self.POST("/Threads('{}')/tm1.CancelOperation".format(threads[0]["ID"]))
+
+    def _transform_async_response(self, response: "httpx.Response") -> "httpx.Response":
+        """
+        Transform async response for TM1 version compatibility
+        """
+        # Response transformation necessary in TM1 < v11
+        if response.content.startswith(b"HTTP/"):
+            return self.build_response_from_binary_response(response.content)
+
+        # In v12 status_code must be set explicitly
+        if "asyncresult" in response.headers:
+            response.status_code = int(response.headers["asyncresult"].split()[0])
+        return response
+
+    @staticmethod
+    def build_response_from_binary_response(data: bytes) -> "httpx.Response":
+        urllib_response = RestService.urllib3_response_from_bytes(data)
+        # body is already decoded and de-chunked by urllib3
+        headers = [
+            (key, value)
+            for key, value in urllib_response.headers.items()
+            if key.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+        ]
+        return httpx.Response(status_code=urllib_response.status, headers=headers, content=urllib_response.data)
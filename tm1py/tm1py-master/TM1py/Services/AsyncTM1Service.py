@@ -0,0 +1,51 @@
+import warnings
+
+from TM1py.Services.AsyncCellService import AsyncCellService
+from TM1py.Services.AsyncElementService import AsyncElementService
+from TM1py.Services.AsyncRestService import AsyncRestService
+
+
+class AsyncTM1Service:
+    """asyncio counterpart of TM1Service. Exposes awaitable cell and element operations.
+    Requires httpx.
+
+    >>> async with AsyncTM1Service(address='', port=8001, user='admin', password='apple', ssl=False) as tm1:
+    >>>     values = await asyncio.gather(*[tm1.cells.execute_mdx_values(mdx) for mdx in mdx_queries])
+    """
+
+    def __init__(self, **kwargs):
+        """Initiate the AsyncTM1Service. Session is started in `connect` or when entering the context manager
+
+        :param kwargs: See TM1Service for all supported arguments
+        """
+        self._tm1_rest = AsyncRestService(**kwargs)
+        self.cells = AsyncCellService(self._tm1_rest)
+        self.elements = AsyncElementService(self._tm1_rest)
+
+    async def connect(self) -> "AsyncTM1Service":
+        await self._tm1_rest.open()
+        return self
+
+    async def logout(self, **kwargs):
+        await self._tm1_rest.logout(**kwargs)
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        try:
+            await self.logout()
+        except Exception as e:
+            warnings.warn(f"Logout Failed due to Exception: {e}")
+
+    @property
+    def version(self):
+        return self._tm1_rest.version
+
+    @property
+    def connection(self):
+        return self._tm1_rest
+
+    @property
+    def metadata_cache(self):
+        return self._tm1_rest.metadata_cache
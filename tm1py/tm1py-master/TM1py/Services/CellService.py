@@ -2,24 +2,42 @@
 import asyncio
 import csv
 import functools
+import gzip
+import inspect
 import itertools
 import json
 import math
+import os
+import threading
+import time
 import uuid
 import warnings
-from collections import OrderedDict
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, wait
 from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import suppress
 from io import StringIO
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import ijson
 from mdxpy import MdxBuilder, MdxHierarchySet, MdxTuple, Member
-from requests import Response
+from requests import ConnectionError, Response
 
 from TM1py.Exceptions.Exceptions import (
     TM1pyException,
     TM1pyRestException,
+    TM1pyTimeout,
     TM1pyWriteFailureException,
     TM1pyWritePartialFailureException,
 )
@@ -39,13 +57,19 @@ from TM1py.Utils import (
     add_url_parameters,
     format_url,
 )
+from TM1py.Utils.LazyImport import is_installed, is_loaded, lazy_import
 from TM1py.Utils.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveTuplesDict,
+    _ResponseReader,
     abbreviate_mdx,
+    build_arrow_batches_from_cellset_partitions,
+    build_arrow_table_from_cellset_dict,
     build_cellset_from_pandas_dataframe,
     build_csv_from_cellset_dict,
+    build_csv_from_dataframe,
     build_dataframe_aggregate_intersections,
+    build_dataframe_from_cellset_dict,
     build_dataframe_from_csv,
     build_mdx_and_values_from_cellset,
     build_mdx_from_cellset,
@@ -56,6 +80,7 @@ from TM1py.Utils.Utils import (
     dimension_name_from_element_unique_name,
     dimension_names_from_element_unique_names,
     drop_dimension_properties,
+    drop_duplicate_intersections,
     extract_compact_json_cellset,
     frame_to_significant_digits,
     get_cube,
@@ -63,18 +88,26 @@ from TM1py.Utils.Utils import (
     require_data_admin,
     require_ops_admin,
     require_pandas,
+    require_pyarrow,
     require_version,
     resembles_mdx,
     verify_version,
     wrap_in_curly_braces,
 )
 
-try:
-    import pandas as pd
+if TYPE_CHECKING:
+    from TM1py.Services.TM1ServicePool import TM1ServicePool
+    from TM1py.Utils.JsonDecoder import Cellset
+
+ijson = lazy_import("ijson")
+pa = lazy_import("pyarrow")
+pd = lazy_import("pandas")
+_has_pandas = is_installed("pandas")
 
-    _has_pandas = True
-except ImportError:
-    _has_pandas = False
+# progress of a pipelined write, passed to the `progress_callback` after every finished chunk
+WriteProgress = namedtuple(
+    "WriteProgress", ["chunk", "cells", "seconds", "total_cells", "total_seconds", "cells_per_second"]
+)
 
 
 @decohints
@@ -136,6 +169,65 @@ def manage_transaction_log(func):
     return wrapper
 
 
+@decohints
+def cache_mdx_result(func):
+    """Serve the result of an MDX query from the MDXResultCache of the RestService, if it is enabled.
+    Results are keyed on the function, the normalized MDX, the sandbox and all other arguments.
+    Pass `use_result_cache=False` to bypass the cache for one call.
+
+    Decorated function must have `mdx` as first argument or keyword argument
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = self._rest.mdx_result_cache
+        use_result_cache = kwargs.pop("use_result_cache", True)
+        # nested calls of decorated functions are covered by the outer call
+        if not use_result_cache or not cache.enabled or cache.bypassed:
+            return func(self, *args, **kwargs)
+
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        del arguments["self"]
+        mdx = arguments.pop("mdx")
+        mdx = mdx.to_mdx() if isinstance(mdx, MdxBuilder) else str(mdx)
+        sandbox_name = arguments.pop("sandbox_name", None)
+        key = (func.__name__, cache.normalize_mdx(mdx), sandbox_name, repr(sorted(arguments.items())))
+
+        cube_name = get_cube(mdx)
+        token = self.get_cube_state(cube_name, sandbox_name=sandbox_name) if cache.check_cube_state else None
+        return cache.load(key, [cube_name], token, lambda: func(self, *args, **kwargs))
+
+    return wrapper
+
+
+@decohints
+def invalidate_mdx_result_cache(func):
+    """Invalidate the cached MDX results of the cube once the decorated operation is done.
+    Writes through cellsets, unbound processes and blobs can't be attributed to the cube by their urls.
+
+    Decorated function must have `cube_name`, `cube` or `mdx` as argument
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+
+        finally:
+            cache = self._rest.mdx_result_cache
+            if cache.enabled:
+                arguments = signature.bind_partial(self, *args, **kwargs).arguments
+                cube_name = arguments.get("cube_name", arguments.get("cube"))
+                if cube_name is None:
+                    mdx = arguments["mdx"]
+                    cube_name = get_cube(mdx.to_mdx() if isinstance(mdx, MdxBuilder) else str(mdx))
+                cache.invalidate_cube(cube_name)
+
+    return wrapper
+
+
 @decohints
 def manage_changeset(func):
     """Control the start and end of change sets which goups write events together in the TM1 transaction log.
@@ -203,12 +295,26 @@ def odata_compact_json(return_as_dict: bool):
 class CellService(ObjectService):
     """Service to handle Read and Write operations to TM1 cubes"""
 
+    # initial estimates of fixed overhead (seconds) and cost per cell (seconds) for every write strategy.
+    # `write` with `auto=True` refines them per cube from the timings of previous writes
+    WRITE_STRATEGY_COSTS = {
+        "cellset": (0.05, 5e-5),
+        "ti": (0.5, 1e-5),
+        "blob": (1.0, 2e-6),
+        "async": (2.0, 5e-7),
+    }
+    # string cells are more expensive than numeric cells in cellset and TI statement payloads
+    WRITE_STRATEGY_STRING_CELL_WEIGHT = 3
+    WRITE_STRATEGY_LEARNING_RATE = 0.3
+    WRITE_STRATEGY_MAX_WORKERS = 8
+
     def __init__(self, tm1_rest: RestService):
         """
 
         :param tm1_rest: instance of RestService
         """
         super().__init__(tm1_rest)
+        self._write_costs = dict()
 
     def get_value(
         self,
@@ -464,7 +570,7 @@ class CellService(ObjectService):
             body_as_dict = self._compose_odata_tuple_from_iterable(cube_name, elements, dimensions)
         data = json.dumps(body_as_dict, ensure_ascii=False)
 
-        return json.loads(self._rest.POST(url=url, data=data, **kwargs).content)
+        return self._rest.json_decoder.loads(self._rest.POST(url=url, data=data, **kwargs).content)
 
     def trace_cell_feeders(
         self,
@@ -512,7 +618,7 @@ class CellService(ObjectService):
             body_as_dict = self._compose_odata_tuple_from_iterable(cube_name, elements, dimensions)
         data = json.dumps(body_as_dict, ensure_ascii=False)
 
-        return json.loads(self._rest.POST(url=url, data=data, **kwargs).content)
+        return self._rest.json_decoder.loads(self._rest.POST(url=url, data=data, **kwargs).content)
 
     def check_cell_feeders(
         self,
@@ -560,8 +666,9 @@ class CellService(ObjectService):
             body_as_dict = self._compose_odata_tuple_from_iterable(cube_name, elements, dimensions)
         data = json.dumps(body_as_dict, ensure_ascii=False)
 
-        return json.loads(self._rest.POST(url=url, data=data, **kwargs).content)
+        return self._rest.json_decoder.loads(self._rest.POST(url=url, data=data, **kwargs).content)
 
+    @invalidate_mdx_result_cache
     def relative_proportional_spread(
         self,
         value: float,
@@ -609,6 +716,7 @@ class CellService(ObjectService):
             cellset_id=cellset_id, payload=payload, delete_cellset=True, sandbox_name=sandbox_name, **kwargs
         )
 
+    @invalidate_mdx_result_cache
     def clear_spread(
         self, cube: str, unique_element_names: Iterable[str], sandbox_name: str = None, **kwargs
     ) -> Response:
@@ -643,6 +751,7 @@ class CellService(ObjectService):
     @require_data_admin
     @require_ops_admin
     @require_version(version="11.7")
+    @invalidate_mdx_result_cache
     def clear(self, cube: str, **kwargs):
         """
         Takes the cube name and keyword argument pairs of dimensions and MDX expressions:
@@ -685,6 +794,7 @@ class CellService(ObjectService):
     @require_data_admin
     @require_ops_admin
     @require_version(version="11.7")
+    @invalidate_mdx_result_cache
     def clear_with_dataframe(self, cube: str, df: "pd.DataFrame", dimension_mapping: Dict = None, **kwargs):
         """Clears data from a TM1 cube based on the distinct values in a DataFrame over cube dimensions.
           Note:
@@ -803,6 +913,7 @@ class CellService(ObjectService):
     @require_data_admin
     @require_ops_admin
     @require_version(version="11.7")
+    @invalidate_mdx_result_cache
     def clear_with_mdx(self, cube: str, mdx: str, sandbox_name: str = None, **kwargs):
         """clear a slice in a cube based on an MDX query.
         Function requires admin permissions, since TM1py uses an unbound TI with a `ViewZeroOut` statement.
@@ -882,6 +993,7 @@ class CellService(ObjectService):
         clear_view: str = None,
         static_dimension_elements: Dict = None,
         infer_column_order: bool = False,
+        auto: bool = False,
         **kwargs,
     ) -> str:
         """
@@ -911,6 +1023,7 @@ class CellService(ObjectService):
         :param static_dimension_elements: Dict of fixed dimension element pairs. Column is created for you.
         :param infer_column_order: bool indicating whether the column order of the dataframe should automatically be
             inferred and mapped to the dimension order in the cube.
+        :param auto: choose cellset, TI, blob or async blob writing based on the data, permissions and previous writes
         :return: changeset or None
         """
         if not isinstance(data, pd.DataFrame):
@@ -948,7 +1061,12 @@ class CellService(ObjectService):
         if not len(data.columns) == len(dimensions) + 1:
             raise ValueError("Number of columns in 'data' DataFrame must be number of dimensions in cube + 1")
 
-        cells = build_cellset_from_pandas_dataframe(data, sum_numeric_duplicates=sum_numeric_duplicates)
+        if use_blob and not use_ti:
+            # skip the intermediate dict. DataFrame is serialized column-wise for the blob upload
+            cells = build_dataframe_aggregate_intersections(data, sum_numeric_duplicates=sum_numeric_duplicates)
+            cells = drop_duplicate_intersections(cells)
+        else:
+            cells = build_cellset_from_pandas_dataframe(data, sum_numeric_duplicates=sum_numeric_duplicates)
 
         return self.write(
             cube_name=cube_name,
@@ -967,10 +1085,12 @@ class CellService(ObjectService):
             measure_dimension_elements=measure_dimension_elements,
             allow_spread=allow_spread,
             clear_view=clear_view,
+            auto=auto,
             **kwargs,
         )
 
     @manage_transaction_log
+    @invalidate_mdx_result_cache
     def write_async(
         self,
         cube_name: str,
@@ -984,6 +1104,8 @@ class CellService(ObjectService):
         sandbox_name: str = None,
         precision: int = None,
         measure_dimension_elements: Dict = None,
+        progress_callback: Callable[[WriteProgress], None] = None,
+        pool: "TM1ServicePool" = None,
         **kwargs,
     ) -> Optional[str]:
         """Write asynchronously
@@ -1001,6 +1123,8 @@ class CellService(ObjectService):
         Necessary to decrease when dealing with large numbers to avoid "number too long" TI syntax error.
         :param measure_dimension_elements: dictionary of measure elements and their types to improve
         performance when `use_ti` is `True`.
+        :param progress_callback: optional function that is called with a `WriteProgress` after every written slice
+        :param pool: optional TM1ServicePool. Slices are written on separate TM1 sessions leased from the pool
         :param kwargs:
         :return:
         """
@@ -1016,52 +1140,23 @@ class CellService(ObjectService):
             for _ in range(0, len(data), slice_size):
                 yield {k: data[k] for k in itertools.islice(it, slice_size)}
 
-        def _write(chunk: Dict):
-            return self.write(
-                cube_name=cube_name,
-                cellset_as_dict=chunk,
-                dimensions=dimensions,
-                increment=increment,
-                use_blob=True,
-                sandbox_name=sandbox_name,
-                precision=precision,
-                measure_dimension_elements=measure_dimension_elements,
-                **kwargs,
-            )
-
-        async def _write_async(data: Dict):
-            loop = asyncio.get_event_loop()
-            failures = []
-
-            with ThreadPoolExecutor(max_workers) as executor:
-                futures = [loop.run_in_executor(executor, _write, chunk) for chunk in _chunks(data)]
-
-                for future in futures:
-                    try:
-                        await future
-                    except (TM1pyWritePartialFailureException, TM1pyWriteFailureException) as exception:
-                        failures.append(exception)
-
-            return failures
-
-        exceptions = asyncio.run(_write_async(cells))
-        if not exceptions:
-            return
-
-        # merge all failures into one combined Exception
-        raise TM1pyWritePartialFailureException(
-            statuses=list(itertools.chain(*[exception.statuses for exception in exceptions])),
-            error_log_files=list(itertools.chain(*[exception.error_log_files for exception in exceptions])),
-            attempts=sum(
-                [
-                    exception.attempts if isinstance(exception, TM1pyWritePartialFailureException) else 1
-                    for exception in exceptions
-                ]
-            ),
+        self._write_pipelined(
+            cube_name=cube_name,
+            chunks=_chunks(cells),
+            max_workers=max_workers,
+            dimensions=dimensions,
+            increment=increment,
+            sandbox_name=sandbox_name,
+            precision=precision,
+            measure_dimension_elements=measure_dimension_elements,
+            progress_callback=progress_callback,
+            pool=pool,
+            **kwargs,
         )
 
     @require_pandas
     @manage_transaction_log
+    @invalidate_mdx_result_cache
     def write_dataframe_async(
         self,
         cube_name: str,
@@ -1073,6 +1168,8 @@ class CellService(ObjectService):
         sandbox_name: str = None,
         deactivate_transaction_log: bool = False,
         reactivate_transaction_log: bool = False,
+        progress_callback: Callable[[WriteProgress], None] = None,
+        pool: "TM1ServicePool" = None,
         **kwargs,
     ):
         """Write DataFrame into a cube using unbound TI processes in a multi-threading way. Requires admin permissions.
@@ -1088,6 +1185,8 @@ class CellService(ObjectService):
         :param sandbox_name: name of the sandbox or None
         :param deactivate_transaction_log:
         :param reactivate_transaction_log:
+        :param progress_callback: optional function that is called with a `WriteProgress` after every written slice
+        :param pool: optional TM1ServicePool. Slices are written on separate TM1 sessions leased from the pool
         :return: the Future’s result or raise exception.
         """
         if not isinstance(data, pd.DataFrame):
@@ -1100,49 +1199,172 @@ class CellService(ObjectService):
             raise ValueError("Number of columns in 'data' DataFrame must be number of dimensions in cube + 1")
 
         def _chunks(df: "pd.DataFrame"):
-            return [df.iloc[i : i + slice_size_of_dataframe] for i in range(0, df.shape[0], slice_size_of_dataframe)]
+            for i in range(0, df.shape[0], slice_size_of_dataframe):
+                yield df.iloc[i : i + slice_size_of_dataframe]
 
-        def _write(chunk: "pd.DataFrame"):
-            return self.write_dataframe(
-                cube_name=cube_name,
-                data=chunk,
-                dimensions=dimensions,
-                increment=increment,
-                use_blob=True,
-                sandbox_name=sandbox_name,
-                **kwargs,
-            )
+        if increment:
+            data = build_dataframe_aggregate_intersections(data, sum_numeric_duplicates=True)
 
-        async def _write_async(df: "pd.DataFrame"):
-            loop = asyncio.get_event_loop()
-            failures = []
+        self._write_pipelined(
+            cube_name=cube_name,
+            chunks=_chunks(data),
+            max_workers=max_workers,
+            dimensions=dimensions,
+            increment=increment,
+            sandbox_name=sandbox_name,
+            progress_callback=progress_callback,
+            pool=pool,
+            **kwargs,
+        )
 
-            with ThreadPoolExecutor(max_workers) as executor:
-                futures = [loop.run_in_executor(executor, _write, chunk) for chunk in _chunks(df)]
+    @manage_transaction_log
+    @invalidate_mdx_result_cache
+    def write_pipelined(
+        self,
+        cube_name: str,
+        chunks: Iterable[Union[Dict, "pd.DataFrame"]],
+        max_workers: int = 8,
+        dimensions: Iterable[str] = None,
+        increment: bool = False,
+        deactivate_transaction_log: bool = False,
+        reactivate_transaction_log: bool = False,
+        sandbox_name: str = None,
+        precision: int = None,
+        measure_dimension_elements: Dict = None,
+        progress_callback: Callable[[WriteProgress], None] = None,
+        pool: "TM1ServicePool" = None,
+        **kwargs,
+    ):
+        """Write an iterable of chunks through blob uploads in parallel. Requires admin permissions.
+        Chunks are pulled from the iterable only when a worker is free, so no more than `max_workers` chunks are
+        held in memory at any time. This allows writing very large data sets from a generator.
 
-                for future in futures:
-                    try:
-                        await future
-                    except (TM1pyWritePartialFailureException, TM1pyWriteFailureException) as exception:
-                        failures.append(exception)
+        :param cube_name: name of the cube
+        :param chunks: iterable of cellset dicts {(elem_a, elem_b, elem_c): 243, ...} and/or DataFrames
+        in the shape that `write_dataframe` expects
+        :param max_workers: max number of chunks written concurrently
+        :param dimensions: optional. Dimension names in their natural order. Will speed up the execution!
+        :param increment: increment or update cell values
+        :param deactivate_transaction_log: deactivate before writing
+        :param reactivate_transaction_log: reactivate after writing
+        :param sandbox_name: str
+        :param precision: max precision when writhing through unbound process.
+        :param measure_dimension_elements: dictionary of measure elements and their types
+        :param progress_callback: optional function that is called with a `WriteProgress` after every written chunk
+        :param pool: optional TM1ServicePool. Chunks are written on separate TM1 sessions leased from the pool
+        :param kwargs:
+        :return:
+        """
+        if not dimensions:
+            dimensions = self.get_dimension_names_for_writing(cube_name=cube_name)
 
-            return failures
+        self._write_pipelined(
+            cube_name=cube_name,
+            chunks=chunks,
+            max_workers=max_workers,
+            dimensions=dimensions,
+            increment=increment,
+            sandbox_name=sandbox_name,
+            precision=precision,
+            measure_dimension_elements=measure_dimension_elements,
+            progress_callback=progress_callback,
+            pool=pool,
+            **kwargs,
+        )
 
-        if increment:
-            data = build_dataframe_aggregate_intersections(data, sum_numeric_duplicates=True)
+    def _write_pipelined(
+        self,
+        cube_name: str,
+        chunks: Iterable[Union[Dict, "pd.DataFrame"]],
+        max_workers: int,
+        dimensions: Iterable[str],
+        progress_callback: Callable[[WriteProgress], None] = None,
+        pool: "TM1ServicePool" = None,
+        **kwargs,
+    ):
+        def _write_chunk(cell_service: "CellService", chunk: Union[Dict, "pd.DataFrame"]):
+            # chunk is serialized to CSV inside the worker, right before its upload
+            if is_loaded("pandas") and isinstance(chunk, pd.DataFrame):
+                cell_service.write_dataframe(
+                    cube_name=cube_name, data=chunk, dimensions=dimensions, use_blob=True, **kwargs
+                )
+            else:
+                cell_service.write(
+                    cube_name=cube_name, cellset_as_dict=chunk, dimensions=dimensions, use_blob=True, **kwargs
+                )
+
+        def _write(chunk: Union[Dict, "pd.DataFrame"]):
+            start = time.perf_counter()
+            try:
+                if pool is None:
+                    _write_chunk(self, chunk)
+                else:
+                    with pool.lease() as tm1:
+                        _write_chunk(tm1.cells, chunk)
+                failure = None
+            except (TM1pyWritePartialFailureException, TM1pyWriteFailureException) as exception:
+                failure = exception
+            return len(chunk), time.perf_counter() - start, failure
+
+        failures = []
+        total_cells = 0
+        started = time.perf_counter()
+
+        def _collect(futures: Dict):
+            nonlocal total_cells
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk_number = futures.pop(future)
+                cells, seconds, failure = future.result()
+                if failure:
+                    failures.append(failure)
+                total_cells += cells
+                if progress_callback:
+                    total_seconds = time.perf_counter() - started
+                    progress_callback(
+                        WriteProgress(
+                            chunk=chunk_number,
+                            cells=cells,
+                            seconds=seconds,
+                            total_cells=total_cells,
+                            total_seconds=total_seconds,
+                            cells_per_second=total_cells / total_seconds if total_seconds else 0.0,
+                        )
+                    )
 
-        exceptions = asyncio.run(_write_async(data))
-        if not exceptions:
+        with ThreadPoolExecutor(max_workers) as executor:
+            in_flight = {}
+            chunks = iter(chunks)
+            for chunk_number in itertools.count():
+                # only pull the next chunk from the iterable once a worker is available
+                while len(in_flight) >= max_workers:
+                    _collect(in_flight)
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                in_flight[executor.submit(_write, chunk)] = chunk_number
+                del chunk
+
+            while in_flight:
+                _collect(in_flight)
+
+        if not failures:
             return
 
         # merge all failures into one combined Exception
         raise TM1pyWritePartialFailureException(
-            statuses=list(itertools.chain(*[exception.statuses for exception in exceptions])),
-            error_log_files=list(itertools.chain(*[exception.error_log_files for exception in exceptions])),
-            attempts=sum([exception.attempts if hasattr(exception, "attempts") else 1 for exception in exceptions]),
+            statuses=list(itertools.chain(*[exception.statuses for exception in failures])),
+            error_log_files=list(itertools.chain(*[exception.error_log_files for exception in failures])),
+            attempts=sum(
+                [
+                    exception.attempts if isinstance(exception, TM1pyWritePartialFailureException) else 1
+                    for exception in failures
+                ]
+            ),
         )
 
     @manage_changeset
+    @invalidate_mdx_result_cache
     def write_value(
         self,
         value: Union[str, float],
@@ -1174,6 +1396,7 @@ class CellService(ObjectService):
         data = json.dumps(body_as_dict, ensure_ascii=False)
         return self._rest.POST(url=url, data=data, **kwargs)
 
+    @invalidate_mdx_result_cache
     def write(
         self,
         cube_name: str,
@@ -1192,6 +1415,7 @@ class CellService(ObjectService):
         remove_blob: bool = True,
         allow_spread: bool = False,
         clear_view: str = None,
+        auto: bool = False,
         **kwargs,
     ) -> Optional[str]:
         """Write values to a cube
@@ -1221,14 +1445,59 @@ class CellService(ObjectService):
         :param remove_blob: remove blob file after writing with use_blob=True
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements
         :param clear_view: name of cube view to clear before writing
+        :param auto: choose cellset, TI, blob or async blob writing (and slice size) based on the number of cells,
+        the share of string cells, admin permissions, server version and the timings of previous writes to the cube
         :return: changeset or None
         """
+        if auto:
+            if use_ti or use_blob:
+                raise ValueError("'auto' can not be used in conjunction with 'use_ti' or 'use_blob'")
+
+            if measure_dimension_elements is None and self._write_strategy_depends_on_cell_types(
+                cube_name, len(cellset_as_dict)
+            ):
+                measure_dimension_elements = self.get_elements_from_all_measure_hierarchies(cube_name=cube_name)
+
+            strategy, slice_size = self._suggest_write_strategy(
+                cube_name=cube_name,
+                cellset_as_dict=cellset_as_dict,
+                measure_dimension_elements=measure_dimension_elements,
+                use_changeset=use_changeset,
+                clear_view=clear_view,
+            )
+            if strategy == "async":
+                start = time.perf_counter()
+                result = self.write_async(
+                    cube_name=cube_name,
+                    cells=cellset_as_dict,
+                    slice_size=slice_size,
+                    max_workers=self.WRITE_STRATEGY_MAX_WORKERS,
+                    dimensions=dimensions,
+                    increment=increment,
+                    deactivate_transaction_log=deactivate_transaction_log,
+                    reactivate_transaction_log=reactivate_transaction_log,
+                    sandbox_name=sandbox_name,
+                    precision=precision,
+                    measure_dimension_elements=measure_dimension_elements,
+                    skip_non_updateable=skip_non_updateable,
+                    remove_blob=remove_blob,
+                    allow_spread=allow_spread,
+                    **kwargs,
+                )
+                self._record_write_timing(cube_name, "async", len(cellset_as_dict), time.perf_counter() - start)
+                return result
+
+            use_ti = strategy == "ti"
+            use_blob = strategy == "blob"
 
         if clear_view and not use_blob:
             raise ValueError("'clear_view' can only be used in conjunction with 'use_blob'")
 
+        strategy = "ti" if use_ti else "blob" if use_blob else "cellset"
+        start = time.perf_counter()
+
         if use_ti:
-            return self.write_through_unbound_process(
+            result = self.write_through_unbound_process(
                 cube_name=cube_name,
                 cellset_as_dict=cellset_as_dict,
                 increment=increment,
@@ -1243,8 +1512,8 @@ class CellService(ObjectService):
                 **kwargs,
             )
 
-        if use_blob:
-            return self.write_through_blob(
+        elif use_blob:
+            result = self.write_through_blob(
                 cube_name=cube_name,
                 cellset_as_dict=cellset_as_dict,
                 increment=increment,
@@ -1259,19 +1528,107 @@ class CellService(ObjectService):
                 **kwargs,
             )
 
-        return self.write_through_cellset(
-            cube_name,
-            cellset_as_dict,
-            dimensions,
-            increment,
-            deactivate_transaction_log,
-            reactivate_transaction_log,
-            sandbox_name,
-            use_changeset,
-            skip_non_updateable,
-            **kwargs,
-        )
+        else:
+            result = self.write_through_cellset(
+                cube_name,
+                cellset_as_dict,
+                dimensions,
+                increment,
+                deactivate_transaction_log,
+                reactivate_transaction_log,
+                sandbox_name,
+                use_changeset,
+                skip_non_updateable,
+                **kwargs,
+            )
+
+        self._record_write_timing(cube_name, strategy, len(cellset_as_dict), time.perf_counter() - start)
+
+        if cube_name.lower().startswith(self.ELEMENT_ATTRIBUTES_PREFIX.lower()):
+            # aliases determine principal element names
+            self._rest.metadata_cache.invalidate_dimension(cube_name[len(self.ELEMENT_ATTRIBUTES_PREFIX) :])
+        return result
+
+    def _write_strategy_depends_on_cell_types(self, cube_name: str, cells: int) -> bool:
+        """Cell types are only relevant if cellset writing is not the cheapest strategy with only string cells"""
+        if not (self.is_data_admin and self.is_ops_admin):
+            return False
+
+        costs = self._get_write_costs(cube_name)
+        overhead, rate = costs["cellset"]
+        cellset_cost = overhead + cells * rate * self.WRITE_STRATEGY_STRING_CELL_WEIGHT
+        return cellset_cost > min(fixed_cost for strategy, (fixed_cost, _) in costs.items() if strategy != "cellset")
+
+    def _suggest_write_strategy(
+        self,
+        cube_name: str,
+        cellset_as_dict: Union[Dict, "pd.DataFrame"],
+        measure_dimension_elements: Dict = None,
+        use_changeset: bool = False,
+        clear_view: str = None,
+        sample_size: int = 10_000,
+    ) -> Tuple[str, int]:
+        """Estimate the cheapest write strategy for the cube
+
+        :return: strategy ('cellset', 'ti', 'blob' or 'async') and slice size
+        """
+        cells = len(cellset_as_dict)
+
+        # only cellset writing supports changesets and doesn't require admin permissions
+        if use_changeset or not (self.is_data_admin and self.is_ops_admin):
+            if clear_view:
+                raise ValueError("'clear_view' can only be used in conjunction with 'use_blob'")
+            return "cellset", cells
+
+        # only blob writing supports clear_view
+        candidates = [] if clear_view else ["cellset", "ti"]
+        # blob writing requires the contents api
+        if verify_version(required_version="11.4", version=self.version):
+            candidates.append("blob")
+            # CaseAndSpaceInsensitiveTuplesDict is a Mapping, but not a dict
+            if isinstance(cellset_as_dict, Mapping) and not clear_view:
+                candidates.append("async")
+        elif clear_view:
+            raise ValueError("'clear_view' can only be used in conjunction with 'use_blob'")
+
+        string_share = 0
+        if measure_dimension_elements and cells:
+            sample = list(itertools.islice(iter(cellset_as_dict), sample_size))
+            string_cells = sum(1 for elements in sample if measure_dimension_elements.get(elements[-1]) == "String")
+            string_share = string_cells / len(sample)
+        weighted_cells = cells * (1 + string_share * (self.WRITE_STRATEGY_STRING_CELL_WEIGHT - 1))
+
+        costs = self._get_write_costs(cube_name)
+        estimates = dict()
+        for strategy in candidates:
+            overhead, rate = costs[strategy]
+            estimates[strategy] = overhead + rate * (weighted_cells if strategy in ("cellset", "ti") else cells)
+        strategy = min(estimates, key=estimates.get)
+
+        slice_size = cells
+        if strategy == "async":
+            slice_size = max(50_000, min(250_000, math.ceil(cells / self.WRITE_STRATEGY_MAX_WORKERS)))
+
+        return strategy, slice_size
+
+    def _get_write_costs(self, cube_name: str) -> Dict[str, Tuple[float, float]]:
+        return self._write_costs.setdefault(lower_and_drop_spaces(cube_name), dict(self.WRITE_STRATEGY_COSTS))
+
+    def _record_write_timing(self, cube_name: str, strategy: str, cells: int, seconds: float):
+        """Refine the cost estimates of the strategy for the cube with the timing of a write"""
+        costs = self._get_write_costs(cube_name)
+        overhead, rate = costs[strategy]
+        learning_rate = self.WRITE_STRATEGY_LEARNING_RATE
+
+        # small writes are dominated by the fixed overhead, large writes by the cost per cell
+        if cells * rate < overhead:
+            overhead = (1 - learning_rate) * overhead + learning_rate * max(seconds - cells * rate, 0)
+        else:
+            rate = (1 - learning_rate) * rate + learning_rate * max(seconds - overhead, 0) / cells
+
+        costs[strategy] = (overhead, rate)
 
+    @invalidate_mdx_result_cache
     def write_through_cellset(
         self,
         cube_name: str,
@@ -1329,6 +1686,7 @@ class CellService(ObjectService):
     @require_data_admin
     @require_ops_admin
     @manage_transaction_log
+    @invalidate_mdx_result_cache
     def write_through_unbound_process(
         self,
         cube_name: str,
@@ -1426,10 +1784,11 @@ class CellService(ObjectService):
     @require_ops_admin
     @manage_transaction_log
     @require_pandas
+    @invalidate_mdx_result_cache
     def write_through_blob(
         self,
         cube_name: str,
-        cellset_as_dict: dict,
+        cellset_as_dict: Union[Dict, "pd.DataFrame"],
         increment: bool = False,
         sandbox_name: str = None,
         skip_non_updateable: bool = False,
@@ -1437,12 +1796,14 @@ class CellService(ObjectService):
         dimensions: str = None,
         allow_spread: bool = False,
         clear_view: str = None,
+        compress: bool = False,
         **kwargs,
     ):
         """
         Writes data back to TM1 via an unbound TI process having an uploaded CSV as data source
         :param cube_name: str
-        :param cellset_as_dict:
+        :param cellset_as_dict: cellset as dict or DataFrame in the shape that `write_dataframe` expects.
+        DataFrames are serialized column-wise, which is much faster for large data sets
         :param increment: increment or update cell values
         :param sandbox_name: str
         :param skip_non_updateable: skip cells that are not updateable (e.g. rule derived or consolidated)
@@ -1450,6 +1811,7 @@ class CellService(ObjectService):
         :param dimensions: optional. Dimension names in their natural order. Will speed up the execution!
         :param allow_spread: allow TI process in use_blob or use_ti to use CellPutProportionalSpread on C elements.
         :param clear_view: name of cube view to clear before writing
+        :param compress: upload the blob gzip compressed. Requires the server to accept gzip encoded request bodies
         :param kwargs: Additional arguments for the REST request
         :return: Success: bool, Messages: list, ChangeSet: None
         """
@@ -1461,15 +1823,30 @@ class CellService(ObjectService):
         unique_name = self.suggest_unique_object_name()
 
         # Transform cells to format that's consumable for TI
-        csv_content = StringIO()
-        csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
-        csv_writer.writerows(
-            list(elements) + [value.replace("\r", "").replace("\n", "") if isinstance(value, str) else value]
-            for elements, value in cellset_as_dict.items()
-        )
+        if is_loaded("pandas") and isinstance(cellset_as_dict, pd.DataFrame):
+            file_content = build_csv_from_dataframe(cellset_as_dict)
+        else:
+            csv_content = StringIO()
+            csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
+            csv_writer.writerows(
+                list(elements) + [value.replace("\r", "").replace("\n", "") if isinstance(value, str) else value]
+                for elements, value in cellset_as_dict.items()
+            )
+            file_content = csv_content.getvalue().encode("utf-8")
 
         file_name = f"{unique_name}.csv"
-        file_service.create(file_name=file_name, file_content=csv_content.getvalue().encode("utf-8"), **kwargs)
+        if compress:
+            # favour speed over ratio. Blob is decompressed by the server on arrival
+            file_service.create(
+                file_name=file_name,
+                file_content=gzip.compress(file_content, compresslevel=1),
+                multi_part_upload=False,
+                content_encoding="gzip",
+                **kwargs,
+            )
+        else:
+            file_service.create(file_name=file_name, file_content=file_content, **kwargs)
+        del file_content
 
         try:
             # Create and execute unbound TI process to load blob file to cube
@@ -1954,6 +2331,7 @@ class CellService(ObjectService):
 
     @manage_changeset
     @manage_transaction_log
+    @invalidate_mdx_result_cache
     def write_values(
         self,
         cube_name: str,
@@ -1981,6 +2359,13 @@ class CellService(ObjectService):
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
         url = add_url_parameters(url, **{"!ChangeSet": changeset})
 
+        updates = self._build_write_values_body(cellset_as_dict, dimensions)
+        self._rest.POST(url=url, data=updates, **kwargs)
+
+        return changeset
+
+    @staticmethod
+    def _build_write_values_body(cellset_as_dict: Dict, dimensions: Iterable[str]) -> str:
         updates = []
         for element_tuple, value in cellset_as_dict.items():
             body_as_dict = OrderedDict()
@@ -1991,13 +2376,11 @@ class CellService(ObjectService):
             ]
             body_as_dict["Value"] = value if value else ""
             updates.append(json.dumps(body_as_dict, ensure_ascii=False))
-        updates = "[" + ",".join(updates) + "]"
-        self._rest.POST(url=url, data=updates, **kwargs)
-
-        return changeset
+        return "[" + ",".join(updates) + "]"
 
     @manage_changeset
     @manage_transaction_log
+    @invalidate_mdx_result_cache
     def write_values_through_cellset(
         self, mdx: str, values: Iterable, increment: bool = False, sandbox_name: str = None, **kwargs
     ) -> str:
@@ -2066,6 +2449,7 @@ class CellService(ObjectService):
 
         return self._rest.PATCH(url, json.dumps(data, ensure_ascii=False), **kwargs)
 
+    @cache_mdx_result
     def execute_mdx(
         self,
         mdx: str,
@@ -2339,6 +2723,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_mdx_result
     def execute_mdx_raw(
         self,
         mdx: str,
@@ -2392,6 +2777,57 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_mdx_result
+    def execute_mdx_struct(
+        self,
+        mdx: str,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip_contexts: bool = False,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_hierarchies: bool = False,
+        **kwargs,
+    ) -> "Cellset":
+        """Execute MDX and return the cellset as typed records instead of nested dicts
+
+        :param mdx: String, a valid MDX Query
+        :param cell_properties: List of properties to be queried from the cell. E.g. ['Value', 'RuleDerived', ...]
+        :param elem_properties: List of properties to be queried from the elements. E.g. ['Name','Attributes', ...]
+        :param member_properties: List of properties to be queried from the members. E.g. ['Name','Attributes', ...]
+        :param top: Integer limiting the number of cells and the number or rows returned
+        :param skip: Integer limiting the number of cells and the number or rows returned
+        :param skip_contexts: skip elements from titles / contexts in response
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_hierarchies: retrieve Hierarchies property on Axes
+        :return: Cellset with Axes, Tuples, Members and Cells as attributes. See `JsonDecoder.decode_cellset`
+        """
+        cellset_id = self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+        return self.extract_cellset_struct(
+            cellset_id=cellset_id,
+            cell_properties=cell_properties,
+            elem_properties=elem_properties,
+            member_properties=member_properties,
+            top=top,
+            skip=skip,
+            delete_cellset=True,
+            skip_contexts=skip_contexts,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_hierarchies=include_hierarchies,
+            **kwargs,
+        )
+
     def execute_view_raw(
         self,
         cube_name: str,
@@ -2449,6 +2885,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_mdx_result
     def execute_mdx_values(
         self,
         mdx: str,
@@ -2457,6 +2894,9 @@ class CellService(ObjectService):
         skip_zeros: bool = False,
         skip_consolidated_cells: bool = False,
         skip_rule_derived_cells: bool = False,
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
+        pool: "TM1ServicePool" = None,
         **kwargs,
     ) -> List[Union[str, float]]:
         """Optimized for performance. Query only raw cell values.
@@ -2468,9 +2908,36 @@ class CellService(ObjectService):
         :param skip_zeros: bool
         :param skip_consolidated_cells: bool
         :param skip_rule_derived_cells: bool
+        :param max_workers: Int, if > 1 cells are retrieved in partitions on parallel threads
+        :param cells_per_request: Int, target number of cells per partition. Only applies if max_workers > 1
+        :param pool: optional TM1ServicePool to retrieve partitions on separate TM1 sessions.
+        Only applies if max_workers > 1
         :return: List of cell values
         """
+        if max_workers > 1 and use_compact_json:
+            raise ValueError("'use_compact_json' must not be used in conjunction with 'max_workers' > 1")
+
         cellset_id = self.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+
+        if max_workers > 1:
+            try:
+                cells = self.extract_cellset_cells_partitioned(
+                    cellset_id,
+                    cells_per_request=cells_per_request,
+                    max_workers=max_workers,
+                    skip_zeros=skip_zeros,
+                    skip_consolidated_cells=skip_consolidated_cells,
+                    skip_rule_derived_cells=skip_rule_derived_cells,
+                    sandbox_name=sandbox_name,
+                    mdx=mdx,
+                    pool=pool,
+                    **kwargs,
+                )
+                return [cell["Value"] for cell in cells]
+
+            finally:
+                self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+
         return self.extract_cellset_values(
             cellset_id,
             delete_cellset=True,
@@ -2521,6 +2988,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
+    @cache_mdx_result
     def execute_mdx_rows_and_values(
         self, mdx: str, element_unique_names: bool = True, sandbox_name: str = None, **kwargs
     ) -> CaseAndSpaceInsensitiveTuplesDict:
@@ -2563,6 +3031,7 @@ class CellService(ObjectService):
             cellset_id, element_unique_names, delete_cellset=True, sandbox_name=sandbox_name, **kwargs
         )
 
+    @cache_mdx_result
     def execute_mdx_csv(
         self,
         mdx: Union[str, MdxBuilder],
@@ -2580,6 +3049,8 @@ class CellService(ObjectService):
         use_compact_json: bool = False,
         use_blob: bool = False,
         mdx_headers: bool = False,
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
         **kwargs,
     ) -> str:
         """Optimized for performance. Get csv string of coordinates and values.
@@ -2601,8 +3072,15 @@ class CellService(ObjectService):
         :param use_compact_json: bool
         :param use_blob: Has better performance on datasets > 1M cells and lower memory footprint in any case.
         :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param max_workers: Int, if > 1 cells are retrieved in partitions on parallel threads
+        :param cells_per_request: Int, target number of cells per partition. Only applies if max_workers > 1
         :return: String
         """
+        if max_workers > 1 and (use_blob or use_iterative_json):
+            raise ValueError(
+                "'max_workers' > 1 must not be used in conjunction with 'use_blob' or 'use_iterative_json'"
+            )
+
         if use_blob:
             if include_attributes:
                 raise ValueError("'include_attributes' must not be used in conjunction with 'use_blob'")
@@ -2661,6 +3139,8 @@ class CellService(ObjectService):
             include_attributes=include_attributes,
             use_compact_json=use_compact_json,
             mdx_headers=mdx_headers,
+            max_workers=max_workers,
+            cells_per_request=cells_per_request,
             **kwargs,
         )
 
@@ -2772,7 +3252,7 @@ class CellService(ObjectService):
             **kwargs,
         )
 
-    def execute_mdx_elements_value_dict(
+    def execute_mdx_iter_rows(
         self,
         mdx: str,
         top: int = None,
@@ -2780,10 +3260,121 @@ class CellService(ObjectService):
         skip_zeros: bool = True,
         skip_consolidated_cells: bool = False,
         skip_rule_derived_cells: bool = False,
-        element_separator: str = "|",
         sandbox_name: str = None,
-        **kwargs,
-    ) -> CaseAndSpaceInsensitiveDict:
+        include_attributes: bool = False,
+        include_headers: bool = True,
+        mdx_headers: bool = False,
+        batch_size: int = None,
+        chunk_size: int = 65_536,
+        **kwargs,
+    ) -> Generator[List, None, None]:
+        """Execute MDX and stream the result row by row.
+        Memory consumption stays flat, irrespective of the size of the cellset.
+
+        :param mdx: Valid MDX Query
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param include_headers: yield header row first
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param batch_size: if provided, yield lists of up to batch_size rows instead of individual rows
+        :param chunk_size: number of bytes to read from the socket at once
+        :return: generator of rows: [element, ..., element, value]. The cellset is created on first iteration
+        """
+        # cellset is created on first iteration. An unused generator must not leave it behind on the server
+        cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
+
+        yield from self.extract_cellset_iter_rows(
+            cellset_id=cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            include_headers=include_headers,
+            mdx_headers=mdx_headers,
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    def execute_view_iter_rows(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        include_headers: bool = True,
+        mdx_headers: bool = False,
+        batch_size: int = None,
+        chunk_size: int = 65_536,
+        **kwargs,
+    ) -> Generator[List, None, None]:
+        """Execute view and stream the result row by row.
+        Memory consumption stays flat, irrespective of the size of the cellset.
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param private: True (private) or False (public)
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param include_headers: yield header row first
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param batch_size: if provided, yield lists of up to batch_size rows instead of individual rows
+        :param chunk_size: number of bytes to read from the socket at once
+        :return: generator of rows: [element, ..., element, value]. The cellset is created on first iteration
+        """
+        # cellset is created on first iteration. An unused generator must not leave it behind on the server
+        cellset_id = self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+
+        yield from self.extract_cellset_iter_rows(
+            cellset_id=cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            include_headers=include_headers,
+            mdx_headers=mdx_headers,
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    @cache_mdx_result
+    def execute_mdx_elements_value_dict(
+        self,
+        mdx: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        element_separator: str = "|",
+        sandbox_name: str = None,
+        **kwargs,
+    ) -> CaseAndSpaceInsensitiveDict:
         """Optimized for performance. Get Dict from MDX Query.
         :param mdx: Valid MDX Query
         :param top: Int, number of cells to return (counting from top)
@@ -2817,6 +3408,7 @@ class CellService(ObjectService):
         return elements_value_dict
 
     @require_pandas
+    @cache_mdx_result
     def execute_mdx_dataframe(
         self,
         mdx: Union[str, MdxBuilder],
@@ -2836,6 +3428,10 @@ class CellService(ObjectService):
         fillna_numeric_attributes_value: Any = 0,
         fillna_string_attributes: bool = False,
         fillna_string_attributes_value: Any = "",
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
+        use_columnar: bool = False,
+        use_arrow_csv: bool = False,
         **kwargs,
     ) -> "pd.DataFrame":
         """Optimized for performance. Get Pandas DataFrame from MDX Query.
@@ -2864,16 +3460,28 @@ class CellService(ObjectService):
         :param fillna_string_attributes: boolean, fills empty string attributes with fillna_string_attributes_value
         :param fillna_numeric_attributes_value: Any, value with which to replace na if fillna_numeric_attributes is True
         :param fillna_string_attributes_value: Any, value with which to replace na if fillna_string_attributes is True
+        :param max_workers: Int, if > 1 cells are retrieved in partitions on parallel threads
+        :param cells_per_request: Int, target number of cells per partition. Only applies if max_workers > 1
+        :param use_columnar: build data frame directly from the cellset with categorical dimension columns,
+        instead of going through csv
+        :param use_arrow_csv: parse the csv with the multithreaded pyarrow csv reader into an Arrow backed
+        DataFrame. Requires pyarrow. Arguments for pandas.read_csv are ignored
         :return: Pandas Dataframe
         """
         if (fillna_numeric_attributes or fillna_string_attributes) and not include_attributes:
             raise ValueError("Include attributes must be True if fillna_numeric or fillna_string is True.")
+        if use_arrow_csv and (shaped or use_columnar):
+            raise ValueError("'use_arrow_csv' must not be used in conjunction with 'shaped' or 'use_columnar'")
 
         # necessary to assure column order in line with cube view
         if shaped:
             skip_zeros = False
 
         if use_blob:
+            if max_workers > 1:
+                raise ValueError("'max_workers' > 1 must not be used in conjunction with 'use_blob'")
+            if use_columnar:
+                raise ValueError("'use_columnar' must not be used in conjunction with 'use_blob'")
             if any(
                 [
                     fillna_numeric_attributes,
@@ -2897,9 +3505,11 @@ class CellService(ObjectService):
                 value_separator="~",
                 use_blob=use_blob,
                 mdx_headers=mdx_headers,
+                # pass the bytes of the blob to the arrow csv reader as they are
+                decode=not use_arrow_csv,
             )
 
-            return build_dataframe_from_csv(raw_csv, sep="~", shaped=shaped, **kwargs)
+            return build_dataframe_from_csv(raw_csv, sep="~", shaped=shaped, use_arrow=use_arrow_csv, **kwargs)
 
         cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
         return self.extract_cellset_dataframe(
@@ -2919,14 +3529,18 @@ class CellService(ObjectService):
             fillna_numeric_attributes_value=fillna_numeric_attributes_value,
             fillna_string_attributes=fillna_string_attributes,
             fillna_string_attributes_value=fillna_string_attributes_value,
+            max_workers=max_workers,
+            cells_per_request=cells_per_request,
+            use_columnar=use_columnar,
+            use_arrow_csv=use_arrow_csv,
             **kwargs,
         )
 
-    @require_pandas
-    def execute_mdx_dataframe_async(
+    @require_pyarrow
+    @cache_mdx_result
+    def execute_mdx_arrow(
         self,
-        mdx_list: List[Union[str, MdxBuilder]],
-        max_workers: int = 8,
+        mdx: Union[str, MdxBuilder],
         top: int = None,
         skip: int = None,
         skip_zeros: bool = True,
@@ -2934,125 +3548,440 @@ class CellService(ObjectService):
         skip_rule_derived_cells: bool = False,
         sandbox_name: str = None,
         include_attributes: bool = False,
-        use_iterative_json: bool = False,
-        use_compact_json: bool = False,
-        use_blob: bool = False,
-        shaped: bool = False,
         mdx_headers: bool = False,
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
         **kwargs,
-    ) -> "pd.DataFrame":
-
-        def _execute_mdx_dataframe(mdx: Union[str, MdxBuilder]):
-            return self.execute_mdx_dataframe(
-                mdx=mdx,
-                top=top,
-                skip=skip,
-                skip_zeros=skip_zeros,
-                skip_consolidated_cells=skip_consolidated_cells,
-                skip_rule_derived_cells=skip_rule_derived_cells,
-                sandbox_name=sandbox_name,
-                include_attributes=include_attributes,
-                use_iterative_json=use_iterative_json,
-                use_compact_json=use_compact_json,
-                use_blob=use_blob,
-                shaped=shaped,
-                mdx_headers=mdx_headers,
-                **kwargs,
-            )
-
-        async def _exec_mdx_dataframe_async():
-            loop = asyncio.get_event_loop()
-            result_list = []
-            with ThreadPoolExecutor(max_workers) as executor:
-                futures = [loop.run_in_executor(executor, _execute_mdx_dataframe, mdx) for mdx in mdx_list]
-                for future in futures:
-                    result = await future
-                    result_list.append(result)
-            return pd.concat(result_list, ignore_index=True)
-
-        result_dataframe = asyncio.run(_exec_mdx_dataframe_async())
+    ) -> "pa.Table":
+        """Get Arrow Table from MDX Query. Dimension columns are dictionary encoded.
 
-        return result_dataframe
+        :param mdx: Valid MDX Query
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param max_workers: Int, if > 1 cells are retrieved in partitions on parallel threads
+        :param cells_per_request: Int, target number of cells per partition. Only applies if max_workers > 1
+        :return: pyarrow Table
+        """
+        cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
+        return self.extract_cellset_arrow(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            max_workers=max_workers,
+            cells_per_request=cells_per_request,
+            **kwargs,
+        )
 
-    @require_pandas
-    def execute_mdx_dataframe_shaped(
+    @require_pyarrow
+    def execute_mdx_to_parquet(
         self,
-        mdx: str,
+        mdx: Union[str, MdxBuilder],
+        path: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
         sandbox_name: str = None,
-        display_attribute: bool = False,
-        use_iterative_json: bool = False,
-        use_blob: bool = False,
+        include_attributes: bool = False,
         mdx_headers: bool = False,
+        cells_per_request: int = 100_000,
+        max_workers: int = 1,
+        value_type: "pa.DataType" = None,
+        compression: Optional[str] = "snappy",
         **kwargs,
-    ) -> "pd.DataFrame":
-        """Retrieves data from cube in the shape of the query.
-        Dimensions on rows can be stacked. One dimension must be placed on columns. Title selections are ignored.
+    ) -> int:
+        """Stream the result of an MDX query into a parquet file, without building the full result in memory.
+        Cells are retrieved in partitions and every partition is written as one row group.
+        Dimension columns are dictionary encoded.
 
-        :param mdx:
+        :param mdx: Valid MDX Query
+        :param path: path of the parquet file
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
         :param sandbox_name: str
-        :param use_blob:
-        :param use_iterative_json:
-        :param display_attribute: bool, show element name or first attribute from MDX PROPERTIES clause
-        :param kwargs:
-        :return:
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param cells_per_request: Int, number of cells per partition. Each partition is written as one row group
+        :param max_workers: Int, if > 1 the next partitions are retrieved on parallel threads while writing.
+        At most `max_workers` partitions are held in memory
+        :param value_type: pa.float64() or pa.string(). Type of the Value column. Default: derived from the first
+        partition. Must be pa.string() if string cells may appear after numeric cells
+        :param compression: compression codec of the parquet file, e.g. 'snappy', 'zstd' or None
+        :return: number of rows written
         """
-        if display_attribute and any([use_blob, use_iterative_json]):
-            raise ValueError("When 'use_blob' or 'use_iterative_json' is True, 'display_attribute' must be False")
-
-        # default case
-        if not any([use_blob, use_iterative_json]):
-            cellset_id = self.create_cellset(mdx=mdx, sandbox_name=sandbox_name)
-            return self.extract_cellset_dataframe_shaped(
-                cellset_id=cellset_id,
-                delete_cellset=True,
-                sandbox_name=sandbox_name,
-                display_attribute=display_attribute,
-                mdx_headers=mdx_headers,
-                **kwargs,
-            )
-
-        if all([use_blob, use_iterative_json]):
-            raise ValueError("'use_blob' and 'use_iterative_json' must not be used together")
-
-        # ijson approach
-        if use_iterative_json:
-            return self.execute_mdx_dataframe(
-                mdx=mdx,
-                shaped=True,
-                sandbox_name=sandbox_name,
-                use_iterative_json=use_iterative_json,
-                use_blob=False,
-                mdx_headers=mdx_headers,
-                **kwargs,
-            )
-
-        # blob approach
-        return self.execute_mdx_dataframe(
-            mdx=mdx, shaped=True, sandbox_name=sandbox_name, use_blob=True, mdx_headers=mdx_headers, **kwargs
+        cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
+        return self.extract_cellset_to_parquet(
+            cellset_id,
+            path,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            cells_per_request=cells_per_request,
+            max_workers=max_workers,
+            value_type=value_type,
+            compression=compression,
+            **kwargs,
         )
 
-    @require_pandas
-    def execute_view_dataframe_shaped(
+    @require_pyarrow
+    def execute_mdx_to_arrow_ipc(
         self,
-        cube_name: str,
-        view_name: str,
-        private: bool = False,
+        mdx: Union[str, MdxBuilder],
+        path: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
         sandbox_name: str = None,
-        use_iterative_json: bool = False,
-        use_blob: bool = False,
+        include_attributes: bool = False,
         mdx_headers: bool = False,
+        cells_per_request: int = 100_000,
+        max_workers: int = 1,
+        value_type: "pa.DataType" = None,
+        compression: Optional[str] = None,
         **kwargs,
-    ) -> "pd.DataFrame":
-        """Retrieves data from cube in the shape of the query.
-        Dimensions on rows can be stacked. One dimension must be placed on columns. Title selections are ignored.
+    ) -> int:
+        """Stream the result of an MDX query into an Arrow IPC file (Feather V2), without building the full result
+        in memory. Cells are retrieved in partitions and every partition is written as one record batch.
+        Dimension columns are dictionary encoded.
 
-        :param cube_name:
-        :param view_name:
-        :param private:
-        :param sandbox_name: str
-        :param use_blob:
-        :param use_iterative_json:
-        :param kwargs:
+        :param mdx: Valid MDX Query
+        :param path: path of the Arrow IPC file
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param cells_per_request: Int, number of cells per partition. Each partition is written as one record batch
+        :param max_workers: Int, if > 1 the next partitions are retrieved on parallel threads while writing.
+        At most `max_workers` partitions are held in memory
+        :param value_type: pa.float64() or pa.string(). Type of the Value column. Default: derived from the first
+        partition. Must be pa.string() if string cells may appear after numeric cells
+        :param compression: compression codec of the IPC file: 'lz4', 'zstd' or None
+        :return: number of rows written
+        """
+        cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
+        return self.extract_cellset_to_arrow_ipc(
+            cellset_id,
+            path,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            cells_per_request=cells_per_request,
+            max_workers=max_workers,
+            value_type=value_type,
+            compression=compression,
+            **kwargs,
+        )
+
+    @require_pyarrow
+    def execute_view_to_parquet(
+        self,
+        cube_name: str,
+        view_name: str,
+        path: str,
+        private: bool = False,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        cells_per_request: int = 100_000,
+        max_workers: int = 1,
+        value_type: "pa.DataType" = None,
+        compression: Optional[str] = "snappy",
+        **kwargs,
+    ) -> int:
+        """Stream a cube view into a parquet file, without building the full result in memory.
+        Cells are retrieved in partitions and every partition is written as one row group.
+        Dimension columns are dictionary encoded.
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param path: path of the parquet file
+        :param private: True (private) or False (public)
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param cells_per_request: Int, number of cells per partition. Each partition is written as one row group
+        :param max_workers: Int, if > 1 the next partitions are retrieved on parallel threads while writing.
+        At most `max_workers` partitions are held in memory
+        :param value_type: pa.float64() or pa.string(). Type of the Value column. Default: derived from the first
+        partition. Must be pa.string() if string cells may appear after numeric cells
+        :param compression: compression codec of the parquet file, e.g. 'snappy', 'zstd' or None
+        :return: number of rows written
+        """
+        cellset_id = self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return self.extract_cellset_to_parquet(
+            cellset_id,
+            path,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            cells_per_request=cells_per_request,
+            max_workers=max_workers,
+            value_type=value_type,
+            compression=compression,
+            **kwargs,
+        )
+
+    @require_pyarrow
+    def execute_view_to_arrow_ipc(
+        self,
+        cube_name: str,
+        view_name: str,
+        path: str,
+        private: bool = False,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        cells_per_request: int = 100_000,
+        max_workers: int = 1,
+        value_type: "pa.DataType" = None,
+        compression: Optional[str] = None,
+        **kwargs,
+    ) -> int:
+        """Stream a cube view into an Arrow IPC file (Feather V2), without building the full result in memory.
+        Cells are retrieved in partitions and every partition is written as one record batch.
+        Dimension columns are dictionary encoded.
+
+        :param cube_name: String, name of the cube
+        :param view_name: String, name of the view
+        :param path: path of the Arrow IPC file
+        :param private: True (private) or False (public)
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param cells_per_request: Int, number of cells per partition. Each partition is written as one record batch
+        :param max_workers: Int, if > 1 the next partitions are retrieved on parallel threads while writing.
+        At most `max_workers` partitions are held in memory
+        :param value_type: pa.float64() or pa.string(). Type of the Value column. Default: derived from the first
+        partition. Must be pa.string() if string cells may appear after numeric cells
+        :param compression: compression codec of the IPC file: 'lz4', 'zstd' or None
+        :return: number of rows written
+        """
+        cellset_id = self.create_cellset_from_view(
+            cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
+        )
+        return self.extract_cellset_to_arrow_ipc(
+            cellset_id,
+            path,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            cells_per_request=cells_per_request,
+            max_workers=max_workers,
+            value_type=value_type,
+            compression=compression,
+            **kwargs,
+        )
+
+    @require_pandas
+    def execute_mdx_dataframe_async(
+        self,
+        mdx_list: List[Union[str, MdxBuilder]],
+        max_workers: int = 8,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        use_iterative_json: bool = False,
+        use_compact_json: bool = False,
+        use_blob: bool = False,
+        shaped: bool = False,
+        mdx_headers: bool = False,
+        pool: "TM1ServicePool" = None,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Execute a list of MDX queries on parallel threads and concatenate the resulting DataFrames.
+        Remaining arguments as in `execute_mdx_dataframe`
+
+        :param mdx_list: list of MDX queries
+        :param max_workers: max number of queries executed in parallel
+        :param pool: optional TM1ServicePool. Queries are executed on separate TM1 sessions leased from the pool
+        """
+
+        def _execute_mdx_dataframe(mdx: Union[str, MdxBuilder]):
+            if pool is not None:
+                with pool.lease() as tm1:
+                    return _execute_mdx_dataframe_on(tm1.cells, mdx)
+            return _execute_mdx_dataframe_on(self, mdx)
+
+        def _execute_mdx_dataframe_on(cell_service: "CellService", mdx: Union[str, MdxBuilder]):
+            return cell_service.execute_mdx_dataframe(
+                mdx=mdx,
+                top=top,
+                skip=skip,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                include_attributes=include_attributes,
+                use_iterative_json=use_iterative_json,
+                use_compact_json=use_compact_json,
+                use_blob=use_blob,
+                shaped=shaped,
+                mdx_headers=mdx_headers,
+                **kwargs,
+            )
+
+        async def _exec_mdx_dataframe_async():
+            loop = asyncio.get_event_loop()
+            result_list = []
+            with ThreadPoolExecutor(max_workers) as executor:
+                futures = [loop.run_in_executor(executor, _execute_mdx_dataframe, mdx) for mdx in mdx_list]
+                for future in futures:
+                    result = await future
+                    result_list.append(result)
+            return pd.concat(result_list, ignore_index=True)
+
+        result_dataframe = asyncio.run(_exec_mdx_dataframe_async())
+
+        return result_dataframe
+
+    @require_pandas
+    @cache_mdx_result
+    def execute_mdx_dataframe_shaped(
+        self,
+        mdx: str,
+        sandbox_name: str = None,
+        display_attribute: bool = False,
+        use_iterative_json: bool = False,
+        use_blob: bool = False,
+        mdx_headers: bool = False,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Retrieves data from cube in the shape of the query.
+        Dimensions on rows can be stacked. One dimension must be placed on columns. Title selections are ignored.
+
+        :param mdx:
+        :param sandbox_name: str
+        :param use_blob:
+        :param use_iterative_json:
+        :param display_attribute: bool, show element name or first attribute from MDX PROPERTIES clause
+        :param kwargs:
+        :return:
+        """
+        if display_attribute and any([use_blob, use_iterative_json]):
+            raise ValueError("When 'use_blob' or 'use_iterative_json' is True, 'display_attribute' must be False")
+
+        # default case
+        if not any([use_blob, use_iterative_json]):
+            cellset_id = self.create_cellset(mdx=mdx, sandbox_name=sandbox_name)
+            return self.extract_cellset_dataframe_shaped(
+                cellset_id=cellset_id,
+                delete_cellset=True,
+                sandbox_name=sandbox_name,
+                display_attribute=display_attribute,
+                mdx_headers=mdx_headers,
+                **kwargs,
+            )
+
+        if all([use_blob, use_iterative_json]):
+            raise ValueError("'use_blob' and 'use_iterative_json' must not be used together")
+
+        # ijson approach
+        if use_iterative_json:
+            return self.execute_mdx_dataframe(
+                mdx=mdx,
+                shaped=True,
+                sandbox_name=sandbox_name,
+                use_iterative_json=use_iterative_json,
+                use_blob=False,
+                mdx_headers=mdx_headers,
+                **kwargs,
+            )
+
+        # blob approach
+        return self.execute_mdx_dataframe(
+            mdx=mdx, shaped=True, sandbox_name=sandbox_name, use_blob=True, mdx_headers=mdx_headers, **kwargs
+        )
+
+    @require_pandas
+    def execute_view_dataframe_shaped(
+        self,
+        cube_name: str,
+        view_name: str,
+        private: bool = False,
+        sandbox_name: str = None,
+        use_iterative_json: bool = False,
+        use_blob: bool = False,
+        mdx_headers: bool = False,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Retrieves data from cube in the shape of the query.
+        Dimensions on rows can be stacked. One dimension must be placed on columns. Title selections are ignored.
+
+        :param cube_name:
+        :param view_name:
+        :param private:
+        :param sandbox_name: str
+        :param use_blob:
+        :param use_iterative_json:
+        :param kwargs:
         :return:
         """
 
@@ -3126,6 +4055,7 @@ class CellService(ObjectService):
         )
 
     @require_pandas
+    @cache_mdx_result
     def execute_mdx_dataframe_pivot(
         self, mdx: str, dropna: bool = False, fill_value: bool = None, sandbox_name: str = None
     ) -> "pd.DataFrame":
@@ -3142,6 +4072,7 @@ class CellService(ObjectService):
             cellset_id=cellset_id, dropna=dropna, fill_value=fill_value, sandbox_name=sandbox_name
         )
 
+    @cache_mdx_result
     def execute_mdx_cellcount(self, mdx: str, sandbox_name: str = None, **kwargs) -> int:
         """Execute MDX in order to understand how many cells are in a cellset.
         Only return number of cells in the cellset. FAST!
@@ -3153,6 +4084,19 @@ class CellService(ObjectService):
         cellset_id = self.create_cellset(mdx, sandbox_name=sandbox_name, **kwargs)
         return self.extract_cellset_cellcount(cellset_id, delete_cellset=True, sandbox_name=sandbox_name, **kwargs)
 
+    def get_cube_state(self, cube_name: str, sandbox_name: str = None, **kwargs) -> Tuple[str, str]:
+        """Timestamps of the last data update and the last schema update of a cube.
+        Cheap to retrieve. Used to validate cached MDX results
+
+        :param cube_name: name of the cube
+        :param sandbox_name: str
+        :return: LastDataUpdate, LastSchemaUpdate
+        """
+        url = format_url("/Cubes('{}')?$select=LastDataUpdate,LastSchemaUpdate", cube_name)
+        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
+        cube = self._rest.GET(url=url, **kwargs).json()
+        return cube.get("LastDataUpdate"), cube.get("LastSchemaUpdate")
+
     def execute_view_elements_value_dict(
         self,
         cube_name: str,
@@ -3220,6 +4164,7 @@ class CellService(ObjectService):
         shaped: bool = False,
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers: bool = False,
+        use_arrow_csv: bool = False,
         **kwargs,
     ) -> "pd.DataFrame":
         """Optimized for performance. Get Pandas DataFrame from an existing Cube View
@@ -3249,8 +4194,13 @@ class CellService(ObjectService):
          Allows function to skip retrieval of cellset composition in use_blob mode.
          E.g.: axes=(["Year"], ["Region","Product"], ["Period", "Version"])
          :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param use_arrow_csv: parse the csv with the multithreaded pyarrow csv reader into an Arrow backed
+        DataFrame. Requires pyarrow. Arguments for pandas.read_csv are ignored
         :return: Pandas Dataframe
         """
+        if use_arrow_csv and shaped:
+            raise ValueError("'use_arrow_csv' must not be used in conjunction with 'shaped'")
+
         # necessary to assure column order in line with cube view
         if shaped:
             skip_zeros = False
@@ -3271,9 +4221,10 @@ class CellService(ObjectService):
                 use_blob=True,
                 arranged_axes=arranged_axes,
                 mdx_headers=mdx_headers,
+                decode=not use_arrow_csv,
                 **kwargs,
             )
-            return build_dataframe_from_csv(raw_csv, sep="~", shaped=shaped, **kwargs)
+            return build_dataframe_from_csv(raw_csv, sep="~", shaped=shaped, use_arrow=use_arrow_csv, **kwargs)
 
         cellset_id = self.create_cellset_from_view(
             cube_name=cube_name, view_name=view_name, private=private, sandbox_name=sandbox_name, **kwargs
@@ -3289,6 +4240,7 @@ class CellService(ObjectService):
             use_iterative_json=use_iterative_json,
             shaped=shaped,
             mdx_headers=mdx_headers,
+            use_arrow_csv=use_arrow_csv,
             **kwargs,
         )
 
@@ -3619,6 +4571,7 @@ class CellService(ObjectService):
         skip_rule_derived_cells: bool = False,
         sandbox_name: str = None,
         include_hierarchies: bool = False,
+        stream: bool = False,
         **kwargs,
     ) -> Response:
         """Extract full cellset data and return the raw data from TM1
@@ -3635,12 +4588,45 @@ class CellService(ObjectService):
         :param skip_rule_derived_cells: skip rule derived cells in cellset
         :param sandbox_name: str
         :param include_hierarchies: retrieve Hierarchies property on Axes
+        :param stream: don't download the response body immediately. Caller must consume and close the response.
         :return: Raw format from TM1.
         """
-        if not cell_properties:
-            cell_properties = ["Value"]
-
-        if skip_rule_derived_cells:
+        url = self._build_extract_cellset_raw_url(
+            cellset_id,
+            cell_properties,
+            elem_properties,
+            member_properties,
+            top,
+            skip,
+            skip_contexts,
+            skip_zeros,
+            skip_consolidated_cells,
+            skip_rule_derived_cells,
+            sandbox_name,
+            include_hierarchies,
+        )
+        response = self._rest.GET(url=url, stream=stream, **kwargs)
+        return response
+
+    @staticmethod
+    def _build_extract_cellset_raw_url(
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_hierarchies: bool = False,
+    ) -> str:
+        if not cell_properties:
+            cell_properties = ["Value"]
+
+        if skip_rule_derived_cells:
             cell_properties.append("RuleDerived")
             # necessary due to bug in TM1 11.8: If only RuleDerived is retrieved it occasionally produces wrong results
             cell_properties.append("Updateable")
@@ -3705,9 +4691,7 @@ class CellService(ObjectService):
                 filter_cells=f";$filter={filter_cells}" if filter_cells else "",
             )
         )
-        url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-        return response
+        return add_url_parameters(url, **{"!sandbox": sandbox_name})
 
     @tidy_cellset
     def extract_cellset_raw(
@@ -3761,7 +4745,8 @@ class CellService(ObjectService):
                 **kwargs,
             )
 
-            return cellset_response.json()
+            with self._rest.instrumentation.measure("json"):
+                return cellset_response.json()
 
         metadata = self.extract_cellset_metadata_raw(
             cellset_id=cellset_id,
@@ -3790,6 +4775,59 @@ class CellService(ObjectService):
         # Combine metadata and cells back into a single object
         return {**metadata, **cells}
 
+    @tidy_cellset
+    def extract_cellset_struct(
+        self,
+        cellset_id: str,
+        cell_properties: Iterable[str] = None,
+        elem_properties: Iterable[str] = None,
+        member_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        skip_contexts: bool = False,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_hierarchies: bool = False,
+        **kwargs,
+    ) -> "Cellset":
+        """Extract full cellset data and decode it into typed records.
+        With msgspec installed, the records are built while parsing, without intermediate dicts.
+
+        :param cellset_id: String; ID of existing cellset
+        :param cell_properties: List of properties to be queried from cells. E.g. ['Value', 'RuleDerived', ...]
+        :param elem_properties: List of properties to be queried from elements. E.g. ['UniqueName','Attributes', ...]
+        :param member_properties: List properties to be queried from the member. E.g. ['Name', 'UniqueName']
+        :param top: Integer limiting the number of cells and the number or rows returned
+        :param skip: Integer limiting the number of cells and the number or rows returned
+        :param skip_contexts:
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_hierarchies: retrieve Hierarchies property on Axes
+        :return: Cellset with Axes, Tuples, Members and Cells as attributes
+        """
+        cellset_response = self.extract_cellset_raw_response(
+            cellset_id,
+            cell_properties,
+            elem_properties,
+            member_properties,
+            top,
+            skip,
+            skip_contexts,
+            skip_zeros,
+            skip_consolidated_cells,
+            skip_rule_derived_cells,
+            sandbox_name,
+            include_hierarchies,
+            **kwargs,
+        )
+
+        with self._rest.instrumentation.measure("json"):
+            return self._rest.json_decoder.decode_cellset(cellset_response.content)
+
     @tidy_cellset
     def extract_cellset_metadata_raw(
         self,
@@ -4160,6 +5198,233 @@ class CellService(ObjectService):
 
         return cells
 
+    def extract_cellset_cells_partitioned(
+        self,
+        cellset_id: str,
+        cells_per_request: int = 100_000,
+        max_workers: int = 8,
+        cell_properties: Iterable[str] = None,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        retries: int = 3,
+        mdx: str = None,
+        pool: "TM1ServicePool" = None,
+        **kwargs,
+    ) -> List[Dict]:
+        """Extract cells in partitions of `cells_per_request` cells on a bounded pool of threads.
+        Partitions are planned from the cell count of the cellset and retried individually on failure.
+
+        When cells are filtered (e.g. skip_zeros) partitions are planned on the unfiltered cell count,
+        so trailing partitions may be empty.
+
+        Cellsets are bound to the session that created them. With a `pool` every leased session creates its own
+        cellset from `mdx` and extracts its partitions from it.
+
+        :param cellset_id: String; ID of existing cellset
+        :param cells_per_request: Int, target number of cells per request
+        :param max_workers: Int, max number of requests to run in parallel
+        :param cell_properties: properties to be queried from the cells. E.g. Value, RuleDerived, ...
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param retries: Int, number of retries per partition on timeouts, connection errors and server errors
+        :param mdx: MDX of the cellset. Required if `pool` is provided
+        :param pool: optional TM1ServicePool to extract partitions on separate TM1 sessions
+        :return: List of cells in ordinal order
+        """
+        if cells_per_request < 1:
+            raise ValueError("'cells_per_request' must be greater than 0")
+        if pool is not None and not mdx:
+            raise ValueError("'mdx' must be provided in conjunction with 'pool'")
+
+        cell_properties = list(cell_properties) if cell_properties else ["Value"]
+        if "Ordinal" not in cell_properties:
+            cell_properties.append("Ordinal")
+
+        partitions = self._plan_cellset_partitions(cellset_id, cells_per_request, top, skip, sandbox_name)
+
+        def _extract_partition(
+            partition: Tuple[int, int], cell_service: "CellService" = self, partition_cellset_id: str = cellset_id
+        ) -> List[Dict]:
+            return cell_service._extract_cellset_partition(
+                partition_cellset_id,
+                partition,
+                cell_properties=cell_properties,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                retries=retries,
+                **kwargs,
+            )
+
+        if len(partitions) < 2 or max_workers < 2:
+            return [cell for partition in partitions for cell in _extract_partition(partition)]
+
+        if pool is not None:
+            results = [None] * len(partitions)
+            pending = iter(enumerate(partitions))
+            lock = threading.Lock()
+
+            def _extract_partitions_on_leased_session():
+                with pool.lease() as tm1:
+                    session_cellset_id = tm1.cells.create_cellset(mdx=mdx, sandbox_name=sandbox_name, **kwargs)
+                    try:
+                        while True:
+                            with lock:
+                                index, partition = next(pending, (None, None))
+                            if index is None:
+                                return
+                            results[index] = _extract_partition(partition, tm1.cells, session_cellset_id)
+                    finally:
+                        tm1.cells.delete_cellset(cellset_id=session_cellset_id, sandbox_name=sandbox_name)
+
+            workers = min(max_workers, len(partitions), pool.size)
+            with ThreadPoolExecutor(workers) as executor:
+                futures = [executor.submit(_extract_partitions_on_leased_session) for _ in range(workers)]
+                for future in futures:
+                    future.result()
+            return [cell for cells in results for cell in cells]
+
+        # executor.map returns results in order of partitions, which is the ordinal order
+        with ThreadPoolExecutor(min(max_workers, len(partitions))) as executor:
+            return [cell for cells in executor.map(_extract_partition, partitions) for cell in cells]
+
+    def _plan_cellset_partitions(
+        self, cellset_id: str, cells_per_request: int, top: int = None, skip: int = None, sandbox_name: str = None
+    ) -> List[Tuple[int, int]]:
+        """Split the cells of the cellset into partitions of `cells_per_request` cells
+
+        :return: list of (skip, top) per partition
+        """
+        cellcount = self.extract_cellset_cellcount(cellset_id, sandbox_name=sandbox_name, delete_cellset=False)
+        start = skip or 0
+        end = min(cellcount, start + top) if top else cellcount
+        return [
+            (partition_skip, min(cells_per_request, end - partition_skip))
+            for partition_skip in range(start, end, cells_per_request)
+        ]
+
+    def _extract_cellset_partition(
+        self,
+        cellset_id: str,
+        partition: Tuple[int, int],
+        cell_properties: List[str],
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        retries: int = 3,
+        **kwargs,
+    ) -> List[Dict]:
+        """Extract the cells of one partition. Retried on timeouts, connection errors and server errors"""
+        partition_skip, partition_top = partition
+        for attempt in range(retries + 1):
+            try:
+                return self.extract_cellset_cells_raw(
+                    cellset_id,
+                    # list is altered in extract_cellset_cells_raw
+                    cell_properties=list(cell_properties),
+                    top=partition_top,
+                    skip=partition_skip,
+                    skip_zeros=skip_zeros,
+                    skip_consolidated_cells=skip_consolidated_cells,
+                    skip_rule_derived_cells=skip_rule_derived_cells,
+                    sandbox_name=sandbox_name,
+                    **kwargs,
+                )["Cells"]
+            except (TM1pyTimeout, ConnectionError, TM1pyRestException) as e:
+                if isinstance(e, TM1pyRestException) and e.status_code < 500:
+                    raise e
+                if attempt < retries:
+                    time.sleep(2**attempt)  # Exponential backoff
+                else:
+                    raise e
+
+    def _iter_cellset_partitions(
+        self, cellset_id: str, partitions: List[Tuple[int, int]], max_workers: int = 1, **kwargs
+    ) -> Generator[List[Dict], None, None]:
+        """Yield the cells of the partitions in ordinal order.
+        With `max_workers` > 1 the next partitions are retrieved while the current one is consumed.
+        At most `max_workers` partitions are retrieved ahead, which bounds the memory consumption.
+        """
+        if max_workers < 2 or len(partitions) < 2:
+            for partition in partitions:
+                yield self._extract_cellset_partition(cellset_id, partition, **kwargs)
+            return
+
+        with ThreadPoolExecutor(min(max_workers, len(partitions))) as executor:
+            futures = deque()
+            try:
+                for partition in partitions:
+                    futures.append(executor.submit(self._extract_cellset_partition, cellset_id, partition, **kwargs))
+                    if len(futures) >= max_workers:
+                        yield futures.popleft().result()
+                while futures:
+                    yield futures.popleft().result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @tidy_cellset
+    def _extract_cellset_raw_partitioned(
+        self,
+        cellset_id: str,
+        cells_per_request: int,
+        max_workers: int,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        member_properties: Iterable[str] = None,
+        **kwargs,
+    ) -> Dict:
+        """Retrieve axes and cells of the cellset in the format of `extract_cellset_raw`.
+        Cells are retrieved in partitions on parallel threads.
+        """
+        kwargs.pop("delete_cellset", None)
+
+        with ThreadPoolExecutor(1) as executor:
+            # retrieve axes while cells are retrieved. Cellset is deleted by tidy_cellset once both are done
+            metadata = executor.submit(
+                self.extract_cellset_metadata_raw,
+                cellset_id=cellset_id,
+                elem_properties=["Name"],
+                member_properties=member_properties,
+                top=top,
+                skip=skip,
+                skip_contexts=True,
+                sandbox_name=sandbox_name,
+                delete_cellset=False,
+                **kwargs,
+            )
+            cells = self.extract_cellset_cells_partitioned(
+                cellset_id,
+                cells_per_request=cells_per_request,
+                max_workers=max_workers,
+                cell_properties=["Value", "Ordinal"],
+                top=top,
+                skip=skip,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                **kwargs,
+            )
+
+            cellset_dict = metadata.result()
+        cellset_dict["Cells"] = cells
+        return cellset_dict
+
     @tidy_cellset
     def extract_cellset_cube_with_dimensions(self, cellset_id: str, **kwargs):
         url = format_url(
@@ -4192,7 +5457,24 @@ class CellService(ObjectService):
         :param skip_rule_derived_cells: bool
         :return: Raw format from TM1.
         """
+        url = self._build_extract_cellset_values_url(
+            cellset_id, sandbox_name, skip_zeros, skip_consolidated_cells, skip_rule_derived_cells
+        )
+        response = self._rest.GET(url=url, **kwargs)
 
+        if not use_compact_json:
+            return [cell["Value"] for cell in response.json()["Cells"]]
+
+        return response.json()
+
+    @staticmethod
+    def _build_extract_cellset_values_url(
+        cellset_id: str,
+        sandbox_name: str = None,
+        skip_zeros: bool = False,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+    ) -> str:
         filter_cells = ""
         if skip_zeros or skip_consolidated_cells or skip_rule_derived_cells:
             filters = []
@@ -4212,12 +5494,7 @@ class CellService(ObjectService):
         )
         if sandbox_name:
             url = add_url_parameters(url, **{"!sandbox": sandbox_name})
-        response = self._rest.GET(url=url, **kwargs)
-
-        if not use_compact_json:
-            return [cell["Value"] for cell in response.json()["Cells"]]
-
-        return response.json()
+        return url
 
     @tidy_cellset
     def extract_cellset_rows_and_values(
@@ -4283,7 +5560,10 @@ class CellService(ObjectService):
 
         url = add_url_parameters(url, **{"!sandbox": sandbox_name})
         response = self._rest.GET(url=url, **kwargs)
-        response_json = response.json()
+        return self._build_cellset_composition(response.json())
+
+    @staticmethod
+    def _build_cellset_composition(response_json: Dict) -> Tuple[str, List[str], List[str], List[str]]:
         cube = response_json["Cube"]["Name"]
 
         rows, titles, columns = [], [], []
@@ -4329,6 +5609,8 @@ class CellService(ObjectService):
         use_compact_json: bool = False,
         include_headers: bool = True,
         mdx_headers: bool = False,
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
         **kwargs,
     ) -> str:
         """Execute cellset and return only the 'Content', in csv format
@@ -4348,28 +5630,22 @@ class CellService(ObjectService):
         :param use_compact_json: boolean
         :param include_headers: boolean
         :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+        :param max_workers: Int, if > 1 cells are retrieved in partitions on parallel threads
+        :param cells_per_request: Int, target number of cells per partition. Only applies if max_workers > 1
         :return: Raw format from TM1.
         """
-        delete_cellset = kwargs.pop("delete_cellset", True)
-
-        cube, _, rows, columns = self.extract_cellset_composition(
-            cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
-        )
-
-        cellset_dict = self.extract_cellset_raw(
+        rows, columns, cellset_dict = self._extract_cellset_dict_and_composition(
             cellset_id,
-            cell_properties=["Value"],
             top=top,
             skip=skip,
-            skip_contexts=True,
             skip_zeros=skip_zeros,
             skip_consolidated_cells=skip_consolidated_cells,
             skip_rule_derived_cells=skip_rule_derived_cells,
-            delete_cellset=delete_cellset,
             sandbox_name=sandbox_name,
-            elem_properties=["Name"],
-            member_properties=["Name", "Attributes"] if include_attributes else None,
+            include_attributes=include_attributes,
             use_compact_json=use_compact_json,
+            max_workers=max_workers,
+            cells_per_request=cells_per_request,
             **kwargs,
         )
 
@@ -4386,6 +5662,69 @@ class CellService(ObjectService):
             mdx_headers=mdx_headers,
         )
 
+    def _extract_cellset_dict_and_composition(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        use_compact_json: bool = False,
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
+        **kwargs,
+    ) -> Tuple[List[str], List[str], Dict]:
+        """Retrieve row and column hierarchies and the raw cellset (without context axis) in one go
+
+        :return: row hierarchies, column hierarchies, raw cellset
+        """
+        delete_cellset = kwargs.pop("delete_cellset", True)
+
+        cube, _, rows, columns = self.extract_cellset_composition(
+            cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
+        )
+
+        if max_workers > 1:
+            if use_compact_json:
+                raise ValueError("'use_compact_json' must not be used in conjunction with 'max_workers' > 1")
+
+            cellset_dict = self._extract_cellset_raw_partitioned(
+                cellset_id,
+                cells_per_request=cells_per_request,
+                max_workers=max_workers,
+                top=top,
+                skip=skip,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                delete_cellset=delete_cellset,
+                sandbox_name=sandbox_name,
+                member_properties=["Name", "Attributes"] if include_attributes else None,
+                **kwargs,
+            )
+            return rows, columns, cellset_dict
+
+        cellset_dict = self.extract_cellset_raw(
+            cellset_id,
+            cell_properties=["Value"],
+            top=top,
+            skip=skip,
+            skip_contexts=True,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            delete_cellset=delete_cellset,
+            sandbox_name=sandbox_name,
+            elem_properties=["Name"],
+            member_properties=["Name", "Attributes"] if include_attributes else None,
+            use_compact_json=use_compact_json,
+            **kwargs,
+        )
+        return rows, columns, cellset_dict
+
     def extract_cellset_csv_iter_json(
         self,
         cellset_id: str,
@@ -4419,145 +5758,254 @@ class CellService(ObjectService):
         :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
         :return: Raw format from TM1.
         """
-        cube, _, rows, columns = self.extract_cellset_composition(
-            cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
-        )
+        if csv_dialect is None:
+            csv.register_dialect("TM1py", delimiter=value_separator, lineterminator=line_separator)
+            csv_dialect = csv.get_dialect("TM1py")
 
-        cellset_response = self.extract_cellset_raw_response(
+        rows = self.extract_cellset_iter_rows(
             cellset_id,
-            cell_properties=["Value", "Ordinal"],
             top=top,
             skip=skip,
-            skip_contexts=True,
             skip_zeros=skip_zeros,
             skip_consolidated_cells=skip_consolidated_cells,
             skip_rule_derived_cells=skip_rule_derived_cells,
-            delete_cellset=True,
             sandbox_name=sandbox_name,
-            member_properties=["Name", "Attributes"] if include_attributes else ["Name"],
+            include_attributes=include_attributes,
+            include_headers=True,
+            mdx_headers=mdx_headers,
             **kwargs,
         )
 
-        if not mdx_headers:
-            row_headers = list(dimension_names_from_element_unique_names(rows))
-            column_headers = list(dimension_names_from_element_unique_names(columns))
-        else:
-            row_headers = rows
-            column_headers = columns
+        # comply with prior implementations: return empty string when cellset is empty
+        header = next(rows, None)
+        if header is None:
+            return ""
 
-        if csv_dialect is None:
-            csv.register_dialect("TM1py", delimiter=value_separator, lineterminator=line_separator)
-            csv_dialect = csv.get_dialect("TM1py")
-
-        # start parsing of JSON directly into CSV
-        axes0_list = []
-        axes1_list = []
-        current_axes = 0
-        current_tuple = 0
-        current_cell_ordinal = 0
+        csv_header = StringIO()
+        csv.writer(csv_header, dialect=csv_dialect).writerow(header)
         csv_body = StringIO()
-        csv_writer = csv.writer(csv_body, dialect=csv_dialect)
-        # handle potential imbalance between number of headers and entries in row
-        max_entries_per_row = 0
-        least_entries_per_row = 1_000
-
-        parser = ijson.parse(cellset_response.content)
-        prefixes_of_interest = [
-            "Cells.item.Value",
-            "Axes.item.Tuples.item.Members.item.Name",
-            "Cells.item.Ordinal",
-            "Axes.item.Tuples.item.Ordinal",
-            "Cube.Dimensions.item.Name",
-            "Axes.item.Ordinal",
-        ]
+        csv.writer(csv_body, dialect=csv_dialect).writerows(rows)
 
-        attributes_prefixes = set()
-        attributes_by_dimension = None
-        if include_attributes:
-            attributes_by_dimension = self._get_attributes_by_dimension(cube)
-            for _, attributes in attributes_by_dimension.items():
-                for attribute in attributes:
-                    prefix = f"Axes.item.Tuples.item.Members.item.Attributes.{attribute}"
-                    prefixes_of_interest.append(prefix)
-                    attributes_prefixes.add(prefix)
-
-        gen = ((prefix, event, value) for prefix, event, value in parser if prefix in prefixes_of_interest)
-        for prefix, event, value in gen:
-            if prefix == "Cells.item.Value":
-                q, r = divmod(current_cell_ordinal, len(axes0_list))
-                axes0_index = r
-                axes1_index = q
-                if len(axes0_list) == 1 and len(axes0_list[0]) == 0:
-                    row = axes1_list[axes1_index] + [str(value)]
-                # case of no row selection
-                elif len(axes1_list) == 0:
-                    row = axes0_list[axes0_index] + [str(value)]
-                else:
-                    row = axes1_list[axes1_index] + axes0_list[axes0_index] + [str(value)]
-
-                if len(row) > max_entries_per_row:
-                    max_entries_per_row = len(row)
-                if len(row) < least_entries_per_row:
-                    least_entries_per_row = len(row)
+        return csv_header.getvalue() + csv_body.getvalue().strip()
 
-                csv_writer.writerow(row)
+    def extract_cellset_iter_rows(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        include_headers: bool = True,
+        mdx_headers: bool = False,
+        batch_size: int = None,
+        chunk_size: int = 65_536,
+        **kwargs,
+    ) -> Generator[List, None, None]:
+        """Stream cellset from TM1 and yield its content row by row.
 
-            elif (prefix, event) == ("Axes.item.Tuples.item.Members.item.Name", "string"):
-                if current_axes == 0:
-                    axes0_list[current_tuple].append(value)
-                else:
-                    axes1_list[current_tuple].append(value)
+        The response is parsed incrementally while it is read from the socket.
+        Only the axes are held in memory, cells are yielded as soon as they arrive.
+        Cellset is deleted once the generator is exhausted or closed.
 
-            if prefix in attributes_prefixes:
-                if event not in ("string", "number"):
-                    continue
+        :param cellset_id: String; ID of existing cellset
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param include_headers: yield header row first
+        :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+        :param batch_size: if provided, yield lists of up to batch_size rows instead of individual rows
+        :param chunk_size: number of bytes to read from the socket at once
+        :return: generator of rows: [element, ..., element, value]
+        """
+        rows = self._iter_cellset_rows(
+            cellset_id=cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            include_headers=include_headers,
+            mdx_headers=mdx_headers,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+        if not batch_size:
+            return rows
 
-                attribute_name = prefix.split(".")[-1]
-                value = str(value)
+        return self._batch_rows(rows, batch_size)
 
-                if current_axes == 0:
-                    axes0_list[current_tuple].append(value)
-                else:
-                    axes1_list[current_tuple].append(value)
+    @staticmethod
+    def _batch_rows(rows: Iterable[List], batch_size: int) -> Generator[List[List], None, None]:
+        rows = iter(rows)
+        batch = list(itertools.islice(rows, batch_size))
+        while batch:
+            yield batch
+            batch = list(itertools.islice(rows, batch_size))
+
+    def _iter_cellset_rows(
+        self,
+        cellset_id: str,
+        top: int,
+        skip: int,
+        skip_zeros: bool,
+        skip_consolidated_cells: bool,
+        skip_rule_derived_cells: bool,
+        sandbox_name: str,
+        include_attributes: bool,
+        include_headers: bool,
+        mdx_headers: bool,
+        chunk_size: int,
+        **kwargs,
+    ) -> Generator[List, None, None]:
+        delete_cellset = kwargs.pop("delete_cellset", True)
+        try:
+            cube, _, rows, columns = self.extract_cellset_composition(
+                cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
+            )
 
-                # Add header entry for attribute if necessary
-                if current_tuple == 0:
-                    if current_axes == 0:
-                        column_headers.insert(len(axes0_list[current_tuple]) - 1, attribute_name)
-                    else:
-                        row_headers.insert(len(axes1_list[current_tuple]) - 1, attribute_name)
+            if not mdx_headers:
+                row_headers = list(dimension_names_from_element_unique_names(rows))
+                column_headers = list(dimension_names_from_element_unique_names(columns))
+            else:
+                row_headers = list(rows)
+                column_headers = list(columns)
+
+            prefixes_of_interest = {
+                "Cells.item",
+                "Cells.item.Value",
+                "Cells.item.Ordinal",
+                "Axes.item.Ordinal",
+                "Axes.item.Tuples.item.Ordinal",
+                "Axes.item.Tuples.item.Members.item.Name",
+            }
+            attributes_prefixes = set()
+            if include_attributes:
+                for _, attributes in self._get_attributes_by_dimension(cube).items():
+                    for attribute in attributes:
+                        attributes_prefixes.add(f"Axes.item.Tuples.item.Members.item.Attributes.{attribute}")
+                prefixes_of_interest.update(attributes_prefixes)
 
-            elif (prefix, event) == ("Cells.item.Ordinal", "number"):
-                current_cell_ordinal = value
+            response = self.extract_cellset_raw_response(
+                cellset_id,
+                cell_properties=["Value", "Ordinal"],
+                top=top,
+                skip=skip,
+                skip_contexts=True,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                member_properties=["Name", "Attributes"] if include_attributes else ["Name"],
+                stream=True,
+                **kwargs,
+            )
 
-            elif (prefix, event) == ("Axes.item.Tuples.item.Ordinal", "number"):
-                current_tuple = value
-                if current_axes == 0:
-                    axes0_list.append(list())
-                else:
-                    axes1_list.append(list())
+            try:
+                axes0_list = []
+                axes1_list = []
+                current_axes = 0
+                current_tuple = 0
+                cell_ordinal = None
+                cell_value = None
+                cell_counter = 0
+                header_pending = include_headers
+
+                parser = ijson.parse(_ResponseReader(response, chunk_size))
+                for prefix, event, value in parser:
+                    if prefix not in prefixes_of_interest:
+                        continue
+
+                    if prefix == "Cells.item":
+                        if event == "start_map":
+                            cell_ordinal, cell_value = None, None
+                            continue
+                        if event != "end_map":
+                            continue
+
+                        if cell_ordinal is None:
+                            cell_ordinal = cell_counter + (skip or 0)
+                        cell_counter += 1
+
+                        axes1_index, axes0_index = divmod(cell_ordinal, len(axes0_list))
+                        if len(axes0_list) == 1 and len(axes0_list[0]) == 0:
+                            row = axes1_list[axes1_index] + [str(cell_value)]
+                        # case of no row selection
+                        elif len(axes1_list) == 0:
+                            row = axes0_list[axes0_index] + [str(cell_value)]
+                        else:
+                            row = axes1_list[axes1_index] + axes0_list[axes0_index] + [str(cell_value)]
+
+                        # headers are complete once the axes are parsed and the first cell arrives
+                        if include_attributes and len(row) != len(row_headers) + len(column_headers) + 1:
+                            raise ValueError(
+                                "Invalid response. With 'include_attributes' as True,"
+                                " Attributes must be requested explicitly as PROPERTIES in the MDX"
+                            )
+                        if header_pending:
+                            header_pending = False
+                            yield row_headers + column_headers + ["Value"]
+                        yield row
+
+                    elif prefix == "Cells.item.Value":
+                        cell_value = value
+
+                    elif prefix == "Cells.item.Ordinal":
+                        cell_ordinal = value
+
+                    elif prefix == "Axes.item.Tuples.item.Members.item.Name":
+                        if current_axes == 0:
+                            axes0_list[current_tuple].append(value)
+                        else:
+                            axes1_list[current_tuple].append(value)
 
-            elif (prefix, event) == ("Axes.item.Ordinal", "number"):
-                current_axes = value
+                    elif prefix in attributes_prefixes:
+                        if event not in ("string", "number"):
+                            continue
 
-        # comply with prior implementations: return empty string when cellset is empty
-        if csv_body.getvalue() == "":
-            return ""
+                        value = str(value)
+                        if current_axes == 0:
+                            axes0_list[current_tuple].append(value)
+                        else:
+                            axes1_list[current_tuple].append(value)
+
+                        # Add header entry for attribute if necessary
+                        if current_tuple == 0:
+                            attribute_name = prefix.split(".")[-1]
+                            if current_axes == 0:
+                                column_headers.insert(len(axes0_list[current_tuple]) - 1, attribute_name)
+                            else:
+                                row_headers.insert(len(axes1_list[current_tuple]) - 1, attribute_name)
+
+                    elif prefix == "Axes.item.Tuples.item.Ordinal":
+                        current_tuple = value
+                        if current_axes == 0:
+                            axes0_list.append(list())
+                        else:
+                            axes1_list.append(list())
 
-        # prepare header
-        if include_attributes:
-            if not least_entries_per_row == max_entries_per_row == len(row_headers) + len(column_headers) + 1:
-                raise ValueError(
-                    "Invalid response. With 'include_attributes' as True,"
-                    " Attributes must be requested explicitly as PROPERTIES in the MDX"
-                )
+                    elif prefix == "Axes.item.Ordinal":
+                        current_axes = value
 
-        csv_header = StringIO()
-        csv_header_writer = csv.writer(csv_header, dialect=csv_dialect)
-        csv_header_writer.writerow(row_headers + column_headers + ["Value"])
+            finally:
+                response.close()
 
-        cellset_response.close()
-        return csv_header.getvalue() + csv_body.getvalue().strip()
+        finally:
+            if delete_cellset:
+                try:
+                    self.delete_cellset(cellset_id=cellset_id, sandbox_name=sandbox_name)
+                except TM1pyRestException as ex:
+                    # Fail silently if cellset is already removed
+                    if not ex.status_code == 404:
+                        raise ex
 
     @require_pandas
     def extract_cellset_dataframe(
@@ -4578,6 +6026,10 @@ class CellService(ObjectService):
         fillna_numeric_attributes_value: Any = 0,
         fillna_string_attributes: bool = False,
         fillna_string_attributes_value: Any = "",
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
+        use_columnar: bool = False,
+        use_arrow_csv: bool = False,
         **kwargs,
     ) -> "pd.DataFrame":
         """Build pandas data frame from cellset_id
@@ -4593,11 +6045,50 @@ class CellService(ObjectService):
         :param use_iterative_json: use iterative json parsing to reduce memory consumption significantly.
         Comes at a cost of 3-5% performance.
         :param use_compact_json: bool
+        :param max_workers: Int, if > 1 cells are retrieved in partitions on parallel threads
+        :param cells_per_request: Int, target number of cells per partition. Only applies if max_workers > 1
+        :param use_columnar: build data frame directly from the cellset with categorical dimension columns,
+        instead of going through csv
+        :param use_arrow_csv: parse the csv with the multithreaded pyarrow csv reader into an Arrow backed
+        DataFrame. Requires pyarrow. Arguments for pandas.read_csv are ignored
         :param kwargs:
         :return:
         """
         if use_iterative_json and use_compact_json:
             raise ValueError("Iterative JSON parsing must not be used together with compact JSON")
+        if use_iterative_json and max_workers > 1:
+            raise ValueError("Iterative JSON parsing must not be used together with 'max_workers' > 1")
+        if use_arrow_csv and (shaped or use_columnar):
+            raise ValueError("'use_arrow_csv' must not be used in conjunction with 'shaped' or 'use_columnar'")
+
+        if use_columnar:
+            if any([use_iterative_json, shaped, fillna_numeric_attributes, fillna_string_attributes]):
+                raise ValueError(
+                    "'use_columnar' must not be used in conjunction with 'use_iterative_json', 'shaped' or fillna"
+                )
+
+            rows, columns, cellset_dict = self._extract_cellset_dict_and_composition(
+                cellset_id,
+                top=top,
+                skip=skip,
+                skip_zeros=skip_zeros,
+                skip_consolidated_cells=skip_consolidated_cells,
+                skip_rule_derived_cells=skip_rule_derived_cells,
+                sandbox_name=sandbox_name,
+                include_attributes=include_attributes,
+                use_compact_json=use_compact_json,
+                max_workers=max_workers,
+                cells_per_request=cells_per_request,
+                **kwargs,
+            )
+            return build_dataframe_from_cellset_dict(
+                row_dimensions=rows,
+                column_dimensions=columns,
+                raw_cellset_as_dict=cellset_dict,
+                top=top,
+                include_attributes=include_attributes,
+                mdx_headers=mdx_headers,
+            )
 
         if use_iterative_json:
             raw_csv = self.extract_cellset_csv_iter_json(
@@ -4626,13 +6117,15 @@ class CellService(ObjectService):
                 include_attributes=include_attributes,
                 use_compact_json=use_compact_json,
                 mdx_headers=mdx_headers,
+                max_workers=max_workers,
+                cells_per_request=cells_per_request,
                 # dont delete cellset if attribute types must be retrieved later
-                delete_cellset=not any([fillna_string_attributes, fillna_string_attributes]),
+                delete_cellset=not any([fillna_numeric_attributes, fillna_string_attributes]),
                 **kwargs,
             )
 
         attribute_types_by_dimension = None
-        if fillna_string_attributes or fillna_string_attributes:
+        if fillna_numeric_attributes or fillna_string_attributes:
             attribute_types_by_dimension = self._extract_attribute_types_by_dimension(
                 cellset_id=cellset_id, sandbox_name=sandbox_name, delete_cellset=True, **kwargs
             )
@@ -4646,9 +6139,272 @@ class CellService(ObjectService):
             fillna_numeric_attributes_value=fillna_numeric_attributes_value,
             fillna_string_attributes_value=fillna_string_attributes_value,
             attribute_types_by_dimension=attribute_types_by_dimension,
+            use_arrow=use_arrow_csv,
+            **kwargs,
+        )
+
+    @require_pyarrow
+    def extract_cellset_arrow(
+        self,
+        cellset_id: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        max_workers: int = 1,
+        cells_per_request: int = 100_000,
+        **kwargs,
+    ) -> "pa.Table":
+        """Build Arrow Table from cellset_id. Dimension columns are dictionary encoded.
+
+        :param cellset_id:
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param max_workers: Int, if > 1 cells are retrieved in partitions on parallel threads
+        :param cells_per_request: Int, target number of cells per partition. Only applies if max_workers > 1
+        :return: pyarrow Table
+        """
+        rows, columns, cellset_dict = self._extract_cellset_dict_and_composition(
+            cellset_id,
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            max_workers=max_workers,
+            cells_per_request=cells_per_request,
+            **kwargs,
+        )
+        return build_arrow_table_from_cellset_dict(
+            row_dimensions=rows,
+            column_dimensions=columns,
+            raw_cellset_as_dict=cellset_dict,
+            top=top,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+        )
+
+    @require_pyarrow
+    def extract_cellset_to_parquet(
+        self,
+        cellset_id: str,
+        path: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        cells_per_request: int = 100_000,
+        max_workers: int = 1,
+        value_type: "pa.DataType" = None,
+        compression: Optional[str] = "snappy",
+        **kwargs,
+    ) -> int:
+        """Stream the cells of a cellset into a parquet file. Every partition of cells is written as one row group.
+        Dimension columns are dictionary encoded.
+
+        :param cellset_id: String; ID of existing cellset
+        :param path: path of the parquet file
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param cells_per_request: Int, number of cells per partition. Each partition is written as one row group
+        :param max_workers: Int, if > 1 the next partitions are retrieved on parallel threads while writing.
+        At most `max_workers` partitions are held in memory
+        :param value_type: pa.float64() or pa.string(). Type of the Value column. Default: derived from the first
+        partition. Must be pa.string() if string cells may appear after numeric cells
+        :param compression: compression codec of the parquet file, e.g. 'snappy', 'zstd' or None
+        :return: number of rows written
+        """
+        import pyarrow.parquet as pq
+
+        return self._extract_cellset_to_file(
+            cellset_id,
+            path,
+            lambda file_path, schema: pq.ParquetWriter(file_path, schema, compression=compression),
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            cells_per_request=cells_per_request,
+            max_workers=max_workers,
+            value_type=value_type,
             **kwargs,
         )
 
+    @require_pyarrow
+    def extract_cellset_to_arrow_ipc(
+        self,
+        cellset_id: str,
+        path: str,
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        cells_per_request: int = 100_000,
+        max_workers: int = 1,
+        value_type: "pa.DataType" = None,
+        compression: Optional[str] = None,
+        **kwargs,
+    ) -> int:
+        """Stream the cells of a cellset into an Arrow IPC file (Feather V2).
+        Every partition of cells is written as one record batch. Dimension columns are dictionary encoded.
+
+        :param cellset_id: String; ID of existing cellset
+        :param path: path of the Arrow IPC file
+        :param top: Int, number of cells to return (counting from top)
+        :param skip: Int, number of cells to skip (counting from top)
+        :param skip_zeros: skip zeros in cellset (irrespective of zero suppression in MDX / view)
+        :param skip_consolidated_cells: skip consolidated cells in cellset
+        :param skip_rule_derived_cells: skip rule derived cells in cellset
+        :param sandbox_name: str
+        :param include_attributes: include attribute columns
+        :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param cells_per_request: Int, number of cells per partition. Each partition is written as one record batch
+        :param max_workers: Int, if > 1 the next partitions are retrieved on parallel threads while writing.
+        At most `max_workers` partitions are held in memory
+        :param value_type: pa.float64() or pa.string(). Type of the Value column. Default: derived from the first
+        partition. Must be pa.string() if string cells may appear after numeric cells
+        :param compression: compression codec of the IPC file: 'lz4', 'zstd' or None
+        :return: number of rows written
+        """
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        return self._extract_cellset_to_file(
+            cellset_id,
+            path,
+            lambda file_path, schema: pa.ipc.new_file(file_path, schema, options=options),
+            top=top,
+            skip=skip,
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            cells_per_request=cells_per_request,
+            max_workers=max_workers,
+            value_type=value_type,
+            **kwargs,
+        )
+
+    @tidy_cellset
+    def _extract_cellset_to_file(
+        self,
+        cellset_id: str,
+        path: str,
+        open_writer: Callable[[str, "pa.Schema"], Any],
+        top: int = None,
+        skip: int = None,
+        skip_zeros: bool = True,
+        skip_consolidated_cells: bool = False,
+        skip_rule_derived_cells: bool = False,
+        sandbox_name: str = None,
+        include_attributes: bool = False,
+        mdx_headers: bool = False,
+        cells_per_request: int = 100_000,
+        max_workers: int = 1,
+        value_type: "pa.DataType" = None,
+        **kwargs,
+    ) -> int:
+        """Retrieve the cells of the cellset in partitions and write them as record batches to the writer.
+        The file is written to a temporary path next to `path` and only moved to `path` once it is complete
+
+        :param path: path of the file
+        :param open_writer: function that opens a writer with `write_table` and `close` methods for a path and schema
+        :return: number of rows written
+        """
+        if cells_per_request < 1:
+            raise ValueError("'cells_per_request' must be greater than 0")
+        kwargs.pop("delete_cellset", None)
+
+        _, _, rows, columns = self.extract_cellset_composition(
+            cellset_id, delete_cellset=False, sandbox_name=sandbox_name, **kwargs
+        )
+        metadata = self.extract_cellset_metadata_raw(
+            cellset_id=cellset_id,
+            elem_properties=["Name"],
+            member_properties=["Name", "Attributes"] if include_attributes else None,
+            top=top,
+            skip=skip,
+            skip_contexts=True,
+            sandbox_name=sandbox_name,
+            delete_cellset=False,
+            **kwargs,
+        )
+        partitions = self._iter_cellset_partitions(
+            cellset_id,
+            self._plan_cellset_partitions(cellset_id, cells_per_request, top, skip, sandbox_name),
+            max_workers=max_workers,
+            cell_properties=["Value", "Ordinal"],
+            skip_zeros=skip_zeros,
+            skip_consolidated_cells=skip_consolidated_cells,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            sandbox_name=sandbox_name,
+            **kwargs,
+        )
+        batches = build_arrow_batches_from_cellset_partitions(
+            row_dimensions=rows,
+            column_dimensions=columns,
+            raw_cellset_as_dict=metadata,
+            partitions=partitions,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+            value_type=value_type,
+        )
+
+        writer = None
+        written_rows = 0
+        temporary_path = path + ".tmp"
+        try:
+            try:
+                for batch in batches:
+                    if writer is None:
+                        writer = open_writer(temporary_path, batch.schema)
+                    if batch.num_rows:
+                        writer.write_table(pa.Table.from_batches([batch]))
+                        written_rows += batch.num_rows
+            finally:
+                batches.close()
+                if writer is not None:
+                    writer.close()
+        except BaseException:
+            # a failed extraction must not leave a truncated, yet readable file behind
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        if writer is not None:
+            os.replace(temporary_path, path)
+        return written_rows
+
     def _extract_attribute_types_by_dimension(self, cellset_id: str, sandbox_name: str, delete_cellset: bool, **kwargs):
         attribute_types_by_dimension = {}
 
@@ -5155,6 +6911,7 @@ class CellService(ObjectService):
         quote_character: str = '"',
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers=False,
+        decode: bool = True,
         **kwargs,
     ):
         """Execute existing view and retrieve result as csv, using blobs.
@@ -5177,6 +6934,7 @@ class CellService(ObjectService):
          Allows function to skip retrieval of cellset composition.
          E.g.: axes=(["Year"], ["Region","Product"], ["Period", "Version"])
         :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
+        :param decode: decode the csv to str. If False, the bytes of the blob are returned
 
         """
         file_service, process_service, view_service = self._prepare_blob_services()
@@ -5284,7 +7042,8 @@ class CellService(ObjectService):
             if not success:
                 raise RuntimeError(f"Failed writing to blob with TI. " f"Status: '{status}' log: '{error_log_file}'")
 
-            return file_service.get(file_name).decode("UTF-8-sig")
+            content = file_service.get(file_name)
+            return content.decode("UTF-8-sig") if decode else content
 
         finally:
             with suppress(Exception):
@@ -5309,6 +7068,7 @@ class CellService(ObjectService):
         quote_character='"',
         arranged_axes: Tuple[List, List, List] = None,
         mdx_headers: bool = False,
+        decode: bool = True,
         **kwargs,
     ):
         """Execute MDX and retrieve result as csv, using blobs.
@@ -5328,6 +7088,7 @@ class CellService(ObjectService):
         :param arranged_axes: Tuple
         :param mdx_headers: boolean, fully qualified hierarchy name as header instead of simple dimension name
         :include_headers: include header line in csv result
+        :param decode: decode the csv to str. If False, the bytes of the blob are returned
 
         """
         file_service, process_service, view_service = self._prepare_blob_services()
@@ -5415,7 +7176,8 @@ class CellService(ObjectService):
             if not success:
                 raise RuntimeError(f"Failed writing to blob with TI. " f"Status: '{status}' log: '{error_log_file}'")
 
-            return file_service.get(file_name).decode("UTF-8-sig")
+            content = file_service.get(file_name)
+            return content.decode("UTF-8-sig") if decode else content
 
         finally:
             with suppress(Exception):
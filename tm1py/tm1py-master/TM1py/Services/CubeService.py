@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import json
 import random
-from typing import Dict, Iterable, List, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 from requests import Response
 
@@ -12,6 +12,7 @@ from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.ViewService import ViewService
 from TM1py.Utils import (
+    MetadataCache,
     case_and_space_insensitive_equals,
     format_url,
     require_data_admin,
@@ -102,9 +103,7 @@ class CubeService(ObjectService):
         return int(self._rest.GET(url=format_url("/Cubes/$count"), **kwargs).text)
 
     def get_measure_dimension(self, cube_name: str, **kwargs) -> str:
-        url = format_url("/Cubes('{}')/Dimensions?$select=Name", cube_name)
-        response = self._rest.GET(url, **kwargs)
-        return response.json()["value"][-1]["Name"]
+        return self._get_all_dimension_names(cube_name, **kwargs)[-1]
 
     def update(self, cube: Cube, **kwargs) -> Response:
         """Update existing cube on TM1 Server
@@ -220,13 +219,19 @@ class CubeService(ObjectService):
         :param skip_sandbox_dimension:
         :return:  List : [dim1, dim2, dim3, etc.]
         """
-        url = format_url("/Cubes('{}')/Dimensions?$select=Name", cube_name)
-        response = self._rest.GET(url, **kwargs)
-        dimension_names = [element["Name"] for element in response.json()["value"]]
+        dimension_names = list(self._get_all_dimension_names(cube_name, **kwargs))
         if skip_sandbox_dimension and dimension_names[0] == CellService.SANDBOX_DIMENSION:
             return dimension_names[1:]
         return dimension_names
 
+    def _get_all_dimension_names(self, cube_name: str, **kwargs) -> Tuple[str]:
+        def _load():
+            url = format_url("/Cubes('{}')/Dimensions?$select=Name", cube_name)
+            response = self._rest.GET(url, **kwargs)
+            return tuple(element["Name"] for element in response.json()["value"])
+
+        return self._rest.metadata_cache.get_or_load((MetadataCache.CUBE, cube_name, "dimensions"), _load)
+
     def search_for_dimension(self, dimension_name: str, skip_control_cubes: bool = False, **kwargs) -> List[str]:
         """Ask TM1 Server for list of cube names that contain specific dimension
 
@@ -1,25 +1,16 @@
 # -*- coding: utf-8 -*-
 import csv
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum
 from io import StringIO
-from typing import Dict, Iterable, List, Optional, Tuple, Union
-
-from TM1py import Process, Subset
-
-try:
-    import numpy as np
-    import pandas as pd
-
-    _has_pandas = True
-except ImportError:
-    _has_pandas = False
-
-from collections import OrderedDict
+from typing import Dict, Generator, Iterable, List, Optional, Tuple, Union
 
 from mdxpy import MdxHierarchySet, MdxLevelExpression, Member
 from requests import Response
 
+from TM1py import Process, Subset
 from TM1py.Exceptions.Exceptions import (
     TM1pyException,
     TM1pyRestException,
@@ -35,6 +26,8 @@ from TM1py.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveSet,
     CaseAndSpaceInsensitiveTuplesDict,
+    HierarchyIndex,
+    MetadataCache,
     build_element_unique_names,
     dimension_hierarchy_element_tuple_from_unique_name,
     format_url,
@@ -44,6 +37,13 @@ from TM1py.Utils import (
     require_version,
     verify_version,
 )
+from TM1py.Utils.LazyImport import is_installed, lazy_import
+from TM1py.Utils.Utils import _ResponseReader
+
+ijson = lazy_import("ijson")
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+_has_pandas = is_installed("pandas")
 
 
 class MDXDrillMethod(Enum):
@@ -125,6 +125,8 @@ class ElementService(ObjectService):
                 raise TM1pyException(f"Failed to delete elements through unbound process. Error: '{error_log_file}'")
 
         finally:
+            # unbound processes don't reveal the dimension through their urls
+            self._rest.metadata_cache.invalidate_dimension(dimension_name)
             subset_service.delete(subset_name, dimension_name, hierarchy_name, private=False, **kwargs)
 
     @require_version("11.4")
@@ -167,7 +169,11 @@ class ElementService(ObjectService):
 
         process_service = self._get_process_service()
         process = Process(name=unbound_process_name, prolog_procedure="\r\n".join(statements))
-        success, status, error_log_file = process_service.execute_process_with_return(process, **kwargs)
+        try:
+            success, status, error_log_file = process_service.execute_process_with_return(process, **kwargs)
+        finally:
+            # unbound processes don't reveal the dimension through their urls
+            self._rest.metadata_cache.invalidate_dimension(dimension_name)
         if not success:
             raise TM1pyException(f"Failed to delete edges through unbound process. Error: '{error_log_file}'")
 
@@ -219,6 +225,8 @@ class ElementService(ObjectService):
                     raise TM1pyWriteFailureException([status], [log_file])
 
         finally:
+            # unbound processes don't reveal the dimension through their urls
+            self._rest.metadata_cache.invalidate_dimension(dimension_name)
             if remove_blob:
                 file_service.delete(file_name=file_name)
 
@@ -258,6 +266,238 @@ class ElementService(ObjectService):
         hierarchyupdate_process.metadata_procedure = metadata_statement
         return hierarchyupdate_process
 
+    @require_data_admin
+    @require_ops_admin
+    def add_elements_use_blob(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        elements: Iterable[Element],
+        chunk_size: int = 1_000_000,
+        max_workers: int = 4,
+        remove_blob: bool = True,
+        **kwargs,
+    ):
+        """Add elements through unbound TI processes having uploaded CSV files as data source.
+        Scales to millions of elements, unlike the JSON body of `add_elements`
+
+        :param dimension_name: The name of the dimension.
+        :param hierarchy_name: The name of the hierarchy.
+        :param elements: Elements to add. Existing elements are left untouched
+        :param chunk_size: elements per CSV file and TI process
+        :param max_workers: number of parallel uploads
+        :param remove_blob: A boolean indicating whether to remove the files after use (default: True).
+        :return: None
+        """
+        type_codes = {Element.Types.NUMERIC: "N", Element.Types.STRING: "S", Element.Types.CONSOLIDATED: "C"}
+        rows = [(element.name, type_codes[element.element_type]) for element in elements]
+        statement = (
+            f"HierarchyElementInsert('{self._escape_single_quote(dimension_name)}', "
+            f"'{self._escape_single_quote(hierarchy_name)}', '', vElement, vType);"
+        )
+        self._execute_csv_chunks_through_ti(
+            dimension_name=dimension_name,
+            rows=rows,
+            variables=["vElement", "vType"],
+            metadata_procedure=statement,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            remove_blob=remove_blob,
+            **kwargs,
+        )
+
+    @require_data_admin
+    @require_ops_admin
+    def add_edges_use_blob(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        edges: Dict[Tuple[str, str], float],
+        chunk_size: int = 1_000_000,
+        max_workers: int = 4,
+        remove_blob: bool = True,
+        **kwargs,
+    ):
+        """Add edges through unbound TI processes having uploaded CSV files as data source.
+        Parents and components must exist.
+
+        :param dimension_name: The name of the dimension.
+        :param hierarchy_name: The name of the hierarchy.
+        :param edges: {(parent, component): weight}
+        :param chunk_size: edges per CSV file and TI process
+        :param max_workers: number of parallel uploads
+        :param remove_blob: A boolean indicating whether to remove the files after use (default: True).
+        :return: None
+        """
+        rows = [(parent, component, repr(float(weight))) for (parent, component), weight in edges.items()]
+        statement = (
+            f"HierarchyElementComponentAdd('{self._escape_single_quote(dimension_name)}', "
+            f"'{self._escape_single_quote(hierarchy_name)}', vParent, vComponent, StringToNumber(vWeight));"
+        )
+        self._execute_csv_chunks_through_ti(
+            dimension_name=dimension_name,
+            rows=rows,
+            variables=["vParent", "vComponent", "vWeight"],
+            metadata_procedure=statement,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            remove_blob=remove_blob,
+            **kwargs,
+        )
+
+    @require_data_admin
+    @require_ops_admin
+    def update_attribute_values_use_blob(
+        self,
+        dimension_name: str,
+        hierarchy_name: str,
+        attribute_values: Dict[Tuple[str, str], Union[str, float]],
+        chunk_size: int = 1_000_000,
+        max_workers: int = 4,
+        remove_blob: bool = True,
+        **kwargs,
+    ):
+        """Write attribute values through unbound TI processes having uploaded CSV files as data source.
+        Numeric, string and alias attributes are written with ElementAttrPutN and ElementAttrPutS.
+
+        :param dimension_name: The name of the dimension.
+        :param hierarchy_name: The name of the hierarchy.
+        :param attribute_values: {(element, attribute): value}
+        :param chunk_size: values per CSV file and TI process
+        :param max_workers: number of parallel uploads
+        :param remove_blob: A boolean indicating whether to remove the files after use (default: True).
+        :return: None
+        """
+        rows = [
+            (element, attribute, value.replace("\r", "").replace("\n", "") if isinstance(value, str) else value)
+            for (element, attribute), value in attribute_values.items()
+        ]
+        dimension, hierarchy = self._escape_single_quote(dimension_name), self._escape_single_quote(hierarchy_name)
+        statement = f"""
+        If(DType('}}ElementAttributes_{dimension}', vAttribute) @= 'AN');
+            ElementAttrPutN(StringToNumber(vValue), '{dimension}', '{hierarchy}', vElement, vAttribute);
+        Else;
+            ElementAttrPutS(vValue, '{dimension}', '{hierarchy}', vElement, vAttribute);
+        EndIf;
+        """
+        self._execute_csv_chunks_through_ti(
+            dimension_name=dimension_name,
+            rows=rows,
+            variables=["vElement", "vAttribute", "vValue"],
+            data_procedure=statement,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            remove_blob=remove_blob,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _escape_single_quote(text: str) -> str:
+        return text.replace("'", "''")
+
+    def _execute_csv_chunks_through_ti(
+        self,
+        dimension_name: str,
+        rows: List[Tuple],
+        variables: List[str],
+        metadata_procedure: str = "",
+        data_procedure: str = "",
+        chunk_size: int = 1_000_000,
+        max_workers: int = 4,
+        remove_blob: bool = True,
+        **kwargs,
+    ):
+        """Upload rows as CSV chunks in parallel and load each chunk with an unbound TI process.
+        Processes run one after the other, since they lock the same dimension anyway.
+        Failures of all chunks are raised together as one exception.
+        Cached metadata of the dimension is invalidated, as the requests don't reveal the change
+        """
+        if not rows:
+            return
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be a positive integer")
+
+        process_service = ProcessService(self._rest)
+        file_service = FileService(self._rest)
+        unique_name = self.suggest_unique_object_name()
+        chunks = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        file_names = [f"{unique_name}_{number}.csv" for number in range(len(chunks))]
+
+        def _upload(file_name: str, chunk: List[Tuple]):
+            csv_content = StringIO()
+            csv_writer = csv.writer(csv_content, delimiter=",", quoting=csv.QUOTE_ALL)
+            csv_writer.writerows(chunk)
+            file_service.create(file_name=file_name, file_content=csv_content.getvalue().encode("utf-8"), **kwargs)
+            return file_name
+
+        uploaded = []
+        try:
+            with ThreadPoolExecutor(max(1, min(max_workers, len(chunks)))) as executor:
+                futures = [executor.submit(_upload, file_name, chunk) for file_name, chunk in zip(file_names, chunks)]
+                wait(futures)
+            uploaded = [future.result() for future in futures if future.exception() is None]
+            for future in futures:
+                if future.exception() is not None:
+                    raise future.exception()
+
+            statuses, log_files = [], []
+            for file_name in file_names:
+                process = self._build_load_csv_process(
+                    process_name=file_name[: -len(".csv")],
+                    blob_filename=file_name,
+                    variables=variables,
+                    metadata_procedure=metadata_procedure,
+                    data_procedure=data_procedure,
+                )
+                try:
+                    success, status, log_file = process_service.execute_process_with_return(process=process, **kwargs)
+                finally:
+                    self._rest.metadata_cache.invalidate_dimension(dimension_name)
+                if not success:
+                    statuses.append(status)
+                    log_files.append(log_file)
+        finally:
+            if remove_blob and uploaded:
+                with ThreadPoolExecutor(max(1, min(max_workers, len(uploaded)))) as executor:
+                    list(executor.map(lambda file_name: file_service.delete(file_name=file_name), uploaded))
+
+        if not statuses:
+            return
+        if len(statuses) == len(chunks) and "HasMinorErrors" not in statuses:
+            raise TM1pyWriteFailureException(statuses, log_files)
+        raise TM1pyWritePartialFailureException(statuses, log_files, len(chunks))
+
+    def _build_load_csv_process(
+        self,
+        process_name: str,
+        blob_filename: str,
+        variables: List[str],
+        metadata_procedure: str = "",
+        data_procedure: str = "",
+    ) -> Process:
+        # v11 automatically adds blb file extensions to documents created via the contents api
+        if not verify_version(required_version="12", version=self.version):
+            blob_filename += ".blb"
+        process = Process(
+            name=process_name,
+            datasource_type="ASCII",
+            datasource_ascii_header_records=0,
+            datasource_data_source_name_for_server=f"{blob_filename}",
+            datasource_data_source_name_for_client=f"{blob_filename}",
+            datasource_ascii_delimiter_char=",",
+            datasource_ascii_decimal_separator=".",
+            datasource_ascii_thousand_separator="",
+            datasource_ascii_quote_character='"',
+        )
+        process.prolog_procedure = """
+        SetInputCharacterSet('TM1CS_UTF8');
+         """
+        for variable in variables:
+            process.add_variable(name=variable, variable_type="String")
+        process.metadata_procedure = metadata_procedure
+        process.data_procedure = data_procedure
+        return process
+
     def get_elements(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[Element]:
         url = format_url(
             "/Dimensions('{}')/Hierarchies('{}')/Elements?select=Name,Type", dimension_name, hierarchy_name
@@ -334,21 +574,16 @@ class ElementService(ObjectService):
         if not self.attribute_cube_exists(dimension_name):
             raise RuntimeError(self.ELEMENT_ATTRIBUTES_PREFIX + dimension_name + " cube must exist")
 
-        members = [
-            tupl[0]
-            for tupl in self.execute_set_mdx(
-                mdx=elements, element_properties=None, member_properties=("Name", "UniqueName"), parent_properties=None
-            )
-        ]
+        member_names = self.execute_set_mdx_columns(
+            mdx=elements, member_properties=["Name"], parent_properties=None, element_properties=None
+        )["Name"]
 
         element_types = self.get_element_types(
             dimension_name=dimension_name, hierarchy_name=hierarchy_name, skip_consolidations=skip_consolidations
         )
 
         df = pd.DataFrame(
-            data=[
-                (member["Name"], element_types[member["Name"]]) for member in members if member["Name"] in element_types
-            ],
+            data=[(name, element_types[name]) for name in member_names if name in element_types],
             dtype=str,
             columns=[dimension_name, element_type_column],
         )
@@ -568,14 +803,51 @@ class ElementService(ObjectService):
         return pd.merge(df, df_data, on=dimension_name).drop_duplicates()
 
     def get_edges(self, dimension_name: str, hierarchy_name: str, **kwargs) -> Dict[Tuple[str, str], int]:
-        url = format_url(
-            "/Dimensions('{}')/Hierarchies('{}')/Edges?select=ParentName,ComponentName,Weight",
-            dimension_name,
-            hierarchy_name,
+        def _load():
+            url = format_url(
+                "/Dimensions('{}')/Hierarchies('{}')/Edges?select=ParentName,ComponentName,Weight",
+                dimension_name,
+                hierarchy_name,
+            )
+            response = self._rest.GET(url, **kwargs)
+            return tuple(
+                ((edge["ParentName"], edge["ComponentName"]), edge["Weight"]) for edge in response.json()["value"]
+            )
+
+        edges = self._rest.metadata_cache.get_or_load(
+            (MetadataCache.DIMENSION, dimension_name, "edges", hierarchy_name), _load
         )
-        response = self._rest.GET(url, **kwargs)
+        return dict(edges)
+
+    def get_hierarchy_index(self, dimension_name: str, hierarchy_name: str, **kwargs) -> HierarchyIndex:
+        """Build an in-memory index over the edges of a hierarchy for ancestor, descendant and leaf queries
+
+        Requires two requests (edges and element types) that are served from the metadata cache if enabled.
+        Use `HierarchyIndex.refresh` to bring an existing index up to date.
+
+        :param dimension_name: name of dimension
+        :param hierarchy_name: name of hierarchy
+        :return: HierarchyIndex
+        """
+        return HierarchyIndex(
+            edges=self.get_edges(dimension_name, hierarchy_name, **kwargs),
+            element_types=self.get_element_types(dimension_name, hierarchy_name, **kwargs),
+        )
+
+    def _get_cached_hierarchy_index(self, dimension_name: str, hierarchy_name: str) -> HierarchyIndex:
+        """Unlike `get_hierarchy_index`, the index is shared through the metadata cache and must not be changed.
+        It is dropped with the other cached metadata of the dimension
+        """
+
+        def _load():
+            index = self.get_hierarchy_index(dimension_name, hierarchy_name)
+            # label upfront, so that concurrent readers of the shared index don't
+            index._ensure_built()
+            return index
 
-        return {(edge["ParentName"], edge["ComponentName"]): edge["Weight"] for edge in response.json()["value"]}
+        return self._rest.metadata_cache.get_or_load(
+            (MetadataCache.DIMENSION, dimension_name, "index", hierarchy_name), _load
+        )
 
     def get_leaf_elements(self, dimension_name: str, hierarchy_name: str, **kwargs) -> List[Element]:
         url = format_url(
@@ -833,6 +1105,38 @@ class ElementService(ObjectService):
         rows_and_values = self._retrieve_mdx_rows_and_values(mdx, element_unique_names=element_unique_names)
         return self._extract_dict_from_rows_and_values(rows_and_values, exclude_empty_cells=exclude_empty_cells)
 
+    def get_attribute_values(
+        self, dimension_name: str, hierarchy_name: str, attributes: Iterable[str], **kwargs
+    ) -> CaseAndSpaceInsensitiveDict:
+        """Get values of several attributes for all elements in a hierarchy with one query
+
+        :param dimension_name:
+        :param hierarchy_name:
+        :param attributes: Names of the attributes
+        :return: CaseAndSpaceInsensitiveDict {element: {attribute: value}}
+        """
+        attributes = list(attributes)
+        result = CaseAndSpaceInsensitiveDict()
+        if not attributes:
+            return result
+
+        mdx = """
+             SELECT
+             {{ TM1SUBSETALL([{dim}].[{hier}]) }} ON ROWS,
+             {{ {attr_mdx} }} ON COLUMNS
+             FROM [}}ElementAttributes_{dim}]
+             """.format(
+            dim=dimension_name,
+            hier=hierarchy_name,
+            attr_mdx=",".join(
+                build_element_unique_names(["}ElementAttributes_" + dimension_name] * len(attributes), attributes)
+            ),
+        )
+        rows_and_values = self._retrieve_mdx_rows_and_values(mdx, element_unique_names=False, **kwargs)
+        for (element_name, *_), values in rows_and_values.items():
+            result[element_name] = dict(zip(attributes, values))
+        return result
+
     @require_version("11.8.023")
     def element_lock(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> Response:
         """Lock element
@@ -896,31 +1200,47 @@ class ElementService(ObjectService):
     def get_element_types(
         self, dimension_name: str, hierarchy_name: str, skip_consolidations: bool = False, **kwargs
     ) -> CaseAndSpaceInsensitiveDict:
-        url = format_url(
-            "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name,Type", dimension_name, hierarchy_name
+        def _load():
+            url = format_url(
+                "/Dimensions('{}')/Hierarchies('{}')/Elements?$select=Name,Type", dimension_name, hierarchy_name
+            )
+            if skip_consolidations:
+                url += "&$filter=Type ne 3"
+            response = self._rest.GET(url, **kwargs)
+            return tuple((element["Name"], element["Type"]) for element in response.json()["value"])
+
+        element_types = self._rest.metadata_cache.get_or_load(
+            (MetadataCache.DIMENSION, dimension_name, "element_types", hierarchy_name, skip_consolidations), _load
         )
-        if skip_consolidations:
-            url += "&$filter=Type ne 3"
-        response = self._rest.GET(url, **kwargs)
 
         result = CaseAndSpaceInsensitiveDict()
-        for element in response.json()["value"]:
-            result[element["Name"]] = element["Type"]
+        for element_name, element_type in element_types:
+            result[element_name] = element_type
         return result
 
     def get_element_types_from_all_hierarchies(
         self, dimension_name: str, skip_consolidations: bool = False, **kwargs
     ) -> CaseAndSpaceInsensitiveDict:
-        url = format_url(
-            "/Dimensions('{}')?$expand=Hierarchies($select=Elements;$expand=Elements($select=Name,Type", dimension_name
+        def _load():
+            url = format_url(
+                "/Dimensions('{}')?$expand=Hierarchies($select=Elements;$expand=Elements($select=Name,Type",
+                dimension_name,
+            )
+            url += ";$filter=Type ne 3))" if skip_consolidations else "))"
+            response = self._rest.GET(url, **kwargs)
+            return tuple(
+                (element["Name"], element["Type"])
+                for hierarchy in response.json()["Hierarchies"]
+                for element in hierarchy["Elements"]
+            )
+
+        element_types = self._rest.metadata_cache.get_or_load(
+            (MetadataCache.DIMENSION, dimension_name, "element_types_from_all_hierarchies", skip_consolidations), _load
         )
-        url += ";$filter=Type ne 3))" if skip_consolidations else "))"
-        response = self._rest.GET(url, **kwargs)
 
         result = CaseAndSpaceInsensitiveDict()
-        for hierarchy in response.json()["Hierarchies"]:
-            for element in hierarchy["Elements"]:
-                result[element["Name"]] = element["Type"]
+        for element_name, element_type in element_types:
+            result[element_name] = element_type
         return result
 
     def attribute_cube_exists(self, dimension_name: str, **kwargs) -> bool:
@@ -1192,60 +1512,223 @@ class ElementService(ObjectService):
         :return: dictionary of members, unique names, weights, types, and parents
         """
 
-        top = f"$top={top_records};" if top_records else ""
+        url = self._build_execute_set_mdx_url(
+            top=top_records,
+            member_properties=member_properties,
+            parent_properties=parent_properties,
+            element_properties=element_properties,
+        )
+
+        payload = {"MDX": mdx}
+        response = self._rest.POST(url, json.dumps(payload, ensure_ascii=False), **kwargs)
+        raw_dict = response.json()
+        return [tuples["Members"] for tuples in raw_dict["Tuples"]]
+
+    def execute_set_mdx_iter(
+        self,
+        mdx: str,
+        batch_size: int = 100_000,
+        member_properties: Optional[Iterable[str]] = ("Name", "Weight"),
+        parent_properties: Optional[Iterable[str]] = ("Name", "UniqueName"),
+        element_properties: Optional[Iterable[str]] = ("Type", "Level"),
+        paged: bool = False,
+        **kwargs,
+    ) -> Generator[List, None, None]:
+        """Execute an MDX set expression and yield the tuples in batches, without loading the entire response
+
+        :param mdx: valid dimension mdx statement
+        :param batch_size: max number of tuples per batch
+        :param member_properties: list of member properties (e.g., Name, UniqueName, Type, Weight, Attributes/Color)
+        to return, will always return the Name property
+        :param parent_properties: list of parent properties to return, can be None or empty
+        :param element_properties: list of element properties to return, can be None or empty
+        :param paged: False: parse one streamed response while it is downloaded.
+        True: retrieve one page per batch with $top and $skip. Executes the MDX once per page
+        :return: generator of lists of tuples. A tuple is a list of members as returned by `execute_set_mdx`
+        """
+        if batch_size < 1:
+            raise ValueError("'batch_size' must be a positive integer")
+
+        payload = json.dumps({"MDX": mdx}, ensure_ascii=False)
+
+        if paged:
+            skip = 0
+            while True:
+                url = self._build_execute_set_mdx_url(
+                    top=batch_size,
+                    skip=skip,
+                    member_properties=member_properties,
+                    parent_properties=parent_properties,
+                    element_properties=element_properties,
+                )
+                response = self._rest.POST(url, payload, **kwargs)
+                batch = [tupl["Members"] for tupl in response.json()["Tuples"]]
+                if batch:
+                    yield batch
+                if len(batch) < batch_size:
+                    return
+                skip += batch_size
+
+        url = self._build_execute_set_mdx_url(
+            member_properties=member_properties,
+            parent_properties=parent_properties,
+            element_properties=element_properties,
+        )
+        response = self._rest.POST(url, payload, stream=True, **kwargs)
+        try:
+            batch = []
+            for members in ijson.items(_ResponseReader(response), "Tuples.item.Members", use_float=True):
+                batch.append(members)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            response.close()
+
+    def execute_set_mdx_columns(
+        self,
+        mdx: str,
+        member_properties: Optional[Iterable[str]] = ("Name", "UniqueName"),
+        parent_properties: Optional[Iterable[str]] = ("Name",),
+        element_properties: Optional[Iterable[str]] = ("Type", "Level"),
+        batch_size: int = 100_000,
+        paged: bool = False,
+        **kwargs,
+    ) -> Dict[str, List]:
+        """Execute an MDX set expression and return the members as parallel lists instead of nested dicts.
+        Only the first member of every tuple is considered.
+
+        Columns are named after the properties: member properties as they are (e.g., `Name`, `Attributes/Color`),
+        parent properties with `Parent/` prefix (e.g., `Parent/Name`), element properties with `Element/` prefix
+        (e.g., `Element/Type`). Parent properties of members without parent are None.
+
+        :param mdx: valid dimension mdx statement
+        :param member_properties: list of member properties to return, will always return the Name property
+        :param parent_properties: list of parent properties to return, can be None or empty
+        :param element_properties: list of element properties to return, can be None or empty
+        :param batch_size: number of tuples that are parsed at once
+        :param paged: retrieve tuples page by page with $top and $skip instead of parsing one streamed response
+        :return: dictionary of column name and list of values
+        """
+        member_properties = list(member_properties or ["Name"])
+        parent_properties = list(parent_properties or [])
+        element_properties = list(element_properties or [])
+
+        column_names = member_properties + [f"Parent/{p}" for p in parent_properties]
+        column_names += [f"Element/{p}" for p in element_properties]
+        columns = {column_name: [] for column_name in column_names}
+        # TM1 returns attribute names with spaces even though they must be requested without spaces
+        column_lists = [
+            (tuple(column_name.replace(" ", "").split("/")), columns[column_name]) for column_name in column_names
+        ]
+
+        for batch in self.execute_set_mdx_iter(
+            mdx,
+            batch_size=batch_size,
+            member_properties=member_properties,
+            parent_properties=parent_properties,
+            element_properties=element_properties,
+            paged=paged,
+            **kwargs,
+        ):
+            members = [tupl[0] for tupl in batch]
+            for path, values in column_lists:
+                if len(path) == 1:
+                    values.extend([member.get(path[0]) for member in members])
+                    continue
+                for member in members:
+                    value = member
+                    for key in path:
+                        if not value:
+                            value = None
+                            break
+                        value = value[key] if key in value else self._get_ignoring_spaces(value, key)
+                    values.append(value)
 
-        if not member_properties:
-            member_properties = ["Name"]
+        return columns
 
+    @require_pandas
+    def execute_set_mdx_dataframe(
+        self,
+        mdx: str,
+        member_properties: Optional[Iterable[str]] = ("Name", "UniqueName"),
+        parent_properties: Optional[Iterable[str]] = ("Name",),
+        element_properties: Optional[Iterable[str]] = ("Type", "Level"),
+        batch_size: int = 100_000,
+        paged: bool = False,
+        **kwargs,
+    ) -> "pd.DataFrame":
+        """Execute an MDX set expression and return the members as a DataFrame with one row per tuple.
+        Column names as in `execute_set_mdx_columns`
+
+        :param mdx: valid dimension mdx statement
+        :param member_properties: list of member properties to return, will always return the Name property
+        :param parent_properties: list of parent properties to return, can be None or empty
+        :param element_properties: list of element properties to return, can be None or empty
+        :param batch_size: number of tuples that are parsed at once
+        :param paged: retrieve tuples page by page with $top and $skip instead of parsing one streamed response
+        :return: pandas DataFrame
+        """
+        columns = self.execute_set_mdx_columns(
+            mdx,
+            member_properties=member_properties,
+            parent_properties=parent_properties,
+            element_properties=element_properties,
+            batch_size=batch_size,
+            paged=paged,
+            **kwargs,
+        )
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _get_ignoring_spaces(properties: Dict, key: str):
+        for name, value in properties.items():
+            if name.replace(" ", "") == key:
+                return value
+        return None
+
+    @staticmethod
+    def _prepare_set_mdx_properties(properties: Optional[Iterable[str]]) -> List[str]:
         # drop spaces in Attribute names
-        else:
-            member_properties = [
-                member_property.replace(" ", "") if member_property.startswith("Attributes/") else member_property
-                for member_property in member_properties
-            ]
+        return [prop.replace(" ", "") if prop.startswith("Attributes/") else prop for prop in (properties or [])]
 
-        if element_properties:
-            element_properties = [
-                element_property.replace(" ", "") if element_property.startswith("Attributes/") else element_property
-                for element_property in element_properties
-            ]
+    def _build_execute_set_mdx_url(
+        self,
+        top: Optional[int] = None,
+        skip: Optional[int] = None,
+        member_properties: Optional[Iterable[str]] = ("Name", "Weight"),
+        parent_properties: Optional[Iterable[str]] = ("Name", "UniqueName"),
+        element_properties: Optional[Iterable[str]] = ("Type", "Level"),
+    ) -> str:
+        top = f"$top={top};" if top else ""
+        skip = f"$skip={skip};" if skip else ""
 
-        if parent_properties:
-            parent_properties = [
-                parent_property.replace(" ", "") if parent_property.startswith("Attributes/") else parent_property
-                for parent_property in parent_properties
-            ]
+        member_properties = self._prepare_set_mdx_properties(member_properties) or ["Name"]
+        element_properties = self._prepare_set_mdx_properties(element_properties)
+        parent_properties = self._prepare_set_mdx_properties(parent_properties)
 
-        member_properties = ",".join(member_properties)
-        select_member_properties = f"$select={member_properties}"
+        select_member_properties = f"$select={','.join(member_properties)}"
 
         properties_to_expand = []
         if parent_properties:
-            parent_properties = ",".join(parent_properties)
-            select_parent_properties = f"Parent($select={parent_properties})"
-            properties_to_expand.append(select_parent_properties)
+            properties_to_expand.append(f"Parent($select={','.join(parent_properties)})")
 
         if element_properties:
-            element_properties = ",".join(element_properties)
-            select_element_properties = f"Element($select={element_properties})"
-            properties_to_expand.append(select_element_properties)
+            properties_to_expand.append(f"Element($select={','.join(element_properties)})")
 
         if properties_to_expand:
             expand_properties = f';$expand={",".join(properties_to_expand)}'
         else:
             expand_properties = ""
 
-        url = (
-            f"/ExecuteMDXSetExpression?$expand=Tuples({top}"
+        return (
+            f"/ExecuteMDXSetExpression?$expand=Tuples({top}{skip}"
             f"$expand=Members({select_member_properties}"
             f"{expand_properties}))"
         )
 
-        payload = {"MDX": mdx}
-        response = self._rest.POST(url, json.dumps(payload, ensure_ascii=False), **kwargs)
-        raw_dict = response.json()
-        return [tuples["Members"] for tuples in raw_dict["Tuples"]]
-
     def remove_edge(self, dimension_name: str, hierarchy_name: str, parent: str, component: str, **kwargs) -> Response:
         """Remove one edge from hierarchy. Fails if parent or child element doesn't exist.
 
@@ -1268,18 +1751,27 @@ class ElementService(ObjectService):
         return self._rest.DELETE(url=url, **kwargs)
 
     def add_edges(
-        self, dimension_name: str, hierarchy_name: str = None, edges: Dict[Tuple[str, str], int] = None, **kwargs
+        self,
+        dimension_name: str,
+        hierarchy_name: str = None,
+        edges: Dict[Tuple[str, str], int] = None,
+        use_blob: bool = False,
+        **kwargs,
     ) -> Response:
         """Add Edges to hierarchy. Fails if one edge already exists.
 
         :param dimension_name:
         :param hierarchy_name:
         :param edges:
+        :param use_blob: load edges through CSV files and unbound TI processes. Requires admin permissions
         :return:
         """
         if not hierarchy_name:
             hierarchy_name = dimension_name
 
+        if use_blob:
+            return self.add_edges_use_blob(dimension_name, hierarchy_name, edges, **kwargs)
+
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Edges", dimension_name, hierarchy_name)
         body = [
             {"ParentName": parent, "ComponentName": component, "Weight": float(weight)}
@@ -1288,14 +1780,21 @@ class ElementService(ObjectService):
 
         return self._rest.POST(url=url, data=json.dumps(body), **kwargs)
 
-    def add_elements(self, dimension_name: str, hierarchy_name: str, elements: Iterable[Element], **kwargs):
+    def add_elements(
+        self, dimension_name: str, hierarchy_name: str, elements: Iterable[Element], use_blob: bool = False, **kwargs
+    ):
         """Add elements to hierarchy. Fails if one element already exists.
 
         :param dimension_name:
         :param hierarchy_name:
         :param elements:
+        :param use_blob: load elements through CSV files and unbound TI processes. Requires admin permissions.
+        Existing elements are left untouched instead of failing
         :return:
         """
+        if use_blob:
+            return self.add_elements_use_blob(dimension_name, hierarchy_name, elements, **kwargs)
+
         url = format_url("/Dimensions('{}')/Hierarchies('{}')/Elements", dimension_name, hierarchy_name)
         body = [element.body_as_dict for element in elements]
 
@@ -1338,8 +1837,13 @@ class ElementService(ObjectService):
         return {child["Name"]: [parent["Name"] for parent in child["Parents"]] for child in response.json()["value"]}
 
     def get_element_principal_name(self, dimension_name: str, hierarchy_name: str, element_name: str, **kwargs) -> str:
-        element = self.get(dimension_name, hierarchy_name, element_name, **kwargs)
-        return element.name
+        def _load():
+            element = self.get(dimension_name, hierarchy_name, element_name, **kwargs)
+            return element.name
+
+        return self._rest.metadata_cache.get_or_load(
+            (MetadataCache.DIMENSION, dimension_name, "principal_name", hierarchy_name, element_name), _load
+        )
 
     def _get_mdx_set_cardinality(self, mdx: str) -> int:
         url = format_url("/ExecuteMDXSetExpression?$select=Cardinality")
@@ -1404,6 +1908,8 @@ class ElementService(ObjectService):
         value `TI` performs best, but requires admin permissions
         Value 'TM1DrillDownMember' performs well when element is a leaf.
         Value 'Descendants' performs well when `ancestor_name` and `element_name` are Consolidations.
+        Value 'Index' answers from an in-memory HierarchyIndex. With metadata cache the index is built once and kept
+        until the dimension is invalidated. Without metadata cache it is built on every call.
 
         If no value is passed, function defaults to 'TI' for user with admin permissions
         and 'TM1DrillDownMember' for users without admin permissions
@@ -1420,6 +1926,10 @@ class ElementService(ObjectService):
 
             raise TM1pyException(f"Hierarchy: '{hierarchy_name}' does not exist in dimension: '{dimension_name}'")
 
+        if method.upper() == "INDEX":
+            index = self._get_cached_hierarchy_index(dimension_name, hierarchy_name)
+            return index.is_ancestor(ancestor_name, element_name)
+
         # make sure DESCENDANTS behaves like default TM1DrillDownMember
         if method.upper() == MDXDrillMethod.DESCENDANTS.name:
             if not self.exists(dimension_name, hierarchy_name, element_name):
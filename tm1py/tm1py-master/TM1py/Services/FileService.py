@@ -52,7 +52,7 @@ class FileService(ObjectService):
         url = self._construct_content_url(path, exclude_path_end=False, extension="Contents")
 
         response = self._rest.GET(url, **kwargs).content
-        return [file["Name"] for file in json.loads(response)["value"]]
+        return [file["Name"] for file in self._rest.json_decoder.loads(response)["value"]]
 
     @require_version(version="11.4")
     def get(self, file_name: str, **kwargs) -> bytes:
@@ -131,6 +131,7 @@ class FileService(ObjectService):
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
+        content_encoding: str = None,
         **kwargs,
     ):
         """
@@ -140,24 +141,30 @@ class FileService(ObjectService):
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
         :param max_workers: max parallel workers for multipart upload (only available from TM1 12 onwards)
+        :param content_encoding: encoding of file_content in transit (e.g. 'gzip'). Not supported with multipart upload
         """
 
         url = self._construct_content_url(path, exclude_path_end=False, extension="Content")
 
         # empty files must be created without MPU
         if self._file_content_is_empty(file_content):
-            return self._upload_file_content_without_mpu(url, file_content, **kwargs)
+            return self._upload_file_content_without_mpu(url, file_content, content_encoding, **kwargs)
 
         if multi_part_upload is None:
-            multi_part_upload = self.version.startswith("12.")
+            multi_part_upload = self.version.startswith("12.") and not content_encoding
 
         if multi_part_upload:
+            if content_encoding:
+                raise ValueError("'content_encoding' can not be used in conjunction with 'multi_part_upload'")
             return self._upload_file_content_with_mpu(url, file_content, max_mb_per_part, max_workers, **kwargs)
 
-        return self._upload_file_content_without_mpu(url, file_content, **kwargs)
+        return self._upload_file_content_without_mpu(url, file_content, content_encoding, **kwargs)
 
-    def _upload_file_content_without_mpu(self, url, file_content, **kwargs):
-        return self._rest.PUT(url=url, data=file_content, headers=self.binary_http_header, **kwargs)
+    def _upload_file_content_without_mpu(self, url, file_content, content_encoding: str = None, **kwargs):
+        headers = self.binary_http_header
+        if content_encoding:
+            headers = {**headers, "Content-Encoding": content_encoding}
+        return self._rest.PUT(url=url, data=file_content, headers=headers, **kwargs)
 
     def _upload_file_content_with_mpu(
         self,
@@ -236,6 +243,7 @@ class FileService(ObjectService):
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
+        content_encoding: str = None,
         **kwargs,
     ):
         """Create file
@@ -248,6 +256,8 @@ class FileService(ObjectService):
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
         :param max_workers: max parallel workers for multipart upload (only available from TM1 12 onwards)
+        :param content_encoding: encoding of file_content in transit (e.g. 'gzip'). Requires server support.
+        Not supported with multipart upload
         """
         path = Path(file_name)
         self._check_subfolder_support(path=path, function="FileService.create")
@@ -265,7 +275,9 @@ class FileService(ObjectService):
         body = {"@odata.type": "#ibm.tm1.api.v1.Document", "ID": path.name, "Name": path.name}
         self._rest.POST(url, json.dumps(body), **kwargs)
 
-        return self._upload_file_content(path, file_content, multi_part_upload, max_mb_per_part, max_workers, **kwargs)
+        return self._upload_file_content(
+            path, file_content, multi_part_upload, max_mb_per_part, max_workers, content_encoding, **kwargs
+        )
 
     @require_version(version="11.4")
     def update(
@@ -275,6 +287,7 @@ class FileService(ObjectService):
         multi_part_upload: bool = None,
         max_mb_per_part: float = 200,
         max_workers: int = 1,
+        content_encoding: str = None,
         **kwargs,
     ):
         """Update existing file
@@ -285,13 +298,17 @@ class FileService(ObjectService):
         By default, multi_part_upload is used for TM1 v12 and not used for TM1 v11
         :param max_mb_per_part: max megabyte per part in multipart upload (only available from TM1 12 onwards)
         :param max_workers: max parallel workers for multipart upload (only available from TM1 12 onwards)
+        :param content_encoding: encoding of file_content in transit (e.g. 'gzip'). Requires server support.
+        Not supported with multipart upload
         """
         path = Path(file_name)
         self._check_subfolder_support(path=path, function="FileService.update")
         if multi_part_upload:
             self._check_mpu_support(function="FileService.create")
 
-        return self._upload_file_content(path, file_content, multi_part_upload, max_mb_per_part, max_workers, **kwargs)
+        return self._upload_file_content(
+            path, file_content, multi_part_upload, max_mb_per_part, max_workers, content_encoding, **kwargs
+        )
 
     @require_version(version="11.4")
     def update_or_create(
@@ -389,7 +406,7 @@ class FileService(ObjectService):
         )
         response = self._rest.GET(url, **kwargs).content
 
-        return list(file["Name"] for file in json.loads(response)["value"])
+        return list(file["Name"] for file in self._rest.json_decoder.loads(response)["value"])
 
     @staticmethod
     def _split_into_parts(data: Union[bytes, BytesIO], max_chunk_size: int = 200 * 1024 * 1024):
@@ -1,17 +1,9 @@
 # -*- coding: utf-8 -*-
-try:
-    import pandas as pd
-
-    _has_pandas = True
-except ImportError:
-    _has_pandas = False
-
 import json
 import math
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Dict, Iterable, List, Optional, Tuple
 
-
 from requests import Response
 
 from TM1py.Exceptions import TM1pyRestException
@@ -20,6 +12,8 @@ from TM1py.Services.ElementService import ElementService
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.RestService import RestService
 from TM1py.Services.SubsetService import SubsetService
+from TM1py.Utils.HierarchyDiff import HierarchyDiff, HierarchySnapshot
+from TM1py.Utils.LazyImport import is_installed, lazy_import
 from TM1py.Utils.Utils import (
     CaseAndSpaceInsensitiveDict,
     CaseAndSpaceInsensitiveSet,
@@ -32,6 +26,10 @@ from TM1py.Utils.Utils import (
     verify_version,
 )
 
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+_has_pandas = is_installed("pandas")
+
 
 class HierarchyService(ObjectService):
     """Service to handle Object Updates for TM1 Hierarchies"""
@@ -55,71 +53,182 @@ class HierarchyService(ObjectService):
         self.elements = ElementService(rest)
 
     @staticmethod
-    def _validate_edges(df: "pd.DataFrame"):
-        graph = defaultdict(list)  # Build adjacency list (child -> list of parents)
-        for row in df.itertuples(index=False, name=None):
-            child, *parents = row
-            for parent in parents:
-                if not parent:
-                    continue
-                if isinstance(parent, float) and math.isnan(parent):
-                    continue
-                graph[child].append(parent)
-                child = parent
+    def _validate_edges(df: "pd.DataFrame", weights: "pd.DataFrame" = None):
+        """Abort if the edges in the df contain circular references or the same edge with different weights
 
-        visited = set()  # nodes already fully explored
-        active_path = set()  # nodes currently being explored (for cycle detection)
-        cycles = []  # stores detected cycles
+        Works on integer ids: names are factorized once, edges between consecutive non-empty level columns are
+        derived column-wise and cycles are found by peeling elements without children (and without parents)
+        level by level. All offending paths are reported at once.
 
-        def explore_relationships(node, path):
-            if node in active_path:
-                # Found a cycle: extract the part of the path that loops
-                loop_start = path.index(node)
-                cycles.append(path[loop_start:])
-                return
-            if node in visited:
-                return
-
-            visited.add(node)
-            active_path.add(node)
-
-            for parent in graph.get(node, []):
-                explore_relationships(parent, path + [parent])
+        :param df: element column followed by the level columns, from the element towards the top
+        :param weights: optional level weight columns in the same order as the level columns
+        """
+        values = df.to_numpy(dtype=object)
+        if values.shape[0] == 0 or values.shape[1] < 2:
+            return
+        # empty strings and NaN are gaps: the edge goes to the next non-empty level
+        mask = ~pd.isna(values) & (values != "")
+        # normalize each distinct spelling only once
+        codes, spellings = pd.factorize(values[mask])
+        spelling_keys, uniques = pd.factorize(
+            np.array([str(spelling).lower().replace(" ", "") for spelling in spellings], dtype=object)
+        )
+        ids = np.full(values.shape, -1, dtype=np.int64)
+        ids[mask] = spelling_keys[codes]
+        first_spelling = np.empty(len(uniques), dtype=object)
+        first_spelling[spelling_keys[::-1]] = np.asarray(spellings, dtype=object)[::-1]
+
+        # child of a level column is the closest non-empty column to its left
+        children, parents, edge_weights = [], [], []
+        child = ids[:, 0]
+        for column in range(1, ids.shape[1]):
+            parent = ids[:, column]
+            edge_mask = (parent >= 0) & (child >= 0) & (child != parent)
+            children.append(child[edge_mask])
+            parents.append(parent[edge_mask])
+            if weights is not None:
+                edge_weights.append(weights.iloc[:, column - 1].to_numpy(dtype=float)[edge_mask])
+            child = np.where(parent >= 0, parent, child)
+        children, parents = np.concatenate(children), np.concatenate(parents)
+
+        number_of_elements = len(uniques)
+        edge_keys = children * number_of_elements + parents
+        errors = []
+
+        if weights is not None:
+            edge_weights = np.concatenate(edge_weights)
+            conflicts = (
+                pd.DataFrame({"edge": edge_keys, "weight": edge_weights})
+                .drop_duplicates()
+                .groupby("edge")["weight"]
+                .nunique()
+            )
+            for edge in conflicts.index[conflicts.to_numpy() > 1]:
+                child, parent = divmod(int(edge), number_of_elements)
+                errors.append(
+                    f"Edge '{first_spelling[parent]}' -> '{first_spelling[child]}' found with different weights"
+                )
 
-            active_path.remove(node)
+        edge_keys = pd.unique(edge_keys)
+        children, parents = edge_keys // number_of_elements, edge_keys % number_of_elements
+
+        # peel elements without children, then elements without parents. Only cycles remain
+        alive = np.ones(number_of_elements, dtype=bool)
+        for sources, targets in ((children, parents), (parents, children)):
+            while True:
+                edge_alive = alive[sources] & alive[targets]
+                degree = np.bincount(targets[edge_alive], minlength=number_of_elements)
+                removable = alive & (degree == 0)
+                if not removable.any():
+                    break
+                alive &= ~removable
+
+        cycles = []
+        if alive.any():
+            edge_alive = alive[children] & alive[parents]
+            graph = defaultdict(list)
+            for child, parent in zip(children[edge_alive].tolist(), parents[edge_alive].tolist()):
+                graph[child].append(parent)
 
-        for node in graph:
-            if node not in visited:
-                explore_relationships(node, [node])
+            for component in HierarchyService._strongly_connected_components(graph):
+                # shortest cycle through every element of the component that is not on a reported cycle yet
+                members, covered = set(component), set()
+                for start in component:
+                    if start in covered:
+                        continue
+                    predecessors, queue = {start: None}, deque([start])
+                    while queue:
+                        node = queue.popleft()
+                        if start in graph[node]:
+                            break
+                        for parent in graph[node]:
+                            if parent in members and parent not in predecessors:
+                                predecessors[parent] = node
+                                queue.append(parent)
+                    cycle = [start]
+                    while node is not None:
+                        cycle.append(node)
+                        node = predecessors[node]
+                    cycle.reverse()
+                    covered.update(cycle)
+                    cycles.append([first_spelling[element_id] for element_id in cycle])
+
+            errors.insert(0, f"Circular reference{'s' if len(cycles) > 1 else ''} found in edges: {cycles}")
+
+        if errors:
+            raise ValueError("\n".join(errors))
 
-        if cycles:
-            raise ValueError(
-                f"Circular reference{'s' if len(cycles) > 1 else ''} found in edges: {cycles}"
-            )
+    @staticmethod
+    def _strongly_connected_components(graph: Dict[int, List[int]]) -> List[List[int]]:
+        """Iterative Tarjan. Returns components with more than one element or a self reference"""
+        index, low, on_stack, stack, components = dict(), dict(), set(), [], []
+        for root in graph:
+            if root in index:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, position = work.pop()
+                if position == 0:
+                    index[node] = low[node] = len(index)
+                    stack.append(node)
+                    on_stack.add(node)
+                neighbours = graph.get(node, [])
+                if position < len(neighbours):
+                    work.append((node, position + 1))
+                    neighbour = neighbours[position]
+                    if neighbour not in index:
+                        work.append((neighbour, 0))
+                    elif neighbour in on_stack:
+                        low[node] = min(low[node], index[neighbour])
+                    continue
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in neighbours:
+                        components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+        return components
 
     @staticmethod
     def _validate_alias_uniqueness(df: "pd.DataFrame"):
-        # map alias values against their principal element name
-        seen_values = CaseAndSpaceInsensitiveDict()
+        """Abort if an alias value is used by more than one element, as element name or as alias.
+        All conflicting values are reported at once
 
-        for row in df.itertuples(index=False):
-            normalized_row = tuple(col.strip().lower() for col in row)
-            element_name, *alias_values = normalized_row
-            # Register e.g. 'Deutschand' -> 'Deutschand'
-            seen_values[element_name] = element_name
-
-            for value in alias_values:
-                if not value:
-                    continue
+        :param df: element column followed by the alias columns
+        """
+        values = df.fillna("").astype(str)
+        element_keys = values.iloc[:, 0].str.lower().str.replace(" ", "", regex=False)
+        pairs = [pd.DataFrame({"value": element_keys, "element": element_keys, "name": values.iloc[:, 0]})]
+        for column in range(1, values.shape[1]):
+            pairs.append(
+                pd.DataFrame(
+                    {
+                        "value": values.iloc[:, column].str.lower().str.replace(" ", "", regex=False),
+                        "element": element_keys,
+                        "name": values.iloc[:, 0],
+                    }
+                )
+            )
+        pairs = pd.concat(pairs, ignore_index=True)
+        pairs = pairs[pairs["value"] != ""].drop_duplicates(subset=["value", "element"])
 
-                if value in seen_values:
-                    # Duplicate entries
-                    if case_and_space_insensitive_equals(element_name, seen_values[value]):
-                        continue
+        owners = pairs.groupby("value")["element"].transform("size")
+        conflicts = pairs[owners > 1]
+        if conflicts.empty:
+            return
 
-                    raise ValueError(f"Invalid alias value found in record {tuple(row)}")
-                # Register e.g. 'Deutschand' -> 'Germany'
-                seen_values[value] = element_name
+        messages = [
+            f"'{value}' used by {sorted(group['name'].tolist())}"
+            for value, group in conflicts.groupby("value", sort=True)
+        ]
+        raise ValueError(f"Invalid alias value{'s' if len(messages) > 1 else ''} found: {'; '.join(messages)}")
 
     def create(self, hierarchy: Hierarchy, **kwargs):
         """Create a hierarchy in an existing dimension
@@ -159,7 +268,9 @@ class HierarchyService(ObjectService):
         response = self._rest.GET(url, **kwargs)
         return [hierarchy["Name"] for hierarchy in response.json()["value"]]
 
-    def update(self, hierarchy: Hierarchy, keep_existing_attributes=False, **kwargs) -> List[Response]:
+    def update(
+        self, hierarchy: Hierarchy, keep_existing_attributes=False, minimal_diff: bool = False, **kwargs
+    ) -> List[Response]:
         """update a hierarchy. It's a two step process:
         1. Update Hierarchy
         2. Update Element-Attributes
@@ -169,8 +280,13 @@ class HierarchyService(ObjectService):
 
         :param hierarchy: instance of TM1py.Hierarchy
         :param keep_existing_attributes: True to make sure existing attributes are not removed
+        :param minimal_diff: compare with the existing hierarchy and only add and delete the elements and edges
+        that changed, instead of sending the whole structure
         :return: list of responses
         """
+        if minimal_diff:
+            return self._update_minimal_diff(hierarchy, keep_existing_attributes, **kwargs)
+
         # functions returns multiple responses
         responses = list()
         # 1. Update Hierarchy
@@ -198,10 +314,53 @@ class HierarchyService(ObjectService):
                 )
                 for edge in hierarchy.edges
             ]
-            responses.append(process_service.execute_ti_code(lines_prolog=ti_statements, **kwargs))
+            try:
+                responses.append(process_service.execute_ti_code(lines_prolog=ti_statements, **kwargs))
+            finally:
+                # unbound processes don't reveal the dimension through their urls
+                self._rest.metadata_cache.invalidate_dimension(hierarchy.dimension_name)
 
         return responses
 
+    def _update_minimal_diff(self, hierarchy: Hierarchy, keep_existing_attributes=False, **kwargs) -> List[Response]:
+        current = self.get(hierarchy.dimension_name, hierarchy.name, **kwargs)
+        diff = HierarchySnapshot.from_hierarchy(current).diff(
+            HierarchySnapshot.from_hierarchy(hierarchy), delete_elements=True, unwind_all=True
+        )
+
+        responses = list()
+        if diff.elements_to_add:
+            responses.append(
+                self.elements.add_elements(
+                    hierarchy.dimension_name,
+                    hierarchy.name,
+                    [hierarchy.get_element(element_name) for element_name in diff.elements_to_add],
+                    **kwargs,
+                )
+            )
+        for element_name in diff.element_types_to_update:
+            responses.append(
+                self.elements.update(
+                    hierarchy.dimension_name, hierarchy.name, hierarchy.get_element(element_name), **kwargs
+                )
+            )
+        self._apply_edges_diff(hierarchy.dimension_name, hierarchy.name, diff, **kwargs)
+        if diff.elements_to_delete:
+            self.elements.delete_elements(
+                hierarchy.dimension_name,
+                hierarchy.name,
+                element_names=diff.elements_to_delete,
+                use_ti=self.is_admin,
+                **kwargs,
+            )
+
+        responses.append(
+            self.update_element_attributes(
+                hierarchy=hierarchy, keep_existing_attributes=keep_existing_attributes, **kwargs
+            )
+        )
+        return responses
+
     def update_or_create(self, hierarchy: Hierarchy, **kwargs):
         """update if exists else create
 
@@ -484,6 +643,8 @@ class HierarchyService(ObjectService):
         update_attribute_types: bool = False,
         hierarchy_sort_order: Tuple[str, str, str, str] = None,
         delete_orphaned_consolidations: bool = False,
+        minimal_diff: bool = False,
+        use_blob: bool = False,
         **kwargs,
     ):
         """Update or Create a hierarchy based on a dataframe, while never deleting existing elements.
@@ -527,6 +688,14 @@ class HierarchyService(ObjectService):
         :param delete_orphaned_consolidations: bool
             If True, function will delete c elements that will have no children and will have no parents post update.
             By default, function will not delete orphaned consolidations.
+        :param minimal_diff: bool
+            If True, compare the df with a snapshot of the existing hierarchy (elements, edges, weights and values
+            of the attributes in the df) and only write what changed: new elements, changed attribute values,
+            removed and changed edges. `unwind_all` and `unwind_consolidations` then only delete edges that are
+            not in the df. Reading the attribute values is much cheaper than rewriting all of them.
+        :param use_blob: bool
+            If True, new elements, edges and attribute values are loaded through CSV files and unbound TI processes
+            instead of the JSON body of a REST request. Recommended for hundreds of thousands of elements or edges.
 
         :return:
 
@@ -593,7 +762,7 @@ class HierarchyService(ObjectService):
             raise ValueError("Number of level columns must be equal to number of level weight columns")
 
         if verify_edges:
-            self._validate_edges(df=df[[element_column, *level_columns]])
+            self._validate_edges(df=df[[element_column, *level_columns]], weights=df[level_weight_columns])
 
         hierarchy_exists = self.exists(dimension_name, hierarchy_name)
 
@@ -604,6 +773,11 @@ class HierarchyService(ObjectService):
                 dimension_name=dimension_name, hierarchy_name=hierarchy_name
             )
 
+        minimal_diff = minimal_diff and hierarchy_exists
+        if minimal_diff:
+            current_element_types = self.elements.get_element_types(dimension_name, hierarchy_name)
+            current_edges = self.elements.get_edges(dimension_name, hierarchy_name)
+
         if not hierarchy_exists:
             hierarchy = Hierarchy(name=hierarchy_name, dimension_name=dimension_name)
             dimension_service = self.get_dimension_service()
@@ -644,6 +818,7 @@ class HierarchyService(ObjectService):
                 dimension_name=dimension_name,
                 hierarchy_name=hierarchy_name,
                 elements=(Element(element_name, element_type) for element_name, element_type in new_elements.items()),
+                use_blob=use_blob,
             )
 
         # define the attribute columns in df. Applies to all elements in df, not only new ones.
@@ -667,6 +842,7 @@ class HierarchyService(ObjectService):
                 raise ex
 
         new_attributes = []
+        attribute_types = CaseAndSpaceInsensitiveDict()
         for attribute_column in attribute_columns:
             if ":" in attribute_column:
                 attribute_name, attribute_type = attribute_column.rsplit(":", maxsplit=1)
@@ -675,6 +851,7 @@ class HierarchyService(ObjectService):
             else:
                 attribute_name = attribute_column
                 attribute_type = ElementAttribute.Types.STRING
+            attribute_types[attribute_name] = attribute_type
 
             if attribute_name not in existing_attributes:
                 new_attributes.append(ElementAttribute(attribute_name, attribute_type))
@@ -706,8 +883,48 @@ class HierarchyService(ObjectService):
         attribute_column = "}ElementAttributes_" + dimension_name
         attributes_df[attribute_column] = attributes_df[attribute_column].apply(lambda x: x.rsplit(":", 1)[0])
 
+        edges = self._edges_from_dataframe(df, element_column, level_columns, level_weight_columns)
+
+        if minimal_diff:
+            target_attributes = defaultdict(dict)
+            for element_name, attribute_name, value in attributes_df.itertuples(index=False, name=None):
+                target_attributes[element_name][attribute_name] = value
+
+            target_element_types = CaseAndSpaceInsensitiveDict(current_element_types)
+            target_element_types.update(new_elements)
+            current = HierarchySnapshot(
+                element_types=current_element_types,
+                edges=current_edges,
+                attributes=self.elements.get_attribute_values(dimension_name, hierarchy_name, attribute_types),
+                attribute_types=attribute_types,
+            )
+            target = HierarchySnapshot(
+                element_types=target_element_types,
+                edges=edges,
+                attributes=target_attributes,
+                attribute_types=attribute_types,
+            )
+            diff = current.diff(target, unwind_all=unwind_all, unwind_consolidations=unwind_consolidations)
+
+            attributes_df = pd.DataFrame(
+                [
+                    (element_name, attribute_name, value)
+                    for (element_name, attribute_name), value in diff.attribute_values.items()
+                ],
+                columns=[element_column, attribute_column, "attribute_value"],
+            )
+
         # write attributes to cube
-        if not attributes_df.empty:
+        if not attributes_df.empty and use_blob:
+            self.elements.update_attribute_values_use_blob(
+                dimension_name=dimension_name,
+                hierarchy_name=hierarchy_name,
+                attribute_values={
+                    (element_name, attribute_name): value
+                    for element_name, attribute_name, value in attributes_df.itertuples(index=False, name=None)
+                },
+            )
+        elif not attributes_df.empty:
             cell_service = self.get_cell_service()
             # explicitly reference hierarchy if dimension_name != hierarchy_name
             if not case_and_space_insensitive_equals(dimension_name, hierarchy_name):
@@ -719,7 +936,9 @@ class HierarchyService(ObjectService):
                 use_blob=True,
             )
 
-        if unwind_all:
+        if minimal_diff:
+            self._apply_edges_diff(dimension_name, hierarchy_name, diff, use_blob=use_blob)
+        elif unwind_all:
             self.remove_all_edges(dimension_name=dimension_name, hierarchy_name=hierarchy_name)
         else:
             if unwind_consolidations:
@@ -742,26 +961,7 @@ class HierarchyService(ObjectService):
                     use_blob=self.is_admin,
                 )
 
-        edges = CaseAndSpaceInsensitiveTuplesDict()
-        for element_name, *record in df[[element_column, *level_columns, *level_weight_columns]].itertuples(
-            index=False
-        ):
-            levels = record[: len(level_columns)]
-            level_weights = record[len(level_columns) :]
-
-            previous_level = element_name
-            for level, weight in zip(levels, level_weights):
-                if not level:
-                    continue
-                if not isinstance(level, str) and math.isnan(level):
-                    continue
-                if level == previous_level:
-                    continue
-
-                edges[level, previous_level] = weight
-                previous_level = level
-
-        if edges:
+        if edges and not minimal_diff:
             try:
                 current_edges = CaseAndSpaceInsensitiveTuplesDict(
                     self.elements.get_edges(dimension_name=dimension_name, hierarchy_name=hierarchy_name)
@@ -785,7 +985,9 @@ class HierarchyService(ObjectService):
                 (k, v): w for (k, v), w in edges.items() if (k, v) not in current_edges or w != current_edges[(k, v)]
             }
             if new_edges:
-                self.elements.add_edges(dimension_name=dimension_name, hierarchy_name=hierarchy_name, edges=new_edges)
+                self.elements.add_edges(
+                    dimension_name=dimension_name, hierarchy_name=hierarchy_name, edges=new_edges, use_blob=use_blob
+                )
 
         if hierarchy_sort_order:
             self._implement_hierarchy_sort_order(dimension_name, hierarchy_name, hierarchy_sort_order)
@@ -812,6 +1014,50 @@ class HierarchyService(ObjectService):
                     use_ti=self.is_admin,
                 )
 
+    @staticmethod
+    def _edges_from_dataframe(
+        df: "pd.DataFrame", element_column: str, level_columns: List[str], level_weight_columns: List[str]
+    ) -> CaseAndSpaceInsensitiveTuplesDict:
+        edges = CaseAndSpaceInsensitiveTuplesDict()
+        for element_name, *record in df[[element_column, *level_columns, *level_weight_columns]].itertuples(
+            index=False
+        ):
+            levels = record[: len(level_columns)]
+            level_weights = record[len(level_columns) :]
+
+            previous_level = element_name
+            for level, weight in zip(levels, level_weights):
+                if not level:
+                    continue
+                if not isinstance(level, str) and math.isnan(level):
+                    continue
+                if level == previous_level:
+                    continue
+
+                edges[level, previous_level] = weight
+                previous_level = level
+        return edges
+
+    def _apply_edges_diff(
+        self, dimension_name: str, hierarchy_name: str, diff: HierarchyDiff, use_blob: bool = False, **kwargs
+    ):
+        if diff.edges_to_delete:
+            self.elements.delete_edges(
+                dimension_name=dimension_name,
+                hierarchy_name=hierarchy_name,
+                edges=diff.edges_to_delete,
+                use_blob=self.is_admin,
+                **kwargs,
+            )
+        if diff.edges_to_add:
+            self.elements.add_edges(
+                dimension_name=dimension_name,
+                hierarchy_name=hierarchy_name,
+                edges=diff.edges_to_add,
+                use_blob=use_blob,
+                **kwargs,
+            )
+
     def get_dimension_service(self):
         from TM1py import DimensionService
 
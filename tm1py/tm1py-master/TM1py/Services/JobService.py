@@ -1,14 +1,11 @@
-try:
-    import pandas as pd
-
-    _has_pandas = True
-except ImportError:
-    _has_pandas = False
-
 from TM1py.Services.ObjectService import ObjectService
 from TM1py.Services.RestService import RestService
+from TM1py.Utils.LazyImport import is_installed, lazy_import
 from TM1py.Utils.Utils import format_url, require_pandas, require_version
 
+pd = lazy_import("pandas")
+_has_pandas = is_installed("pandas")
+
 
 class JobService(ObjectService):
     """Service to handle TM1 Job objects introduced in v12"""
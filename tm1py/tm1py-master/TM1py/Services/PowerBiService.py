@@ -2,13 +2,10 @@ from collections.abc import Iterable
 
 from TM1py.Services import CellService, ElementService
 from TM1py.Utils import require_pandas
+from TM1py.Utils.LazyImport import is_installed, lazy_import
 
-try:
-    import pandas as pd
-
-    _has_pandas = True
-except ImportError:
-    _has_pandas = False
+pd = lazy_import("pandas")
+_has_pandas = is_installed("pandas")
 
 
 class PowerBiService:
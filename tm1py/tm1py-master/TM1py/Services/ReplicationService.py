@@ -0,0 +1,419 @@
+import glob
+import json
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
+
+from mdxpy import MdxBuilder, MdxHierarchySet
+
+from TM1py.Exceptions.Exceptions import TM1pyRestException
+from TM1py.Services.CellService import CellService
+from TM1py.Services.CubeService import CubeService
+from TM1py.Services.RestService import RestService
+from TM1py.Services.TransactionLogService import TransactionLogService
+from TM1py.Utils import format_url, require_pandas, require_pyarrow
+from TM1py.Utils.LazyImport import is_installed, lazy_import
+from TM1py.Utils.Utils import case_and_space_insensitive_equals
+
+if TYPE_CHECKING:
+    from TM1py.Services.TM1Service import TM1Service
+
+pd = lazy_import("pandas")
+_has_pandas = is_installed("pandas")
+
+
+class ReplicationCheckpoint:
+    """Durable state of the replication of one cube. Saved as JSON after every snapshot and sync."""
+
+    TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+    def __init__(
+        self,
+        file_path: str,
+        cube_name: str = None,
+        delta_request: str = None,
+        timestamp: str = None,
+        snapshot_cells: int = 0,
+        replicated_cells: int = 0,
+    ):
+        """
+
+        :param file_path: path of the JSON file
+        :param cube_name: name of the source cube
+        :param delta_request: next delta request of the transaction log
+        :param timestamp: time of the last replicated change, in UTC. Changes are replayed from here when
+        the delta request can't be executed anymore, e.g. after a restart of the TM1 server
+        :param snapshot_cells: number of cells in the initial snapshot
+        :param replicated_cells: number of cells replicated from the transaction log since the snapshot
+        """
+        self.file_path = file_path
+        self.cube_name = cube_name
+        self.delta_request = delta_request
+        self.timestamp = timestamp
+        self.snapshot_cells = snapshot_cells
+        self.replicated_cells = replicated_cells
+
+    @classmethod
+    def load(cls, file_path: str) -> "ReplicationCheckpoint":
+        with open(file_path, "r", encoding="utf-8") as file:
+            return cls(file_path=file_path, **json.load(file))
+
+    def save(self):
+        body = {
+            "cube_name": self.cube_name,
+            "delta_request": self.delta_request,
+            "timestamp": self.timestamp,
+            "snapshot_cells": self.snapshot_cells,
+            "replicated_cells": self.replicated_cells,
+        }
+        temporary_path = self.file_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(body, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        # a crash never leaves a partially written checkpoint behind
+        os.replace(temporary_path, self.file_path)
+
+    @property
+    def since(self) -> datetime:
+        return datetime.strptime(self.timestamp, self.TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+    @classmethod
+    def format_timestamp(cls, timestamp: datetime) -> str:
+        return timestamp.astimezone(timezone.utc).strftime(cls.TIMESTAMP_FORMAT)
+
+
+class ReplicationTarget(ABC):
+    """Base class for destinations of a replicated cube"""
+
+    @abstractmethod
+    def load_snapshot(self, cube_name: str, data: "pd.DataFrame"):
+        """Replace all data in the target with a snapshot of the source cube
+
+        :param cube_name: name of the source cube
+        :param data: DataFrame with one column per dimension and a 'Value' column
+        """
+
+    @abstractmethod
+    def apply(self, cube_name: str, cells: Dict[Tuple[str, ...], Any]):
+        """Apply a batch of changed cells
+
+        :param cube_name: name of the source cube
+        :param cells: {(elem_a, elem_b, elem_c): 243, (elem_d, elem_e, elem_f): 109}
+        """
+
+
+class CubeReplicationTarget(ReplicationTarget):
+    """Replicate into a cube with the same dimensionality, e.g. on another TM1 server"""
+
+    def __init__(
+        self, tm1: "TM1Service", cube_name: str = None, clear: bool = True, use_blob: bool = True, **write_kwargs
+    ):
+        """
+
+        :param tm1: TM1Service of the target server
+        :param cube_name: name of the target cube. Default: name of the source cube
+        :param clear: clear the target cube before a snapshot is loaded
+        :param use_blob: write through blob. Requires admin permissions
+        :param write_kwargs: further arguments for `CellService.write` and `CellService.write_dataframe`
+        """
+        self._tm1 = tm1
+        self.cube_name = cube_name
+        self.clear = clear
+        self.use_blob = use_blob
+        self._write_kwargs = write_kwargs
+        self._dimensions = None
+
+    def _get_dimensions(self, cube_name: str) -> List[str]:
+        if self._dimensions is None:
+            self._dimensions = self._tm1.cubes.get_dimension_names(cube_name)
+        return self._dimensions
+
+    def load_snapshot(self, cube_name: str, data: "pd.DataFrame"):
+        cube_name = self.cube_name or cube_name
+        if self.clear:
+            self._tm1.cells.clear(cube=cube_name)
+        if data.empty:
+            return
+        self._tm1.cells.write_dataframe(
+            cube_name,
+            data,
+            dimensions=self._get_dimensions(cube_name),
+            use_blob=self.use_blob,
+            **self._write_kwargs,
+        )
+
+    def apply(self, cube_name: str, cells: Dict[Tuple[str, ...], Any]):
+        cube_name = self.cube_name or cube_name
+        self._tm1.cells.write(
+            cube_name,
+            cells,
+            dimensions=self._get_dimensions(cube_name),
+            use_blob=self.use_blob,
+            **self._write_kwargs,
+        )
+
+
+class ColumnarReplicationTarget(ReplicationTarget):
+    """Replicate into a local directory of parquet files: one snapshot file plus one file per applied batch.
+
+    `read` returns the current state of the cube, `compact` merges the batches into the snapshot.
+    Numeric values are stored in the 'Value' column, string values in the 'StringValue' column.
+    """
+
+    SNAPSHOT_FILE = "snapshot.parquet"
+    BATCH_FILE_PATTERN = "batch-{:010d}.parquet"
+
+    def __init__(self, directory: str):
+        """
+
+        :param directory: directory for the parquet files. Created if it doesn't exist
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def _snapshot_path(self) -> str:
+        return os.path.join(self.directory, self.SNAPSHOT_FILE)
+
+    def _batch_paths(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "batch-*.parquet")))
+
+    def _get_dimensions(self) -> List[str]:
+        import pyarrow.parquet as pq
+
+        if not os.path.isfile(self._snapshot_path):
+            raise RuntimeError(f"No snapshot in '{self.directory}'")
+        return [name for name in pq.read_schema(self._snapshot_path).names if name not in ("Value", "StringValue")]
+
+    @staticmethod
+    def _split_values(data: "pd.DataFrame") -> "pd.DataFrame":
+        data = data.copy()
+        values = data.pop("Value")
+        is_string = values.map(lambda value: isinstance(value, str))
+        data["Value"] = pd.to_numeric(values.where(~is_string), errors="coerce").astype("float64")
+        data["StringValue"] = values.where(is_string).astype("object")
+        return data
+
+    def _write(self, data: "pd.DataFrame", file_path: str):
+        temporary_path = file_path + ".tmp"
+        data.to_parquet(temporary_path, engine="pyarrow", index=False)
+        os.replace(temporary_path, file_path)
+
+    @require_pandas
+    @require_pyarrow
+    def load_snapshot(self, cube_name: str, data: "pd.DataFrame"):
+        data = data.astype({column: str for column in data.columns if column != "Value"})
+        self._write(self._split_values(data), self._snapshot_path)
+        for batch_path in self._batch_paths():
+            os.remove(batch_path)
+
+    @require_pandas
+    @require_pyarrow
+    def apply(self, cube_name: str, cells: Dict[Tuple[str, ...], Any]):
+        dimensions = self._get_dimensions()
+        data = pd.DataFrame(list(cells.keys()), columns=dimensions, dtype=str)
+        data["Value"] = pd.Series(list(cells.values()), dtype="object")
+
+        batch_paths = self._batch_paths()
+        number = int(os.path.basename(batch_paths[-1])[6:16]) + 1 if batch_paths else 1
+        self._write(self._split_values(data), os.path.join(self.directory, self.BATCH_FILE_PATTERN.format(number)))
+
+    @require_pandas
+    @require_pyarrow
+    def read(self, skip_zeros: bool = True) -> "pd.DataFrame":
+        """Current state of the replicated cube
+
+        :param skip_zeros: drop cells that were set to 0 or empty string
+        :return: DataFrame with one column per dimension and a 'Value' column
+        """
+        dimensions = self._get_dimensions()
+        frames = [pd.read_parquet(path, engine="pyarrow") for path in [self._snapshot_path] + self._batch_paths()]
+        data = pd.concat(frames, ignore_index=True)
+        # later batches win
+        data = data.drop_duplicates(subset=dimensions, keep="last")
+
+        values = data["Value"].astype("object").where(data["StringValue"].isna(), data["StringValue"])
+        data = data[dimensions].assign(Value=values)
+        if skip_zeros:
+            data = data[~data["Value"].isin([0, "", None]) & data["Value"].notna()]
+        return data.reset_index(drop=True)
+
+    @require_pandas
+    @require_pyarrow
+    def compact(self):
+        """Merge all batches into the snapshot"""
+        self.load_snapshot(cube_name=None, data=self.read(skip_zeros=True))
+
+
+class ReplicationService:
+    """Incremental replication of cubes, driven by the transaction log.
+
+    `snapshot` copies all leaf cells of the cube to the target and starts tracking the transaction log.
+    `sync` applies the changes since the last snapshot or sync. Changes are coalesced per intersection,
+    so a cell that changed many times is written once with its latest value.
+
+    Progress is saved in a checkpoint file after every successful snapshot and sync, so replication can be
+    resumed from another process. Since every change carries the absolute new value, replaying changes after a
+    crash is harmless.
+
+    Changes that are not logged (e.g. cubes with disabled transaction logging) are not replicated.
+    Not available in TM1 v12.
+
+    >>> target = ColumnarReplicationTarget("replica/sales")
+    >>> tm1.replication.replicate("Sales", target, "replica/sales.json")
+    """
+
+    # margin for clock differences between client and server when changes are replayed by timestamp
+    CLOCK_TOLERANCE = timedelta(minutes=5)
+    # arguments of `replicate` that only apply to one of the two modes
+    SNAPSHOT_ARGUMENTS = ("mdx", "skip_rule_derived_cells", "use_blob", "max_workers")
+    SYNC_ARGUMENTS = ("batch_size",)
+
+    def __init__(self, tm1_rest: RestService):
+        """
+
+        :param tm1_rest: instance of RestService
+        """
+        self._tm1_rest = tm1_rest
+        self.cells = CellService(tm1_rest)
+        self.cubes = CubeService(tm1_rest)
+
+    @staticmethod
+    def _transaction_log_filter(cube_name: str) -> str:
+        return format_url("Cube eq '{}'", cube_name)
+
+    def _build_snapshot_mdx(self, cube_name: str) -> str:
+        query = MdxBuilder.from_cube(cube_name).columns_non_empty()
+        for dimension_name in self.cubes.get_dimension_names(cube_name):
+            query.add_hierarchy_set_to_column_axis(MdxHierarchySet.tm1_subset_all(dimension_name).filter_by_level(0))
+        return query.to_mdx()
+
+    @require_pandas
+    def snapshot(
+        self,
+        cube_name: str,
+        target: ReplicationTarget,
+        checkpoint_file: str,
+        mdx: str = None,
+        skip_rule_derived_cells: bool = True,
+        use_blob: bool = False,
+        max_workers: int = 1,
+        **kwargs,
+    ) -> int:
+        """Copy all leaf cells of the cube to the target and start tracking the transaction log
+
+        :param cube_name: name of the source cube
+        :param target: ReplicationTarget
+        :param checkpoint_file: path of the checkpoint file. Overwritten
+        :param mdx: MDX query for the snapshot. Default: all non empty leaf cells of the cube
+        :param skip_rule_derived_cells: don't copy rule derived cells
+        :param use_blob: extract through blob. Requires admin permissions
+        :param max_workers: number of parallel requests for the extraction
+        :return: number of cells in the snapshot
+        """
+        # track changes before the extraction starts, so no change is missed. Changes during the
+        # extraction are applied twice, which doesn't alter the result
+        started = datetime.now(timezone.utc) - self.CLOCK_TOLERANCE
+        transaction_log = TransactionLogService(self._tm1_rest)
+        transaction_log.initialize_delta_requests(filter=self._transaction_log_filter(cube_name), **kwargs)
+
+        data = self.cells.execute_mdx_dataframe(
+            mdx=mdx or self._build_snapshot_mdx(cube_name),
+            skip_zeros=True,
+            skip_consolidated_cells=True,
+            skip_rule_derived_cells=skip_rule_derived_cells,
+            use_blob=use_blob,
+            max_workers=max_workers,
+            use_result_cache=False,
+            **kwargs,
+        )
+        target.load_snapshot(cube_name, data)
+
+        checkpoint = ReplicationCheckpoint(
+            file_path=checkpoint_file,
+            cube_name=cube_name,
+            delta_request=transaction_log.last_delta_request,
+            timestamp=ReplicationCheckpoint.format_timestamp(started),
+            snapshot_cells=len(data),
+        )
+        checkpoint.save()
+        return len(data)
+
+    def sync(
+        self,
+        cube_name: str,
+        target: ReplicationTarget,
+        checkpoint_file: str,
+        batch_size: int = 10_000,
+        **kwargs,
+    ) -> int:
+        """Apply the changes of the cube since the last snapshot or sync to the target
+
+        :param cube_name: name of the source cube
+        :param target: ReplicationTarget
+        :param checkpoint_file: path of a checkpoint file that was written by `snapshot`
+        :param batch_size: max number of cells per call to `target.apply`
+        :return: number of replicated cells
+        """
+        checkpoint = ReplicationCheckpoint.load(checkpoint_file)
+        if not case_and_space_insensitive_equals(checkpoint.cube_name, cube_name):
+            raise ValueError(f"Checkpoint '{checkpoint_file}' belongs to cube '{checkpoint.cube_name}'")
+
+        transaction_log = TransactionLogService(self._tm1_rest)
+        transaction_log.last_delta_request = checkpoint.delta_request
+        try:
+            entries = transaction_log.execute_delta_request(**kwargs)
+        except TM1pyRestException:
+            # delta request is gone, e.g. after a restart of the server. Track changes again
+            # and replay the transaction log since the last checkpoint
+            transaction_log.initialize_delta_requests(filter=self._transaction_log_filter(cube_name), **kwargs)
+            entries = transaction_log.get_entries(reverse=False, cube=cube_name, since=checkpoint.since, **kwargs)
+
+        cells = self.coalesce(entries, cube_name)
+        items = list(cells.items())
+        for start in range(0, len(items), batch_size):
+            target.apply(cube_name, dict(items[start : start + batch_size]))
+
+        # only move the checkpoint once all changes are applied
+        checkpoint.delta_request = transaction_log.last_delta_request
+        timestamps = [entry["TimeStamp"] for entry in entries if entry.get("TimeStamp")]
+        if timestamps:
+            checkpoint.timestamp = max(timestamps)[:19] + "Z"
+        checkpoint.replicated_cells += len(cells)
+        checkpoint.save()
+        return len(cells)
+
+    def replicate(self, cube_name: str, target: ReplicationTarget, checkpoint_file: str, **kwargs) -> int:
+        """Sync if a checkpoint exists, otherwise take a snapshot
+
+        :param cube_name: name of the source cube
+        :param target: ReplicationTarget
+        :param checkpoint_file: path of the checkpoint file
+        :param kwargs: arguments for `snapshot` and `sync`. Arguments of the mode that is not executed are ignored
+        :return: number of replicated cells
+        """
+        if os.path.isfile(checkpoint_file):
+            kwargs = {key: value for key, value in kwargs.items() if key not in self.SNAPSHOT_ARGUMENTS}
+            return self.sync(cube_name, target, checkpoint_file, **kwargs)
+        kwargs = {key: value for key, value in kwargs.items() if key not in self.SYNC_ARGUMENTS}
+        return self.snapshot(cube_name, target, checkpoint_file, **kwargs)
+
+    @staticmethod
+    def coalesce(entries: Iterable[Dict], cube_name: str = None) -> Dict[Tuple[str, ...], Any]:
+        """Reduce transaction log entries to the latest value per intersection
+
+        :param entries: transaction log entries in chronological order
+        :param cube_name: ignore entries of other cubes
+        :return: {(elem_a, elem_b, elem_c): 243, (elem_d, elem_e, elem_f): 109}
+        """
+        cells = dict()
+        for entry in entries:
+            if cube_name and not case_and_space_insensitive_equals(entry["Cube"], cube_name):
+                continue
+            coordinates = tuple(entry["Tuple"])
+            # move changed intersections to the end, so cells are written in the order of their last change
+            cells.pop(coordinates, None)
+            cells[coordinates] = entry["NewValue"]
+        return cells
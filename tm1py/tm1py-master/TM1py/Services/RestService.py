@@ -6,6 +6,7 @@ import time
 import warnings
 from ast import literal_eval
 from base64 import b64decode, b64encode
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from enum import Enum
 from http.client import HTTPResponse
 from http.cookies import SimpleCookie
@@ -22,8 +23,14 @@ from urllib3._collections import HTTPHeaderDict
 
 from TM1py.Exceptions.Exceptions import TM1pyTimeout, TM1pyVersionDeprecationException
 from TM1py.Utils import (
+    AsyncOperationPoller,
+    Batch,
     CaseAndSpaceInsensitiveSet,
     HTTPAdapterWithSocketOptions,
+    Instrumentation,
+    JsonDecoder,
+    MDXResultCache,
+    MetadataCache,
     case_and_space_insensitive_equals,
     verify_version,
 )
@@ -135,9 +142,47 @@ class RestService:
         - **proxies** (dict): Dictionary with proxies, e.g. {'http': 'http://proxy.example.com:8080', 'https': 'http://secureproxy.example.com:8090'}.
         - **ssl_context**: User-defined SSL context.
         - **cert** (str|tuple): (Optional) If string, path to SSL client cert file (.pem). If tuple, ('cert', 'key') pair.
+        - **metadata_cache** (bool): Cache cube dimensions, element types, principal names and edges (default: False).
+        - **metadata_cache_ttl** (float): Seconds after which cached metadata expires (default: 300).
+        - **metadata_cache_size** (int): Maximum number of cached metadata entries (default: 1000).
+        - **mdx_result_cache** (bool): Cache results of `execute_mdx*` functions in CellService (default: False).
+        - **mdx_result_cache_size** (int): Maximum number of cached MDX results (default: 128).
+        - **mdx_result_cache_max_bytes** (int): Maximum total size of cached MDX results in bytes (default: None).
+        - **mdx_result_cache_directory** (str): Store cached MDX results in files in this directory instead of memory. Must be a private directory of the current user, as the files are unpickled.
+        - **mdx_result_cache_check_cube_state** (bool): Validate cached MDX results against LastDataUpdate and LastSchemaUpdate of the cube in the FROM clause. Values that rules read from other cubes are not tracked (default: True).
+        - **json_decoder** (str|JsonDecoder): Library to decode JSON responses: 'auto', 'orjson', 'msgspec' or 'json' (default: 'auto': orjson or msgspec if installed).
+        - **instrumentation** (bool): Record per-endpoint latency histograms and counters (default: False).
+        - **instrumentation_hooks** (list): Functions that are called with a RequestRecord after every request.
 
         :param kwargs: See description above for all supported arguments	
         """
+        self._configure(**kwargs)
+        # polls all outstanding async operations of the session in one background thread
+        self._async_poller = AsyncOperationPoller(
+            retrieve=self.retrieve_async_response,
+            initial_delay=self._async_polling_initial_delay,
+            max_delay=self._async_polling_max_delay,
+            backoff_factor=self._async_polling_backoff_factor,
+            max_workers=int(kwargs.get("async_polling_max_workers", 4)),
+        )
+
+        self._s = Session()
+        self._manage_http_adapter()
+
+        self._s.cert = self._cert
+
+        if self._proxies:
+            self._s.proxies = self._proxies
+
+        # First contact with TM1
+        self.connect()
+        if not self._version:
+            self.set_version()
+
+    def _configure(self, **kwargs):
+        """Read connection settings from kwargs. Shared with AsyncRestService, so it must not create
+        anything that relies on blocking requests
+        """
         # store kwargs for future use e.g. re_connect on 401 session timeout
         self._kwargs = kwargs
 
@@ -172,8 +217,31 @@ class RestService:
         self._async_polling_initial_delay = float(kwargs.get("async_polling_initial_delay", 0.1))
         self._async_polling_max_delay = float(kwargs.get("async_polling_max_delay", 1.0))
         self._async_polling_backoff_factor = float(kwargs.get("async_polling_backoff_factor", 2))
+        # request metrics and hooks, see Instrumentation
+        self._instrumentation = Instrumentation(
+            enabled=self.translate_to_boolean(kwargs.get("instrumentation", False)),
+            hooks=kwargs.get("instrumentation_hooks", None),
+        )
         # is retrieved on demand and then cached
         self._sandboxing_disabled = None
+        # whether the server supports OData $batch requests. Determined by the first Batch
+        self._batch_supported = None
+        # shared by all services that use this instance
+        self._metadata_cache = MetadataCache(
+            ttl=float(kwargs.get("metadata_cache_ttl", 300)),
+            max_size=int(kwargs.get("metadata_cache_size", 1000)),
+            enabled=self.translate_to_boolean(kwargs.get("metadata_cache", False)),
+        )
+        self._mdx_result_cache = MDXResultCache(
+            max_size=int(kwargs.get("mdx_result_cache_size", 128)),
+            max_bytes=int(kwargs["mdx_result_cache_max_bytes"]) if kwargs.get("mdx_result_cache_max_bytes") else None,
+            directory=kwargs.get("mdx_result_cache_directory", None),
+            check_cube_state=self.translate_to_boolean(kwargs.get("mdx_result_cache_check_cube_state", True)),
+            enabled=self.translate_to_boolean(kwargs.get("mdx_result_cache", False)),
+        )
+        # decodes response.json() of all services
+        json_decoder = kwargs.get("json_decoder", "auto")
+        self._json_decoder = json_decoder if isinstance(json_decoder, JsonDecoder) else JsonDecoder(json_decoder)
         # optional verbose logging to stdout
         self.handle_logging(kwargs.get("logging", False))
 
@@ -183,6 +251,7 @@ class RestService:
         self._is_security_admin = None
         self._is_ops_admin = None
         self._ssl_context = kwargs.get("ssl_context", None)
+        self._cert = kwargs.get("cert")
 
         # populated later on the fly for users with the name different from 'Admin'
         if self._user and case_and_space_insensitive_equals(self._user, "ADMIN"):
@@ -202,20 +271,6 @@ class RestService:
 
         self.disable_http_warnings()
 
-        self._s = Session()
-        self._manage_http_adapter()
-
-        self._cert = kwargs.get("cert")
-        self._s.cert = self._cert
-
-        if self._proxies:
-            self._s.proxies = self._proxies
-
-        # First contact with TM1
-        self.connect()
-        if not self._version:
-            self.set_version()
-
     def _determine_verify(self, verify: [bool, str] = None) -> [bool, str]:
         if verify is None:
             # Default SSL verification in v12 is True
@@ -279,6 +334,72 @@ class RestService:
         """
         Execute a request to TM1 REST API
         """
+        if not self._instrumentation.enabled:
+            return self._request(
+                method=method,
+                url=url,
+                data=data,
+                encoding=encoding,
+                async_requests_mode=async_requests_mode,
+                return_async_id=return_async_id,
+                timeout=timeout,
+                cancel_at_timeout=cancel_at_timeout,
+                idempotent=idempotent,
+                verify_response=verify_response,
+                **kwargs,
+            )
+
+        with self._instrumentation.track(
+            method=method,
+            url=url,
+            data=data,
+            encoding=encoding,
+            async_requests_mode=return_async_id
+            or (self._async_requests_mode if async_requests_mode is None else async_requests_mode),
+        ) as record:
+            response = self._request(
+                method=method,
+                url=url,
+                data=data,
+                encoding=encoding,
+                async_requests_mode=async_requests_mode,
+                return_async_id=return_async_id,
+                timeout=timeout,
+                cancel_at_timeout=cancel_at_timeout,
+                idempotent=idempotent,
+                verify_response=verify_response,
+                **kwargs,
+            )
+            if isinstance(response, Response):
+                record.set_response(
+                    status_code=response.status_code,
+                    bytes_received=(
+                        int(response.headers.get("Content-Length", 0))
+                        if kwargs.get("stream")
+                        else len(response.content)
+                    ),
+                    server_time=response.elapsed.total_seconds(),
+                )
+            return response
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        data: str = "",
+        encoding="utf-8",
+        async_requests_mode: Optional[bool] = None,
+        return_async_id=False,
+        timeout: float = None,
+        cancel_at_timeout: bool = False,
+        idempotent: bool = False,
+        verify_response: bool = True,
+        **kwargs,
+    ):
+        # invalidate before and after the request: reads that run while the request is processed
+        # may cache the state from before the change
+        relative_url = url
+        self._metadata_cache.invalidate_for_request(method=method, url=relative_url)
         url, data = self._url_and_body(url=url, data=data, encoding=encoding)
 
         timeout = timeout if timeout else self._timeout
@@ -290,8 +411,13 @@ class RestService:
             elif async_requests_mode is None:
                 async_requests_mode = self._async_requests_mode
 
+            # requests of service calls in a Batch are collected and sent in $batch requests
+            batch = Batch.collecting(self)
+
             # Execute request based on mode
-            if not async_requests_mode:
+            if batch is not None and not return_async_id and Batch.accepts(data, **kwargs):
+                response = batch.execute(method=method, url=url, data=data, timeout=timeout, **kwargs)
+            elif not async_requests_mode:
                 response = self._execute_sync_request(method=method, url=url, data=data, timeout=timeout, **kwargs)
             else:
                 response = self._execute_async_request(
@@ -312,7 +438,7 @@ class RestService:
             if verify_response:
                 self.verify_response(response=response)
             response.encoding = encoding
-            return response
+            return self._json_decoder.install(response)
 
         except Timeout:
             if cancel_at_timeout or (cancel_at_timeout is None and self._cancel_at_timeout):
@@ -348,6 +474,10 @@ class RestService:
             # Other connection errors
             raise e
 
+        finally:
+            self._metadata_cache.invalidate_for_request(method=method, url=relative_url)
+            self._mdx_result_cache.invalidate_for_request(method=method, url=relative_url)
+
     def _execute_sync_request(self, method: str, url: str, data: str, timeout: float, **kwargs):
         """
         Execute a synchronous request with session timeout handling
@@ -356,6 +486,7 @@ class RestService:
 
         # Handle session timeout
         if self._re_connect_on_session_timeout and response.status_code == 401:
+            self._instrumentation.note_reconnect()
             self.connect()
             response = self._s.request(
                 method=method, url=url, data=data, verify=self._verify, timeout=timeout, **kwargs
@@ -379,6 +510,7 @@ class RestService:
 
         # Handle session timeout
         if self._re_connect_on_session_timeout and response.status_code == 401:
+            self._instrumentation.note_reconnect()
             self.connect()
             response = self._s.request(
                 method=method, url=url, data=data, verify=self._verify, timeout=timeout, **kwargs
@@ -402,13 +534,13 @@ class RestService:
 
     def _poll_async_response(self, async_id: str, timeout: float, cancel_at_timeout: bool, method: str, url: str):
         """
-        Poll for async operation completion
+        Wait for async operation completion. Status checks are done by the shared async poller
         """
-        for wait in self.wait_time_generator(timeout):
-            response = self.retrieve_async_response(async_id)
-            if response.status_code in [200, 201]:
-                return response
-            time.sleep(wait)
+        future = self._async_poller.submit(async_id, endpoint=AsyncOperationPoller.endpoint(method, url))
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._async_poller.discard(async_id)
 
         # Timeout reached
         if cancel_at_timeout or (cancel_at_timeout is None and self._cancel_at_timeout):
@@ -465,11 +597,13 @@ class RestService:
             )
 
             time.sleep(current_delay)
+            self._instrumentation.note_retry()
 
             try:
                 # Reconnect
                 self._manage_http_adapter()
                 self.connect()
+                self._instrumentation.note_reconnect()
 
                 # Only retry if idempotent
                 if not idempotent:
@@ -679,6 +813,7 @@ class RestService:
         encoding: str = "utf-8",
         idempotent: bool = True,
         verify_response: bool = True,
+        stream: bool = False,
         **kwargs,
     ):
         """Perform a GET request against TM1 instance
@@ -690,6 +825,8 @@ class RestService:
         :param timeout: Number of seconds that the client will wait to receive the first byte.
         :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
         :param encoding:
+        :param stream: If True the response body is not downloaded immediately and can be consumed incrementally.
+        Caller is responsible to close the response.
         :return: response object or async_id
         """
 
@@ -705,6 +842,7 @@ class RestService:
             encoding=encoding,
             idempotent=idempotent,
             verify_response=verify_response,
+            stream=stream,
         )
 
     def POST(
@@ -719,6 +857,7 @@ class RestService:
         encoding: str = "utf-8",
         idempotent: bool = False,
         verify_response: bool = True,
+        stream: bool = False,
         **kwargs,
     ):
         """Perform a POST request against TM1 instance
@@ -730,6 +869,8 @@ class RestService:
         :param timeout: Number of seconds that the client will wait to receive the first byte.
         :param cancel_at_timeout: Abort operation in TM1 when timeout is reached
         :param encoding:
+        :param stream: If True the response body is not downloaded immediately and can be consumed incrementally.
+        Caller is responsible to close the response.
         :return: response object or async_id
         """
 
@@ -745,6 +886,7 @@ class RestService:
             encoding=encoding,
             idempotent=idempotent,
             verify_response=verify_response,
+            stream=stream,
         )
 
         return response
@@ -882,6 +1024,7 @@ class RestService:
                 **kwargs,
             )
         finally:
+            self._async_poller.close()
             self._s.close()
 
     @staticmethod
@@ -1054,6 +1197,26 @@ class RestService:
         metadata = self.GET(url=url).content.decode("utf-8")
         return json.loads(metadata)
 
+    @property
+    def metadata_cache(self) -> MetadataCache:
+        return self._metadata_cache
+
+    @property
+    def mdx_result_cache(self) -> MDXResultCache:
+        return self._mdx_result_cache
+
+    @property
+    def json_decoder(self) -> JsonDecoder:
+        return self._json_decoder
+
+    @property
+    def async_poller(self) -> AsyncOperationPoller:
+        return self._async_poller
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        return self._instrumentation
+
     @property
     def version(self) -> str:
         return self._version
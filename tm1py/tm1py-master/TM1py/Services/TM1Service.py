@@ -26,11 +26,32 @@ from TM1py.Services.LoggerService import LoggerService
 from TM1py.Services.MessageLogService import MessageLogService
 from TM1py.Services.MonitoringService import MonitoringService
 from TM1py.Services.PowerBiService import PowerBiService
+from TM1py.Services.ReplicationService import ReplicationService
 from TM1py.Services.ServerService import ServerService
 from TM1py.Services.SessionService import SessionService
 from TM1py.Services.ThreadService import ThreadService
 from TM1py.Services.TransactionLogService import TransactionLogService
 from TM1py.Services.UserService import UserService
+from TM1py.Utils import Batch
+
+
+class _LazyService:
+    """Service attribute of TM1Service that is constructed on first access and then kept on the instance"""
+
+    def __init__(self, service_class):
+        self.service_class = service_class
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        service = self.service_class(instance._tm1_rest)
+        # non-data descriptor: the instance attribute takes precedence over this descriptor from now on
+        instance.__dict__[self.name] = service
+        return service
 
 
 class TM1Service:
@@ -38,8 +59,41 @@ class TM1Service:
 
     Can be saved and restored from File, to avoid multiple authentication with TM1.
 
+    Services are constructed on first access, e.g. `tm1.cells`, so connecting stays fast.
+
     """
 
+    annotations = _LazyService(AnnotationService)
+    cells = _LazyService(CellService)
+    chores = _LazyService(ChoreService)
+    cubes = _LazyService(CubeService)
+    dimensions = _LazyService(DimensionService)
+    elements = _LazyService(ElementService)
+    git = _LazyService(GitService)
+    hierarchies = _LazyService(HierarchyService)
+    processes = _LazyService(ProcessService)
+    security = _LazyService(SecurityService)
+    subsets = _LazyService(SubsetService)
+    applications = _LazyService(ApplicationService)
+    views = _LazyService(ViewService)
+    sandboxes = _LazyService(SandboxService)
+    files = _LazyService(FileService)
+    jobs = _LazyService(JobService)
+    users = _LazyService(UserService)
+    threads = _LazyService(ThreadService)
+    sessions = _LazyService(SessionService)
+    transaction_logs = _LazyService(TransactionLogService)
+    message_logs = _LazyService(MessageLogService)
+    configuration = _LazyService(ConfigurationService)
+    audit_logs = _LazyService(AuditLogService)
+
+    # higher level modules
+    power_bi = _LazyService(PowerBiService)
+    loggers = _LazyService(LoggerService)
+    server = _LazyService(ServerService)
+    monitoring = _LazyService(MonitoringService)
+    replication = _LazyService(ReplicationService)
+
     def __init__(self, **kwargs):
         """Initiate the TM1Service
 
@@ -91,41 +145,21 @@ class TM1Service:
         - **proxies** (dict): Dictionary of proxies, e.g., {'http': 'http://proxy.example.com:8080'}.
         - **ssl_context**: User-defined SSL context.
         - **cert** (str or tuple): Path to SSL client cert file or ('cert', 'key') pair.
+        - **metadata_cache** (bool): Cache cube dimensions, element types, principal names and edges (default: False).
+        - **metadata_cache_ttl** (float): Seconds after which cached metadata expires (default: 300).
+        - **metadata_cache_size** (int): Maximum number of cached metadata entries (default: 1000).
+        - **mdx_result_cache** (bool): Cache results of `execute_mdx*` functions in CellService (default: False).
+        - **mdx_result_cache_size** (int): Maximum number of cached MDX results (default: 128).
+        - **mdx_result_cache_max_bytes** (int): Maximum total size of cached MDX results in bytes (default: None).
+        - **mdx_result_cache_directory** (str): Store cached MDX results in files in this directory instead of memory. Must be a private directory of the current user, as the files are unpickled.
+        - **mdx_result_cache_check_cube_state** (bool): Validate cached MDX results against the timestamps of the cube in the FROM clause. Values that rules read from other cubes are not tracked (default: True).
 
         :param kwargs: See description above for all supported arguments
 
         """
         self._tm1_rest = RestService(**kwargs)
-        self.annotations = AnnotationService(self._tm1_rest)
-        self.cells = CellService(self._tm1_rest)
-        self.chores = ChoreService(self._tm1_rest)
-        self.cubes = CubeService(self._tm1_rest)
-        self.dimensions = DimensionService(self._tm1_rest)
-        self.elements = ElementService(self._tm1_rest)
-        self.git = GitService(self._tm1_rest)
-        self.hierarchies = HierarchyService(self._tm1_rest)
-        self.processes = ProcessService(self._tm1_rest)
-        self.security = SecurityService(self._tm1_rest)
-        self.subsets = SubsetService(self._tm1_rest)
-        self.applications = ApplicationService(self._tm1_rest)
-        self.views = ViewService(self._tm1_rest)
-        self.sandboxes = SandboxService(self._tm1_rest)
-        self.files = FileService(self._tm1_rest)
-        self.jobs = JobService(self._tm1_rest)
-        self.users = UserService(self._tm1_rest)
-        self.threads = ThreadService(self._tm1_rest)
-        self.sessions = SessionService(self._tm1_rest)
-        self.transaction_logs = TransactionLogService(self._tm1_rest)
-        self.message_logs = MessageLogService(self._tm1_rest)
-        self.configuration = ConfigurationService(self._tm1_rest)
-        self.audit_logs = AuditLogService(self._tm1_rest)
-
-        # higher level modules
-        self.power_bi = PowerBiService(self._tm1_rest)
-        self.loggers = LoggerService(self._tm1_rest)
-
-        self._server = None
-        self._monitoring = None
+        self._metadata_cache_transaction_log = None
+        self._mdx_result_cache_transaction_log = None
 
     def logout(self, **kwargs):
         self._tm1_rest.logout(**kwargs)
@@ -139,18 +173,6 @@ class TM1Service:
         except Exception as e:
             warnings.warn(f"Logout Failed due to Exception: {e}")
 
-    @property
-    def server(self):
-        if not self._server:
-            self._server = ServerService(self._tm1_rest)
-        return self._server
-
-    @property
-    def monitoring(self):
-        if not self._monitoring:
-            self._monitoring = MonitoringService(self._tm1_rest)
-        return self._monitoring
-
     @property
     def whoami(self):
         return self.security.get_current_user()
@@ -167,6 +189,56 @@ class TM1Service:
     def connection(self):
         return self._tm1_rest
 
+    @property
+    def metadata_cache(self):
+        return self._tm1_rest.metadata_cache
+
+    def sync_metadata_cache(self, **kwargs):
+        """Invalidate cached metadata based on changes to control cubes in the transaction log since the last call.
+        First call starts tracking the transaction log. Not available in TM1 v12.
+        """
+        if self._metadata_cache_transaction_log is None:
+            transaction_log = TransactionLogService(self._tm1_rest)
+            transaction_log.initialize_delta_requests(filter="startswith(Cube,'}')", **kwargs)
+            self._metadata_cache_transaction_log = transaction_log
+            return
+
+        entries = self._metadata_cache_transaction_log.execute_delta_request(**kwargs)
+        self._tm1_rest.metadata_cache.invalidate_from_transaction_log(entries)
+
+    @property
+    def mdx_result_cache(self):
+        return self._tm1_rest.mdx_result_cache
+
+    def sync_mdx_result_cache(self, **kwargs):
+        """Invalidate cached MDX results based on changes in the transaction log since the last call.
+        First call starts tracking the transaction log. Not available in TM1 v12.
+        Changes that are not logged (e.g. cubes with disabled transaction log) are not detected.
+        """
+        if self._mdx_result_cache_transaction_log is None:
+            transaction_log = TransactionLogService(self._tm1_rest)
+            transaction_log.initialize_delta_requests(**kwargs)
+            self._mdx_result_cache_transaction_log = transaction_log
+            return
+
+        entries = self._mdx_result_cache_transaction_log.execute_delta_request(**kwargs)
+        self._tm1_rest.mdx_result_cache.invalidate_from_transaction_log(entries)
+
+    def batch(self, mode: str = "auto", max_requests: int = 100, max_workers: int = None) -> Batch:
+        """Collect independent service calls and send their requests in OData $batch requests.
+        Falls back to parallel execution if the server doesn't support $batch.
+
+        >>> with tm1.batch() as batch:
+        >>>     futures = [batch.submit(tm1.subsets.exists, subset, "Region", "Region") for subset in subsets]
+        >>> exists = [future.result() for future in futures]
+
+        :param mode: 'auto', 'batch' or 'parallel'
+        :param max_requests: max number of requests in one $batch request
+        :param max_workers: max number of parallel calls in mode 'parallel'. Default: connection pool size
+        :return: Batch. Calls are executed when leaving the context or when the result of a future is requested
+        """
+        return Batch(self._tm1_rest, mode=mode, max_requests=max_requests, max_workers=max_workers)
+
     def save_to_file(self, file_name):
         with open(file_name, "wb") as file:
             pickle.dump(self, file)
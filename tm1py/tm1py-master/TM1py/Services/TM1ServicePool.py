@@ -0,0 +1,242 @@
+import threading
+import time
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from requests import ConnectionError
+
+from TM1py.Services.TM1Service import TM1Service
+
+
+class TM1ServicePool:
+    """Pool of authenticated TM1Service instances, each with its own TM1 session and HTTP session.
+
+    A TM1Service must only be used by one thread at a time: TM1 serializes the requests of one session and
+    cookies and reconnects of one `requests.Session` race between threads. The pool leases every TM1Service to one
+    thread at a time, so parallel work runs on separate TM1 sessions.
+
+    Sessions are created lazily up to `size`. Sessions that have been idle for longer than `health_check_interval`
+    are checked before they are leased and re-authenticated if TM1 dropped them.
+    `max_sessions_per_server` caps the number of concurrently leased sessions per TM1 server across all pools
+    of the process.
+
+    >>> with TM1ServicePool(size=8, address="localhost", port=12354, user="admin", password="apple", ssl=True) as pool:
+    >>>     with pool.lease() as tm1:
+    >>>         tm1.cells.execute_mdx_values(mdx)
+    """
+
+    # one semaphore per TM1 server, shared by all pools of the process
+    _server_semaphores: Dict[str, threading.BoundedSemaphore] = dict()
+    _server_semaphores_lock = threading.Lock()
+
+    def __init__(
+        self,
+        size: int = 4,
+        max_sessions_per_server: int = None,
+        health_check_interval: float = 60.0,
+        **kwargs,
+    ):
+        """
+
+        :param size: max number of sessions in the pool
+        :param max_sessions_per_server: max number of concurrently leased sessions per TM1 server across all pools.
+        The first pool that connects to a server determines the limit. None: no limit beyond `size`
+        :param health_check_interval: seconds a session can be idle before it is checked on the next lease
+        :param kwargs: connection arguments as for TM1Service (e.g. address, port, user, password, session_context)
+        """
+        if size < 1:
+            raise ValueError("'size' must be a positive integer")
+        if "session_id" in kwargs:
+            raise ValueError("'session_id' must not be used with TM1ServicePool, as it requires separate sessions")
+
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self._kwargs = kwargs
+        self._idle = deque()
+        self._leased = set()
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._server_semaphore = None
+        if max_sessions_per_server:
+            self._server_semaphore = self._get_server_semaphore(self.server_key(**kwargs), max_sessions_per_server)
+
+    @staticmethod
+    def server_key(**kwargs) -> str:
+        """Identifies the TM1 server (resp. v12 database) that a set of connection arguments points to"""
+        if kwargs.get("base_url"):
+            return kwargs["base_url"].lower().rstrip("/")
+        return "/".join(
+            str(kwargs.get(argument) or "").lower() for argument in ("address", "port", "instance", "database")
+        )
+
+    @classmethod
+    def _get_server_semaphore(cls, server_key: str, max_sessions: int) -> threading.BoundedSemaphore:
+        with cls._server_semaphores_lock:
+            if server_key not in cls._server_semaphores:
+                cls._server_semaphores[server_key] = threading.BoundedSemaphore(max_sessions)
+            return cls._server_semaphores[server_key]
+
+    @property
+    def leased(self) -> int:
+        with self._condition:
+            return len(self._leased)
+
+    @property
+    def idle(self) -> int:
+        with self._condition:
+            return len(self._idle)
+
+    def acquire(self, timeout: float = None) -> TM1Service:
+        """Lease a TM1Service. Blocks until a session is available. Must be given back with `release`
+
+        :param timeout: max seconds to wait for a session. None: wait forever
+        :return: TM1Service for exclusive use by the calling thread
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if self._server_semaphore and not self._server_semaphore.acquire(timeout=self._remaining(deadline)):
+            raise TimeoutError(f"No TM1 session available for server within {timeout} seconds")
+
+        try:
+            tm1, last_used = self._take(deadline, timeout)
+            if tm1 is None:
+                tm1 = self._create()
+            elif time.monotonic() - last_used > self.health_check_interval:
+                self._check(tm1)
+        except BaseException:
+            if self._server_semaphore:
+                self._server_semaphore.release()
+            raise
+
+        with self._condition:
+            self._leased.add(tm1)
+        return tm1
+
+    def release(self, tm1: TM1Service, discard: bool = False):
+        """Give a leased TM1Service back to the pool
+
+        :param tm1: TM1Service that was returned by `acquire`
+        :param discard: log the session out instead of returning it to the pool, e.g. after connection errors
+        """
+        with self._condition:
+            if tm1 not in self._leased:
+                raise ValueError("TM1Service is not leased from this pool")
+            self._leased.remove(tm1)
+            discard = discard or self._closed
+            if discard:
+                self._created -= 1
+            else:
+                self._idle.append((tm1, time.monotonic()))
+            self._condition.notify()
+
+        if self._server_semaphore:
+            self._server_semaphore.release()
+
+        if discard:
+            self._logout(tm1)
+
+    @contextmanager
+    def lease(self, timeout: float = None) -> Iterator[TM1Service]:
+        """Context manager that leases a TM1Service and gives it back when the block is left
+
+        :param timeout: max seconds to wait for a session. None: wait forever
+        """
+        tm1 = self.acquire(timeout=timeout)
+        discard = False
+        try:
+            yield tm1
+        except ConnectionError:
+            discard = True
+            raise
+        finally:
+            self.release(tm1, discard=discard)
+
+    def map(self, func: Callable[[TM1Service, Any], Any], iterable: Iterable, max_workers: int = None) -> List:
+        """Call `func(tm1, item)` for every item on parallel threads, each with a leased TM1Service
+
+        :param func: function that takes a TM1Service and an item
+        :param iterable: items
+        :param max_workers: number of threads. Default: size of the pool
+        :return: results in the order of the items
+        """
+
+        def _call(item):
+            with self.lease() as tm1:
+                return func(tm1, item)
+
+        with ThreadPoolExecutor(max_workers or self.size) as executor:
+            return list(executor.map(_call, iterable))
+
+    def close(self):
+        """Log out all idle sessions. Leased sessions are logged out when they are released"""
+        with self._condition:
+            self._closed = True
+            idle = [tm1 for tm1, _ in self._idle]
+            self._idle.clear()
+            self._created -= len(idle)
+            self._condition.notify_all()
+
+        for tm1 in idle:
+            self._logout(tm1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"TM1ServicePool(size={self.size}, leased={self.leased}, idle={self.idle})"
+
+    def _take(self, deadline: Optional[float], timeout: Optional[float]):
+        """Pop an idle session or reserve a slot for a new one (None)"""
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("TM1ServicePool is closed")
+                if self._idle:
+                    # most recently used session first: it is the least likely to be timed out
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    return None, None
+                if not self._condition.wait(timeout=self._remaining(deadline)):
+                    raise TimeoutError(f"No TM1 session available in pool within {timeout} seconds")
+
+    def _create(self) -> TM1Service:
+        try:
+            return TM1Service(**self._kwargs)
+        except BaseException:
+            self._drop_slot()
+            raise
+
+    def _check(self, tm1: TM1Service):
+        try:
+            if not tm1.connection.is_connected():
+                tm1.re_authenticate()
+        except BaseException:
+            self._drop_slot()
+            self._logout(tm1)
+            raise
+
+    def _drop_slot(self):
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _logout(tm1: TM1Service):
+        try:
+            tm1.logout()
+        except Exception as e:
+            warnings.warn(f"Logout Failed due to Exception: {e}")
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
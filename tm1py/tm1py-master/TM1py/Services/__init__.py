@@ -15,6 +15,11 @@ from TM1py.Services.SecurityService import SecurityService
 from TM1py.Services.SubsetService import SubsetService
 from TM1py.Services.ViewService import ViewService
 from TM1py.Services.TM1Service import TM1Service
+from TM1py.Services.TM1ServicePool import TM1ServicePool
+from TM1py.Services.AsyncRestService import AsyncRestService
+from TM1py.Services.AsyncCellService import AsyncCellService
+from TM1py.Services.AsyncElementService import AsyncElementService
+from TM1py.Services.AsyncTM1Service import AsyncTM1Service
 
 
 from TM1py.Services.ManageService import ManageService
@@ -31,3 +36,4 @@ from TM1py.Services.LoggerService import LoggerService
 from TM1py.Services.ServerService import ServerService
 from TM1py.Services.MonitoringService import MonitoringService
 from TM1py.Services.PowerBiService import PowerBiService
+from TM1py.Services.ReplicationService import ReplicationService
@@ -0,0 +1,202 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from TM1py.Utils.Utils import endpoint_template
+
+
+class _PendingOperation:
+    __slots__ = ["async_id", "endpoint", "future", "started", "next_check", "delay"]
+
+    def __init__(self, async_id: str, endpoint: str, future: Future, started: float, next_check: float, delay: float):
+        self.async_id = async_id
+        self.endpoint = endpoint
+        self.future = future
+        self.started = started
+        self.next_check = next_check
+        self.delay = delay
+
+
+class AsyncOperationPoller:
+    """Single background thread that polls all outstanding async operations (`Prefer: respond-async`) of a session.
+
+    Each round checks the operations that are due with at most `max_workers` parallel requests, so that N parallel
+    async requests cause a bounded stream of status checks instead of N competing polling loops.
+    Operations are resolved through futures.
+
+    The first check of an operation is scheduled after half the average observed duration of its endpoint,
+    which skips checks that are pointless for long running operations. Afterwards the interval grows from `initial_delay` by `backoff_factor` up to `max_delay`.
+    """
+
+    # weight of the latest observed duration in the moving average
+    SMOOTHING = 0.3
+    # share of the expected duration to wait before the first check
+    FIRST_CHECK_RATIO = 0.5
+    MAX_ENDPOINTS = 256
+
+    def __init__(
+        self,
+        retrieve: Callable[[str], Any],
+        initial_delay: float = 0.1,
+        max_delay: float = 1.0,
+        backoff_factor: float = 2,
+        max_workers: int = 4,
+    ):
+        """
+
+        :param retrieve: function that takes an async id and returns the response of `/_async('id')`
+        :param initial_delay: seconds until the first check of an operation on an endpoint without history
+        :param max_delay: max seconds between two checks of an operation
+        :param backoff_factor: multiplier applied to the delay after every unfinished check
+        :param max_workers: max number of parallel status checks within one round
+        """
+        self.retrieve = retrieve
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff_factor = backoff_factor
+        self.max_workers = max_workers
+        self.checks = 0
+        self._durations = OrderedDict()
+        self._init_runtime_state()
+
+    def _init_runtime_state(self):
+        self._pending: Dict[str, _PendingOperation] = dict()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def __getstate__(self) -> Dict:
+        # outstanding operations and the thread are bound to the current process
+        state = self.__dict__.copy()
+        for attribute in ("_pending", "_condition", "_thread"):
+            del state[attribute]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._init_runtime_state()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def pending_async_ids(self) -> List[str]:
+        with self._condition:
+            return list(self._pending)
+
+    @staticmethod
+    def endpoint(method: str, url: str) -> str:
+        """Key under which durations are recorded. Object names and ids are dropped from the url"""
+        return endpoint_template(method, url)
+
+    def expected_duration(self, endpoint: str) -> Optional[float]:
+        """Average observed duration of async operations on the endpoint in seconds. None if not observed yet"""
+        with self._condition:
+            return self._durations.get(endpoint)
+
+    def submit(self, async_id: str, endpoint: str = None) -> Future:
+        """Track an async operation until its result is available
+
+        :param async_id: id from the Location header of the 202 response
+        :param endpoint: key under which durations are recorded, e.g. 'POST /ExecuteMDX'
+        :return: future that resolves to the response of the finished operation
+        """
+        future = Future()
+        now = time.monotonic()
+        with self._condition:
+            expected = self._durations.get(endpoint)
+            first_delay = (
+                self.initial_delay if expected is None else max(self.initial_delay, expected * self.FIRST_CHECK_RATIO)
+            )
+            self._pending[async_id] = _PendingOperation(
+                async_id=async_id,
+                endpoint=endpoint,
+                future=future,
+                started=now,
+                next_check=now + first_delay,
+                delay=self.initial_delay,
+            )
+            self._ensure_thread()
+            self._condition.notify()
+        return future
+
+    def discard(self, async_id: str):
+        """Stop tracking an async operation, e.g. after the caller ran into a timeout"""
+        with self._condition:
+            operation = self._pending.pop(async_id, None)
+        if operation:
+            operation.future.cancel()
+
+    def close(self):
+        """Cancel all outstanding futures. The background thread stops once it has nothing left to poll"""
+        with self._condition:
+            pending, self._pending = self._pending, dict()
+            self._condition.notify()
+        for operation in pending.values():
+            operation.future.cancel()
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="TM1py-AsyncOperationPoller", daemon=True)
+            self._thread.start()
+
+    def _record_duration(self, endpoint: str, duration: float):
+        average = self._durations.pop(endpoint, None)
+        if average is not None:
+            duration = self.SMOOTHING * duration + (1 - self.SMOOTHING) * average
+        self._durations[endpoint] = duration
+        while len(self._durations) > self.MAX_ENDPOINTS:
+            self._durations.popitem(last=False)
+
+    def _due_operations(self) -> Optional[List[_PendingOperation]]:
+        """Block until operations are due. None when there is nothing left to poll"""
+        with self._condition:
+            while True:
+                if not self._pending:
+                    self._thread = None
+                    return None
+                now = time.monotonic()
+                next_check = min(operation.next_check for operation in self._pending.values())
+                if next_check <= now:
+                    return [operation for operation in self._pending.values() if operation.next_check <= now]
+                self._condition.wait(next_check - now)
+
+    def _run(self):
+        while True:
+            due = self._due_operations()
+            if due is None:
+                return
+
+            if self.max_workers > 1 and len(due) > 1:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as executor:
+                    list(executor.map(self._check, due))
+            else:
+                for operation in due:
+                    self._check(operation)
+
+    def _check(self, operation: _PendingOperation):
+        if operation.future.cancelled():
+            return
+        try:
+            response = self.retrieve(operation.async_id)
+        except Exception as e:
+            with self._condition:
+                if self._pending.get(operation.async_id) is not operation:
+                    return
+                del self._pending[operation.async_id]
+            operation.future.set_exception(e)
+            return
+
+        with self._condition:
+            self.checks += 1
+            if self._pending.get(operation.async_id) is not operation:
+                # discarded while the check was running
+                return
+            if response.status_code not in [200, 201]:
+                operation.next_check = time.monotonic() + operation.delay
+                operation.delay = min(operation.delay * self.backoff_factor, self.max_delay)
+                return
+            del self._pending[operation.async_id]
+            self._record_duration(operation.endpoint, time.monotonic() - operation.started)
+        operation.future.set_result(response)
@@ -0,0 +1,290 @@
+import re
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from TM1py.Exceptions.Exceptions import TM1pyException
+
+# batch of the service call that is executed by the current thread
+_local = threading.local()
+
+# $batch responses with these status codes indicate that the server doesn't support $batch
+_UNSUPPORTED_STATUS_CODES = (400, 404, 405, 501)
+
+
+class _BatchRequest:
+    __slots__ = ["method", "url", "data", "headers", "response", "error", "send_directly", "done"]
+
+    def __init__(self, method: str, url: str, data: bytes, headers: Dict):
+        self.method = method
+        self.url = url
+        self.data = data
+        self.headers = headers
+        self.response = None
+        self.error = None
+        self.send_directly = False
+        self.done = threading.Event()
+
+
+class BatchFuture(Future):
+    """Future of a service call in a Batch. `result` and `exception` send the outstanding requests of the batch"""
+
+    def __init__(self, batch: "Batch"):
+        super().__init__()
+        self._batch = batch
+
+    def result(self, timeout: float = None):
+        if not self.done():
+            self._batch.flush()
+        return super().result(timeout=timeout)
+
+    def exception(self, timeout: float = None):
+        if not self.done():
+            self._batch.flush()
+        return super().exception(timeout=timeout)
+
+
+class Batch:
+    """Collects the REST requests of independent service calls and sends them to TM1 in OData `$batch` requests.
+
+    Each submitted call runs in a worker thread. When it sends a request, the request is parked until all
+    calls of the round are either parked or finished. The parked requests are then sent in one `$batch` request and
+    the calls continue with their individual responses. Calls that send several requests (e.g. `get` after
+    `exists`) take several rounds. If the server doesn't support `$batch`, calls are executed in parallel instead.
+
+    Calls must be independent of each other. Their order of execution within a round is not defined.
+
+    >>> with tm1.batch() as batch:
+    >>>     exists = {name: batch.submit(tm1.dimensions.exists, name) for name in dimension_names}
+    >>> missing = [name for name, future in exists.items() if not future.result()]
+    """
+
+    MODES = ("auto", "batch", "parallel")
+
+    def __init__(self, rest, mode: str = "auto", max_requests: int = 100, max_workers: int = None):
+        """
+
+        :param rest: instance of RestService
+        :param mode: 'batch' to send requests in `$batch` requests, 'parallel' to execute the calls in parallel
+            threads or 'auto' to use `$batch` if the server supports it and 'parallel' otherwise
+        :param max_requests: max number of requests in one `$batch` request
+        :param max_workers: max number of parallel calls in mode 'parallel'. Default: connection pool size
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid value for 'mode': '{mode}'. Must be one of: {self.MODES}")
+        if max_requests < 1:
+            raise ValueError("'max_requests' must be greater than 0")
+
+        self._rest = rest
+        self._mode = mode
+        self._max_requests = max_requests
+        self._max_workers = max_workers or rest._connection_pool_size
+        self._pending: List[Tuple[BatchFuture, Callable, Tuple, Dict]] = list()
+        self._flush_lock = threading.RLock()
+        self._condition = threading.Condition()
+        # calls of the current round that are neither parked nor finished
+        self._running = 0
+        self._parked: List[_BatchRequest] = list()
+        self.batch_requests = 0
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if exception_type is None:
+            self.flush()
+        else:
+            self.cancel()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def mode(self) -> str:
+        """'batch' or 'parallel'. 'auto' until support for `$batch` is known"""
+        if self._mode == "auto" and self._rest._batch_supported is not None:
+            return "batch" if self._rest._batch_supported else "parallel"
+        return self._mode
+
+    def submit(self, func: Callable, *args, **kwargs) -> BatchFuture:
+        """Schedule a service call, e.g. `batch.submit(tm1.dimensions.exists, 'Region')`.
+        Calls are executed on `flush`, when leaving the context manager or when the result of a future is requested.
+
+        :param func: function of a service that uses the same RestService as the batch
+        :param args: positional arguments of the function
+        :param kwargs: keyword arguments of the function
+        :return: future that resolves to the return value of the function
+        """
+        future = BatchFuture(self)
+        self._pending.append((future, func, args, kwargs))
+        return future
+
+    def cancel(self):
+        """Cancel all calls that have not been executed yet"""
+        pending, self._pending = self._pending, list()
+        for future, _, _, _ in pending:
+            future.cancel()
+
+    def flush(self):
+        """Execute all submitted calls and wait for their completion"""
+        with self._flush_lock:
+            while self._pending:
+                if self.mode == "parallel":
+                    calls, self._pending = self._pending, list()
+                    self._execute_in_parallel(calls)
+                else:
+                    calls, self._pending = self._pending[: self._max_requests], self._pending[self._max_requests :]
+                    self._execute_in_rounds(calls)
+
+    def _execute_in_parallel(self, calls: List):
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(calls))) as executor:
+            for future, func, args, kwargs in calls:
+                executor.submit(self._call, future, func, args, kwargs, False)
+
+    def _execute_in_rounds(self, calls: List):
+        self._running = len(calls)
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            for future, func, args, kwargs in calls:
+                executor.submit(self._call, future, func, args, kwargs, True)
+
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._running == 0)
+                    requests, self._parked = self._parked, list()
+                    self._running = len(requests)
+                if not requests:
+                    break
+                self._dispatch(requests)
+
+    def _call(self, future: BatchFuture, func: Callable, args: Tuple, kwargs: Dict, collect: bool):
+        try:
+            if not future.set_running_or_notify_cancel():
+                return
+            _local.batch = self if collect else None
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finally:
+                _local.batch = None
+        finally:
+            if collect:
+                with self._condition:
+                    self._running -= 1
+                    self._condition.notify_all()
+
+    @staticmethod
+    def collecting(rest) -> Optional["Batch"]:
+        """Batch that collects the requests of the current thread to the RestService, if any"""
+        batch = getattr(_local, "batch", None)
+        if batch is None or batch._rest is not rest or batch.mode == "parallel":
+            return None
+        return batch
+
+    @staticmethod
+    def accepts(data, **kwargs) -> bool:
+        """Streamed responses and file-like payloads are not sent through `$batch`"""
+        return isinstance(data, bytes) and not kwargs.get("stream") and set(kwargs) <= {"headers", "stream"}
+
+    def execute(self, method: str, url: str, data: bytes, timeout: float = None, **kwargs):
+        """Park a request of a service call until the `$batch` request of the round has been answered
+
+        :return: response of the request
+        """
+        request = _BatchRequest(method=method, url=url, data=data, headers=kwargs.get("headers") or dict())
+        with self._condition:
+            self._parked.append(request)
+            self._running -= 1
+            self._condition.notify_all()
+        request.done.wait()
+
+        if request.send_directly:
+            return self._rest._execute_sync_request(method=method, url=url, data=data, timeout=timeout, **kwargs)
+        if request.error is not None:
+            raise request.error
+        return request.response
+
+    def _dispatch(self, requests: List[_BatchRequest]):
+        try:
+            responses = None if self._rest._batch_supported is False else self._send(requests)
+            if responses is None:
+                # requests that were parked before the lack of $batch support was detected are sent by their calls
+                for request in requests:
+                    request.send_directly = True
+            else:
+                for request, response in zip(requests, responses):
+                    request.response = response
+        except Exception as e:
+            for request in requests:
+                request.error = e
+        finally:
+            for request in requests:
+                request.done.set()
+
+    def _send(self, requests: List[_BatchRequest]) -> Optional[List]:
+        """Send the requests in one $batch request
+
+        :return: responses in the order of the requests or None if the server doesn't support $batch
+        """
+        boundary = f"batch_{uuid.uuid4()}"
+        response = self._rest.POST(
+            url="/$batch",
+            data=self._build_body(requests, boundary),
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}", "Accept": "multipart/mixed"},
+            async_requests_mode=False,
+            verify_response=False,
+        )
+        self.batch_requests += 1
+
+        if response.status_code in _UNSUPPORTED_STATUS_CODES and self._mode == "auto":
+            self._rest._batch_supported = False
+            return None
+        if not response.ok:
+            # not a TM1pyRestException: calls like `exists` would take a 404 of the $batch request as their answer
+            raise TM1pyException(f"$batch request failed with status code {response.status_code}: '{response.text}'")
+        self._rest._batch_supported = True
+
+        responses = self._parse_body(response)
+        if len(responses) != len(requests):
+            raise TM1pyException(f"$batch returned {len(responses)} responses for {len(requests)} requests")
+        return responses
+
+    @staticmethod
+    def _build_body(requests: List[_BatchRequest], boundary: str) -> bytes:
+        parts = list()
+        for content_id, request in enumerate(requests, start=1):
+            url = urlsplit(request.url)
+            target = url.path + ("?" + url.query if url.query else "")
+            lines = [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                "Content-Transfer-Encoding: binary",
+                f"Content-ID: {content_id}",
+                "",
+                f"{request.method.upper()} {target} HTTP/1.1",
+                f"Host: {url.netloc}",
+            ]
+            lines += [f"{key}: {value}" for key, value in request.headers.items() if key.lower() != "connection"]
+            if request.data:
+                lines.append(f"Content-Length: {len(request.data)}")
+            parts.append("\r\n".join(lines).encode("utf-8") + b"\r\n\r\n" + request.data + b"\r\n")
+        return b"".join(parts) + f"--{boundary}--\r\n".encode("utf-8")
+
+    def _parse_body(self, response) -> List:
+        match = re.search(r'boundary="?([^";]+)"?', response.headers.get("Content-Type", ""))
+        if not match:
+            raise TM1pyException(f"$batch response without multipart boundary: '{response.text[:200]}'")
+        delimiter = b"\r\n--" + match.group(1).encode("utf-8")
+
+        responses = dict()
+        # leading CRLF so that the first delimiter matches like all others
+        for position, part in enumerate((b"\r\n" + response.content).split(delimiter)[1:-1]):
+            mime_headers, _, http_response = part.lstrip(b"\r\n").partition(b"\r\n\r\n")
+            content_id = re.search(rb"(?im)^Content-ID:\s*(\d+)", mime_headers)
+            key = int(content_id.group(1)) - 1 if content_id else position
+            responses[key] = self._rest.build_response_from_binary_response(http_response)
+        return [responses[key] for key in sorted(responses)]
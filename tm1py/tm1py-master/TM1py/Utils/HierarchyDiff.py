@@ -0,0 +1,226 @@
+import hashlib
+import math
+from typing import Dict, Iterable, List, Tuple
+
+from TM1py.Utils.HierarchyIndex import HierarchyIndex
+from TM1py.Utils.Utils import (
+    CaseAndSpaceInsensitiveDict,
+    CaseAndSpaceInsensitiveTuplesDict,
+    lower_and_drop_spaces,
+)
+
+
+class HierarchySnapshot:
+    """Normalized state of a hierarchy: element types, edges, weights and attribute values.
+
+    Every element gets a digest over its type, its parent edges with weights and its attribute values.
+    Comparing two snapshots only looks at the details of elements whose digests differ, so unchanged
+    elements of large hierarchies cost one bytes comparison each.
+
+    Element names and attribute names are case and space insensitive.
+    """
+
+    def __init__(
+        self,
+        element_types: Dict[str, str],
+        edges: Dict[Tuple[str, str], float] = None,
+        attributes: Dict[str, Dict[str, object]] = None,
+        attribute_types: Dict[str, str] = None,
+    ):
+        """
+
+        :param element_types: {element: type}
+        :param edges: {(parent, component): weight}
+        :param attributes: {element: {attribute: value}}
+        :param attribute_types: {attribute: type}. Used to normalize empty values: 0 for numeric attributes, ''
+        otherwise. Attributes without type are treated as string attributes
+        """
+        self.attribute_types = CaseAndSpaceInsensitiveDict(attribute_types or {})
+
+        self._names: Dict[str, str] = dict()
+        self._types: Dict[str, str] = dict()
+        for element_name, element_type in element_types.items():
+            key = lower_and_drop_spaces(element_name)
+            self._names[key] = element_name
+            self._types[key] = str(element_type).capitalize()
+
+        self.edges = CaseAndSpaceInsensitiveTuplesDict()
+        self._parents: Dict[str, Dict[str, float]] = dict()
+        for (parent, component), weight in (edges or {}).items():
+            weight = float(weight)
+            self.edges[parent, component] = weight
+            self._parents.setdefault(lower_and_drop_spaces(component), dict())[lower_and_drop_spaces(parent)] = weight
+
+        self._attribute_names: Dict[str, str] = dict()
+        self._attributes: Dict[str, Dict[str, object]] = dict()
+        for element_name, values in (attributes or {}).items():
+            normalized_values = dict()
+            for attribute, value in values.items():
+                attribute_key = lower_and_drop_spaces(attribute)
+                if attribute_key not in self._attribute_names:
+                    self._attribute_names[attribute_key] = attribute
+                normalized_values[attribute_key] = self.normalize_value(attribute, value)
+            self._attributes[lower_and_drop_spaces(element_name)] = normalized_values
+
+        self._digests: Dict[str, bytes] = {key: self._digest(key) for key in self._names}
+
+    @classmethod
+    def from_hierarchy(cls, hierarchy) -> "HierarchySnapshot":
+        """Snapshot of the structure of a TM1py.Hierarchy. Attribute values are not part of the Hierarchy object
+
+        :param hierarchy: instance of TM1py.Hierarchy
+        :return: HierarchySnapshot
+        """
+        return cls(
+            element_types={element.name: element.element_type for element in hierarchy},
+            edges=hierarchy.edges,
+            attribute_types={ea.name: ea.attribute_type for ea in hierarchy.element_attributes},
+        )
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, element_name: str) -> bool:
+        return lower_and_drop_spaces(element_name) in self._names
+
+    def normalize_value(self, attribute: str, value):
+        is_numeric = lower_and_drop_spaces(str(self.attribute_types.get(attribute, ""))) == "numeric"
+        if value is None or (isinstance(value, float) and math.isnan(value)) or value == "":
+            return 0.0 if is_numeric else ""
+        if is_numeric:
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return value
+        return str(value)
+
+    def _digest(self, key: str) -> bytes:
+        parents = sorted(self._parents.get(key, {}).items())
+        values = sorted(self._attributes.get(key, {}).items())
+        content = repr((self._types[key], parents, values)).encode("utf-8")
+        return hashlib.blake2b(content, digest_size=16).digest()
+
+    def digest(self, element_name: str) -> bytes:
+        return self._digests[lower_and_drop_spaces(element_name)]
+
+    @property
+    def digests(self) -> Dict[str, bytes]:
+        """{element: digest} e.g. to persist a snapshot and detect changes without comparing details"""
+        return {self._names[key]: digest for key, digest in self._digests.items()}
+
+    @property
+    def element_names(self) -> List[str]:
+        return list(self._names.values())
+
+    def element_type(self, element_name: str) -> str:
+        return self._types[lower_and_drop_spaces(element_name)]
+
+    def attribute_value(self, element_name: str, attribute: str):
+        values = self._attributes.get(lower_and_drop_spaces(element_name), {})
+        return values.get(lower_and_drop_spaces(attribute), self.normalize_value(attribute, None))
+
+    def diff(
+        self,
+        target: "HierarchySnapshot",
+        delete_elements: bool = False,
+        unwind_all: bool = False,
+        unwind_consolidations: Iterable[str] = None,
+    ) -> "HierarchyDiff":
+        """Minimal set of changes that turns this snapshot into `target`
+
+        Edges that are only in this snapshot are kept, unless they are in scope of `unwind_all` or
+        `unwind_consolidations`. Edges with changed weights are deleted and added again.
+        Attribute values are compared for the attributes of the target elements only.
+
+        :param target: desired state
+        :param delete_elements: delete elements that are not in target
+        :param unwind_all: delete all edges that are not in target
+        :param unwind_consolidations: delete edges under these consolidations that are not in target
+        :return: HierarchyDiff
+        """
+        diff = HierarchyDiff()
+
+        for key, element_name in target._names.items():
+            if key not in self._names:
+                diff.elements_to_add[element_name] = target._types[key]
+            elif self._types[key] != target._types[key]:
+                diff.element_types_to_update[element_name] = target._types[key]
+
+        if delete_elements:
+            diff.elements_to_delete = [name for key, name in self._names.items() if key not in target._names]
+
+        for (parent, component), weight in target.edges.items():
+            current_weight = self.edges.get((parent, component))
+            if current_weight is None:
+                diff.edges_to_add[parent, component] = weight
+            elif current_weight != weight:
+                diff.edges_to_delete.append((parent, component))
+                diff.edges_to_add[parent, component] = weight
+
+        unwind_edges = CaseAndSpaceInsensitiveTuplesDict()
+        if unwind_all:
+            unwind_edges = self.edges
+        elif unwind_consolidations:
+            index = HierarchyIndex(edges=self.edges)
+            for consolidation in unwind_consolidations:
+                if consolidation in index:
+                    unwind_edges.join(index.edges_under(consolidation))
+        deleted_elements = CaseAndSpaceInsensitiveDict({name: None for name in diff.elements_to_delete})
+        for parent, component in unwind_edges:
+            if (parent, component) in target.edges:
+                continue
+            # edges of deleted elements disappear with the element
+            if parent in deleted_elements or component in deleted_elements:
+                continue
+            diff.edges_to_delete.append((parent, component))
+
+        for key, values in target._attributes.items():
+            if target._digests.get(key) == self._digests.get(key):
+                continue
+            element_name = target._names.get(key, key)
+            current_values = self._attributes.get(key, {})
+            for attribute, value in values.items():
+                if current_values.get(attribute, target.normalize_value(attribute, None)) != value:
+                    diff.attribute_values[element_name, target._attribute_names[attribute]] = value
+
+        return diff
+
+
+class HierarchyDiff:
+    """Changes between two HierarchySnapshots, in the order they must be applied:
+    add elements, delete edges, add edges, write attribute values, delete elements
+    """
+
+    def __init__(self):
+        self.elements_to_add: Dict[str, str] = CaseAndSpaceInsensitiveDict()
+        self.element_types_to_update: Dict[str, str] = CaseAndSpaceInsensitiveDict()
+        self.elements_to_delete: List[str] = []
+        self.edges_to_add: Dict[Tuple[str, str], float] = CaseAndSpaceInsensitiveTuplesDict()
+        self.edges_to_delete: List[Tuple[str, str]] = []
+        self.attribute_values: Dict[Tuple[str, str], object] = CaseAndSpaceInsensitiveTuplesDict()
+
+    def __bool__(self) -> bool:
+        return any(
+            (
+                self.elements_to_add,
+                self.element_types_to_update,
+                self.elements_to_delete,
+                self.edges_to_add,
+                self.edges_to_delete,
+                self.attribute_values,
+            )
+        )
+
+    @property
+    def summary(self) -> Dict[str, int]:
+        return {
+            "elements_to_add": len(self.elements_to_add),
+            "element_types_to_update": len(self.element_types_to_update),
+            "elements_to_delete": len(self.elements_to_delete),
+            "edges_to_add": len(self.edges_to_add),
+            "edges_to_delete": len(self.edges_to_delete),
+            "attribute_values": len(self.attribute_values),
+        }
+
+    def __repr__(self) -> str:
+        return f"HierarchyDiff({self.summary})"
@@ -0,0 +1,461 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from TM1py.Utils.Utils import (
+    CaseAndSpaceInsensitiveDict,
+    CaseAndSpaceInsensitiveTuplesDict,
+    lower_and_drop_spaces,
+)
+
+
+class HierarchyIndex:
+    """In-memory index over the parent-child structure of a hierarchy.
+
+    Built once from edges (e.g. `ElementService.get_edges` or `Hierarchy.edges`) and optionally element types.
+    Children and parents are kept in CSR arrays. Every element is labelled with its post-order number and a
+    list of post-order intervals that covers all its descendants (tree cover labelling, which also handles
+    elements with multiple parents). Reachability is answered with a binary search over these intervals,
+    leaf and member expansion by slicing the post-order.
+
+    Element names are case and space insensitive. Unknown elements are treated like in
+    `ElementService.element_is_ancestor`: reachability questions return False.
+
+    Changes through `add_edge`, `remove_edge`, `add_element`, `remove_element` or `refresh` are applied to the
+    adjacency right away. The derived labels are rebuilt in O(elements + edges) on the next query, and only if
+    the structure actually changed.
+
+    >>> index = tm1.elements.get_hierarchy_index("Region", "Region")
+    >>> index.is_ancestor("World", "Germany")
+    """
+
+    def __init__(self, edges: Dict[Tuple[str, str], float] = None, element_types: Dict[str, str] = None):
+        """
+
+        :param edges: {(parent, component): weight}
+        :param element_types: {element: type}. Elements without children are leaves unless their type is
+        'Consolidated'. Elements that only appear here (orphans) are part of the index too
+        """
+        self._ids: Dict[str, int] = dict()
+        self._names: List[Optional[str]] = []
+        self._consolidated: List[bool] = []
+        self._children: List[Dict[int, float]] = []
+        self._parents: List[Dict[int, None]] = []
+        self._dirty = True
+
+        for element_name, element_type in (element_types or {}).items():
+            self.add_element(element_name, element_type)
+        for (parent, component), weight in (edges or {}).items():
+            self.add_edge(parent, component, weight)
+
+    @classmethod
+    def from_hierarchy(cls, hierarchy) -> "HierarchyIndex":
+        """
+        :param hierarchy: instance of TM1py.Hierarchy
+        :return: HierarchyIndex
+        """
+        element_types = {element.name: element.element_type for element in hierarchy}
+        return cls(edges=hierarchy.edges, element_types=element_types)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, element_name: str) -> bool:
+        return lower_and_drop_spaces(element_name) in self._ids
+
+    @property
+    def element_names(self) -> List[str]:
+        return [name for name in self._names if name is not None]
+
+    # --- changes ---
+
+    def _id(self, element_name: str) -> int:
+        return self._ids.get(lower_and_drop_spaces(element_name), -1)
+
+    def _id_or_raise(self, element_name: str) -> int:
+        element_id = self._id(element_name)
+        if element_id < 0:
+            raise KeyError(f"Element '{element_name}' not found in HierarchyIndex")
+        return element_id
+
+    @staticmethod
+    def _is_consolidated_type(element_type) -> bool:
+        return element_type is not None and lower_and_drop_spaces(str(element_type)) in ("consolidated", "3")
+
+    def add_element(self, element_name: str, element_type=None) -> int:
+        """Add element or update its type
+
+        :param element_name:
+        :param element_type: 'Numeric', 'String', 'Consolidated' or TM1py.Element.Types
+        :return: internal id of the element
+        """
+        element_id = self._id(element_name)
+        if element_id >= 0:
+            if element_type is not None:
+                consolidated = self._is_consolidated_type(element_type) or bool(self._children[element_id])
+                if consolidated != self._consolidated[element_id]:
+                    self._consolidated[element_id] = consolidated
+                    self._dirty = True
+            return element_id
+
+        element_id = len(self._names)
+        self._ids[lower_and_drop_spaces(element_name)] = element_id
+        self._names.append(element_name)
+        self._consolidated.append(self._is_consolidated_type(element_type))
+        self._children.append(dict())
+        self._parents.append(dict())
+        self._dirty = True
+        return element_id
+
+    def remove_element(self, element_name: str):
+        """Remove element and all its edges"""
+        element_id = self._id_or_raise(element_name)
+        for child_id in self._children[element_id]:
+            del self._parents[child_id][element_id]
+        for parent_id in self._parents[element_id]:
+            del self._children[parent_id][element_id]
+        self._children[element_id] = dict()
+        self._parents[element_id] = dict()
+        del self._ids[lower_and_drop_spaces(element_name)]
+        self._names[element_id] = None
+        self._dirty = True
+
+    def add_edge(self, parent: str, component: str, weight: float = 1):
+        """Add edge or update its weight. Missing elements are added; the parent becomes a consolidation"""
+        parent_id = self.add_element(parent)
+        component_id = self.add_element(component)
+        if not self._consolidated[parent_id]:
+            self._consolidated[parent_id] = True
+            self._dirty = True
+        if self._children[parent_id].get(component_id) != weight:
+            self._children[parent_id][component_id] = weight
+            self._parents[component_id][parent_id] = None
+            self._dirty = True
+
+    def remove_edge(self, parent: str, component: str):
+        parent_id = self._id_or_raise(parent)
+        component_id = self._id_or_raise(component)
+        if component_id not in self._children[parent_id]:
+            raise KeyError(f"Edge '{parent}' -> '{component}' not found in HierarchyIndex")
+        del self._children[parent_id][component_id]
+        del self._parents[component_id][parent_id]
+        self._dirty = True
+
+    def refresh(self, edges: Dict[Tuple[str, str], float], element_types: Dict[str, str] = None) -> bool:
+        """Apply the difference to a newer version of the hierarchy
+
+        :param edges: all edges of the hierarchy {(parent, component): weight}
+        :param element_types: all elements of the hierarchy with their types. If not passed, elements are not removed
+        :return: True if the hierarchy changed
+        """
+        was_dirty, self._dirty = self._dirty, False
+
+        new_edges = CaseAndSpaceInsensitiveTuplesDict(edges)
+        for (parent, component), _ in list(self.edges().items()):
+            if (parent, component) not in new_edges:
+                self.remove_edge(parent, component)
+
+        if element_types is not None:
+            element_types = CaseAndSpaceInsensitiveDict(element_types)
+            for element_name in self.element_names:
+                if element_name not in element_types:
+                    self.remove_element(element_name)
+            for element_name, element_type in element_types.items():
+                self.add_element(element_name, element_type)
+
+        for (parent, component), weight in new_edges.items():
+            self.add_edge(parent, component, weight)
+
+        changed = self._dirty
+        self._dirty = was_dirty or changed
+        return changed
+
+    # --- labelling ---
+
+    def _build(self):
+        size = len(self._names)
+        alive = [name is not None for name in self._names]
+
+        # CSR adjacency
+        child_offsets, child_ids, child_weights = array("l", [0]), array("l"), array("d")
+        parent_offsets, parent_ids = array("l", [0]), array("l")
+        for element_id in range(size):
+            children = self._children[element_id]
+            child_ids.extend(children.keys())
+            child_weights.extend(children.values())
+            child_offsets.append(len(child_ids))
+            parent_ids.extend(self._parents[element_id].keys())
+            parent_offsets.append(len(parent_ids))
+
+        # post-order numbering through iterative DFS from all roots
+        post = array("l", [-1]) * size
+        low = array("l", [-1]) * size
+        level = array("l", [0]) * size
+        by_post = array("l")
+        intervals: List[Optional[List[Tuple[int, int]]]] = [None] * size
+        state = bytearray(size)
+
+        roots = [element_id for element_id in range(size) if alive[element_id] and not self._parents[element_id]]
+        for root in roots:
+            state[root] = 1
+            low[root] = len(by_post)
+            stack = [(root, child_offsets[root])]
+            while stack:
+                node, position = stack[-1]
+                end = child_offsets[node + 1]
+                while position < end:
+                    child = child_ids[position]
+                    position += 1
+                    if state[child] == 0:
+                        stack[-1] = (node, position)
+                        state[child] = 1
+                        low[child] = len(by_post)
+                        stack.append((child, child_offsets[child]))
+                        break
+                    if state[child] == 1:
+                        raise ValueError(f"Circular reference in hierarchy at element '{self._names[child]}'")
+                else:
+                    stack.pop()
+                    state[node] = 2
+                    post[node] = len(by_post)
+                    by_post.append(node)
+
+                    # all children are labelled before their parents
+                    node_intervals = [(low[node], post[node])]
+                    node_level = 0
+                    for child_position in range(child_offsets[node], end):
+                        child = child_ids[child_position]
+                        node_intervals.extend(intervals[child])
+                        node_level = max(node_level, level[child] + 1)
+                    level[node] = node_level
+                    intervals[node] = self._merge_intervals(node_intervals)
+
+        if len(by_post) != sum(alive):
+            unvisited = next(i for i in range(size) if alive[i] and state[i] == 0)
+            raise ValueError(f"Circular reference in hierarchy at element '{self._names[unvisited]}'")
+
+        interval_offsets, interval_starts, interval_ends = array("l", [0]), array("l"), array("l")
+        for element_id in range(size):
+            for start, end in intervals[element_id] or []:
+                interval_starts.append(start)
+                interval_ends.append(end)
+            interval_offsets.append(len(interval_starts))
+
+        leaf_posts = array("l", (p for p, element_id in enumerate(by_post) if self._is_leaf_id(element_id)))
+
+        self._child_offsets, self._child_ids, self._child_weights = child_offsets, child_ids, child_weights
+        self._parent_offsets, self._parent_ids = parent_offsets, parent_ids
+        self._post, self._by_post, self._level = post, by_post, level
+        self._interval_offsets, self._interval_starts, self._interval_ends = (
+            interval_offsets,
+            interval_starts,
+            interval_ends,
+        )
+        self._leaf_posts = leaf_posts
+        self._dirty = False
+
+    @staticmethod
+    def _merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        intervals.sort()
+        merged = [intervals[0]]
+        for start, end in intervals[1:]:
+            last_start, last_end = merged[-1]
+            if start <= last_end + 1:
+                if end > last_end:
+                    merged[-1] = (last_start, end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _ensure_built(self):
+        if self._dirty:
+            self._build()
+
+    def _is_leaf_id(self, element_id: int) -> bool:
+        return not self._consolidated[element_id] and not self._children[element_id]
+
+    def _reaches(self, ancestor_id: int, element_id: int) -> bool:
+        """element_id is ancestor_id or one of its descendants"""
+        target = self._post[element_id]
+        first, last = self._interval_offsets[ancestor_id], self._interval_offsets[ancestor_id + 1]
+        position = bisect_right(self._interval_starts, target, first, last) - 1
+        return position >= first and self._interval_ends[position] >= target
+
+    def _descendant_ids(self, element_id: int, leaves_only: bool = False) -> List[int]:
+        result = []
+        for position in range(self._interval_offsets[element_id], self._interval_offsets[element_id + 1]):
+            start, end = self._interval_starts[position], self._interval_ends[position]
+            if leaves_only:
+                first = bisect_left(self._leaf_posts, start)
+                last = bisect_right(self._leaf_posts, end)
+                result.extend(self._by_post[p] for p in self._leaf_posts[first:last])
+            else:
+                result.extend(self._by_post[start : end + 1])
+        return [descendant_id for descendant_id in result if descendant_id != element_id]
+
+    def _ancestor_ids(self, element_id: int) -> List[int]:
+        ancestors = dict()
+        stack = [element_id]
+        while stack:
+            node = stack.pop()
+            for position in range(self._parent_offsets[node], self._parent_offsets[node + 1]):
+                parent = self._parent_ids[position]
+                if parent not in ancestors:
+                    ancestors[parent] = None
+                    stack.append(parent)
+        return list(ancestors)
+
+    # --- queries ---
+
+    def is_leaf(self, element_name: str) -> bool:
+        return self._is_leaf_id(self._id_or_raise(element_name))
+
+    def level(self, element_name: str) -> int:
+        """Level like TM1's ELLEV: 0 for leaves, 1 + max level of the children for consolidations"""
+        self._ensure_built()
+        return self._level[self._id_or_raise(element_name)]
+
+    def children(self, element_name: str) -> List[str]:
+        self._ensure_built()
+        element_id = self._id_or_raise(element_name)
+        return [
+            self._names[self._child_ids[p]]
+            for p in range(self._child_offsets[element_id], self._child_offsets[element_id + 1])
+        ]
+
+    def parents(self, element_name: str) -> List[str]:
+        self._ensure_built()
+        element_id = self._id_or_raise(element_name)
+        return [
+            self._names[self._parent_ids[p]]
+            for p in range(self._parent_offsets[element_id], self._parent_offsets[element_id + 1])
+        ]
+
+    def weight(self, parent: str, component: str) -> float:
+        """Weight of the direct edge"""
+        parent_id = self._id_or_raise(parent)
+        component_id = self._id_or_raise(component)
+        try:
+            return self._children[parent_id][component_id]
+        except KeyError:
+            raise KeyError(f"Edge '{parent}' -> '{component}' not found in HierarchyIndex") from None
+
+    def is_parent(self, parent: str, element_name: str) -> bool:
+        parent_id, element_id = self._id(parent), self._id(element_name)
+        if parent_id < 0 or element_id < 0:
+            return False
+        return element_id in self._children[parent_id]
+
+    def is_ancestor(self, ancestor: str, element_name: str) -> bool:
+        """True if element is a (direct or indirect) descendant of ancestor. False for unknown elements"""
+        self._ensure_built()
+        ancestor_id, element_id = self._id(ancestor), self._id(element_name)
+        if ancestor_id < 0 or element_id < 0 or ancestor_id == element_id:
+            return False
+        return self._reaches(ancestor_id, element_id)
+
+    def is_descendant(self, element_name: str, ancestor: str) -> bool:
+        return self.is_ancestor(ancestor, element_name)
+
+    def ancestors(self, element_name: str) -> List[str]:
+        """All direct and indirect parents"""
+        self._ensure_built()
+        return [self._names[i] for i in self._ancestor_ids(self._id_or_raise(element_name))]
+
+    def descendants(self, element_name: str, leaves_only: bool = False) -> List[str]:
+        """All direct and indirect components in post-order (components before their consolidations)"""
+        self._ensure_built()
+        return [self._names[i] for i in self._descendant_ids(self._id_or_raise(element_name), leaves_only)]
+
+    def leaves(self, element_name: str) -> List[str]:
+        """Leaves under a consolidation. For a leaf the leaf itself"""
+        self._ensure_built()
+        element_id = self._id_or_raise(element_name)
+        if self._is_leaf_id(element_id):
+            return [self._names[element_id]]
+        return [self._names[i] for i in self._descendant_ids(element_id, leaves_only=True)]
+
+    def edges_under(self, element_name: str) -> CaseAndSpaceInsensitiveTuplesDict:
+        """All edges below a consolidation, like `ElementService.get_edges_under_consolidation`"""
+        self._ensure_built()
+        element_id = self._id_or_raise(element_name)
+        edges = CaseAndSpaceInsensitiveTuplesDict()
+        for parent_id in [element_id] + self._descendant_ids(element_id):
+            for position in range(self._child_offsets[parent_id], self._child_offsets[parent_id + 1]):
+                edges[self._names[parent_id], self._names[self._child_ids[position]]] = self._child_weights[position]
+        return edges
+
+    def leaf_weights(self, element_name: str) -> Dict[str, float]:
+        """Effective weight of every leaf in the consolidation: sum over all paths of the product of edge weights"""
+        self._ensure_built()
+        element_id = self._id_or_raise(element_name)
+        if self._is_leaf_id(element_id):
+            return {self._names[element_id]: 1.0}
+
+        factors = {element_id: 1.0}
+        # descending post-order visits consolidations before their components
+        for node in sorted([element_id] + self._descendant_ids(element_id), key=self._post.__getitem__, reverse=True):
+            factor = factors.get(node)
+            if not factor:
+                continue
+            for position in range(self._child_offsets[node], self._child_offsets[node + 1]):
+                child = self._child_ids[position]
+                factors[child] = factors.get(child, 0.0) + factor * self._child_weights[position]
+
+        return {
+            self._names[leaf_id]: factors.get(leaf_id, 0.0)
+            for leaf_id in self._descendant_ids(element_id, leaves_only=True)
+        }
+
+    def roll_up(self, values: Dict[str, float]) -> Dict[str, float]:
+        """Consolidate leaf values through all consolidations of the hierarchy, applying edge weights
+
+        :param values: {leaf: value}. Values of consolidations are ignored
+        :return: {consolidation: value} for all consolidations
+        """
+        self._ensure_built()
+        totals = array("d", [0.0]) * len(self._names)
+        for element_name, value in values.items():
+            element_id = self._id_or_raise(element_name)
+            if self._is_leaf_id(element_id):
+                totals[element_id] = value
+
+        result = dict()
+        # post-order visits components before their consolidations
+        for node in self._by_post:
+            if self._is_leaf_id(node):
+                continue
+            total = 0.0
+            for position in range(self._child_offsets[node], self._child_offsets[node + 1]):
+                total += totals[self._child_ids[position]] * self._child_weights[position]
+            totals[node] = total
+            result[self._names[node]] = total
+        return result
+
+    def common_ancestors(self, *element_names: str) -> List[str]:
+        """Elements that are ancestors of all passed elements"""
+        self._ensure_built()
+        common = None
+        for element_name in element_names:
+            ancestors = set(self._ancestor_ids(self._id_or_raise(element_name)))
+            common = ancestors if common is None else common & ancestors
+        if not common:
+            return []
+        return [self._names[i] for i in sorted(common, key=self._post.__getitem__)]
+
+    def lowest_common_ancestors(self, *element_names: str) -> List[str]:
+        """Common ancestors that are not ancestors of another common ancestor"""
+        common = [self._id(name) for name in self.common_ancestors(*element_names)]
+        return [
+            self._names[candidate]
+            for candidate in common
+            if not any(other != candidate and self._reaches(candidate, other) for other in common)
+        ]
+
+    def edges(self) -> CaseAndSpaceInsensitiveTuplesDict:
+        """All edges {(parent, component): weight}"""
+        edges = CaseAndSpaceInsensitiveTuplesDict()
+        for parent_id, children in enumerate(self._children):
+            for child_id, weight in children.items():
+                edges[self._names[parent_id], self._names[child_id]] = weight
+        return edges
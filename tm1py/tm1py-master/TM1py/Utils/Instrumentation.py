@@ -0,0 +1,476 @@
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from TM1py.Utils.Utils import endpoint_template
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+
+    _has_opentelemetry = True
+except ImportError:
+    _has_opentelemetry = False
+
+
+class LatencyHistogram:
+    """HDR-style histogram for durations in seconds.
+
+    Values are recorded with microsecond resolution into log-linear buckets: below 2^precision_bits microseconds
+    every value has its own bucket, above that each power of two is split into 2^precision_bits buckets.
+    The relative error of quantiles is thereby bounded by 2^-precision_bits, independent of the magnitude.
+    """
+
+    def __init__(self, precision_bits: int = 5):
+        """
+
+        :param precision_bits: number of sub-buckets per power of two as exponent of 2. 5 means ~3% max error
+        """
+        self.precision_bits = precision_bits
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self._buckets: Dict[int, int] = dict()
+
+    def _bucket_index(self, microseconds: int) -> int:
+        sub_buckets = 1 << self.precision_bits
+        if microseconds < sub_buckets:
+            return microseconds
+        shift = microseconds.bit_length() - 1 - self.precision_bits
+        return shift * sub_buckets + (microseconds >> shift)
+
+    def _bucket_upper_bound(self, index: int) -> float:
+        """Exclusive upper bound of the bucket in seconds"""
+        sub_buckets = 1 << self.precision_bits
+        if index < 2 * sub_buckets:
+            return (index + 1) / 1_000_000
+        shift = index // sub_buckets - 1
+        mantissa = index - shift * sub_buckets
+        return ((mantissa + 1) << shift) / 1_000_000
+
+    def record(self, seconds: float):
+        index = self._bucket_index(max(0, int(seconds * 1_000_000)))
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram"):
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("Histograms with different 'precision_bits' can not be merged")
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile q (0 <= q <= 1). Upper bound of the bucket, capped at the max recorded value"""
+        if not 0 <= q <= 1:
+            raise ValueError("'q' must be between 0 and 1")
+        if not self.count:
+            return None
+
+        target = max(1, q * self.count)
+        cumulative = 0
+        for index in sorted(self._buckets):
+            cumulative += self._buckets[index]
+            if cumulative >= target:
+                return min(self._bucket_upper_bound(index), self.max)
+        return self.max
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """Upper bounds of non-empty buckets with the number of values below them, as used by Prometheus"""
+        cumulative = 0
+        buckets = []
+        for index in sorted(self._buckets):
+            cumulative += self._buckets[index]
+            buckets.append((self._bucket_upper_bound(index), cumulative))
+        return buckets
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "p999": self.quantile(0.999),
+        }
+
+
+class RequestRecord:
+    """Metrics of one call to `RestService.request`. Passed to instrumentation hooks once the call is done"""
+
+    __slots__ = [
+        "method",
+        "url",
+        "endpoint",
+        "async_requests_mode",
+        "started",
+        "duration",
+        "server_time",
+        "transfer_time",
+        "status_code",
+        "bytes_sent",
+        "bytes_received",
+        "retries",
+        "reconnects",
+        "error",
+    ]
+
+    def __init__(self, method: str, url: str, bytes_sent: int = 0, async_requests_mode: bool = False):
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = endpoint_template(method, url)
+        self.async_requests_mode = async_requests_mode
+        # epoch seconds
+        self.started = time.time()
+        self.duration = None
+        self.server_time = None
+        self.transfer_time = None
+        self.status_code = None
+        self.bytes_sent = bytes_sent
+        self.bytes_received = 0
+        self.retries = 0
+        self.reconnects = 0
+        self.error = None
+
+    def set_response(self, status_code: int = None, bytes_received: int = 0, server_time: float = None):
+        """
+        :param status_code: HTTP status of the final response
+        :param bytes_received: size of the response body
+        :param server_time: seconds until the response headers arrived. None if not known
+        """
+        self.status_code = status_code
+        self.bytes_received = bytes_received
+        self.server_time = server_time
+
+    def to_dict(self) -> Dict:
+        return {attribute: getattr(self, attribute) for attribute in self.__slots__}
+
+
+class Instrumentation:
+    """Records metrics for every request of a RestService and feeds per-endpoint latency histograms.
+
+    Endpoints are request urls without query and object names, e.g. "GET /Cellsets('')".
+    For every endpoint the total duration, the server time (until the response headers arrived) and the
+    transfer time (remainder, mostly the download of the body) are recorded. In async_requests_mode the
+    whole wait for the async operation counts as server time.
+
+    Hooks are called with a `RequestRecord` after every request. Client-side work such as JSON parsing can be
+    timed through `measure`.
+
+    Metrics can be exported through `to_dict` and `to_prometheus`. `OpenTelemetryHook` turns records into spans.
+    """
+
+    KINDS = ("duration", "server", "transfer")
+
+    def __init__(self, enabled: bool = False, hooks: Iterable[Callable[[RequestRecord], None]] = None):
+        """
+
+        :param enabled: when disabled, requests are not recorded
+        :param hooks: functions that are called with the RequestRecord of every request
+        """
+        self.enabled = enabled
+        self.hooks = list(hooks or [])
+        self._init_runtime_state()
+        self.reset()
+
+    def _init_runtime_state(self):
+        self._lock = threading.Lock()
+        # records of requests in progress in the current thread, innermost last
+        self._local = threading.local()
+
+    def __getstate__(self) -> Dict:
+        # hooks (e.g. tracers) are typically bound to the current process
+        state = self.__dict__.copy()
+        for attribute in ("_lock", "_local", "hooks"):
+            del state[attribute]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self.hooks = []
+        self._init_runtime_state()
+
+    def reset(self):
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._histograms: Dict[Tuple[str, str], LatencyHistogram] = dict()
+            self._counters: Dict[str, Dict] = dict()
+            self._client_histograms: Dict[str, LatencyHistogram] = dict()
+
+    def add_hook(self, hook: Callable[[RequestRecord], None]):
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestRecord], None]):
+        self.hooks.remove(hook)
+
+    def _stack(self) -> List[RequestRecord]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def track(
+        self,
+        method: str,
+        url: str,
+        data=None,
+        encoding: str = "utf-8",
+        async_requests_mode: bool = False,
+        register: bool = True,
+    ):
+        """Record a request. Yields the RequestRecord, which must be completed through `set_response`
+
+        :param method: HTTP method
+        :param url: request url
+        :param data: request body
+        :param encoding: encoding of the body if passed as str
+        :param async_requests_mode: whether the request is executed with `Prefer: respond-async`
+        :param register: make the record available to `note_retry` and `note_reconnect` in the current thread.
+        Not suitable for asyncio, where requests of concurrent tasks interleave in one thread
+        """
+        if isinstance(data, str):
+            bytes_sent = len(data.encode(encoding))
+        else:
+            bytes_sent = len(data) if data else 0
+
+        record = RequestRecord(method=method, url=url, bytes_sent=bytes_sent, async_requests_mode=async_requests_mode)
+        if register:
+            self._stack().append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record.error = type(e).__name__
+            record.status_code = getattr(e, "status_code", None)
+            raise
+        finally:
+            record.duration = time.perf_counter() - start
+            if register:
+                self._stack().pop()
+            self._complete(record)
+
+    def note_retry(self):
+        """Count a retry for the request in progress in the current thread"""
+        stack = self._stack()
+        if stack:
+            stack[-1].retries += 1
+
+    def note_reconnect(self):
+        """Count a re-connect for the request in progress in the current thread"""
+        stack = self._stack()
+        if stack:
+            stack[-1].reconnects += 1
+
+    @contextmanager
+    def measure(self, name: str):
+        """Time client-side work, e.g. parsing of a response, in a histogram of its own
+
+        :param name: e.g. 'json'
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                if name not in self._client_histograms:
+                    self._client_histograms[name] = LatencyHistogram()
+                self._client_histograms[name].record(duration)
+
+    def _complete(self, record: RequestRecord):
+        if record.server_time is None or record.async_requests_mode:
+            record.server_time = record.duration
+        record.server_time = min(record.server_time, record.duration)
+        record.transfer_time = record.duration - record.server_time
+
+        with self._lock:
+            for kind, value in zip(self.KINDS, (record.duration, record.server_time, record.transfer_time)):
+                key = (record.endpoint, kind)
+                if key not in self._histograms:
+                    self._histograms[key] = LatencyHistogram()
+                self._histograms[key].record(value)
+
+            counters = self._counters.setdefault(
+                record.endpoint,
+                {
+                    "requests": 0,
+                    "errors": 0,
+                    "status": dict(),
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "retries": 0,
+                    "reconnects": 0,
+                },
+            )
+            counters["requests"] += 1
+            if record.error:
+                counters["errors"] += 1
+            if record.status_code is not None:
+                counters["status"][record.status_code] = counters["status"].get(record.status_code, 0) + 1
+            counters["bytes_sent"] += record.bytes_sent
+            counters["bytes_received"] += record.bytes_received
+            counters["retries"] += record.retries
+            counters["reconnects"] += record.reconnects
+
+        for hook in list(self.hooks):
+            try:
+                hook(record)
+            except Exception as e:
+                warnings.warn(f"Instrumentation hook failed due to Exception: {e}")
+
+    def histogram(self, endpoint: str, kind: str = "duration") -> Optional[LatencyHistogram]:
+        """
+        :param endpoint: e.g. "POST /ExecuteMDX"
+        :param kind: 'duration', 'server' or 'transfer'
+        :return: histogram or None if no request was recorded for the endpoint
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"'kind' must be one of {self.KINDS}")
+        return self._histograms.get((endpoint, kind))
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            endpoints = dict()
+            for endpoint, counters in self._counters.items():
+                endpoints[endpoint] = dict(counters, status=dict(counters["status"]))
+                for kind in self.KINDS:
+                    endpoints[endpoint][kind] = self._histograms[(endpoint, kind)].to_dict()
+
+            return {
+                "endpoints": endpoints,
+                "client": {name: histogram.to_dict() for name, histogram in self._client_histograms.items()},
+            }
+
+    @staticmethod
+    def _escape_label(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def _format_float(value: float) -> str:
+        return repr(float(value))
+
+    def _prometheus_histogram(self, lines: List[str], name: str, labels: str, histogram: LatencyHistogram):
+        for upper_bound, count in histogram.cumulative_buckets():
+            lines.append(f'{name}_bucket{{{labels},le="{self._format_float(upper_bound)}"}} {count}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self._format_float(histogram.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+    def to_prometheus(self, prefix: str = "tm1py") -> str:
+        """Metrics in the Prometheus text exposition format
+
+        :param prefix: prefix of all metric names
+        :return: str
+        """
+        lines = []
+        with self._lock:
+            endpoint_labels = dict()
+            for endpoint in self._counters:
+                method, path = endpoint.split(" ", 1)
+                endpoint_labels[endpoint] = (
+                    f'method="{self._escape_label(method)}",endpoint="{self._escape_label(path)}"'
+                )
+
+            for kind, help_text in [
+                ("duration", "Total duration of requests"),
+                ("server", "Time until response headers arrived"),
+                ("transfer", "Time spent after response headers arrived"),
+            ]:
+                name = f"{prefix}_request_{kind}_seconds"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for endpoint, labels in endpoint_labels.items():
+                    self._prometheus_histogram(lines, name, labels, self._histograms[(endpoint, kind)])
+
+            name = f"{prefix}_requests_total"
+            lines.append(f"# HELP {name} Number of requests by status code")
+            lines.append(f"# TYPE {name} counter")
+            for endpoint, labels in endpoint_labels.items():
+                for status_code, count in self._counters[endpoint]["status"].items():
+                    lines.append(f'{name}{{{labels},status="{status_code}"}} {count}')
+
+            for counter, help_text in [
+                ("errors", "Number of requests that raised an exception"),
+                ("bytes_sent", "Bytes sent in request bodies"),
+                ("bytes_received", "Bytes received in response bodies"),
+                ("retries", "Number of retries after remote disconnects"),
+                ("reconnects", "Number of re-connects during requests"),
+            ]:
+                name = f"{prefix}_request_{counter}_total"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for endpoint, labels in endpoint_labels.items():
+                    lines.append(f"{name}{{{labels}}} {self._counters[endpoint][counter]}")
+
+            if self._client_histograms:
+                name = f"{prefix}_client_seconds"
+                lines.append(f"# HELP {name} Duration of client-side work")
+                lines.append(f"# TYPE {name} histogram")
+                for client_name, histogram in self._client_histograms.items():
+                    self._prometheus_histogram(lines, name, f'name="{self._escape_label(client_name)}"', histogram)
+
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook:
+    """Instrumentation hook that exports every request as OpenTelemetry client span. Requires opentelemetry-api
+
+    >>> tm1 = TM1Service(..., instrumentation=True)
+    >>> tm1.connection.instrumentation.add_hook(OpenTelemetryHook())
+    """
+
+    def __init__(self, tracer=None):
+        """
+
+        :param tracer: OpenTelemetry tracer. Defaults to the tracer 'TM1py' of the global tracer provider
+        """
+        if not _has_opentelemetry:
+            raise ImportError("OpenTelemetryHook requires opentelemetry-api")
+        self.tracer = tracer or trace.get_tracer("TM1py")
+
+    def __call__(self, record: RequestRecord):
+        start_time = int(record.started * 1_000_000_000)
+        attributes = {
+            "http.request.method": record.method,
+            "url.template": record.endpoint,
+            "http.request.body.size": record.bytes_sent,
+            "http.response.body.size": record.bytes_received,
+            "tm1py.server_time": record.server_time,
+            "tm1py.transfer_time": record.transfer_time,
+            "tm1py.retries": record.retries,
+            "tm1py.reconnects": record.reconnects,
+            "tm1py.async_requests_mode": record.async_requests_mode,
+        }
+        if record.status_code is not None:
+            attributes["http.response.status_code"] = record.status_code
+        if record.error:
+            attributes["error.type"] = record.error
+
+        span = self.tracer.start_span(
+            name=record.endpoint, kind=SpanKind.CLIENT, start_time=start_time, attributes=attributes
+        )
+        if record.error or (record.status_code is not None and record.status_code >= 400):
+            span.set_status(Status(StatusCode.ERROR))
+        span.end(end_time=start_time + int(record.duration * 1_000_000_000))
@@ -0,0 +1,225 @@
+import json
+from json import JSONDecodeError
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+try:
+    import msgspec
+
+    _has_msgspec = True
+except ImportError:
+    _has_msgspec = False
+
+
+class _Struct:
+    """Fallback for msgspec.Struct: typed, slotted record that is built from a decoded dict"""
+
+    __slots__ = ()
+    _fields: Tuple = ()
+
+    def __init__(self, **kwargs):
+        for name, _, default in self._fields:
+            setattr(self, name, kwargs.get(name, default))
+
+    @classmethod
+    def from_dict(cls, values: Dict) -> "_Struct":
+        instance = cls.__new__(cls)
+        for name, annotation, default in cls._fields:
+            value = values.get(name, default)
+            setattr(instance, name, None if value is None else _convert(value, annotation))
+        return instance
+
+    def __eq__(self, other) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name, _, _ in self._fields)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name, _, _ in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+def _is_struct(annotation) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, _Struct)
+
+
+def _convert(value: Any, annotation) -> Any:
+    # Optional[X] -> X
+    if getattr(annotation, "__origin__", None) is Union and len(annotation.__args__) == 2:
+        annotation = next(arg for arg in annotation.__args__ if arg is not type(None))
+    if _is_struct(annotation):
+        return annotation.from_dict(value)
+    # List[X]: __origin__ is list in Python >= 3.7 and List in 3.6
+    if getattr(annotation, "__origin__", None) in (list, List) and _is_struct(annotation.__args__[0]):
+        return [annotation.__args__[0].from_dict(item) for item in value]
+    return value
+
+
+def _define_struct(name: str, fields: List[Tuple[str, Any, Any]]):
+    """Define a record type with msgspec if installed, so cellsets can be decoded straight into it"""
+    if _has_msgspec:
+        return msgspec.defstruct(name, fields, module=__name__)
+    return type(name, (_Struct,), {"__slots__": tuple(field[0] for field in fields), "_fields": tuple(fields)})
+
+
+# fields that TM1 doesn't return for the requested properties are None.
+# Properties that are not declared here are dropped
+CellsetMember = _define_struct(
+    "CellsetMember",
+    [
+        ("Name", Optional[str], None),
+        ("UniqueName", Optional[str], None),
+        ("Type", Optional[str], None),
+        ("Ordinal", Optional[int], None),
+        ("Weight", Optional[float], None),
+        ("Attributes", Optional[Dict[str, Any]], None),
+        ("Element", Optional[Dict[str, Any]], None),
+        ("Parent", Optional[Dict[str, Any]], None),
+    ],
+)
+CellsetTuple = _define_struct(
+    "CellsetTuple",
+    [
+        ("Ordinal", Optional[int], None),
+        ("Members", Optional[List[CellsetMember]], None),
+    ],
+)
+CellsetAxis = _define_struct(
+    "CellsetAxis",
+    [
+        ("Ordinal", Optional[int], None),
+        ("Cardinality", Optional[int], None),
+        ("Hierarchies", Optional[List[Dict[str, Any]]], None),
+        ("Tuples", Optional[List[CellsetTuple]], None),
+    ],
+)
+CellsetCell = _define_struct(
+    "CellsetCell",
+    [
+        ("Ordinal", Optional[int], None),
+        ("Value", Union[float, str, None], None),
+        ("FormattedValue", Optional[str], None),
+        ("Updateable", Optional[int], None),
+        ("RuleDerived", Optional[bool], None),
+        ("Consolidated", Optional[bool], None),
+        ("Annotated", Optional[bool], None),
+        ("HasPicklist", Optional[bool], None),
+        ("PicklistValues", Optional[List[str]], None),
+    ],
+)
+Cellset = _define_struct(
+    "Cellset",
+    [
+        ("ID", Optional[str], None),
+        ("Cube", Optional[Dict[str, Any]], None),
+        ("Axes", Optional[List[CellsetAxis]], None),
+        ("Cells", Optional[List[CellsetCell]], None),
+    ],
+)
+
+
+class JsonDecoder:
+    """Decodes the JSON bodies of TM1 responses with the fastest available library.
+
+    'auto' picks orjson, then msgspec and falls back to the standard library.
+    `decode_cellset` decodes a cellset into `Cellset` records. With msgspec installed the records are
+    msgspec Structs that are built while parsing, without intermediate dicts.
+    """
+
+    LIBRARIES = ("orjson", "msgspec", "json")
+
+    def __init__(self, library: str = "auto"):
+        """
+
+        :param library: 'auto', 'orjson', 'msgspec' or 'json'
+        """
+        if library == "auto":
+            library = "orjson" if _has_orjson else "msgspec" if _has_msgspec else "json"
+        if library not in self.LIBRARIES:
+            raise ValueError(f"Invalid value for 'library': '{library}'. Must be one of: 'auto', {self.LIBRARIES}")
+        if library == "orjson" and not _has_orjson:
+            raise ImportError("JsonDecoder with library 'orjson' requires orjson")
+        if library == "msgspec" and not _has_msgspec:
+            raise ImportError("JsonDecoder with library 'msgspec' requires msgspec")
+
+        self.library = library
+        if library == "orjson":
+            self._loads = orjson.loads
+        elif library == "msgspec":
+            self._loads = msgspec.json.Decoder().decode
+        else:
+            self._loads = json.loads
+        self._cellset_decoder = msgspec.json.Decoder(Cellset).decode if _has_msgspec else None
+        self._response_classes: Dict[type, type] = dict()
+
+    def __reduce__(self):
+        return JsonDecoder, (self.library,)
+
+    def __repr__(self) -> str:
+        return f"JsonDecoder(library='{self.library}')"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document
+
+        :param data: UTF-8 encoded bytes or str
+        :return: dicts, lists and scalars as from `json.loads`
+        """
+        try:
+            return self._loads(data)
+        except ValueError:
+            raise
+        except Exception as e:
+            # msgspec errors are raised as the JSONDecodeError that callers of json.loads expect
+            raise JSONDecodeError(str(e), data if isinstance(data, str) else data.decode("utf-8", "replace"), 0)
+
+    def decode_cellset(self, data: Union[bytes, str]) -> "Cellset":
+        """Decode the body of a cellset request, e.g. from `CellService.extract_cellset_raw_response`
+
+        :param data: UTF-8 encoded bytes or str
+        :return: Cellset
+        """
+        if self._cellset_decoder is not None:
+            try:
+                return self._cellset_decoder(data)
+            except msgspec.DecodeError as e:
+                raise JSONDecodeError(str(e), data if isinstance(data, str) else data.decode("utf-8", "replace"), 0)
+        return Cellset.from_dict(self.loads(data))
+
+    def decode_response(self, response, **kwargs) -> Any:
+        """Decode the body of a `requests` or `httpx` response
+
+        :param response: response
+        :param kwargs: arguments for `json.loads`. If provided, the standard library is used
+        """
+        if kwargs:
+            return json.loads(response.text, **kwargs)
+        if (response.encoding or "utf-8").lower().replace("-", "") == "utf8":
+            return self.loads(response.content)
+        return self.loads(response.text)
+
+    def install(self, response):
+        """Route `response.json()` through this decoder"""
+        if self.library != "json":
+            # swap the class instead of setting `json` on the instance: a bound method would keep the response
+            # and its (possibly large) body alive in a reference cycle. `POST(...).json()` must still work
+            response.__class__ = self._response_class(type(response))
+        return response
+
+    def _response_class(self, response_class: type) -> type:
+        """Subclass of the response class, e.g. requests.Response, whose `json` method uses this decoder"""
+        subclass = self._response_classes.get(response_class)
+        if subclass is None:
+            decoder = self
+
+            def json(response, **kwargs) -> Any:
+                return decoder.decode_response(response, **kwargs)
+
+            subclass = type(response_class.__name__, (response_class,), {"json": json})
+            self._response_classes[response_class] = subclass
+        return subclass
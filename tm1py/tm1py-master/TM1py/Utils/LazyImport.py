@@ -0,0 +1,74 @@
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+
+_lock = threading.RLock()
+
+
+class LazyModule(types.ModuleType):
+    """Placeholder for an optional, heavy dependency (e.g. pandas) that is imported on first attribute access.
+
+    Keeps `import TM1py` fast for scripts that never touch data frames.
+    Once loaded, the attributes of the module are copied onto the placeholder, so later lookups are direct.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__.update(module.__dict__)
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Import a module on first use. Returns the module itself if it was imported already
+
+    :param name: fully qualified module name, e.g. 'pyarrow.compute'
+    :return: module or LazyModule
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def is_installed(name: str) -> bool:
+    """Check if a module can be imported, without importing it
+
+    :param name: name of a top level package. Parents of submodules are imported to find them
+    :return: bool
+    """
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def is_loaded(name: str) -> bool:
+    """Check if a module has been imported already
+
+    :param name: fully qualified module name
+    :return: bool
+    """
+    return sys.modules.get(name) is not None
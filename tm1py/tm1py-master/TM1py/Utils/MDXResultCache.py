@@ -0,0 +1,342 @@
+import hashlib
+import mmap
+import os
+import pickle
+import re
+import stat
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Tuple
+from urllib.parse import unquote
+
+from TM1py.Utils.Utils import lower_and_drop_spaces
+
+
+class MDXResultCache:
+    """Thread-safe cache for results of MDX queries, e.g. from `CellService.execute_mdx_dataframe`
+
+    Every entry is stored with the cubes that the query reads and a token of their state
+    (e.g. LastDataUpdate and LastSchemaUpdate). A cached result is only returned if the token of the cubes is
+    unchanged, so a hit costs one cheap request for the token instead of building a cellset.
+    The token only covers the cube in the FROM clause. Values that rules pull from other cubes
+    are not tracked and may be stale until the entry is invalidated or evicted.
+
+    Results are stored pickled, so every hit returns a fresh object that the caller can alter.
+    Entries are kept in memory or, if `directory` is provided, in files that are memory-mapped on read.
+    The least recently used entries are evicted once more than `max_size` entries or `max_bytes` bytes are cached.
+    """
+
+    _WHITESPACE_OR_STRING_PATTERN = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|\s+")
+    _HEADER = struct.Struct("<Q")
+    FILE_SUFFIX = ".mdxcache"
+    _CUBE_PATTERN = re.compile(r"/Cubes\('((?:[^']|'')*)'\)(/[^?]*)?", re.IGNORECASE)
+    # requests against these parts of a cube don't alter its data
+    _READ_ONLY_CUBE_PATHS = ("/views", "/privateviews", "/tm1.trace", "/tm1.check", "/tm1.dimensionsstorageorder")
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        max_bytes: int = None,
+        directory: str = None,
+        check_cube_state: bool = True,
+        enabled: bool = True,
+    ):
+        """
+
+        :param max_size: max number of entries
+        :param max_bytes: max total size of the pickled results. None for no limit
+        :param directory: store results in files in this directory instead of memory. Entries in the directory
+        are reused across processes, as long as the tokens of their cubes are unchanged.
+        Files are unpickled, which can execute arbitrary code. The directory must be private: owned by the current
+        user and not writable by anyone else
+        :param check_cube_state: validate every hit against the current state of the cube. If False, hits cost no
+        request at all and entries stay valid until they are invalidated, e.g. through `invalidate_from_transaction_log`
+        :param enabled: when disabled, every lookup is passed through to the loader
+        """
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.check_cube_state = check_cube_state
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        # key -> (cubes, token, size, payload). payload is None for entries on disk
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        if directory and enabled:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            self._verify_private_directory(directory)
+            self._load_directory()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that were answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": self.hit_rate,
+        }
+
+    @classmethod
+    def normalize_mdx(cls, mdx: str) -> str:
+        """Collapse whitespace outside of string literals, so that formatting doesn't affect the key"""
+        mdx = str(mdx).strip()
+        return cls._WHITESPACE_OR_STRING_PATTERN.sub(lambda match: match.group(1) or " ", mdx)
+
+    @staticmethod
+    def _normalize_cubes(cubes: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(sorted({lower_and_drop_spaces(cube) for cube in cubes}))
+
+    @property
+    def bypassed(self) -> bool:
+        """True while a cached function is being loaded on this thread. Nested cached calls are not cached"""
+        return getattr(self._local, "depth", 0) > 0
+
+    def get(self, key: Hashable, token: Hashable) -> Tuple[bool, Any]:
+        """Look up a result
+
+        :param key: key of the query, e.g. function name, normalized MDX, sandbox and arguments
+        :param token: current state of the cubes that the query reads
+        :return: found, value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            _, entry_token, _, payload = entry
+            if entry_token != token:
+                self.misses += 1
+                self.stale += 1
+                self._remove(key)
+                return False, None
+            self._entries.move_to_end(key)
+
+        if payload is None:
+            found, value = self._read_file(key, token)
+        else:
+            found, value = True, pickle.loads(payload)
+
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._remove(key)
+        return found, value
+
+    def set(self, key: Hashable, cubes: Iterable[str], token: Hashable, value: Any):
+        """Store a result. Results that can't be pickled or exceed `max_bytes` are not cached
+
+        :param key: key of the query
+        :param cubes: cubes that the query reads
+        :param token: state of the cubes at the time before the query was executed
+        :param value: result
+        """
+        if not self.enabled:
+            return
+
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            return
+
+        cubes = self._normalize_cubes(cubes)
+        with self._lock:
+            self._remove(key)
+            if self.directory:
+                self._write_file(key, cubes, token, payload)
+                self._entries[key] = (cubes, token, len(payload), None)
+            else:
+                self._entries[key] = (cubes, token, len(payload), payload)
+            self._bytes += len(payload)
+            self._evict()
+
+    def load(self, key: Hashable, cubes: Iterable[str], token: Hashable, loader) -> Any:
+        """Return the cached result for key or call loader, cache and return its result
+
+        :param key: key of the query
+        :param cubes: cubes that the query reads
+        :param token: current state of the cubes, retrieved before the loader is called
+        :param loader: function without arguments that executes the query
+        :return: result
+        """
+        if not self.enabled:
+            return loader()
+
+        found, value = self.get(key, token)
+        if found:
+            return value
+
+        generation = self._generation
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            value = loader()
+        finally:
+            self._local.depth -= 1
+
+        # don't cache results that were loaded while the cache was invalidated
+        if generation == self._generation:
+            self.set(key, cubes, token, value)
+        return value
+
+    def invalidate_cube(self, cube_name: str):
+        cube_name = lower_and_drop_spaces(cube_name)
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if cube_name in entry[0]]:
+                self._remove(key)
+            self._generation += 1
+
+    def invalidate_for_request(self, method: str, url: str):
+        """Invalidate the results of the cube that a modifying request against the TM1 REST API addresses,
+        e.g. POST /Cubes('Sales')/tm1.Update. Changes to control cubes (e.g. element attributes) clear the cache.
+
+        :param method: HTTP method
+        :param url: url of the request
+        """
+        if not self.enabled or method.lower() == "get":
+            return
+
+        match = self._CUBE_PATTERN.search(url)
+        if not match or (match.group(2) or "").lower().startswith(self._READ_ONLY_CUBE_PATHS):
+            return
+        cube_name = unquote(match.group(1).replace("''", "'"))
+        if cube_name.startswith("}"):
+            self.clear()
+        else:
+            self.invalidate_cube(cube_name)
+
+    def invalidate_from_transaction_log(self, entries: Iterable[Dict]):
+        """Invalidate entries based on transaction log entries, e.g. from `TransactionLogService.execute_delta_request`
+
+        Changes to regular cubes invalidate the results of queries on these cubes.
+        Changes to control cubes (e.g. element attributes, security) clear the cache.
+
+        :param entries: transaction log entries with 'Cube' property
+        """
+        for cube_name in {entry.get("Cube") or "" for entry in entries}:
+            if cube_name.startswith("}"):
+                self.clear()
+                return
+            self.invalidate_cube(cube_name)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._generation += 1
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_size or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry[2]
+        if self.directory:
+            try:
+                os.remove(self._file_path(key))
+            except OSError:
+                pass
+
+    @staticmethod
+    def _verify_private_directory(directory: str):
+        # ownership and permission bits are not meaningful on Windows
+        if not hasattr(os, "getuid"):
+            return
+        status = os.stat(directory)
+        if status.st_uid != os.getuid() or status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise ValueError(
+                f"MDXResultCache directory '{directory}' must be owned by the current user "
+                "and must not be writable by group or others"
+            )
+
+    def _file_path(self, key: Hashable) -> str:
+        file_name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + self.FILE_SUFFIX
+        return os.path.join(self.directory, file_name)
+
+    def _write_file(self, key: Hashable, cubes: Tuple[str, ...], token: Hashable, payload: bytes):
+        header = pickle.dumps((key, cubes, token), protocol=pickle.HIGHEST_PROTOCOL)
+        file_path = self._file_path(key)
+        temporary_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(self._HEADER.pack(len(header)))
+            file.write(header)
+            file.write(payload)
+        # readers in other processes never see partially written files
+        os.replace(temporary_path, file_path)
+
+    def _read_header(self, mapped: mmap.mmap) -> Tuple[Tuple, int]:
+        (header_size,) = self._HEADER.unpack_from(mapped, 0)
+        offset = self._HEADER.size + header_size
+        return pickle.loads(mapped[self._HEADER.size : offset]), offset
+
+    def _read_file(self, key: Hashable, token: Hashable) -> Tuple[bool, Any]:
+        try:
+            with open(self._file_path(key), "rb") as file, mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                (file_key, _, file_token), offset = self._read_header(mapped)
+                if file_key != key or file_token != token:
+                    return False, None
+                # unpickle straight from the mapped file without copying the payload
+                with memoryview(mapped) as view, view[offset:] as payload:
+                    return True, pickle.loads(payload)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, struct.error):
+            return False, None
+
+    def _load_directory(self):
+        """Register entries that were written to the directory before, least recently written first"""
+        files = []
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(self.FILE_SUFFIX):
+                file_path = os.path.join(self.directory, file_name)
+                files.append((os.path.getmtime(file_path), file_path))
+
+        for _, file_path in sorted(files):
+            try:
+                with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    (key, cubes, token), offset = self._read_header(mapped)
+                    size = len(mapped) - offset
+            except (OSError, ValueError, EOFError, pickle.UnpicklingError, struct.error):
+                continue
+            self._entries[key] = (cubes, token, size, None)
+            self._bytes += size
+        self._evict()
@@ -0,0 +1,199 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
+from urllib.parse import unquote
+
+from TM1py.Utils.Utils import lower_and_drop_spaces
+
+
+class MetadataCache:
+    """Thread-safe cache for metadata that rarely changes, such as the dimension order of cubes,
+    element types, principal element names and hierarchy edges.
+
+    Entries expire after `ttl` seconds. The least recently used entries are evicted once more than `max_size`
+    entries are cached. Keys are tuples that start with the type of the owning object ('cube' or 'dimension')
+    and its name, e.g. ('cube', 'Sales', 'dimensions'). String parts of keys are case and space insensitive.
+
+    Requests from the same client that alter cubes or dimensions invalidate the affected entries.
+    Changes made by other clients are picked up when entries expire or through `invalidate_from_transaction_log`.
+    """
+
+    CUBE = "cube"
+    DIMENSION = "dimension"
+
+    ELEMENT_ATTRIBUTES_PREFIX = "}elementattributes_"
+
+    _CUBE_PATTERN = re.compile(r"/Cubes\('((?:[^']|'')*)'\)(/[^?]*)?", re.IGNORECASE)
+    _DIMENSION_PATTERN = re.compile(r"/Dimensions\('((?:[^']|'')*)'\)", re.IGNORECASE)
+
+    def __init__(self, ttl: float = 300, max_size: int = 1000, enabled: bool = True):
+        """
+
+        :param ttl: seconds after which entries expire. None for no expiry
+        :param max_size: max number of entries
+        :param enabled: when disabled, every lookup is passed through to the loader
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(key: Tuple) -> Tuple:
+        return tuple(lower_and_drop_spaces(part) if isinstance(part, str) else part for part in key)
+
+    def get_or_load(self, key: Tuple, loader: Callable[[], Any]) -> Any:
+        """Return cached value for key or load, cache and return it
+
+        :param key: tuple, e.g. ('cube', cube_name, 'dimensions')
+        :param loader: function without arguments that retrieves the value from TM1
+        :return: value
+        """
+        if not self.enabled:
+            return loader()
+
+        key = self._normalize(key)
+        found, value, generation = self._lookup(key)
+        if found:
+            return value
+
+        value = loader()
+        self._store_if_current(key, value, generation)
+        return value
+
+    async def get_or_load_async(self, key: Tuple, loader: Callable[[], Awaitable]) -> Any:
+        """Return cached value for key or await loader, cache and return it
+
+        :param key: tuple, e.g. ('cube', cube_name, 'dimensions')
+        :param loader: coroutine function without arguments that retrieves the value from TM1
+        :return: value
+        """
+        if not self.enabled:
+            return await loader()
+
+        key = self._normalize(key)
+        found, value, generation = self._lookup(key)
+        if found:
+            return value
+
+        value = await loader()
+        self._store_if_current(key, value, generation)
+        return value
+
+    def _lookup(self, key: Tuple) -> Tuple[bool, Any, int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value, self._generation
+                del self._entries[key]
+            self.misses += 1
+            return False, None, self._generation
+
+    def _store_if_current(self, key: Tuple, value: Any, generation: int):
+        with self._lock:
+            # don't cache values that were loaded while the cache was invalidated
+            if generation == self._generation:
+                self._store(key, value)
+
+    def set(self, key: Tuple, value: Any):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._store(self._normalize(key), value)
+
+    def _store(self, key: Tuple, value: Any):
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Tuple):
+        with self._lock:
+            self._entries.pop(self._normalize(key), None)
+            self._generation += 1
+
+    def _invalidate_owner(self, owner_type: str, owner_name: str):
+        owner = (owner_type, lower_and_drop_spaces(owner_name))
+        with self._lock:
+            for key in [key for key in self._entries if key[:2] == owner]:
+                del self._entries[key]
+            self._generation += 1
+
+    def invalidate_cube(self, cube_name: str):
+        self._invalidate_owner(self.CUBE, cube_name)
+
+    def invalidate_dimension(self, dimension_name: str):
+        self._invalidate_owner(self.DIMENSION, dimension_name)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def invalidate_for_request(self, method: str, url: str):
+        """Invalidate entries that are affected by a modifying request against the TM1 REST API
+
+        :param method: HTTP method
+        :param url: url of the request
+        """
+        if not self.enabled or method.lower() == "get":
+            return
+
+        for match in self._DIMENSION_PATTERN.finditer(url):
+            self.invalidate_dimension(self._unescape(match.group(1)))
+
+        match = self._CUBE_PATTERN.search(url)
+        if not match:
+            return
+        cube_name = self._unescape(match.group(1))
+        if cube_name.lower().startswith(self.ELEMENT_ATTRIBUTES_PREFIX):
+            # aliases determine principal element names
+            self.invalidate_dimension(cube_name[len(self.ELEMENT_ATTRIBUTES_PREFIX) :])
+        elif not match.group(2) or match.group(2).lower().startswith("/dimensions"):
+            self.invalidate_cube(cube_name)
+
+    def invalidate_from_transaction_log(self, entries: Iterable[Dict]):
+        """Invalidate entries based on transaction log entries, e.g. from `TransactionLogService.execute_delta_request`
+
+        Changes to regular cubes don't affect metadata. Changes to element attribute cubes invalidate the dimension.
+        Changes to other control cubes clear the cache.
+
+        :param entries: transaction log entries with 'Cube' property
+        """
+        for entry in entries:
+            cube_name = entry.get("Cube") or ""
+            if not cube_name.startswith("}"):
+                continue
+            if cube_name.lower().startswith(self.ELEMENT_ATTRIBUTES_PREFIX):
+                self.invalidate_dimension(cube_name[len(self.ELEMENT_ATTRIBUTES_PREFIX) :])
+            else:
+                self.clear()
+                return
+
+    @staticmethod
+    def _unescape(object_name: str) -> str:
+        return unquote(object_name.replace("''", "'"))
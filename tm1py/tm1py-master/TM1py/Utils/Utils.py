@@ -1,3 +1,4 @@
+import codecs
 import collections
 import csv
 import functools
@@ -7,6 +8,7 @@ import math
 import re
 import ssl
 import urllib.parse as urlparse
+from array import array
 from enum import Enum, unique
 from io import StringIO
 from typing import (
@@ -35,14 +37,17 @@ from TM1py.Exceptions.Exceptions import (
     TM1pyVersionDeprecationException,
     TM1pyVersionException,
 )
+from TM1py.Utils.LazyImport import is_installed, lazy_import
 
-try:
-    import numpy as np
-    import pandas as pd
+# optional dependencies are imported on first use
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+_has_pandas = is_installed("pandas")
 
-    _has_pandas = True
-except ImportError:
-    _has_pandas = False
+pa = lazy_import("pyarrow")
+pc = lazy_import("pyarrow.compute")
+pa_csv = lazy_import("pyarrow.csv")
+_has_pyarrow = is_installed("pyarrow")
 
 
 def decohints(decorator: Callable) -> Callable:
@@ -165,6 +170,17 @@ def require_pandas(func):
     return wrapper
 
 
+@decohints
+def require_pyarrow(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _has_pyarrow:
+            raise ImportError(f"Function '{func.__name__}' requires pyarrow")
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 def get_all_servers_from_adminhost(adminhost="localhost", port=None, use_ssl=False) -> List:
     from TM1py.Objects import Server
 
@@ -289,6 +305,23 @@ def format_url(url, *args: str, **kwargs: str) -> str:
     return url.format(*args, **kwargs)
 
 
+_QUOTED_OBJECT_NAME_PATTERN = re.compile(r"'(?:[^']|'')*'")
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """Normalize a request to its endpoint by dropping query, service root and object names
+
+    :param method: HTTP method
+    :param url: request url, e.g. "/Cellsets('abc')?$expand=Cells"
+    :return: e.g. "GET /Cellsets('')"
+    """
+    path = url.split("?")[0]
+    api_root = path.find("/api/v1/")
+    if api_root >= 0:
+        path = path[api_root + len("/api/v1") :]
+    return method.upper() + " " + _QUOTED_OBJECT_NAME_PATTERN.sub("''", path)
+
+
 def abbreviate_mdx(mdx: str, size=100) -> str:
     if len(mdx) < size:
         return mdx
@@ -556,6 +589,288 @@ def build_csv_from_cellset_dict(
     return csv_content.getvalue().strip()
 
 
+def _factorize_axis(axis: Dict, include_attributes: bool = False) -> List[Tuple["np.ndarray", List[str]]]:
+    """Decode the tuples of an axis once per member into dictionary encoded columns
+
+    :return: list of (codes, categories) per column. codes has one entry per tuple on the axis
+    """
+    columns = []
+    tuples = axis["Tuples"]
+    if not tuples:
+        return []
+    for position, first_member in enumerate(tuples[0]["Members"]):
+        members = [tupl["Members"][position] for tupl in tuples]
+        names = [m["Element"]["Name"] if "Element" in m and m["Element"] else m["Name"] for m in members]
+        columns.append(names)
+        if include_attributes:
+            for attribute in first_member["Attributes"]:
+                columns.append([str(m["Attributes"][attribute]) if m["Attributes"][attribute] else "" for m in members])
+
+    factorized = []
+    for column in columns:
+        codes, categories = pd.factorize(np.array(column, dtype=object))
+        factorized.append((codes.astype(np.int32), list(categories)))
+    return factorized
+
+
+def _build_columns_from_cellset_dict(
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    raw_cellset_as_dict: Dict,
+    top: Optional[int] = None,
+    include_attributes: bool = False,
+    mdx_headers: bool = False,
+) -> Tuple[List[str], List[Tuple["np.ndarray", List[str]]], List]:
+    """Broadcast axis members to the cells through the cell ordinals, without creating per cell tuples
+
+    :return: headers, list of (codes, categories) per dimension column, cell values
+    """
+    cells = raw_cellset_as_dict["Cells"]
+    if top:
+        cells = cells[:top]
+
+    axes = extract_axes_from_cellset(raw_cellset_as_dict=raw_cellset_as_dict)
+    column_axis = axes[0] if axes else None
+    row_axis = axes[1] if len(axes) > 1 else None
+
+    if include_attributes and not cells:
+        headers = [
+            dimension if mdx_headers else dimension_name_from_element_unique_name(dimension)
+            for dimension in row_dimensions + column_dimensions
+        ] + ["Value"]
+    else:
+        headers = _build_headers_for_csv(
+            row_axis=row_axis,
+            column_axis=column_axis,
+            row_dimensions=row_dimensions,
+            column_dimensions=column_dimensions,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+        )
+
+    # if skip is used in execution we must use the original ordinal from the cell, if not we can simply enumerate
+    if cells and "Ordinal" in cells[0]:
+        ordinals = np.fromiter((cell["Ordinal"] for cell in cells), dtype=np.int64, count=len(cells))
+    else:
+        ordinals = np.arange(len(cells), dtype=np.int64)
+    values = [cell["Value"] for cell in cells]
+
+    if not cells:
+        # empty or zero suppressed cellset: one empty column per header
+        return headers, [(np.array([], dtype=np.int32), []) for _ in headers[:-1]], values
+
+    columns = []
+    if column_axis and row_axis:
+        index_rows = ordinals // column_axis["Cardinality"] % row_axis["Cardinality"]
+        index_columns = ordinals % column_axis["Cardinality"]
+        for codes, categories in _factorize_axis(row_axis, include_attributes):
+            columns.append((codes[index_rows], categories))
+        for codes, categories in _factorize_axis(column_axis, include_attributes):
+            columns.append((codes[index_columns], categories))
+
+    elif column_axis:
+        index_columns = ordinals % column_axis["Cardinality"]
+        for codes, categories in _factorize_axis(column_axis, include_attributes):
+            columns.append((codes[index_columns], categories))
+
+    if include_attributes and cells and not len(columns) + 1 == len(headers):
+        raise ValueError(
+            "Invalid response. With 'include_attributes' as True,"
+            " Attributes must be requested explicitly as PROPERTIES in the MDX"
+        )
+
+    return headers, columns, values
+
+
+def build_dataframe_from_cellset_dict(
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    raw_cellset_as_dict: Dict,
+    top: Optional[int] = None,
+    include_attributes: bool = False,
+    mdx_headers: bool = False,
+    categorical: bool = True,
+) -> "pd.DataFrame":
+    """Build DataFrame from raw cellset in a columnar way.
+    Axis tuples are decoded once per member and broadcast to the cells through the cell ordinals.
+
+    :param row_dimensions:
+    :param column_dimensions:
+    :param raw_cellset_as_dict:
+    :param top: Maximum Number of cells
+    :param include_attributes: include attribute columns
+    :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+    :param categorical: boolean. Dimension columns as pandas Categorical instead of str objects
+    :return: DataFrame with one column per dimension (and attribute) and a Value column
+    """
+    headers, columns, values = _build_columns_from_cellset_dict(
+        row_dimensions=row_dimensions,
+        column_dimensions=column_dimensions,
+        raw_cellset_as_dict=raw_cellset_as_dict,
+        top=top,
+        include_attributes=include_attributes,
+        mdx_headers=mdx_headers,
+    )
+
+    data = {}
+    for position, (codes, categories) in enumerate(columns):
+        if categorical:
+            data[position] = pd.Categorical.from_codes(codes, categories=categories)
+        else:
+            data[position] = np.array(categories, dtype=object)[codes] if categories else np.array([], dtype=object)
+    data[len(columns)] = pd.Series(values, dtype=None if values else float)
+
+    # build on positions, as headers are not necessarily unique (e.g. same attribute on multiple dimensions)
+    df = pd.DataFrame(data)
+    df.columns = headers
+    return df
+
+
+@require_pyarrow
+def build_arrow_table_from_cellset_dict(
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    raw_cellset_as_dict: Dict,
+    top: Optional[int] = None,
+    include_attributes: bool = False,
+    mdx_headers: bool = False,
+) -> "pa.Table":
+    """Build Arrow Table from raw cellset in a columnar way.
+    Dimension columns are dictionary encoded. Value column is numeric, or string if the values are mixed.
+
+    :param row_dimensions:
+    :param column_dimensions:
+    :param raw_cellset_as_dict:
+    :param top: Maximum Number of cells
+    :param include_attributes: include attribute columns
+    :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+    :return: pyarrow Table
+    """
+    headers, columns, values = _build_columns_from_cellset_dict(
+        row_dimensions=row_dimensions,
+        column_dimensions=column_dimensions,
+        raw_cellset_as_dict=raw_cellset_as_dict,
+        top=top,
+        include_attributes=include_attributes,
+        mdx_headers=mdx_headers,
+    )
+
+    arrays = [
+        pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()), pa.array(categories, type=pa.string()))
+        for codes, categories in columns
+    ]
+    arrays.append(_build_arrow_value_array(values))
+    return pa.Table.from_arrays(arrays, names=headers)
+
+
+def _build_arrow_value_array(values: List) -> "pa.Array":
+    if not values:
+        return pa.array([], type=pa.float64())
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # mixed numeric and string values
+        return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+
+@require_pyarrow
+def build_arrow_batches_from_cellset_partitions(
+    row_dimensions: List[str],
+    column_dimensions: List[str],
+    raw_cellset_as_dict: Dict,
+    partitions: Iterable[List[Dict]],
+    include_attributes: bool = False,
+    mdx_headers: bool = False,
+    value_type: "pa.DataType" = None,
+) -> Generator["pa.RecordBatch", None, None]:
+    """Build Arrow record batches from the axes of a raw cellset and its cells, retrieved in partitions.
+    Axes are decoded once. Each partition of cells becomes one batch, so only one partition is held in memory.
+
+    Dimension columns are dictionary encoded and share one dictionary across all batches.
+    All batches have the same schema. The type of the Value column is taken from the first non-empty partition
+    (float64, or string if the values are mixed) unless `value_type` is provided.
+    Yields one empty batch if there are no cells.
+
+    :param row_dimensions:
+    :param column_dimensions:
+    :param raw_cellset_as_dict: raw cellset with axes. Cells are ignored
+    :param partitions: iterable of lists of cells with Value and Ordinal, in ordinal order
+    :param include_attributes: include attribute columns
+    :param mdx_headers: boolean. Fully qualified hierarchy name as header instead of simple dimension name
+    :param value_type: pa.float64() or pa.string(). Type of the Value column
+    :return: generator of pyarrow RecordBatches
+    """
+    axes = extract_axes_from_cellset(raw_cellset_as_dict=raw_cellset_as_dict)
+    column_axis = axes[0] if axes else None
+    row_axis = axes[1] if len(axes) > 1 else None
+
+    if column_axis is None:
+        headers = [
+            dimension if mdx_headers else dimension_name_from_element_unique_name(dimension)
+            for dimension in row_dimensions + column_dimensions
+        ] + ["Value"]
+        factorized_axes = []
+    else:
+        headers = _build_headers_for_csv(
+            row_axis=row_axis,
+            column_axis=column_axis,
+            row_dimensions=row_dimensions,
+            column_dimensions=column_dimensions,
+            include_attributes=include_attributes,
+            mdx_headers=mdx_headers,
+        )
+        factorized_axes = [(column_axis, _factorize_axis(column_axis, include_attributes))]
+        if row_axis:
+            factorized_axes.insert(0, (row_axis, _factorize_axis(row_axis, include_attributes)))
+
+    # (axis, codes per tuple on the axis, dictionary) per dimension column
+    columns = [
+        (axis, codes, pa.array(categories, type=pa.string()))
+        for axis, factorized in factorized_axes
+        for codes, categories in factorized
+    ]
+    if include_attributes and columns and not len(columns) + 1 == len(headers):
+        raise ValueError(
+            "Invalid response. With 'include_attributes' as True,"
+            " Attributes must be requested explicitly as PROPERTIES in the MDX"
+        )
+
+    empty = True
+    for cells in partitions:
+        if not cells:
+            continue
+
+        ordinals = np.fromiter((cell["Ordinal"] for cell in cells), dtype=np.int64, count=len(cells))
+        arrays = []
+        for axis, codes, dictionary in columns:
+            if axis is column_axis:
+                index = ordinals % column_axis["Cardinality"]
+            else:
+                index = ordinals // column_axis["Cardinality"] % row_axis["Cardinality"]
+            arrays.append(pa.DictionaryArray.from_arrays(pa.array(codes[index], type=pa.int32()), dictionary))
+
+        values = [cell["Value"] for cell in cells]
+        value_array = _build_arrow_value_array(values)
+        if value_type is None:
+            value_type = pa.string() if pa.types.is_string(value_array.type) else pa.float64()
+        if pa.types.is_string(value_type) and not pa.types.is_string(value_array.type):
+            value_array = pa.array([None if value is None else str(value) for value in values], type=pa.string())
+        elif not pa.types.is_string(value_type) and pa.types.is_string(value_array.type):
+            raise ValueError(
+                "String values in a partition after numeric values. Pass 'value_type' as pa.string() "
+                "to export cellsets with string cells"
+            )
+        arrays.append(value_array.cast(value_type))
+
+        empty = False
+        yield pa.RecordBatch.from_arrays(arrays, names=headers)
+
+    if empty:
+        arrays = [pa.array([], type=pa.dictionary(pa.int32(), pa.string())) for _ in headers[:-1]]
+        arrays.append(pa.array([], type=value_type or pa.float64()))
+        yield pa.RecordBatch.from_arrays(arrays, names=headers)
+
+
 def build_dataframe_from_csv(
     raw_csv,
     sep="~",
@@ -565,11 +880,44 @@ def build_dataframe_from_csv(
     fillna_string_attributes: bool = False,
     fillna_string_attributes_value: Any = "",
     attribute_types_by_dimension: Dict[str, Dict[str, str]] = None,
+    use_arrow: bool = False,
     **kwargs,
 ) -> "pd.DataFrame":
+    """Build DataFrame from csv with one column per dimension (and attribute) and a Value column
+
+    :param raw_csv: csv as str or, e.g. from blob, as UTF-8 encoded bytes
+    :param sep: value separator
+    :param shaped: pivot the last dimension into columns
+    :param fillna_numeric_attributes: fill empty numeric attribute columns with fillna_numeric_attributes_value
+    :param fillna_numeric_attributes_value: Any
+    :param fillna_string_attributes: fill empty string attribute columns with fillna_string_attributes_value
+    :param fillna_string_attributes_value: Any
+    :param attribute_types_by_dimension: attribute types per dimension. Required for fillna
+    :param use_arrow: parse with the multithreaded pyarrow csv reader into an Arrow backed DataFrame.
+    Arguments for pandas.read_csv are ignored
+    :param kwargs: arguments for pandas.read_csv
+    :return: DataFrame
+    """
     if not raw_csv:
         return pd.DataFrame()
 
+    if use_arrow:
+        if shaped:
+            raise ValueError("'use_arrow' must not be used in conjunction with 'shaped'")
+        table = build_arrow_table_from_csv(
+            raw_csv,
+            sep=sep,
+            fillna_numeric_attributes=fillna_numeric_attributes,
+            fillna_numeric_attributes_value=fillna_numeric_attributes_value,
+            fillna_string_attributes=fillna_string_attributes,
+            fillna_string_attributes_value=fillna_string_attributes_value,
+            attribute_types_by_dimension=attribute_types_by_dimension,
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    if isinstance(raw_csv, (bytes, bytearray, memoryview)):
+        raw_csv = bytes(raw_csv).decode("UTF-8-sig")
+
     # make sure all element names are strings and values column is derived from data
     if "dtype" not in kwargs:
         kwargs["dtype"] = {"Value": None, **{col: str for col in range(999)}}
@@ -582,36 +930,14 @@ def build_dataframe_from_csv(
         df = pd.read_csv(StringIO(raw_csv), sep=sep, na_values={"Value": ["None"]}, keep_default_na=False, **kwargs)
 
     if fillna_numeric_attributes:
-        fill_numeric_bool_list = [
-            attr_type.lower() == "numeric"
-            for dimension, attributes in attribute_types_by_dimension.items()
-            for attr_type in [dimension] + list(attributes.values())
-        ]
-        fill_numeric_bool_list += [False]  # for the value column
-        df = df.apply(
-            lambda col: (
-                col.replace(["", "None"], np.nan).fillna(fillna_numeric_attributes_value)
-                if fill_numeric_bool_list[list(df.columns.values).index(col.name)]
-                else col
-            ),
-            axis=0,
-        )
+        columns = _get_columns_of_attribute_type(df, attribute_types_by_dimension, "numeric")
+        if columns:
+            df[columns] = df[columns].replace(["", "None"], np.nan).fillna(fillna_numeric_attributes_value)
 
     if fillna_string_attributes:
-        fill_string_bool_list = [
-            attr_type.lower() == "string"
-            for dimension, attributes in attribute_types_by_dimension.items()
-            for attr_type in [dimension] + list(attributes.values())
-        ]
-        fill_string_bool_list += [False]  # for the value column
-        df = df.apply(
-            lambda col: (
-                col.replace(["", "None"], np.nan).fillna(fillna_string_attributes_value)
-                if fill_string_bool_list[list(df.columns.values).index(col.name)]
-                else col
-            ),
-            axis=0,
-        )
+        columns = _get_columns_of_attribute_type(df, attribute_types_by_dimension, "string")
+        if columns:
+            df[columns] = df[columns].replace(["", "None"], np.nan).fillna(fillna_string_attributes_value)
 
     if not shaped:
         return df
@@ -638,6 +964,115 @@ def build_dataframe_from_csv(
     return df.rename_axis(None, axis=1)
 
 
+def _get_attribute_types(attribute_types_by_dimension: Dict[str, Dict[str, str]]) -> List[str]:
+    """Lower case attribute type per csv column. Dimension columns and the value column have no type"""
+    types = []
+    for attributes in attribute_types_by_dimension.values():
+        types.append(None)
+        types.extend(attribute_type.lower() for attribute_type in attributes.values())
+    types.append(None)
+    return types
+
+
+def _get_columns_of_attribute_type(
+    df: "pd.DataFrame", attribute_types_by_dimension: Dict[str, Dict[str, str]], attribute_type: str
+) -> List[str]:
+    return [
+        column
+        for column, column_type in zip(df.columns, _get_attribute_types(attribute_types_by_dimension))
+        if column_type == attribute_type
+    ]
+
+
+@require_pyarrow
+def build_arrow_table_from_csv(
+    raw_csv: Union[bytes, str],
+    sep: str = "~",
+    fillna_numeric_attributes: bool = False,
+    fillna_numeric_attributes_value: Any = 0,
+    fillna_string_attributes: bool = False,
+    fillna_string_attributes_value: Any = "",
+    attribute_types_by_dimension: Dict[str, Dict[str, str]] = None,
+    use_threads: bool = True,
+) -> "pa.Table":
+    """Parse csv from TM1 with the multithreaded pyarrow csv reader. Bytes are passed to the reader without a copy.
+    Dimension and attribute columns are dictionary encoded strings.
+    The Value column is float64, or string if the values are mixed.
+    Filled numeric attribute columns are float64 if the fill value is numeric.
+
+    :param raw_csv: csv as UTF-8 encoded bytes (e.g. from blob) or str
+    :param sep: value separator
+    :param fillna_numeric_attributes: fill empty numeric attribute columns with fillna_numeric_attributes_value
+    :param fillna_numeric_attributes_value: Any
+    :param fillna_string_attributes: fill empty string attribute columns with fillna_string_attributes_value
+    :param fillna_string_attributes_value: Any
+    :param attribute_types_by_dimension: attribute types per dimension. Required for fillna
+    :param use_threads: parse blocks of the csv on parallel threads
+    :return: pyarrow Table
+    """
+    if isinstance(raw_csv, str):
+        raw_csv = raw_csv.encode("utf-8")
+    buffer = pa.py_buffer(raw_csv)
+    if buffer.size >= len(codecs.BOM_UTF8) and buffer[: len(codecs.BOM_UTF8)].to_pybytes() == codecs.BOM_UTF8:
+        buffer = buffer[len(codecs.BOM_UTF8) :]
+
+    names = _read_csv_header(buffer, sep)
+    column_types = {name: pa.dictionary(pa.int32(), pa.string()) for name in names[:-1]}
+    # values are read as strings and converted afterwards, so mixed values require no second parse
+    column_types[names[-1]] = pa.string()
+
+    table = pa_csv.read_csv(
+        pa.BufferReader(buffer),
+        read_options=pa_csv.ReadOptions(use_threads=use_threads, column_names=names, skip_rows=1),
+        parse_options=pa_csv.ParseOptions(delimiter=sep, quote_char='"', double_quote=True),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=False),
+    )
+
+    columns = table.columns
+    columns[-1] = _convert_arrow_value_column(columns[-1])
+
+    if fillna_numeric_attributes or fillna_string_attributes:
+        for position, attribute_type in enumerate(_get_attribute_types(attribute_types_by_dimension)):
+            if attribute_type == "numeric" and fillna_numeric_attributes:
+                columns[position] = _fill_empty_arrow_strings(columns[position], fillna_numeric_attributes_value)
+            elif attribute_type == "string" and fillna_string_attributes:
+                columns[position] = _fill_empty_arrow_strings(columns[position], fillna_string_attributes_value)
+
+    return pa.Table.from_arrays(columns, names=names)
+
+
+def _read_csv_header(buffer: "pa.Buffer", sep: str) -> List[str]:
+    view = memoryview(buffer)
+    size = 4096
+    end = bytes(view[:size]).find(b"\n")
+    while end < 0 and size < len(view):
+        size *= 2
+        end = bytes(view[:size]).find(b"\n")
+    header = bytes(view[: end if end >= 0 else len(view)]).decode("utf-8").rstrip("\r")
+    return next(csv.reader([header], delimiter=sep, quotechar='"'))
+
+
+def _convert_arrow_value_column(column: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    column = pc.if_else(pc.equal(column, "None"), pa.scalar(None, pa.string()), column)
+    try:
+        return pc.cast(column, pa.float64())
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        # mixed numeric and string values
+        return column
+
+
+def _fill_empty_arrow_strings(column: "pa.ChunkedArray", value: Any) -> "pa.ChunkedArray":
+    column = pc.cast(column, pa.string())
+    empty = pc.is_in(column, value_set=pa.array(["", "None"]))
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            numbers = pc.cast(pc.if_else(empty, pa.scalar(None, pa.string()), column), pa.float64())
+            return pc.fill_null(numbers, float(value))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+    return pc.dictionary_encode(pc.if_else(empty, str(value), column))
+
+
 def _build_csv_line_items_from_axis_tuple(members: Dict, include_attributes: bool = False) -> List[str]:
     if not include_attributes:
         return extract_element_names_from_members(members)
@@ -890,49 +1325,58 @@ def build_pandas_dataframe_from_cellset(
     :param sort_values: Boolean to control sorting in result DataFrame
     :return:
     """
-    try:
-        cellset_clean = {}
-        coordinates = []
-        for coordinates, cell in cellset.items():
-            element_names = element_names_from_element_unique_names(coordinates)
-            cellset_clean[element_names] = cell["Value"] if cell else None
-        dimension_names = tuple(unique_name[1 : unique_name.find("].[")] for unique_name in coordinates)
-
-        # create index
-        keylist = list(cellset_clean.keys())
-        index = pd.MultiIndex.from_tuples(keylist, names=dimension_names)
-
-        # create DataFrame
-        values = list(cellset_clean.values())
-        df = pd.DataFrame(values, index=index, columns=["Values"])
-
-        if not multiindex:
-            df.reset_index(inplace=True)
-            if sort_values:
-                df.sort_values(inplace=True, by=list(dimension_names))
-        return df
-    except UnboundLocalError:
+    if not cellset:
         message = """
             Can't build DataFrame from empty cellset. 
             Make sure the underlying MDX / View is not fully zero suppressed.
         """
         raise ValueError(message)
 
+    keys = list(cellset.keys())
+    values = [cell["Value"] if cell else None for cell in cellset.values()]
+    dimension_names = tuple(dimension_name_from_element_unique_name(unique_name) for unique_name in keys[0])
+
+    # decode every distinct unique name only once per dimension instead of once per cell
+    levels, codes = [], []
+    for unique_names in zip(*keys):
+        unique_name_codes, distinct_unique_names = pd.factorize(np.array(unique_names, dtype=object))
+        element_names = [element_name_from_element_unique_name(unique_name) for unique_name in distinct_unique_names]
+        element_name_codes, level = pd.factorize(np.array(element_names, dtype=object))
+        codes.append(element_name_codes[unique_name_codes])
+        levels.append(level)
+
+    index = pd.MultiIndex(levels=levels, codes=codes, names=dimension_names, verify_integrity=False)
+    df = pd.DataFrame({"Values": values}, index=index)
+    if index.has_duplicates:
+        df = df[~index.duplicated(keep="last")]
+
+    if not multiindex:
+        df.reset_index(inplace=True)
+        if sort_values:
+            df.sort_values(inplace=True, by=list(dimension_names))
+    return df
+
 
 @require_pandas
 def build_cellset_from_pandas_dataframe(
-    df: "pd.DataFrame", sum_numeric_duplicates: bool = True
-) -> "CaseAndSpaceInsensitiveTuplesDict":
+    df: "pd.DataFrame", sum_numeric_duplicates: bool = True, compact: bool = False
+) -> Union["CaseAndSpaceInsensitiveTuplesDict", "CompactCaseAndSpaceInsensitiveTuplesDict"]:
     """
 
     param sum_numeric_duplicates: Aggregate numerical values for duplicated intersections
     param df: a Pandas Dataframe, with dimension-column mapping in correct order.
     As created in build_pandas_dataframe_from_cellset
+    param compact: return a memory efficient CompactCaseAndSpaceInsensitiveTuplesDict
 
     :return: a CaseAndSpaceInsensitiveTuplesDict
     """
     df = build_dataframe_aggregate_intersections(df, sum_numeric_duplicates)
 
+    if compact:
+        return CompactCaseAndSpaceInsensitiveTuplesDict(
+            zip(df.iloc[:, :-1].itertuples(index=False, name=None), df.iloc[:, -1].values)
+        )
+
     cellset = CaseAndSpaceInsensitiveTuplesDict(
         dict(zip(df.iloc[:, :-1].itertuples(index=False, name=None), df.iloc[:, -1].values))
     )
@@ -973,6 +1417,92 @@ def aggregate_duplicate_intersections(df, dimension_headers, value_header):
     return df.groupby([*dimension_headers])[value_header].sum().reset_index()
 
 
+@require_pandas
+def drop_duplicate_intersections(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Drop rows that address the same intersection, ignoring case and spaces in element names.
+    Like in a CaseAndSpaceInsensitiveTuplesDict, the last value for an intersection wins.
+
+    param df: A Dataframe, with dimension-column mapping in correct order.
+
+    :return: A Dataframe
+    """
+    intersections = pd.DataFrame(
+        {n: df.iloc[:, n].astype(str).str.lower().str.replace(" ", "", regex=False) for n in range(df.shape[1] - 1)}
+    )
+    duplicated = intersections.duplicated(keep="last").to_numpy()
+    if not duplicated.any():
+        return df
+    return df[~duplicated]
+
+
+@require_pandas
+def build_csv_from_dataframe(df: "pd.DataFrame") -> bytes:
+    """Serialize a DataFrame into the fully quoted, comma separated UTF-8 format that is consumed by the
+    blob load process in `write_through_blob`. Last column holds the values. Line breaks are removed from values.
+
+    Columns are quoted and escaped as a whole. When pyarrow is installed, lines are assembled in a single
+    contiguous buffer without creating a python string per row.
+
+    :param df: a DataFrame, with dimension-column mapping in correct order and the values in the last column
+    :return: csv content as bytes
+    """
+    if df.shape[0] == 0:
+        return b""
+
+    if _has_pyarrow:
+        return _build_csv_from_dataframe_with_arrow(df)
+
+    columns = []
+    for n in range(df.shape[1]):
+        column = df.iloc[:, n]
+        if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+            strings = np.array(list(map(str, column.tolist())), dtype=object)
+            strings[column.isna().to_numpy()] = ""
+            columns.append(strings)
+            continue
+
+        # quote and escape every distinct value once
+        codes, uniques = pd.factorize(column)
+        uniques = pd.Series(list(map(str, uniques.tolist())), dtype=object)
+        if n == df.shape[1] - 1:
+            uniques = uniques.str.replace("\r", "", regex=False).str.replace("\n", "", regex=False)
+        quoted = np.array(uniques.str.replace('"', '""', regex=False).tolist() + [""], dtype=object)
+        # missing values have code -1 and map to the trailing empty string
+        columns.append(quoted[codes])
+
+    body = '"\r\n"'.join(map('","'.join, zip(*columns)))
+    return ('"' + body + '"\r\n').encode("utf-8")
+
+
+def _build_csv_from_dataframe_with_arrow(df: "pd.DataFrame") -> bytes:
+    def _as_quoted_strings(column: "pd.Series", strip_line_breaks: bool) -> "pa.Array":
+        if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+            array = pc.cast(pa.Array.from_pandas(column), pa.large_string())
+        elif pd.api.types.is_string_dtype(column) and not column.dtype == object:
+            array = pc.cast(pa.Array.from_pandas(column), pa.large_string())
+        else:
+            array = pa.array(column.map(str, na_action="ignore"), type=pa.large_string(), from_pandas=True)
+
+        if strip_line_breaks:
+            array = pc.replace_substring(pc.replace_substring(array, "\r", ""), "\n", "")
+        return pc.fill_null(pc.replace_substring(array, '"', '""'), "")
+
+    def _scalar(value: str) -> "pa.Scalar":
+        return pa.scalar(value, pa.large_string())
+
+    columns = [_as_quoted_strings(df.iloc[:, n], n == df.shape[1] - 1) for n in range(df.shape[1])]
+    lines = pc.binary_join_element_wise(*columns, _scalar('","'))
+    lines = pc.binary_join_element_wise(_scalar('"'), lines, _scalar('"\r\n'), _scalar(""))
+    if isinstance(lines, pa.ChunkedArray):
+        lines = lines.combine_chunks()
+
+    # all lines are stored back to back in the data buffer of the array
+    _, offsets, data = lines.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64)
+    return data[offsets[lines.offset] : offsets[lines.offset + len(lines)]].to_pybytes()
+
+
 def lower_and_drop_spaces(item: str) -> str:
     return item.replace(" ", "").lower()
 
@@ -1498,6 +2028,372 @@ class CaseAndSpaceInsensitiveTuplesDict(collections.abc.MutableMapping):
         return repr(self)
 
 
+_COMPACT_EMPTY = -1
+_COMPACT_DELETED = -2
+_COMPACT_MISSING = object()
+
+
+class SymbolTable:
+    """Interns the element names of one dimension. Every distinct spelling is normalized only once"""
+
+    __slots__ = ["names", "adjusted_names", "_codes", "_spellings"]
+
+    def __init__(self):
+        # name of the element as last set, by code
+        self.names: List[str] = []
+        self.adjusted_names: List[str] = []
+        # adjusted name -> code
+        self._codes: Dict[str, int] = dict()
+        # every spelling seen so far -> code
+        self._spellings: Dict[str, int] = dict()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, name: str) -> int:
+        """Code of the element or -1 if it is unknown"""
+        code = self._spellings.get(name)
+        if code is not None:
+            return code
+        try:
+            code = self._codes.get(lower_and_drop_spaces(name), -1)
+        except AttributeError:
+            raise TypeError("All items in the key tuple must be strings.") from None
+        if code >= 0:
+            self._spellings[name] = code
+        return code
+
+    def intern(self, name: str) -> int:
+        """Code of the element. Unknown elements are added. The case of the last spelling is remembered"""
+        code = self._spellings.get(name)
+        if code is None:
+            try:
+                adjusted_name = lower_and_drop_spaces(name)
+            except AttributeError:
+                raise TypeError("All items in the key tuple must be strings.") from None
+            code = self._codes.get(adjusted_name)
+            if code is None:
+                code = len(self.names)
+                self._codes[adjusted_name] = code
+                self.names.append(name)
+                self.adjusted_names.append(adjusted_name)
+            self._spellings[name] = code
+        if self.names[code] != name:
+            self.names[code] = name
+        return code
+
+
+class CompactCaseAndSpaceInsensitiveTuplesDict(collections.abc.MutableMapping):
+    """
+    Memory efficient variant of `CaseAndSpaceInsensitiveTuplesDict` for large cellsets.
+
+    Element names are interned per tuple position (dimension), so each distinct name is stored and normalized
+    once. Keys are stored as fixed-width tuples of integer codes in flat arrays, indexed by an open-addressing
+    hash table. Compared to `CaseAndSpaceInsensitiveTuplesDict` a cell costs roughly 4 bytes per dimension plus
+    ~30 bytes, instead of two tuples of strings and a dict entry. Lookups are somewhat slower in exchange.
+
+    Lookup semantics are the same as in `CaseAndSpaceInsensitiveTuplesDict`:
+        data = CompactCaseAndSpaceInsensitiveTuplesDict()
+        data[('[Business Unit].[UK]', '[Scenario].[Worst Case]')] = 1000
+        assert data[('[BusinessUnit].[UK]', '[Scenario].[worstcase]')] == 1000
+
+    All keys must be tuples of strings of the same length. The case of an element name is remembered per element,
+    not per key: keys are returned with the spelling of each element that was set last.
+
+    Entries are ordered.
+    """
+
+    def __init__(self, data=None, **kwargs):
+        """Initialize the dictionary with optional initial data."""
+        self.clear()
+        if data is None:
+            data = {}
+        self.update(data, **kwargs)
+
+    def clear(self):
+        """Remove all items from the dictionary."""
+        self._width: Optional[int] = None
+        self._symbols: List[SymbolTable] = []
+        # codes of all entries, width per entry. Entries of deleted keys stay until the next resize
+        self._keys = array("I")
+        self._hashes = array("q")
+        self._values = []
+        # open addressing table: entry index, _COMPACT_EMPTY or _COMPACT_DELETED
+        self._slots = array("q", [_COMPACT_EMPTY]) * 8
+        self._used = 0
+        self._filled = 0
+
+    @property
+    def symbols(self) -> List[SymbolTable]:
+        """Symbol tables per tuple position"""
+        return self._symbols
+
+    def _codes_for_lookup(self, key) -> Optional[Tuple[int, ...]]:
+        if not isinstance(key, tuple):
+            raise TypeError("Keys must be tuples of strings.")
+        if len(key) != self._width:
+            return None
+        codes = []
+        for symbols, name in zip(self._symbols, key):
+            code = symbols.lookup(name)
+            if code < 0:
+                return None
+            codes.append(code)
+        return tuple(codes)
+
+    def _codes_for_insert(self, key) -> Tuple[int, ...]:
+        if not isinstance(key, tuple):
+            raise TypeError("Keys must be tuples of strings.")
+        if self._width is None:
+            self._width = len(key)
+            self._symbols = [SymbolTable() for _ in range(self._width)]
+        elif len(key) != self._width:
+            raise ValueError(f"All keys must have {self._width} items. Key {key} has {len(key)} items.")
+        return tuple([symbols.intern(name) for symbols, name in zip(self._symbols, key)])
+
+    def _find(self, codes: Tuple[int, ...], hash_value: int) -> Tuple[int, int]:
+        """Return slot for the codes and index of the entry or -1 if the codes are not present"""
+        slots = self._slots
+        mask = len(slots) - 1
+        width = self._width
+        index = hash_value & mask
+        perturb = hash_value & 0xFFFFFFFFFFFFFFFF
+        free_slot = -1
+        while True:
+            entry = slots[index]
+            if entry == _COMPACT_EMPTY:
+                return (index if free_slot < 0 else free_slot), -1
+            if entry == _COMPACT_DELETED:
+                if free_slot < 0:
+                    free_slot = index
+            elif self._hashes[entry] == hash_value and tuple(self._keys[entry * width : (entry + 1) * width]) == codes:
+                return index, entry
+            perturb >>= 5
+            index = (index * 5 + perturb + 1) & mask
+
+    def _resize(self):
+        """Grow the table and drop entries of deleted keys"""
+        if self._used < len(self._values):
+            width = self._width
+            keys, hashes, values = array("I"), array("q"), []
+            for entry, value in enumerate(self._values):
+                if value is not _COMPACT_MISSING:
+                    keys.extend(self._keys[entry * width : (entry + 1) * width])
+                    hashes.append(self._hashes[entry])
+                    values.append(value)
+            self._keys, self._hashes, self._values = keys, hashes, values
+
+        capacity = 8
+        while capacity < self._used * 3:
+            capacity <<= 1
+        slots = array("q", [_COMPACT_EMPTY]) * capacity
+        mask = capacity - 1
+        for entry, hash_value in enumerate(self._hashes):
+            index = hash_value & mask
+            perturb = hash_value & 0xFFFFFFFFFFFFFFFF
+            while slots[index] != _COMPACT_EMPTY:
+                perturb >>= 5
+                index = (index * 5 + perturb + 1) & mask
+            slots[index] = entry
+        self._slots = slots
+        self._filled = self._used
+
+    def __setitem__(self, key, value):
+        """Set the value for a key. Element names are interned"""
+        codes = self._codes_for_insert(key)
+        hash_value = hash(codes)
+        slot, entry = self._find(codes, hash_value)
+        if entry >= 0:
+            self._values[entry] = value
+            return
+
+        if (self._filled + 1) * 3 >= len(self._slots) * 2:
+            self._resize()
+            slot, _ = self._find(codes, hash_value)
+
+        if self._slots[slot] == _COMPACT_EMPTY:
+            self._filled += 1
+        self._slots[slot] = len(self._values)
+        self._keys.extend(codes)
+        self._hashes.append(hash_value)
+        self._values.append(value)
+        self._used += 1
+
+    def _entry(self, key) -> Tuple[int, int]:
+        codes = self._codes_for_lookup(key)
+        if codes is None:
+            return -1, -1
+        return self._find(codes, hash(codes))
+
+    def __getitem__(self, key):
+        """Retrieve the value for a key, ignoring case and spaces."""
+        _, entry = self._entry(key)
+        if entry < 0:
+            raise KeyError(f"Key {key} not found.")
+        return self._values[entry]
+
+    def __delitem__(self, key):
+        """Delete the item associated with the key."""
+        slot, entry = self._entry(key)
+        if entry < 0:
+            raise KeyError(f"Key {key} not found.")
+        self._slots[slot] = _COMPACT_DELETED
+        self._values[entry] = _COMPACT_MISSING
+        self._used -= 1
+
+    def __contains__(self, key):
+        """Check if the key exists in the dictionary."""
+        return self._entry(key)[1] >= 0
+
+    def __len__(self):
+        """Return the number of items in the dictionary."""
+        return self._used
+
+    def _live_entries(self) -> Iterable[int]:
+        return (entry for entry, value in enumerate(self._values) if value is not _COMPACT_MISSING)
+
+    def _key(self, entry: int) -> Tuple[str, ...]:
+        width = self._width
+        return tuple(
+            [
+                symbols.names[code]
+                for symbols, code in zip(self._symbols, self._keys[entry * width : (entry + 1) * width])
+            ]
+        )
+
+    def _adjusted_key(self, entry: int) -> Tuple[str, ...]:
+        width = self._width
+        return tuple(
+            [
+                symbols.adjusted_names[code]
+                for symbols, code in zip(self._symbols, self._keys[entry * width : (entry + 1) * width])
+            ]
+        )
+
+    def __iter__(self):
+        """Iterate over the keys in their original case."""
+        return (self._key(entry) for entry in self._live_entries())
+
+    def keys(self):
+        """Return a view of the keys in their original case."""
+        return list(iter(self))
+
+    def values(self):
+        """Return a view of the values."""
+        return [value for value in self._values if value is not _COMPACT_MISSING]
+
+    def items(self):
+        """Return a view of the items (key-value pairs)."""
+        return [(self._key(entry), self._values[entry]) for entry in self._live_entries()]
+
+    def adjusted_keys(self):
+        """Return a generator of the adjusted keys."""
+        return (self._adjusted_key(entry) for entry in self._live_entries())
+
+    def adjusted_items(self):
+        """Return a generator of (adjusted_key, value) pairs."""
+        return ((self._adjusted_key(entry), self._values[entry]) for entry in self._live_entries())
+
+    def __eq__(self, other):
+        """Check equality with another dictionary."""
+        if not isinstance(other, collections.abc.Mapping):
+            return NotImplemented
+        if not isinstance(other, (CompactCaseAndSpaceInsensitiveTuplesDict, CaseAndSpaceInsensitiveTuplesDict)):
+            other = CaseAndSpaceInsensitiveTuplesDict(other)
+        return dict(self.adjusted_items()) == dict(other.adjusted_items())
+
+    def copy(self):
+        """Create a shallow copy of the dictionary."""
+        new_copy = CompactCaseAndSpaceInsensitiveTuplesDict()
+        new_copy.update(self.items())
+        return new_copy
+
+    def to_tuples_dict(self) -> CaseAndSpaceInsensitiveTuplesDict:
+        """Convert to a regular CaseAndSpaceInsensitiveTuplesDict"""
+        return CaseAndSpaceInsensitiveTuplesDict(self.items())
+
+    def update(self, other=(), **kwargs):
+        """
+        Update the dictionary with key/value pairs from other, overwriting existing keys.
+
+        Parameters:
+            other (Mapping or Iterable): A mapping or iterable of key-value pairs.
+            **kwargs: Additional key-value pairs.
+        """
+        if isinstance(other, collections.abc.Mapping):
+            for key, value in other.items():
+                self[key] = value
+
+        elif hasattr(other, "__iter__"):
+            for item in other:
+                if not isinstance(item, collections.abc.Iterable):
+                    raise TypeError("Items must be key-value pairs.")
+                key, value = item
+                self[key] = value
+
+        elif other:
+            raise TypeError("Other object is not a mapping or iterable of key-value pairs.")
+
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def get(self, key, default=None):
+        """
+        Return the value for key if key is in the dictionary, else default.
+
+        Parameters:
+            key (tuple): The key to look up.
+            default: The value to return if the key is not found.
+        """
+        _, entry = self._entry(key)
+        if entry < 0:
+            return default
+        return self._values[entry]
+
+    def pop(self, key, default=None):
+        """
+        Remove the specified key and return the corresponding value.
+        If key is not found, default is returned if provided, otherwise KeyError is raised.
+
+        Parameters:
+            key (tuple): The key to remove.
+            default: The value to return if the key is not found.
+        """
+        slot, entry = self._entry(key)
+        if entry < 0:
+            if default is not None:
+                return default
+            raise KeyError(f"Key {key} not found.")
+        value = self._values[entry]
+        self._slots[slot] = _COMPACT_DELETED
+        self._values[entry] = _COMPACT_MISSING
+        self._used -= 1
+        return value
+
+    def popitem(self):
+        """
+        Remove and return a (key, value) pair from the dictionary.
+        Pairs are returned in LIFO order.
+
+        Raises:
+            KeyError: If the dictionary is empty.
+        """
+        for entry in range(len(self._values) - 1, -1, -1):
+            if self._values[entry] is not _COMPACT_MISSING:
+                key = self._key(entry)
+                return key, self.pop(key)
+        raise KeyError("popitem(): dictionary is empty")
+
+    def __repr__(self):
+        """Return the dictionary's string representation."""
+        items = ", ".join(f"{key!r}: {value!r}" for key, value in self.items())
+        return f"{self.__class__.__name__}({{{items}}})"
+
+    def __str__(self):
+        """Return a user-friendly string representation."""
+        return repr(self)
+
+
 class CaseAndSpaceInsensitiveSet(collections.abc.MutableSet):
     """
     A case-and-space-insensitive set-like object for strings.
@@ -1831,3 +2727,17 @@ class HTTPAdapterWithSocketOptions(HTTPAdapter):
         if hasattr(self, "ssl_context"):
             kwargs["ssl_context"] = self.ssl_context
         super(HTTPAdapterWithSocketOptions, self).init_poolmanager(*args, **kwargs)
+
+
+class _ResponseReader:
+    """File-like wrapper around a (streamed) response, so ijson can parse the body while it is downloaded"""
+
+    def __init__(self, response: requests.Response, chunk_size: int = 65_536):
+        # iter_content takes care of content-encoding (e.g. gzip) and works for consumed responses too
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0)
+        if size == 0:
+            return b""
+        return next(self._chunks, b"")
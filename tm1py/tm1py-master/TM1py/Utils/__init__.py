@@ -1,2 +1,22 @@
+from TM1py.Utils.AsyncOperationPoller import (
+    AsyncOperationPoller as AsyncOperationPoller,
+)
+from TM1py.Utils.Batch import Batch as Batch
+from TM1py.Utils.Batch import BatchFuture as BatchFuture
+from TM1py.Utils.HierarchyDiff import HierarchyDiff as HierarchyDiff
+from TM1py.Utils.HierarchyDiff import HierarchySnapshot as HierarchySnapshot
+from TM1py.Utils.HierarchyIndex import HierarchyIndex as HierarchyIndex
+from TM1py.Utils.Instrumentation import Instrumentation as Instrumentation
+from TM1py.Utils.Instrumentation import LatencyHistogram as LatencyHistogram
+from TM1py.Utils.Instrumentation import OpenTelemetryHook as OpenTelemetryHook
+from TM1py.Utils.Instrumentation import RequestRecord as RequestRecord
+from TM1py.Utils.JsonDecoder import Cellset as Cellset
+from TM1py.Utils.JsonDecoder import CellsetAxis as CellsetAxis
+from TM1py.Utils.JsonDecoder import CellsetCell as CellsetCell
+from TM1py.Utils.JsonDecoder import CellsetMember as CellsetMember
+from TM1py.Utils.JsonDecoder import CellsetTuple as CellsetTuple
+from TM1py.Utils.JsonDecoder import JsonDecoder as JsonDecoder
+from TM1py.Utils.MDXResultCache import MDXResultCache as MDXResultCache
 from TM1py.Utils.MDXUtils import *
+from TM1py.Utils.MetadataCache import MetadataCache as MetadataCache
 from TM1py.Utils.Utils import *
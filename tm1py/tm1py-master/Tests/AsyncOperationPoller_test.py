@@ -0,0 +1,118 @@
+import pickle
+import threading
+import time
+import unittest
+from concurrent.futures import CancelledError
+
+from TM1py.Exceptions import TM1pyRestException
+from TM1py.Utils.AsyncOperationPoller import AsyncOperationPoller
+
+
+class _Response:
+    def __init__(self, status_code: int, async_id: str):
+        self.status_code = status_code
+        self.async_id = async_id
+
+
+class TestAsyncOperationPoller(unittest.TestCase):
+
+    def setUp(self):
+        self.ready_at = dict()
+        self.checks = []
+        self.lock = threading.Lock()
+        self.poller = AsyncOperationPoller(self._retrieve, initial_delay=0.01, max_delay=0.05, backoff_factor=2)
+
+    def tearDown(self):
+        self.poller.close()
+
+    def _retrieve(self, async_id):
+        with self.lock:
+            self.checks.append(async_id)
+        if async_id == "failing":
+            raise TM1pyRestException("error", status_code=500, reason="Internal Server Error", headers={})
+        if time.monotonic() < self.ready_at[async_id]:
+            return _Response(202, async_id)
+        return _Response(200, async_id)
+
+    def _submit(self, async_id, duration, endpoint="POST /ExecuteMDX"):
+        self.ready_at[async_id] = time.monotonic() + duration
+        return self.poller.submit(async_id, endpoint=endpoint)
+
+    def test_submit_resolves_future(self):
+        future = self._submit("a", 0.05)
+
+        response = future.result(timeout=5)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("a", response.async_id)
+        self.assertEqual(0, len(self.poller))
+
+    def test_submit_many_in_parallel(self):
+        futures = {str(i): self._submit(str(i), 0.02 * (i % 5)) for i in range(50)}
+
+        for async_id, future in futures.items():
+            self.assertEqual(async_id, future.result(timeout=5).async_id)
+        self.assertEqual([], self.poller.pending_async_ids)
+
+    def test_exception_is_set_on_future(self):
+        future = self.poller.submit("failing")
+
+        with self.assertRaises(TM1pyRestException):
+            future.result(timeout=5)
+        self.assertEqual(0, len(self.poller))
+
+    def test_discard(self):
+        future = self._submit("a", 10)
+
+        self.poller.discard("a")
+
+        self.assertTrue(future.cancelled())
+        self.assertEqual(0, len(self.poller))
+
+    def test_close_cancels_outstanding(self):
+        future = self._submit("a", 10)
+
+        self.poller.close()
+
+        with self.assertRaises(CancelledError):
+            future.result(timeout=1)
+
+    def test_poller_usable_after_close(self):
+        self.poller.close()
+
+        future = self._submit("a", 0)
+
+        self.assertEqual("a", future.result(timeout=5).async_id)
+
+    def test_expected_duration_is_recorded(self):
+        self._submit("a", 0.2).result(timeout=5)
+
+        self.assertGreaterEqual(self.poller.expected_duration("POST /ExecuteMDX"), 0.2)
+        self.assertIsNone(self.poller.expected_duration("POST /Cubes('')/tm1.Update"))
+
+    def test_first_check_adapts_to_expected_duration(self):
+        self._submit("a", 0.4).result(timeout=5)
+        checks_without_history = self.checks.count("a")
+
+        self._submit("b", 0.4).result(timeout=5)
+
+        self.assertLess(self.checks.count("b"), checks_without_history)
+
+    def test_endpoint(self):
+        self.assertEqual(
+            "GET /Cellsets('')",
+            AsyncOperationPoller.endpoint("get", "https://localhost:8010/api/v1/Cellsets('abc')?$expand=Cells"),
+        )
+        self.assertEqual(
+            "POST /Cubes('')/tm1.Update", AsyncOperationPoller.endpoint("POST", "/Cubes('Sa''les')/tm1.Update")
+        )
+
+    def test_pickle(self):
+        poller = pickle.loads(pickle.dumps(AsyncOperationPoller(retrieve=len, initial_delay=0.5)))
+
+        self.assertEqual(0.5, poller.initial_delay)
+        self.assertEqual(0, len(poller))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import inspect
+import unittest
+
+from Tests.MockServer import MockTM1Server
+from TM1py.Services import AsyncRestService, RestService
+
+try:
+    import httpx  # noqa: F401
+
+    _has_httpx = True
+except ImportError:
+    _has_httpx = False
+
+
+@unittest.skipIf(not _has_httpx, "AsyncRestService requires httpx")
+class TestAsyncRestService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    async def test_open(self):
+        async with AsyncRestService(**self.server.connection_parameters) as rest:
+            response = await rest.GET("/Dimensions('Month')/Hierarchies('Month')/Elements?$select=Name")
+
+            self.assertEqual(["M01", "M02", "M03", "Year"], [element["Name"] for element in response.json()["value"]])
+            self.assertEqual("11.8.02300.1", rest.version)
+            self.assertTrue(rest.session_id)
+            self.assertFalse(rest.metadata_cache.enabled)
+
+    def test_no_blocking_methods(self):
+        rest = AsyncRestService(**self.server.connection_parameters)
+
+        self.assertNotIsInstance(rest, RestService)
+        for name in ("request", "GET", "POST", "PATCH", "PUT", "DELETE", "connect", "logout", "is_connected"):
+            self.assertTrue(inspect.iscoroutinefunction(getattr(rest, name)), name)
+        self.assertFalse(hasattr(rest, "_manage_http_adapter"))
+        self.assertFalse(hasattr(rest, "async_poller"))
+        self.assertFalse(hasattr(rest, "_async_poller"))
+        for name in ("is_admin", "is_data_admin", "is_security_admin", "is_ops_admin", "sandboxing_disabled"):
+            self.assertFalse(hasattr(rest, name), name)
+        self.assertFalse(hasattr(rest, "get_monitoring_service"))
+        with self.assertRaises(TypeError):
+            with rest:
+                pass
+
+    async def test_admin_flags(self):
+        async with AsyncRestService(**self.server.connection_parameters) as rest:
+            self.assertTrue(await rest.get_is_admin())
+            self.assertTrue(await rest.get_is_data_admin())
+            self.assertTrue(await rest.get_is_security_admin())
+            self.assertTrue(await rest.get_is_ops_admin())
+            self.assertFalse(await rest.get_sandboxing_disabled())
+
+            requests = len(self.server.model.requests)
+            self.assertTrue(await rest.get_is_admin())
+            self.assertEqual(requests, len(self.server.model.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
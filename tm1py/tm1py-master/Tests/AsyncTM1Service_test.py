@@ -0,0 +1,161 @@
+import asyncio
+import configparser
+import unittest
+from pathlib import Path
+
+from Tests.Utils import generate_test_uuid
+from TM1py.Objects import Cube, Dimension, Hierarchy
+from TM1py.Services import AsyncTM1Service, TM1Service
+
+try:
+    import httpx  # noqa: F401
+
+    _has_httpx = True
+except ImportError:
+    _has_httpx = False
+
+
+@unittest.skipIf(not _has_httpx, "AsyncTM1Service requires httpx")
+class TestAsyncTM1Service(unittest.IsolatedAsyncioTestCase):
+    tm1: TM1Service
+
+    prefix = "TM1py_Tests_AsyncTM1Service_"
+    test_uuid = generate_test_uuid()
+    cube_name = prefix + "Cube_" + test_uuid
+    dimension_names = [prefix + "Dimension1_" + test_uuid, prefix + "Dimension2_" + test_uuid]
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Establishes a connection to TM1 and creates TM1 objects to use across all tests
+        """
+
+        # Connection to TM1
+        cls.config = configparser.ConfigParser()
+        cls.config.read(Path(__file__).parent.joinpath("config.ini"))
+        cls.tm1 = TM1Service(**cls.config["tm1srv01"])
+
+        for dimension_name in cls.dimension_names:
+            hierarchy = Hierarchy(dimension_name, dimension_name)
+            hierarchy.add_element("Total", "Consolidated")
+            for i in range(1, 11):
+                hierarchy.add_element(f"Element {i}", "Numeric")
+                hierarchy.add_edge("Total", f"Element {i}", 1)
+            cls.tm1.dimensions.update_or_create(Dimension(dimension_name, [hierarchy]))
+
+        cls.tm1.cubes.update_or_create(Cube(cls.cube_name, cls.dimension_names))
+
+        cls.mdx = f"""
+        SELECT
+        {{[{cls.dimension_names[0]}].[Element 1], [{cls.dimension_names[0]}].[Element 2]}} ON 0,
+        {{Tm1SubsetAll([{cls.dimension_names[1]}])}} ON 1
+        FROM [{cls.cube_name}]
+        """
+
+    async def asyncSetUp(self):
+        self.tm1.cells.write_values(self.cube_name, {("Element 1", "Element 1"): 1, ("Element 2", "Element 3"): 2})
+        self.async_tm1 = await AsyncTM1Service(**self.config["tm1srv01"]).connect()
+
+    async def asyncTearDown(self):
+        await self.async_tm1.logout()
+        self.tm1.processes.execute_ti_code(lines_prolog=f"CubeClearData('{self.cube_name}');")
+
+    async def test_version(self):
+        self.assertEqual(self.tm1.version, self.async_tm1.version)
+
+    async def test_execute_mdx_values(self):
+        values = await self.async_tm1.cells.execute_mdx_values(self.mdx)
+
+        self.assertEqual(self.tm1.cells.execute_mdx_values(self.mdx), values)
+
+    async def test_execute_mdx_values_concurrent(self):
+        results = await asyncio.gather(*[self.async_tm1.cells.execute_mdx_values(self.mdx) for _ in range(50)])
+
+        expected = self.tm1.cells.execute_mdx_values(self.mdx)
+        for values in results:
+            self.assertEqual(expected, values)
+
+    async def test_execute_mdx(self):
+        cells = await self.async_tm1.cells.execute_mdx(self.mdx, skip_zeros=True, element_unique_names=False)
+
+        self.assertEqual(
+            {
+                (self.cube_name, self.dimension_names[0], "Element 1", self.dimension_names[1], "Element 1"): 1,
+                (self.cube_name, self.dimension_names[0], "Element 2", self.dimension_names[1], "Element 3"): 2,
+            },
+            {coordinates: cell["Value"] for coordinates, cell in cells.items()},
+        )
+
+    async def test_execute_mdx_async_requests_mode(self):
+        values = await self.async_tm1.cells.execute_mdx_values(self.mdx, async_requests_mode=True)
+
+        self.assertEqual(self.tm1.cells.execute_mdx_values(self.mdx), values)
+
+    async def test_execute_mdx_dataframe(self):
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("Test 'test_execute_mdx_dataframe' requires pandas")
+
+        df = await self.async_tm1.cells.execute_mdx_dataframe(self.mdx)
+
+        self.assertEqual(2, len(df))
+        self.assertEqual([*self.dimension_names, "Value"], list(df.columns))
+        self.assertEqual(3, df["Value"].sum())
+
+    async def test_write_values(self):
+        await asyncio.gather(
+            *[
+                self.async_tm1.cells.write_values(self.cube_name, {("Element 1", f"Element {i}"): i})
+                for i in range(1, 11)
+            ]
+        )
+
+        values = self.tm1.cells.execute_mdx_values(self.mdx)
+        self.assertEqual(55 + 2, sum(value for value in values if value))
+
+    async def test_write_value(self):
+        await self.async_tm1.cells.write_value(5, self.cube_name, ("Element 2", "Element 2"))
+
+        self.assertEqual(5, self.tm1.cells.get_value(self.cube_name, "Element 2,Element 2"))
+
+    async def test_get_element_names(self):
+        element_names = await self.async_tm1.elements.get_element_names(
+            self.dimension_names[0], self.dimension_names[0]
+        )
+
+        self.assertEqual(
+            self.tm1.elements.get_element_names(self.dimension_names[0], self.dimension_names[0]), element_names
+        )
+
+    async def test_get_edges(self):
+        edges = await self.async_tm1.elements.get_edges(self.dimension_names[0], self.dimension_names[0])
+
+        self.assertEqual(self.tm1.elements.get_edges(self.dimension_names[0], self.dimension_names[0]), edges)
+
+    async def test_exists(self):
+        self.assertTrue(
+            await self.async_tm1.elements.exists(self.dimension_names[0], self.dimension_names[0], "Element 1")
+        )
+        self.assertFalse(
+            await self.async_tm1.elements.exists(self.dimension_names[0], self.dimension_names[0], "Not Existing")
+        )
+
+    async def test_reconnect_on_session_timeout(self):
+        # drop session cookie to provoke a 401
+        self.async_tm1.connection._s.cookies.clear()
+
+        values = await self.async_tm1.cells.execute_mdx_values(self.mdx)
+
+        self.assertEqual(self.tm1.cells.execute_mdx_values(self.mdx), values)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm1.cubes.delete(cls.cube_name)
+        for dimension_name in cls.dimension_names:
+            cls.tm1.dimensions.delete(dimension_name)
+        cls.tm1.logout()
+
+
+if __name__ == "__main__":
+    unittest.main()
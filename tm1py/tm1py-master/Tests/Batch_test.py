@@ -0,0 +1,143 @@
+import unittest
+
+from Tests.MockServer import MockTM1Server
+from TM1py import TM1Service
+from TM1py.Exceptions import TM1pyException, TM1pyRestException
+from TM1py.Utils import Batch
+
+DIMENSIONS = ["Region", "Product", "Month", "Version"]
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3).start()
+        self.tm1 = TM1Service(**self.server.connection_parameters)
+
+    def tearDown(self):
+        self.tm1.logout()
+        self.server.stop()
+
+    def _requests_since(self, start: int):
+        return self.server.model.requests[start:]
+
+    def test_batch(self):
+        start = len(self.server.model.requests)
+
+        with self.tm1.batch() as batch:
+            exists = [batch.submit(self.tm1.dimensions.exists, dimension) for dimension in DIMENSIONS]
+            names = batch.submit(self.tm1.elements.get_element_names, "Month", "Month")
+
+        self.assertEqual([True, True, True, False], [future.result() for future in exists])
+        self.assertEqual(["M01", "M02", "M03", "Year"], names.result())
+        self.assertEqual("batch", batch.mode)
+        self.assertEqual(1, batch.batch_requests)
+        requests = self._requests_since(start)
+        self.assertEqual(("POST", "/$batch"), requests[0])
+        self.assertEqual(6, len(requests))
+
+    def test_batch_exception(self):
+        with self.tm1.batch() as batch:
+            dimension = batch.submit(self.tm1.dimensions.get, "Version")
+
+        self.assertIsInstance(dimension.exception(), TM1pyRestException)
+        self.assertEqual(404, dimension.exception().status_code)
+
+    def test_batch_several_rounds(self):
+        # get_hierarchy_names and get_element_names run sequentially within their calls
+        def element_count(dimension_name: str) -> int:
+            hierarchy_name = self.tm1.hierarchies.get_all_names(dimension_name)[0]
+            return len(self.tm1.elements.get_element_names(dimension_name, hierarchy_name))
+
+        with self.tm1.batch() as batch:
+            counts = [batch.submit(element_count, dimension) for dimension in DIMENSIONS[:3]]
+
+        self.assertEqual([11, 6, 4], [future.result() for future in counts])
+        self.assertEqual(2, batch.batch_requests)
+
+    def test_batch_max_requests(self):
+        with self.tm1.batch(max_requests=3) as batch:
+            exists = [batch.submit(self.tm1.dimensions.exists, dimension) for dimension in DIMENSIONS * 2]
+
+        self.assertEqual([True, True, True, False] * 2, [future.result() for future in exists])
+        self.assertEqual(3, batch.batch_requests)
+
+    def test_batch_write(self):
+        start = len(self.server.model.requests)
+
+        with self.tm1.batch() as batch:
+            batch.submit(self.tm1.cells.write_value, 5, "Sales", ("R0", "P0", "M01"))
+
+        self.assertEqual("5", self.server.model.updates[-1]["Value"])
+        self.assertEqual(
+            [
+                ("POST", "/$batch"),
+                ("GET", "/Cubes('Sales')/Dimensions?$select=Name"),
+                ("POST", "/$batch"),
+                ("POST", "/Cubes('Sales')/tm1.Update"),
+            ],
+            self._requests_since(start),
+        )
+
+    def test_result_flushes_batch(self):
+        with self.tm1.batch() as batch:
+            exists = batch.submit(self.tm1.dimensions.exists, "Region")
+
+            self.assertTrue(exists.result())
+            self.assertEqual(0, len(batch))
+
+    def test_exception_in_context_cancels_calls(self):
+        with self.assertRaises(RuntimeError):
+            with self.tm1.batch() as batch:
+                exists = batch.submit(self.tm1.dimensions.exists, "Region")
+                raise RuntimeError()
+
+        self.assertTrue(exists.cancelled())
+
+    def test_parallel(self):
+        start = len(self.server.model.requests)
+
+        with self.tm1.batch(mode="parallel", max_workers=2) as batch:
+            exists = [batch.submit(self.tm1.dimensions.exists, dimension) for dimension in DIMENSIONS]
+
+        self.assertEqual([True, True, True, False], [future.result() for future in exists])
+        self.assertNotIn(("POST", "/$batch"), self._requests_since(start))
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            self.tm1.batch(mode="pipelined")
+
+
+class TestBatchNotSupported(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3, batch=False).start()
+        self.tm1 = TM1Service(**self.server.connection_parameters)
+
+    def tearDown(self):
+        self.tm1.logout()
+        self.server.stop()
+
+    def test_auto_falls_back_to_parallel(self):
+        with self.tm1.batch() as batch:
+            exists = [batch.submit(self.tm1.dimensions.exists, dimension) for dimension in DIMENSIONS]
+
+        self.assertEqual([True, True, True, False], [future.result() for future in exists])
+        self.assertEqual("parallel", batch.mode)
+
+        # support is remembered
+        start = len(self.server.model.requests)
+        with self.tm1.batch() as batch:
+            batch.submit(self.tm1.dimensions.exists, "Region")
+        self.assertNotIn(("POST", "/$batch"), self.server.model.requests[start:])
+
+    def test_batch_mode_raises(self):
+        with Batch(self.tm1.connection, mode="batch") as batch:
+            exists = batch.submit(self.tm1.dimensions.exists, "Region")
+
+        self.assertIsInstance(exists.exception(), TM1pyException)
+        self.assertNotIsInstance(exists.exception(), TM1pyRestException)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,516 @@
+"""End-to-end performance benchmarks for TM1py against the offline mock server (see `Tests/MockServer.py`)
+
+Covers extraction, DataFrame building, writes, hierarchy updates, metadata calls, async requests and the startup time
+of `import TM1py` and `TM1Service`. Each run is
+stored as JSON, so library upgrades and code changes can be compared for regressions before they reach production.
+
+    # run all benchmarks and store the results in .benchmarks/
+    python -m Tests.Benchmarks
+
+    # run the extraction benchmarks with 50k rows and compare with the previous run
+    python -m Tests.Benchmarks --group extraction --rows 50000 --compare latest
+
+    # fail (exit code 1) if a benchmark is more than 20% slower than the baseline
+    python -m Tests.Benchmarks --compare .benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+import TM1py
+from Tests.MockServer import MockTM1Model, MockTM1Server
+from TM1py import TM1Service
+from TM1py.Objects import Process
+from TM1py.Utils import JsonDecoder, build_csv_from_dataframe, build_dataframe_from_csv
+from TM1py.Utils.JsonDecoder import _has_orjson
+from TM1py.Utils.Utils import _has_pyarrow
+
+MDX = (
+    "SELECT {[Month].[Month].Members} ON 0, {[Region].[Region].Members * [Product].[Product].Members} ON 1 FROM [Sales]"
+)
+
+# name -> (group, function that sets up the benchmark and returns the callable to time)
+BENCHMARKS: Dict[str, Tuple[str, Callable]] = OrderedDict()
+
+
+def benchmark(group: str, requires: bool = True):
+    """Register a benchmark. The decorated function receives a BenchmarkContext and returns the callable to time
+
+    :param group: 'extraction', 'dataframe', 'writes', 'hierarchies', 'metadata', 'async' or 'startup'
+    :param requires: False to skip the benchmark, e.g. if an optional dependency is missing
+    """
+
+    def wrap(func):
+        if requires:
+            BENCHMARKS[func.__name__] = (group, func)
+        return func
+
+    return wrap
+
+
+class BenchmarkContext:
+    """Mock servers and TM1Service instances shared by the benchmarks of a run"""
+
+    def __init__(self, rows: int, columns: int, latency: float):
+        self.rows = rows
+        self.columns = columns
+        self.latency = latency
+        self._servers: Dict[str, MockTM1Server] = dict()
+        self._services: Dict[Tuple, TM1Service] = dict()
+        self._directory = None
+
+    @property
+    def cells(self) -> int:
+        return self.rows * self.columns
+
+    def server(self, version: str = "11.8.02300.1") -> MockTM1Server:
+        if version not in self._servers:
+            model = MockTM1Model(rows=self.rows, columns=self.columns, version=version, latency=self.latency)
+            self._servers[version] = MockTM1Server(model).start()
+        return self._servers[version]
+
+    def tm1(self, version: str = "11.8.02300.1", **kwargs) -> TM1Service:
+        """TM1Service connected to the mock server of the version
+
+        :param version: version of the mock server
+        :param kwargs: additional arguments for TM1Service, e.g. async_requests_mode
+        """
+        key = (version,) + tuple(sorted(kwargs.items()))
+        if key not in self._services:
+            self._services[key] = TM1Service(**self.server(version).connection_parameters, **kwargs)
+        return self._services[key]
+
+    def cellset(self) -> Dict:
+        model = self.server().model
+        cells = ((row, column) for row in model.rows for column in model.columns)
+        return {(region, product, column): ordinal * 1.5 for ordinal, ((region, product), column) in enumerate(cells)}
+
+    def csv(self) -> str:
+        lines = ["Region~Product~Month~Value"]
+        lines += ["~".join(coordinates) + f"~{value}" for coordinates, value in self.cellset().items()]
+        return "\r\n".join(lines)
+
+    def path(self, file_name: str) -> str:
+        """Path of a file in a temporary directory that is removed on close"""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="tm1py_benchmarks_")
+        return os.path.join(self._directory, file_name)
+
+    def close(self):
+        for tm1 in self._services.values():
+            tm1.logout()
+        for server in self._servers.values():
+            server.stop()
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+
+
+@benchmark("extraction")
+def execute_mdx(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.cells.execute_mdx(MDX)
+
+
+@benchmark("extraction")
+def execute_mdx_values(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.cells.execute_mdx_values(MDX)
+
+
+@benchmark("extraction")
+def execute_mdx_struct(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.cells.execute_mdx_struct(MDX)
+
+
+@benchmark("extraction")
+def execute_mdx_dataframe(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.cells.execute_mdx_dataframe(MDX)
+
+
+@benchmark("extraction")
+def execute_mdx_dataframe_stdlib_json(context: BenchmarkContext):
+    tm1 = context.tm1(json_decoder="json")
+    return lambda: tm1.cells.execute_mdx_dataframe(MDX)
+
+
+@benchmark("extraction", requires=_has_orjson)
+def execute_mdx_dataframe_orjson(context: BenchmarkContext):
+    tm1 = context.tm1(json_decoder="orjson")
+    return lambda: tm1.cells.execute_mdx_dataframe(MDX)
+
+
+@benchmark("extraction")
+def execute_mdx_dataframe_iterative_json(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.cells.execute_mdx_dataframe(MDX, use_iterative_json=True)
+
+
+@benchmark("extraction")
+def execute_mdx_dataframe_columnar(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.cells.execute_mdx_dataframe(MDX, use_columnar=True)
+
+
+@benchmark("extraction")
+def execute_mdx_dataframe_parallel(context: BenchmarkContext):
+    tm1 = context.tm1()
+    cells_per_request = max(1, context.cells // 4)
+    return lambda: tm1.cells.execute_mdx_dataframe(MDX, max_workers=4, cells_per_request=cells_per_request)
+
+
+@benchmark("extraction", requires=_has_pyarrow)
+def execute_mdx_to_parquet(context: BenchmarkContext):
+    tm1 = context.tm1()
+    path = context.path("cells.parquet")
+    cells_per_request = max(1, context.cells // 4)
+    return lambda: tm1.cells.execute_mdx_to_parquet(MDX, path, max_workers=4, cells_per_request=cells_per_request)
+
+
+@benchmark("extraction")
+def execute_mdx_paged(context: BenchmarkContext):
+    tm1 = context.tm1()
+    page_size = max(1, context.cells // 10)
+
+    def run():
+        cellset_id = tm1.cells.create_cellset(MDX)
+        try:
+            for skip in range(0, context.cells, page_size):
+                tm1.cells.extract_cellset_cells_raw(cellset_id, top=page_size, skip=skip)
+        finally:
+            tm1.cells.delete_cellset(cellset_id)
+
+    return run
+
+
+@benchmark("dataframe")
+def build_dataframe_from_csv_pandas(context: BenchmarkContext):
+    raw_csv = context.csv()
+    return lambda: build_dataframe_from_csv(raw_csv)
+
+
+@benchmark("dataframe", requires=_has_pyarrow)
+def build_dataframe_from_csv_arrow(context: BenchmarkContext):
+    raw_csv = context.csv().encode("utf-8")
+    return lambda: build_dataframe_from_csv(raw_csv, use_arrow=True)
+
+
+@benchmark("dataframe")
+def build_csv_from_dataframe_pandas(context: BenchmarkContext):
+    df = build_dataframe_from_csv(context.csv())
+    return lambda: build_csv_from_dataframe(df)
+
+
+@benchmark("writes")
+def write_cellset(context: BenchmarkContext):
+    tm1 = context.tm1()
+    cells = context.cellset()
+    dimensions = list(MockTM1Model.ROW_DIMENSIONS) + [MockTM1Model.COLUMN_DIMENSION]
+    return lambda: tm1.cells.write(MockTM1Model.CUBE, cells, dimensions=dimensions)
+
+
+@benchmark("writes")
+def write_dataframe_blob(context: BenchmarkContext):
+    tm1 = context.tm1()
+    df = build_dataframe_from_csv(context.csv())
+    dimensions = list(MockTM1Model.ROW_DIMENSIONS) + [MockTM1Model.COLUMN_DIMENSION]
+    return lambda: tm1.cells.write_dataframe(MockTM1Model.CUBE, df, dimensions=dimensions, use_blob=True)
+
+
+@benchmark("writes")
+def upload_blob_multipart(context: BenchmarkContext):
+    tm1 = context.tm1(version="12.0.0")
+    content = context.csv().encode("utf-8")
+    return lambda: tm1.files.create("benchmark.csv", content, multi_part_upload=True, max_mb_per_part=1, max_workers=4)
+
+
+@benchmark("hierarchies")
+def get_hierarchy(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.hierarchies.get("Product", "Product")
+
+
+@benchmark("hierarchies")
+def update_hierarchy(context: BenchmarkContext):
+    tm1 = context.tm1()
+    hierarchy = tm1.hierarchies.get("Product", "Product")
+    hierarchy.add_element("P_new", "Numeric")
+    hierarchy.add_edge("Total Product", "P_new", 1)
+    return lambda: tm1.hierarchies.update(hierarchy)
+
+
+@benchmark("metadata")
+def get_dimension(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.dimensions.get("Product")
+
+
+@benchmark("metadata")
+def get_element_names(context: BenchmarkContext):
+    tm1 = context.tm1()
+    return lambda: tm1.elements.get_element_names("Product", "Product")
+
+
+@benchmark("metadata")
+def metadata_round_trips(context: BenchmarkContext):
+    tm1 = context.tm1()
+
+    def run():
+        for _ in range(20):
+            tm1.dimensions.exists("Product")
+            tm1.hierarchies.get_all_names("Product")
+            tm1.elements.get_number_of_elements("Month", "Month")
+
+    return run
+
+
+def _metadata_round_trips_batched(tm1: TM1Service, mode: str):
+    # same calls as metadata_round_trips
+    def run():
+        with tm1.batch(mode=mode) as batch:
+            for _ in range(20):
+                batch.submit(tm1.dimensions.exists, "Product")
+                batch.submit(tm1.hierarchies.get_all_names, "Product")
+                batch.submit(tm1.elements.get_number_of_elements, "Month", "Month")
+
+    return run
+
+
+@benchmark("metadata")
+def metadata_round_trips_batch(context: BenchmarkContext):
+    return _metadata_round_trips_batched(context.tm1(), mode="batch")
+
+
+@benchmark("metadata")
+def metadata_round_trips_parallel(context: BenchmarkContext):
+    return _metadata_round_trips_batched(context.tm1(), mode="parallel")
+
+
+@benchmark("async")
+def execute_process_async(context: BenchmarkContext):
+    tm1 = context.tm1(async_requests_mode=True)
+    process = Process(name="")
+    return lambda: tm1.processes.execute_process_with_return(process)
+
+
+@benchmark("async")
+def execute_mdx_dataframe_async(context: BenchmarkContext):
+    tm1 = context.tm1(async_requests_mode=True)
+    return lambda: tm1.cells.execute_mdx_dataframe(MDX)
+
+
+@benchmark("startup")
+def import_tm1py(context: BenchmarkContext):
+    # fresh interpreter per round, since modules are imported only once per process
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, "-c", "import TM1py"]
+    return lambda: subprocess.run(command, cwd=root, check=True)
+
+
+@benchmark("startup")
+def connect_tm1service(context: BenchmarkContext):
+    connection_parameters = context.server().connection_parameters
+
+    def run():
+        tm1 = TM1Service(**connection_parameters)
+        tm1.logout()
+
+    return run
+
+
+def run_benchmarks(
+    names: List[str] = None,
+    groups: List[str] = None,
+    rows: int = 10_000,
+    columns: int = 12,
+    latency: float = 0.0,
+    rounds: int = 5,
+    warmup: int = 1,
+    verbose: bool = True,
+) -> Dict:
+    """Run the benchmarks and return the results
+
+    :param names: names of the benchmarks to run. All if None
+    :param groups: groups of the benchmarks to run. All if None
+    :param rows: number of row tuples in the mock cellsets and of elements in the 'Product' dimension
+    :param columns: number of columns in the mock cellsets
+    :param latency: seconds the mock server waits before each response
+    :param rounds: number of timed executions per benchmark
+    :param warmup: number of untimed executions per benchmark
+    :param verbose: print results while running
+    :return: dict with environment, parameters and timings in seconds per benchmark
+    """
+    context = BenchmarkContext(rows=rows, columns=columns, latency=latency)
+    results = OrderedDict()
+    try:
+        for name, (group, setup) in BENCHMARKS.items():
+            if names and name not in names or groups and group not in groups:
+                continue
+            func = setup(context)
+            for _ in range(warmup):
+                func()
+            timings = list()
+            for _ in range(rounds):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+            results[name] = {
+                "group": group,
+                "rounds": rounds,
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.mean(timings),
+                "stdev": statistics.stdev(timings) if rounds > 1 else 0.0,
+            }
+            if verbose:
+                print(f"{group:<12} {name:<40} median {results[name]['median'] * 1000:>10.2f} ms", flush=True)
+    finally:
+        context.close()
+
+    return {
+        "environment": _environment(),
+        "parameters": {"rows": rows, "columns": columns, "latency": latency, "rounds": rounds, "warmup": warmup},
+        "benchmarks": results,
+    }
+
+
+def _environment() -> Dict:
+    environment = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tm1py": TM1py.__version__,
+        "json_decoder": JsonDecoder().library,
+    }
+    for library in ("requests", "urllib3", "pandas", "numpy", "pyarrow", "orjson", "msgspec", "ijson"):
+        try:
+            environment[library] = __import__(library).__version__
+        except (ImportError, AttributeError):
+            environment[library] = None
+    return environment
+
+
+def compare(results: Dict, baseline: Dict, threshold: float = 0.1) -> List[Dict]:
+    """Compare the median timings of two runs
+
+    :param results: results of `run_benchmarks`
+    :param baseline: results of an earlier run
+    :param threshold: relative slowdown of the median that counts as regression, e.g. 0.1 for 10%
+    :return: one dict per benchmark that is in both runs
+    """
+    comparison = list()
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        baseline_median = baseline["benchmarks"][name]["median"]
+        ratio = result["median"] / baseline_median if baseline_median else float("inf")
+        comparison.append(
+            {
+                "name": name,
+                "baseline": baseline_median,
+                "current": result["median"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return comparison
+
+
+def save(results: Dict, directory: str) -> str:
+    """Store results as `<directory>/<timestamp>.json`
+
+    :return: file path
+    """
+    os.makedirs(directory, exist_ok=True)
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S")
+    file_path = os.path.join(directory, f"{timestamp}.json")
+    with open(file_path, "w") as file:
+        json.dump(results, file, indent=2)
+    return file_path
+
+
+def load(file_path: str, directory: str = None) -> Dict:
+    """Load stored results
+
+    :param file_path: path to a JSON file or 'latest' for the most recent run in directory
+    :param directory: directory with stored runs
+    """
+    if file_path == "latest":
+        runs = sorted(glob.glob(os.path.join(directory, "*.json")))
+        if not runs:
+            raise ValueError(f"No stored benchmark runs in '{directory}'")
+        file_path = runs[-1]
+    with open(file_path, "r") as file:
+        return json.load(file)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*", help="benchmarks to run. Default: all")
+    parser.add_argument("--group", action="append", choices=sorted({group for group, _ in BENCHMARKS.values()}))
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the server waits before each response")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--output", default=".benchmarks", help="directory to store the results in")
+    parser.add_argument("--no-save", action="store_true", help="don't store the results")
+    parser.add_argument("--compare", help="stored results to compare with, or 'latest'")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown that counts as regression")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (group, _) in BENCHMARKS.items():
+            print(f"{group:<12} {name}")
+        return 0
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {unknown}")
+
+    # resolve 'latest' before this run is stored
+    baseline = load(args.compare, args.output) if args.compare else None
+
+    results = run_benchmarks(
+        names=args.names,
+        groups=args.group,
+        rows=args.rows,
+        columns=args.columns,
+        latency=args.latency,
+        rounds=args.rounds,
+        warmup=args.warmup,
+    )
+    if not args.no_save:
+        print(f"Results stored in '{save(results, args.output)}'")
+
+    if baseline is None:
+        return 0
+
+    if baseline["parameters"] != results["parameters"]:
+        print(f"Warning: parameters differ from baseline: {baseline['parameters']}")
+    comparison = compare(results, baseline, args.threshold)
+    print(f"\n{'benchmark':<40} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}")
+    for row in comparison:
+        print(
+            f"{row['name']:<40} {row['baseline'] * 1000:>12.2f} {row['current'] * 1000:>12.2f} "
+            f"{row['ratio']:>7.2f}{'  REGRESSION' if row['regression'] else ''}"
+        )
+    return 1 if any(row["regression"] for row in comparison) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from Tests.MockServer import MockTM1Server
+from TM1py import TM1Service
+from TM1py.Utils.Utils import build_arrow_batches_from_cellset_partitions
+
+MDX = (
+    "SELECT {[Month].[Month].Members} ON 0, {[Region].[Region].Members * [Product].[Product].Members} ON 1 FROM [Sales]"
+)
+
+# 2 rows x 2 columns
+CELLSET = {
+    "Axes": [
+        {
+            "Ordinal": 0,
+            "Cardinality": 2,
+            "Tuples": [{"Members": [{"Name": "M01"}]}, {"Members": [{"Name": "M02"}]}],
+        },
+        {
+            "Ordinal": 1,
+            "Cardinality": 2,
+            "Tuples": [{"Members": [{"Name": "R0"}]}, {"Members": [{"Name": "R1"}]}],
+        },
+    ]
+}
+
+
+class TestCellServiceExport(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3).start()
+        self.tm1 = TM1Service(**self.server.connection_parameters)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.tm1.logout()
+        self.server.stop()
+        shutil.rmtree(self.directory)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def test_execute_mdx_to_parquet(self):
+        rows = self.tm1.cells.execute_mdx_to_parquet(MDX, self._path("sales.parquet"), cells_per_request=4)
+
+        self.assertEqual(14, rows)
+        parquet_file = pq.ParquetFile(self._path("sales.parquet"))
+        # one row group per partition
+        self.assertEqual(4, parquet_file.metadata.num_row_groups)
+        expected = self.tm1.cells.execute_mdx_arrow(MDX)
+        self.assertTrue(expected.schema.equals(parquet_file.schema_arrow))
+        self.assertTrue(expected.equals(parquet_file.read()))
+        self.assertEqual({}, self.server.model.cellsets)
+
+    def test_execute_mdx_to_parquet_parallel(self):
+        self.tm1.cells.execute_mdx_to_parquet(
+            MDX, self._path("sales.parquet"), cells_per_request=2, max_workers=3, compression="zstd"
+        )
+
+        table = pq.read_table(self._path("sales.parquet"))
+        self.assertTrue(self.tm1.cells.execute_mdx_arrow(MDX).equals(table))
+
+    def test_execute_mdx_to_parquet_top_and_skip(self):
+        rows = self.tm1.cells.execute_mdx_to_parquet(
+            MDX, self._path("sales.parquet"), top=6, skip=3, skip_zeros=False, cells_per_request=4
+        )
+
+        self.assertEqual(6, rows)
+        expected = self.tm1.cells.execute_mdx_arrow(MDX, top=6, skip=3, skip_zeros=False)
+        self.assertTrue(expected.equals(pq.read_table(self._path("sales.parquet"))))
+
+    def test_execute_mdx_to_arrow_ipc(self):
+        rows = self.tm1.cells.execute_mdx_to_arrow_ipc(
+            MDX, self._path("sales.arrow"), cells_per_request=4, max_workers=2, compression="lz4"
+        )
+
+        self.assertEqual(14, rows)
+        with pa.ipc.open_file(self._path("sales.arrow")) as reader:
+            self.assertEqual(4, reader.num_record_batches)
+            table = reader.read_all()
+        self.assertTrue(self.tm1.cells.execute_mdx_arrow(MDX).equals(table))
+
+    def test_execute_view_to_parquet(self):
+        rows = self.tm1.cells.execute_view_to_parquet("Sales", "Default", self._path("sales.parquet"))
+
+        self.assertEqual(14, rows)
+        self.assertEqual(["Region", "Product", "Month", "Value"], pq.read_schema(self._path("sales.parquet")).names)
+
+    def test_execute_view_to_arrow_ipc(self):
+        rows = self.tm1.cells.execute_view_to_arrow_ipc("Sales", "Default", self._path("sales.arrow"), private=True)
+
+        self.assertEqual(14, rows)
+        self.assertEqual({}, self.server.model.cellsets)
+
+    def test_execute_mdx_to_parquet_empty(self):
+        rows = self.tm1.cells.execute_mdx_to_parquet(MDX, self._path("sales.parquet"), top=1)
+
+        self.assertEqual(0, rows)
+        table = pq.read_table(self._path("sales.parquet"))
+        self.assertEqual(["Region", "Product", "Month", "Value"], table.column_names)
+        self.assertEqual(0, table.num_rows)
+
+    def test_execute_mdx_to_parquet_failure(self):
+        self.tm1.cells.execute_mdx_to_parquet(MDX, self._path("sales.parquet"), top=6)
+        expected = pq.read_table(self._path("sales.parquet"))
+
+        def fail_after_first_batch(**kwargs):
+            batches = build_arrow_batches_from_cellset_partitions(**kwargs)
+            yield next(batches)
+            batches.close()
+            raise ConnectionError("lost connection")
+
+        with patch("TM1py.Services.CellService.build_arrow_batches_from_cellset_partitions", fail_after_first_batch):
+            with self.assertRaises(ConnectionError):
+                self.tm1.cells.execute_mdx_to_parquet(MDX, self._path("sales.parquet"), cells_per_request=4)
+
+        # previous file is untouched and no partial file is left behind
+        self.assertTrue(expected.equals(pq.read_table(self._path("sales.parquet"))))
+        self.assertEqual(["sales.parquet"], os.listdir(self.directory))
+
+
+class TestBuildArrowBatches(unittest.TestCase):
+
+    def _build(self, partitions, value_type=None):
+        return list(
+            build_arrow_batches_from_cellset_partitions(
+                row_dimensions=["[Region].[Region]"],
+                column_dimensions=["[Month].[Month]"],
+                raw_cellset_as_dict=CELLSET,
+                partitions=partitions,
+                value_type=value_type,
+            )
+        )
+
+    def test_batches_share_dictionaries(self):
+        batches = self._build([[{"Ordinal": 0, "Value": 1}], [], [{"Ordinal": 3, "Value": 2.5}]])
+
+        self.assertEqual(2, len(batches))
+        self.assertEqual([("R0", "M01", 1.0), ("R1", "M02", 2.5)], [tuple(r.values()) for r in self._rows(batches)])
+        # same dictionary buffers in all batches
+        self.assertEqual(
+            batches[0].column(0).dictionary.buffers()[2].address, batches[1].column(0).dictionary.buffers()[2].address
+        )
+        self.assertEqual(pa.float64(), batches[0].schema.field("Value").type)
+
+    def test_string_values(self):
+        batches = self._build([[{"Ordinal": 0, "Value": 1}], [{"Ordinal": 1, "Value": "a"}]], value_type=pa.string())
+
+        self.assertEqual(["1", "a"], [row["Value"] for row in self._rows(batches)])
+
+    def test_string_values_after_numeric_values(self):
+        with self.assertRaises(ValueError):
+            self._build([[{"Ordinal": 0, "Value": 1}], [{"Ordinal": 1, "Value": "a"}]])
+
+    def test_no_cells(self):
+        batches = self._build([[]])
+
+        self.assertEqual(1, len(batches))
+        self.assertEqual(0, batches[0].num_rows)
+        self.assertEqual(["Region", "Month", "Value"], batches[0].schema.names)
+
+    @staticmethod
+    def _rows(batches):
+        return pa.Table.from_batches(batches).to_pylist()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from TM1py.Services import CellService
+from TM1py.Utils.Utils import CaseAndSpaceInsensitiveTuplesDict
+
+
+def _cells(count: int) -> dict:
+    return {("e1", "e2", str(i)): i for i in range(count)}
+
+
+class TestSuggestWriteStrategy(unittest.TestCase):
+
+    def setUp(self):
+        self.cell_service = CellService(MagicMock())
+
+    def _suggest(self, version: str, cells: dict, admin: bool = True, **kwargs):
+        with patch.object(CellService, "version", new_callable=PropertyMock, return_value=version), patch.object(
+            CellService, "is_data_admin", new_callable=PropertyMock, return_value=admin
+        ), patch.object(CellService, "is_ops_admin", new_callable=PropertyMock, return_value=admin):
+            return self.cell_service._suggest_write_strategy("Sales", cells, **kwargs)
+
+    def test_small_write_uses_cellset(self):
+        for version in ("11.2.00000.1", "12.0.0"):
+            self.assertEqual(("cellset", 1), self._suggest(version, _cells(1)))
+
+    def test_ti_on_versions_before_11_4(self):
+        strategy, _ = self._suggest("11.2.00000.1", _cells(200_000))
+
+        self.assertEqual("ti", strategy)
+
+    def test_ti_on_versions_from_11_4(self):
+        strategy, _ = self._suggest("12.0.0", _cells(20_000))
+
+        self.assertEqual("ti", strategy)
+
+    def test_blob_for_large_writes(self):
+        strategy, _ = self._suggest("12.0.0", _cells(200_000))
+
+        self.assertEqual("blob", strategy)
+
+    def test_async_for_tuples_dict(self):
+        # timings of previous writes made async writing the cheapest strategy
+        self.cell_service._get_write_costs("Sales")["async"] = (0.0, 1e-7)
+
+        strategy, _ = self._suggest("12.0.0", CaseAndSpaceInsensitiveTuplesDict(_cells(1_000)))
+
+        self.assertEqual("async", strategy)
+
+    def test_non_admin_uses_cellset(self):
+        strategy, _ = self._suggest("12.0.0", _cells(200_000), admin=False)
+
+        self.assertEqual("cellset", strategy)
+
+    def test_clear_view(self):
+        strategy, _ = self._suggest("12.0.0", _cells(1), clear_view="Default")
+
+        self.assertEqual("blob", strategy)
+        with self.assertRaises(ValueError):
+            self._suggest("11.2.00000.1", _cells(1), clear_view="Default")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -540,6 +540,32 @@ class TestCellService(unittest.TestCase):
 
         self.assertEqual(self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()), [1234])
 
+    def test_write_auto(self):
+        cells = {("Element 1", "Element4", "Element9"): 4321}
+        self.tm1.cells.write(self.cube_name, cells, auto=True)
+
+        query = MdxBuilder.from_cube(self.cube_name)
+        query.add_member_tuple_to_columns(
+            f"[{self.dimension_names[0]}].[Element 1]",
+            f"[{self.dimension_names[1]}].[Element 4]",
+            f"[{self.dimension_names[2]}].[Element 9]",
+        )
+
+        self.assertEqual(self.tm1.cells.execute_mdx_values(mdx=query.to_mdx()), [4321])
+
+    def test_write_auto_small_write_uses_cellset(self):
+        cells = {("Element 1", "Element4", "Element9"): 1}
+
+        strategy, _ = self.tm1.cells._suggest_write_strategy(self.cube_name, cells)
+
+        self.assertEqual("cellset", strategy)
+
+    def test_write_auto_with_use_blob(self):
+        cells = {("Element 1", "Element4", "Element9"): 1}
+
+        with self.assertRaises(ValueError):
+            self.tm1.cells.write(self.cube_name, cells, auto=True, use_blob=True)
+
     def test_write_use_blob_allow_spread(self):
         cells = {
             ("Element 1", "Element4", "Element9"): 1,
@@ -1482,6 +1508,43 @@ class TestCellService(unittest.TestCase):
 
         self.assertEqual(list(cells.values()), values)
 
+    @skip_if_no_pandas
+    def test_write_pipelined(self):
+        cells = {
+            ("element 1", "element 1", "element 5"): 1.59,
+            ("element 1", "element 2", "element 5"): 2.87,
+            ("element 1", "element 3", "element 5"): 3.12,
+        }
+
+        def chunks():
+            for elements, value in cells.items():
+                yield {elements: value}
+
+        progress = []
+        self.tm1.cells.write_pipelined(self.cube_name, chunks(), max_workers=2, progress_callback=progress.append)
+
+        self.assertEqual(3, len(progress))
+        self.assertEqual([0, 1, 2], sorted(p.chunk for p in progress))
+        self.assertEqual(3, max(p.total_cells for p in progress))
+
+        query = MdxBuilder.from_cube(self.cube_name)
+        query = query.add_hierarchy_set_to_column_axis(
+            MdxHierarchySet.member(Member.of(self.dimension_names[0], "element 1"))
+        )
+        query = query.add_hierarchy_set_to_row_axis(
+            MdxHierarchySet.members(
+                [
+                    Member.of(self.dimension_names[1], "element 1"),
+                    Member.of(self.dimension_names[1], "element 2"),
+                    Member.of(self.dimension_names[1], "element 3"),
+                ]
+            )
+        )
+        query = query.add_member_to_where(Member.of(self.dimension_names[2], "element 5"))
+        values = self.tm1.cells.execute_mdx_values(query.to_mdx())
+
+        self.assertEqual(list(cells.values()), values)
+
     @skip_if_no_pandas
     def test_write_async_minor_errors(self):
         cells = {
@@ -2485,6 +2548,29 @@ class TestCellService(unittest.TestCase):
         data = self.tm1.cells.execute_mdx_values(mdx)
         self.assertEqual(2000, sum(data))
 
+    def test_execute_mdx_values_max_workers(self):
+        self.tm1.cells.write_values(self.cube_name, self.cellset)
+
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .columns_non_empty()
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        cell_values = self.tm1.cells.execute_mdx_values(mdx)
+        cell_values_partitioned = self.tm1.cells.execute_mdx_values(mdx, max_workers=4, cells_per_request=10)
+
+        self.assertEqual(cell_values, cell_values_partitioned)
+
     def test_execute_mdx_values_skip_zeros(self):
         cells = {("Element 1", "Element 3", "Element 9"): 128}
         self.tm1.cells.write(self.cube_name, cells)
@@ -2580,6 +2666,98 @@ class TestCellService(unittest.TestCase):
         # check if sum of retrieved values is sum of written values
         self.assertEqual(self.total_value, sum(values))
 
+    def test_execute_mdx_csv_max_workers(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        csv = self.tm1.cells.execute_mdx_csv(mdx)
+        csv_partitioned = self.tm1.cells.execute_mdx_csv(mdx, max_workers=4, cells_per_request=5)
+
+        self.assertEqual(csv, csv_partitioned)
+
+    def test_execute_mdx_csv_max_workers_top_skip(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        csv = self.tm1.cells.execute_mdx_csv(mdx, top=10, skip=3)
+        csv_partitioned = self.tm1.cells.execute_mdx_csv(mdx, top=10, skip=3, max_workers=4, cells_per_request=3)
+
+        self.assertEqual(csv, csv_partitioned)
+
+    def test_execute_mdx_iter_rows(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        rows = self.tm1.cells.execute_mdx_iter_rows(mdx)
+
+        # check header
+        self.assertEqual(self.dimension_names + ["Value"], next(rows))
+
+        records = list(rows)
+        coordinates = {tuple(record[0:3]) for record in records}
+        self.assertEqual(len(coordinates), len(self.target_coordinates))
+        self.assertTrue(coordinates.issubset(self.target_coordinates))
+        self.assertEqual(self.total_value, sum(float(record[3]) for record in records))
+
+    def test_execute_mdx_iter_rows_batch_size(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        batches = list(self.tm1.cells.execute_mdx_iter_rows(mdx, include_headers=False, batch_size=10))
+
+        self.assertTrue(all(len(batch) <= 10 for batch in batches))
+        records = [record for batch in batches for record in batch]
+        self.assertEqual(len(records), len(self.target_coordinates))
+        self.assertEqual(self.total_value, sum(float(record[3]) for record in records))
+
     def test_execute_mdx_csv_column_only(self):
         mdx = """SELECT
                     NON EMPTY {[TM1PY_TESTS_CELL_DIMENSION1].[TM1PY_TESTS_CELL_DIMENSION1].MEMBERS} * 
@@ -3014,6 +3192,56 @@ class TestCellService(unittest.TestCase):
         values = df[["Value"]].values
         self.assertEqual(self.total_value, sum(values))
 
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_max_workers(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        df = self.tm1.cells.execute_mdx_dataframe(mdx)
+        df_partitioned = self.tm1.cells.execute_mdx_dataframe(mdx, max_workers=4, cells_per_request=5)
+
+        self.assertTrue(df.equals(df_partitioned))
+
+    @skip_if_no_pandas
+    def test_execute_mdx_dataframe_use_columnar(self):
+        mdx = (
+            MdxBuilder.from_cube(self.cube_name)
+            .rows_non_empty()
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[0], self.dimension_names[0])
+            )
+            .add_hierarchy_set_to_row_axis(
+                MdxHierarchySet.all_members(self.dimension_names[1], self.dimension_names[1])
+            )
+            .add_hierarchy_set_to_column_axis(
+                MdxHierarchySet.all_members(self.dimension_names[2], self.dimension_names[2])
+            )
+            .to_mdx()
+        )
+
+        df = self.tm1.cells.execute_mdx_dataframe(mdx, use_columnar=True)
+
+        # check coordinates in df are equal to target coordinates
+        coordinates = {tuple(row) for row in df[[*self.dimension_names]].values}
+        self.assertEqual(len(coordinates), len(self.target_coordinates))
+        self.assertTrue(coordinates.issubset(self.target_coordinates))
+        self.assertIsInstance(df[self.dimension_names[0]].dtype, pd.CategoricalDtype)
+
+        # check if total values are equal
+        self.assertEqual(self.total_value, df["Value"].sum())
+
     @skip_if_no_pandas
     def test_execute_mdx_dataframe_na_element_name(self):
         attribute_dimension = "}ElementAttributes_" + self.dimension_names[0]
@@ -0,0 +1,241 @@
+import pickle
+import unittest
+
+from TM1py.Utils.Utils import (
+    CaseAndSpaceInsensitiveTuplesDict,
+    CompactCaseAndSpaceInsensitiveTuplesDict,
+)
+
+
+class TestCompactCaseAndSpaceInsensitiveTuplesDict(unittest.TestCase):
+
+    def setUp(self):
+        self.map = CompactCaseAndSpaceInsensitiveTuplesDict()
+        self.map[("Elem1", "Elem1")] = "Value1"
+        self.map[("Elem1", "Elem2")] = 2
+        self.map[("Elem1", "Elem3")] = 3
+
+    def tearDown(self):
+        del self.map
+
+    def test_delete_item(self):
+        # Verify items exist
+        self.assertIn(("Elem1", "Elem1"), self.map)
+        self.assertIn(("Elem1", "Elem2"), self.map)
+        self.assertIn(("Elem1", "Elem3"), self.map)
+
+        # Delete items with case and space insensitivity
+        del self.map[("El em1", "ELEM1")]
+        del self.map[("El em1", "E L E M 2")]
+        del self.map[("El em1", " eLEM3")]
+
+        # Confirm deletion
+        self.assertNotIn(("Elem1", "Elem1"), self.map)
+        self.assertNotIn(("Elem1", "Elem2"), self.map)
+        self.assertNotIn(("Elem1", "Elem3"), self.map)
+
+    def test_equality(self):
+        # Exact match
+        other_map = CompactCaseAndSpaceInsensitiveTuplesDict(
+            {("Elem1", "Elem1"): "Value1", ("Elem1", "Elem2"): 2, ("Elem1", "Elem3"): 3}
+        )
+        self.assertEqual(other_map, self.map)
+
+        # Case and space-insensitive match
+        other_map = CompactCaseAndSpaceInsensitiveTuplesDict(
+            {("Elem 1", "Elem1"): "Value1", ("ELEM 1", "E L E M 2"): 2, (" Elem1 ", "Elem 3"): 3}
+        )
+        self.assertEqual(other_map, self.map)
+
+    def test_inequality(self):
+        # Different value
+        other_map = CompactCaseAndSpaceInsensitiveTuplesDict(
+            {("Elem1", "Elem1"): "Value1", ("Elem1", "Elem2"): 0, ("Elem1", "Elem3"): 3}
+        )
+        self.assertNotEqual(other_map, self.map)
+
+        # Partially matching keys with incorrect values
+        other_map = CompactCaseAndSpaceInsensitiveTuplesDict(
+            {("Elem 1", "Elem1"): "Value1", ("ELEM 1", "E L E M 2"): "wrong", (" Elem1 ", "Elem 3"): 3}
+        )
+        self.assertNotEqual(other_map, self.map)
+
+        # Completely different key
+        other_map = CompactCaseAndSpaceInsensitiveTuplesDict(
+            {("wrong", "Elem1"): "Value1", ("Elem1", "Elem2"): 2, ("Elem1", "Elem3"): 3}
+        )
+        self.assertNotEqual(other_map, self.map)
+
+    def test_get_item(self):
+        # Retrieve with case and space insensitivity
+        self.assertEqual(self.map[("ELEM1", "ELEM1")], "Value1")
+        self.assertEqual(self.map[("elem1", "e l e m 2")], 2)
+        self.assertEqual(self.map[("e l e M 1", "elem3")], 3)
+
+    def test_iterate_keys(self):
+        # Ensure iteration maintains insertion order
+        expected_keys = [("Elem1", "Elem1"), ("Elem1", "Elem2"), ("Elem1", "Elem3")]
+        for actual_key, expected_key in zip(self.map, expected_keys):
+            self.assertEqual(actual_key, expected_key)
+
+    def test_length(self):
+        # Check length
+        self.assertEqual(len(self.map), 3)
+
+    def test_set_item(self):
+        # Test setting a new item and overriding an existing item
+        self.map[("E L E M 1", "E L E M 2")] = 3
+        self.assertEqual(self.map[("Elem1", "Elem2")], 3)
+
+        # Add a new entry and check
+        self.map[("Elem4", "Elem5")] = 5
+        self.assertEqual(len(self.map), 4)
+        self.assertEqual(self.map[("Elem4", "Elem5")], 5)
+
+    def test_copy(self):
+        # Verify that a copy has the same contents but is a different instance
+        copy_map = self.map.copy()
+        self.assertIsNot(copy_map, self.map)
+        self.assertEqual(copy_map, self.map)
+
+    def test_adjusted_keys(self):
+        # Test that adjusted keys return as expected (all keys lowercased and spaceless)
+        adjusted_keys = list(self.map.adjusted_keys())
+        expected_keys = [("elem1", "elem1"), ("elem1", "elem2"), ("elem1", "elem3")]
+        self.assertEqual(adjusted_keys, expected_keys)
+
+    def test_adjusted_items(self):
+        # Test adjusted items
+        adjusted_items = dict(self.map.adjusted_items())
+        expected_items = {("elem1", "elem1"): "Value1", ("elem1", "elem2"): 2, ("elem1", "elem3"): 3}
+        self.assertEqual(adjusted_items, expected_items)
+
+    def test_update(self):
+        # Test updating with new values
+        update_map = {("Elem1", "Elem2"): "Updated", ("Elem1", "NewElem"): 10}
+        self.map.update(update_map)
+
+        # Check that updates are applied
+        self.assertEqual(self.map[("Elem1", "Elem2")], "Updated")
+        self.assertEqual(self.map[("Elem1", "NewElem")], 10)
+        self.assertEqual(len(self.map), 4)
+
+    def test_setdefault(self):
+        # Existing key with setdefault should return the existing value
+        self.assertEqual(self.map.setdefault(("Elem1", "Elem2"), "NewValue"), 2)
+
+        # New key should add the value and return the default
+        self.assertEqual(self.map.setdefault(("Elem1", "NewElem"), 10), 10)
+        self.assertEqual(self.map[("Elem1", "NewElem")], 10)
+
+    def test_keyerror_on_nonexistent_key(self):
+        # Test that a KeyError is raised when accessing a non-existent key
+        with self.assertRaises(KeyError):
+            _ = self.map[("NonExistent", "Key")]
+
+    def test_contains(self):
+        # Test that keys are found with case and space insensitivity
+        self.assertIn(("Elem1", "Elem1"), self.map)
+        self.assertIn(("elem1", "elem2"), self.map)
+        self.assertIn((" e l e m 1 ", " elem 3 "), self.map)
+        self.assertNotIn(("NonExistent", "Key"), self.map)
+
+    def test_keys_method(self):
+        # Test that keys() returns all keys in original case and insertion order
+        expected_keys = [("Elem1", "Elem1"), ("Elem1", "Elem2"), ("Elem1", "Elem3")]
+        self.assertEqual(list(self.map.keys()), expected_keys)
+
+    def test_values_method(self):
+        # Test that values() returns all values in insertion order
+        expected_values = ["Value1", 2, 3]
+        self.assertEqual(list(self.map.values()), expected_values)
+
+    def test_items_method(self):
+        # Test that items() returns all key-value pairs in original case and insertion order
+        expected_items = [(("Elem1", "Elem1"), "Value1"), (("Elem1", "Elem2"), 2), (("Elem1", "Elem3"), 3)]
+        self.assertEqual(list(self.map.items()), expected_items)
+
+    def test_equality_with_tuples_dict(self):
+        other_map = CaseAndSpaceInsensitiveTuplesDict(
+            {("Elem 1", "Elem1"): "Value1", ("ELEM 1", "E L E M 2"): 2, (" Elem1 ", "Elem 3"): 3}
+        )
+        self.assertEqual(other_map, self.map)
+        self.assertEqual(self.map, other_map)
+        self.assertEqual(self.map, {("Elem1", "Elem1"): "Value1", ("Elem1", "Elem2"): 2, ("Elem1", "Elem3"): 3})
+
+    def test_case_of_last_set_is_remembered(self):
+        self.map[("ELEM 1", "Elem4")] = 4
+
+        self.assertEqual(("ELEM 1", "Elem4"), self.map.keys()[-1])
+        self.assertEqual(("ELEM 1", "Elem1"), self.map.keys()[0])
+
+    def test_element_names_are_interned(self):
+        self.map[("elem1", "ELEM2")] = 5
+
+        self.assertEqual(1, len(self.map.symbols[0]))
+        self.assertEqual(3, len(self.map.symbols[1]))
+        self.assertEqual(3, len(self.map))
+
+    def test_keys_of_different_length(self):
+        with self.assertRaises(ValueError):
+            self.map[("Elem1", "Elem2", "Elem3")] = 1
+
+        self.assertNotIn(("Elem1", "Elem2", "Elem3"), self.map)
+        self.assertIsNone(self.map.get(("Elem1",)))
+
+    def test_invalid_keys(self):
+        with self.assertRaises(TypeError):
+            self.map["Elem1"] = 1
+        with self.assertRaises(TypeError):
+            self.map[("Elem1", 2)] = 1
+
+    def test_many_items(self):
+        data = {(f"Elem{i % 97}", f"Elem{i}"): i for i in range(10000)}
+
+        self.map.update(data)
+
+        self.assertEqual(10002, len(self.map))
+        for key, value in data.items():
+            self.assertEqual(value, self.map[(key[0].upper(), key[1].lower())])
+
+    def test_delete_and_reinsert(self):
+        for i in range(1000):
+            self.map[("Elem1", f"Temp{i}")] = i
+        for i in range(1000):
+            del self.map[("elem1", f"temp{i}")]
+        for i in range(0, 1000, 2):
+            self.map[("Elem1", f"Temp{i}")] = -i
+
+        self.assertEqual(503, len(self.map))
+        self.assertEqual(-998, self.map[("Elem1", "Temp998")])
+        self.assertNotIn(("Elem1", "Temp999"), self.map)
+        self.assertEqual(("Elem1", "Elem1"), next(iter(self.map)))
+
+    def test_pop_and_popitem(self):
+        self.assertEqual(2, self.map.pop(("ELEM1", "ELEM2")))
+        self.assertEqual("default", self.map.pop(("ELEM1", "ELEM2"), "default"))
+        with self.assertRaises(KeyError):
+            self.map.pop(("ELEM1", "ELEM2"))
+
+        self.assertEqual((("Elem1", "Elem3"), 3), self.map.popitem())
+        self.assertEqual(1, len(self.map))
+
+    def test_clear(self):
+        self.map.clear()
+
+        self.assertEqual(0, len(self.map))
+        self.map[("Elem1", "Elem2", "Elem3")] = 1
+        self.assertEqual(1, self.map[("Elem1", "Elem2", "Elem3")])
+
+    def test_to_tuples_dict(self):
+        tuples_dict = self.map.to_tuples_dict()
+
+        self.assertIsInstance(tuples_dict, CaseAndSpaceInsensitiveTuplesDict)
+        self.assertEqual(list(self.map.items()), list(tuples_dict.items()))
+
+    def test_pickle(self):
+        self.assertEqual(self.map, pickle.loads(pickle.dumps(self.map)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,12 @@ from Tests.Utils import (
     skip_if_no_pandas,
     skip_if_version_lower_than,
 )
-from TM1py.Exceptions import TM1pyException, TM1pyRestException
+from TM1py.Exceptions import (
+    TM1pyException,
+    TM1pyRestException,
+    TM1pyWriteFailureException,
+    TM1pyWritePartialFailureException,
+)
 from TM1py.Objects import Dimension, Element, ElementAttribute, Hierarchy
 from TM1py.Services import TM1Service
 
@@ -1078,6 +1083,54 @@ class TestElementService(unittest.TestCase):
             element = Element(self.years[0], "Numeric")
             self.tm1.elements.add_elements(self.dimension_name, self.dimension_name, [element])
 
+    def test_add_elements_use_blob(self):
+        elements = [Element(name=f"Element{i}", element_type="Numeric") for i in range(25)]
+        elements.append(Element(name="Consolidation'1", element_type="Consolidated"))
+
+        self.tm1.elements.add_elements(self.dimension_name, self.dimension_name, elements, use_blob=True)
+
+        for element in elements:
+            self.assertEqual(element, self.tm1.elements.get(self.dimension_name, self.dimension_name, element.name))
+
+    def test_add_elements_use_blob_multiple_chunks(self):
+        elements = [Element(name=f"Element{i}", element_type="Numeric") for i in range(25)]
+
+        self.tm1.elements.add_elements_use_blob(self.dimension_name, self.dimension_name, elements, chunk_size=10)
+
+        element_names = self.tm1.elements.get_element_names(self.dimension_name, self.dimension_name)
+        for element in elements:
+            self.assertIn(element.name, element_names)
+
+    def test_add_edges_use_blob(self):
+        self.tm1.elements.add_elements(
+            self.dimension_name, self.dimension_name, [Element("New Consolidation", "Consolidated")]
+        )
+        edges = {("New Consolidation", "1989"): 1, ("New Consolidation", "1990"): -1}
+
+        self.tm1.elements.add_edges(self.dimension_name, self.dimension_name, edges, use_blob=True)
+
+        current_edges = self.tm1.elements.get_edges(self.dimension_name, self.dimension_name)
+        self.assertEqual(1, current_edges[("New Consolidation", "1989")])
+        self.assertEqual(-1, current_edges[("New Consolidation", "1990")])
+
+    def test_add_edges_use_blob_fail(self):
+        edges = {("Total Years", "Not Existing Element"): 1}
+
+        with self.assertRaises((TM1pyWriteFailureException, TM1pyWritePartialFailureException)):
+            self.tm1.elements.add_edges_use_blob(self.dimension_name, self.dimension_name, edges)
+
+    def test_update_attribute_values_use_blob(self):
+        self.tm1.elements.update_attribute_values_use_blob(
+            self.dimension_name,
+            self.dimension_name,
+            {("1989", "Previous Year"): "1988 updated", ("1989", "Financial Year"): "FY 1989"},
+        )
+
+        values = self.tm1.elements.get_attribute_values(
+            self.dimension_name, self.dimension_name, ["Previous Year", "Financial Year"]
+        )
+        self.assertEqual({"Previous Year": "1988 updated", "Financial Year": "FY 1989"}, values["1989"])
+
     def test_add_element_attributes_single(self):
         element_attribute = ElementAttribute(name="Attribute1", attribute_type="String")
         self.tm1.elements.add_element_attributes(self.dimension_name, self.dimension_name, [element_attribute])
@@ -1130,6 +1183,51 @@ class TestElementService(unittest.TestCase):
 
         self.assertEqual(members, [[{"Name": "1990", "Attributes": {"Previous Year": "1989"}}]])
 
+    def test_execute_set_mdx_iter(self):
+        mdx = f"{{[{self.dimension_name}].[{self.hierarchy_name}].Members}}"
+        expected = self.tm1.elements.execute_set_mdx(mdx=mdx)
+
+        batches = list(self.tm1.elements.execute_set_mdx_iter(mdx=mdx, batch_size=3))
+
+        self.assertTrue(all(len(batch) <= 3 for batch in batches))
+        self.assertEqual(expected, [tupl for batch in batches for tupl in batch])
+
+    def test_execute_set_mdx_iter_paged(self):
+        mdx = f"{{[{self.dimension_name}].[{self.hierarchy_name}].Members}}"
+        expected = self.tm1.elements.execute_set_mdx(mdx=mdx)
+
+        batches = list(self.tm1.elements.execute_set_mdx_iter(mdx=mdx, batch_size=3, paged=True))
+
+        self.assertEqual([3, 3, 1], [len(batch) for batch in batches])
+        self.assertEqual(expected, [tupl for batch in batches for tupl in batch])
+
+    def test_execute_set_mdx_columns(self):
+        mdx = f"{{[{self.dimension_name}].[{self.hierarchy_name}].[1990], [{self.dimension_name}].[Total Years]}}"
+        columns = self.tm1.elements.execute_set_mdx_columns(
+            mdx=mdx,
+            member_properties=["Name", "Attributes/Previous Year"],
+            parent_properties=["Name"],
+            element_properties=["Type"],
+        )
+
+        self.assertEqual(
+            {
+                "Name": ["1990", "Total Years"],
+                "Attributes/Previous Year": ["1989", ""],
+                "Parent/Name": ["Total Years", "All Consolidations"],
+                "Element/Type": ["Numeric", "Consolidated"],
+            },
+            columns,
+        )
+
+    def test_execute_set_mdx_dataframe(self):
+        mdx = f"{{[{self.dimension_name}].[{self.hierarchy_name}].[1990]}}"
+        df = self.tm1.elements.execute_set_mdx_dataframe(mdx=mdx, paged=True)
+
+        self.assertEqual(["Name", "UniqueName", "Parent/Name", "Element/Type", "Element/Level"], list(df.columns))
+        self.assertEqual(["1990"], df["Name"].tolist())
+        self.assertEqual(["Numeric"], df["Element/Type"].tolist())
+
     def test_get_element_types(self):
         element_types = self.tm1.elements.get_element_types(self.dimension_name, self.hierarchy_name)
         expected = {
@@ -0,0 +1,166 @@
+import unittest
+
+from TM1py.Objects import Hierarchy
+from TM1py.Utils import HierarchyDiff, HierarchySnapshot
+
+
+class TestHierarchySnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.element_types = {
+            "Total": "Consolidated",
+            "Europe": "Consolidated",
+            "Germany": "Numeric",
+            "France": "Numeric",
+            "Old": "Numeric",
+        }
+        self.edges = {
+            ("Total", "Europe"): 1,
+            ("Europe", "Germany"): 1,
+            ("Europe", "France"): 1,
+            ("Total", "Old"): 1,
+        }
+        self.attributes = {
+            "Germany": {"Currency": "EUR", "Population": 84000000},
+            "France": {"Currency": "EUR", "Population": None},
+        }
+        self.attribute_types = {"Currency": "String", "Population": "Numeric"}
+        self.current = HierarchySnapshot(self.element_types, self.edges, self.attributes, self.attribute_types)
+
+    def _target(self, element_types=None, edges=None, attributes=None):
+        return HierarchySnapshot(
+            element_types if element_types is not None else self.element_types,
+            edges if edges is not None else self.edges,
+            attributes if attributes is not None else self.attributes,
+            self.attribute_types,
+        )
+
+    def test_no_changes(self):
+        diff = self.current.diff(self._target(), delete_elements=True, unwind_all=True)
+
+        self.assertFalse(diff)
+        self.assertEqual(self.current.digests, self._target().digests)
+
+    def test_case_and_space_insensitive(self):
+        target = HierarchySnapshot(
+            {name.upper(): element_type for name, element_type in self.element_types.items()},
+            {(parent.lower(), component.upper()): weight for (parent, component), weight in self.edges.items()},
+            {" ger many ": {"CURRENCY": "EUR", "population": 84000000.0}, "France": {"Currency": "EUR"}},
+            self.attribute_types,
+        )
+
+        self.assertFalse(self.current.diff(target, delete_elements=True, unwind_all=True))
+
+    def test_empty_values_are_normalized(self):
+        target = self._target(
+            attributes={
+                "Germany": {"Currency": "EUR", "Population": "84000000"},
+                "France": {"Currency": "EUR", "Population": float("nan")},
+                "Old": {"Currency": "", "Population": 0},
+            }
+        )
+
+        self.assertEqual(0, len(self.current.diff(target).attribute_values))
+
+    def test_attribute_values(self):
+        target = self._target(
+            attributes={
+                "Germany": {"Currency": "EUR", "Population": 85000000},
+                "France": {"Currency": "EUR", "Population": None},
+            }
+        )
+
+        diff = self.current.diff(target)
+
+        self.assertEqual({("Germany", "Population"): 85000000.0}, dict(diff.attribute_values))
+
+    def test_new_elements_and_edges(self):
+        element_types = dict(self.element_types, Italy="Numeric")
+        edges = dict(self.edges)
+        edges["Europe", "Italy"] = 1
+
+        diff = self.current.diff(self._target(element_types=element_types, edges=edges))
+
+        self.assertEqual({"Italy": "Numeric"}, dict(diff.elements_to_add))
+        self.assertEqual({("Europe", "Italy"): 1.0}, dict(diff.edges_to_add))
+        self.assertEqual([], diff.edges_to_delete)
+
+    def test_changed_weight_is_deleted_and_added(self):
+        edges = dict(self.edges)
+        edges["Europe", "France"] = 2
+
+        diff = self.current.diff(self._target(edges=edges))
+
+        self.assertEqual([("Europe", "France")], diff.edges_to_delete)
+        self.assertEqual({("Europe", "France"): 2.0}, dict(diff.edges_to_add))
+
+    def test_missing_edges_kept_without_unwind(self):
+        edges = dict(self.edges)
+        del edges["Total", "Old"]
+
+        self.assertFalse(self.current.diff(self._target(edges=edges)))
+
+    def test_unwind_all(self):
+        edges = dict(self.edges)
+        del edges["Total", "Old"]
+
+        diff = self.current.diff(self._target(edges=edges), unwind_all=True)
+
+        self.assertEqual([("Total", "Old")], diff.edges_to_delete)
+        self.assertEqual({}, dict(diff.edges_to_add))
+
+    def test_unwind_consolidations(self):
+        edges = dict(self.edges)
+        del edges["Total", "Old"]
+        del edges["Europe", "France"]
+
+        diff = self.current.diff(self._target(edges=edges), unwind_consolidations=["Europe", "Not Existing"])
+
+        self.assertEqual([("Europe", "France")], diff.edges_to_delete)
+
+    def test_delete_elements(self):
+        element_types = dict(self.element_types)
+        del element_types["Old"]
+        edges = dict(self.edges)
+        del edges["Total", "Old"]
+
+        diff = self.current.diff(self._target(element_types, edges), delete_elements=True, unwind_all=True)
+
+        self.assertEqual(["Old"], diff.elements_to_delete)
+        # edge disappears with the element
+        self.assertEqual([], diff.edges_to_delete)
+
+    def test_element_type_change(self):
+        element_types = dict(self.element_types, Old="String")
+
+        diff = self.current.diff(self._target(element_types=element_types))
+
+        self.assertEqual({"Old": "String"}, dict(diff.element_types_to_update))
+        self.assertNotEqual(self.current.digest("Old"), self._target(element_types=element_types).digest("Old"))
+
+    def test_from_hierarchy(self):
+        hierarchy = Hierarchy("Region", "Region")
+        for name, element_type in self.element_types.items():
+            hierarchy.add_element(name, element_type)
+        for (parent, component), weight in self.edges.items():
+            hierarchy.add_edge(parent, component, weight)
+        hierarchy.add_element_attribute("Population", "Numeric")
+
+        snapshot = HierarchySnapshot.from_hierarchy(hierarchy)
+
+        self.assertEqual(5, len(snapshot))
+        self.assertEqual("Consolidated", snapshot.element_type("total"))
+        self.assertEqual("Numeric", str(snapshot.attribute_types["Population"]))
+        self.assertFalse(snapshot.diff(HierarchySnapshot(self.element_types, self.edges), unwind_all=True))
+
+    def test_summary(self):
+        diff = HierarchyDiff()
+        diff.edges_to_delete.append(("Total", "Old"))
+
+        self.assertTrue(diff)
+        self.assertEqual(1, diff.summary["edges_to_delete"])
+        self.assertEqual(0, diff.summary["attribute_values"])
+
+
+if __name__ == "__main__":
+    unittest.main()
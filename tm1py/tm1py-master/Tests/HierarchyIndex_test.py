@@ -0,0 +1,209 @@
+import random
+import unittest
+
+from TM1py.Objects import Hierarchy
+from TM1py.Utils import HierarchyIndex
+
+
+class TestHierarchyIndex(unittest.TestCase):
+
+    def setUp(self):
+        # Total
+        #   Europe
+        #     Germany
+        #     France
+        #   America
+        #     USA
+        # Top Markets (alternate hierarchy)
+        #   Germany
+        #   USA (weight 2)
+        # Orphan
+        self.edges = {
+            ("Total", "Europe"): 1,
+            ("Total", "America"): 1,
+            ("Europe", "Germany"): 1,
+            ("Europe", "France"): 1,
+            ("America", "USA"): 1,
+            ("Top Markets", "Germany"): 1,
+            ("Top Markets", "USA"): 2,
+        }
+        self.element_types = {
+            "Total": "Consolidated",
+            "Europe": "Consolidated",
+            "America": "Consolidated",
+            "Top Markets": "Consolidated",
+            "Germany": "Numeric",
+            "France": "Numeric",
+            "USA": "Numeric",
+            "Orphan": "Numeric",
+        }
+        self.index = HierarchyIndex(edges=self.edges, element_types=self.element_types)
+
+    def test_is_ancestor(self):
+        self.assertTrue(self.index.is_ancestor("Total", "Germany"))
+        self.assertTrue(self.index.is_ancestor("total", "EUROPE"))
+        self.assertTrue(self.index.is_ancestor("TopMarkets", "USA"))
+        self.assertFalse(self.index.is_ancestor("Europe", "USA"))
+        self.assertFalse(self.index.is_ancestor("Top Markets", "France"))
+        self.assertFalse(self.index.is_ancestor("Germany", "Total"))
+        self.assertFalse(self.index.is_ancestor("Total", "Total"))
+        self.assertFalse(self.index.is_ancestor("Total", "Orphan"))
+        self.assertTrue(self.index.is_descendant("France", "Total"))
+
+    def test_is_ancestor_unknown_element(self):
+        self.assertFalse(self.index.is_ancestor("Total", "Not Existing"))
+        self.assertFalse(self.index.is_ancestor("Not Existing", "Germany"))
+
+    def test_leaves(self):
+        self.assertEqual({"Germany", "France", "USA"}, set(self.index.leaves("Total")))
+        self.assertEqual({"Germany", "USA"}, set(self.index.leaves("Top Markets")))
+        self.assertEqual(["Orphan"], self.index.leaves("Orphan"))
+
+    def test_descendants(self):
+        self.assertEqual({"Europe", "America", "Germany", "France", "USA"}, set(self.index.descendants("Total")))
+        self.assertEqual({"Germany", "France", "USA"}, set(self.index.descendants("Total", leaves_only=True)))
+        self.assertEqual([], self.index.descendants("Germany"))
+
+    def test_descendants_components_before_consolidations(self):
+        descendants = self.index.descendants("Total")
+        self.assertLess(descendants.index("Germany"), descendants.index("Europe"))
+        self.assertLess(descendants.index("USA"), descendants.index("America"))
+
+    def test_ancestors(self):
+        self.assertEqual({"Europe", "Total", "Top Markets"}, set(self.index.ancestors("Germany")))
+        self.assertEqual([], self.index.ancestors("Total"))
+
+    def test_children_and_parents(self):
+        self.assertEqual(["Europe", "America"], self.index.children("Total"))
+        self.assertEqual({"Europe", "Top Markets"}, set(self.index.parents("germany")))
+        self.assertTrue(self.index.is_parent("Europe", "Germany"))
+        self.assertFalse(self.index.is_parent("Total", "Germany"))
+
+    def test_unknown_element_raises(self):
+        with self.assertRaises(KeyError):
+            self.index.children("Not Existing")
+
+    def test_level_and_is_leaf(self):
+        self.assertEqual(2, self.index.level("Total"))
+        self.assertEqual(1, self.index.level("Top Markets"))
+        self.assertEqual(0, self.index.level("USA"))
+        self.assertTrue(self.index.is_leaf("Orphan"))
+        self.assertFalse(self.index.is_leaf("Europe"))
+
+    def test_empty_consolidation_is_not_a_leaf(self):
+        index = HierarchyIndex(element_types={"Empty": "Consolidated", "Leaf": "Numeric"})
+
+        self.assertFalse(index.is_leaf("Empty"))
+        self.assertEqual([], index.leaves("Empty"))
+
+    def test_edges_under(self):
+        edges = self.index.edges_under("Total")
+
+        self.assertEqual(5, len(edges))
+        self.assertEqual(1, edges["europe", "germany"])
+        self.assertNotIn(("Top Markets", "USA"), edges)
+
+    def test_weights(self):
+        self.assertEqual(2, self.index.weight("Top Markets", "USA"))
+        self.assertEqual({"Germany": 1, "USA": 2}, self.index.leaf_weights("Top Markets"))
+
+    def test_leaf_weights_multiple_paths(self):
+        index = HierarchyIndex(edges={("A", "B"): 2, ("A", "C"): 1, ("B", "D"): 3, ("C", "D"): -1})
+
+        self.assertEqual({"D": 5}, index.leaf_weights("A"))
+
+    def test_roll_up(self):
+        totals = self.index.roll_up({"Germany": 10, "France": 5, "USA": 1})
+
+        self.assertEqual(15, totals["Europe"])
+        self.assertEqual(16, totals["Total"])
+        self.assertEqual(12, totals["Top Markets"])
+
+    def test_common_ancestors(self):
+        self.assertEqual(["Total"], self.index.common_ancestors("France", "USA"))
+        self.assertEqual({"Total", "Top Markets"}, set(self.index.common_ancestors("Germany", "USA")))
+        self.assertEqual(["Europe"], self.index.lowest_common_ancestors("Germany", "France"))
+        self.assertEqual([], self.index.common_ancestors("Germany", "Orphan"))
+
+    def test_add_and_remove_edge(self):
+        self.index.add_edge("America", "Canada")
+        self.assertTrue(self.index.is_ancestor("Total", "Canada"))
+        self.assertEqual(0, self.index.level("Canada"))
+
+        self.index.remove_edge("Total", "America")
+        self.assertFalse(self.index.is_ancestor("Total", "Canada"))
+        self.assertFalse(self.index.is_ancestor("Total", "USA"))
+
+    def test_remove_element(self):
+        self.index.remove_element("Europe")
+
+        self.assertNotIn("Europe", self.index)
+        self.assertEqual(["USA"], self.index.leaves("Total"))
+        self.assertEqual(["Top Markets"], self.index.parents("Germany"))
+
+    def test_circular_reference(self):
+        index = HierarchyIndex(edges={("A", "B"): 1, ("B", "C"): 1})
+        index.add_edge("C", "B")
+
+        with self.assertRaises(ValueError):
+            index.is_ancestor("A", "C")
+
+    def test_refresh(self):
+        edges = dict(self.edges)
+        del edges["Top Markets", "USA"]
+        edges["America", "Canada"] = 1
+        element_types = dict(self.element_types)
+        element_types["Canada"] = "Numeric"
+        del element_types["Orphan"]
+
+        self.assertTrue(self.index.refresh(edges, element_types))
+        self.assertEqual(["Germany"], self.index.leaves("Top Markets"))
+        self.assertTrue(self.index.is_ancestor("Total", "Canada"))
+        self.assertNotIn("Orphan", self.index)
+
+        self.assertFalse(self.index.refresh(edges, element_types))
+
+    def test_from_hierarchy(self):
+        hierarchy = Hierarchy("Region", "Region")
+        for name, element_type in self.element_types.items():
+            hierarchy.add_element(name, element_type)
+        for (parent, component), weight in self.edges.items():
+            hierarchy.add_edge(parent, component, weight)
+
+        index = HierarchyIndex.from_hierarchy(hierarchy)
+
+        self.assertEqual(len(self.element_types), len(index))
+        self.assertTrue(index.is_ancestor("Total", "Germany"))
+        self.assertTrue(index.is_leaf("Orphan"))
+
+    def test_matches_naive_traversal(self):
+        random.seed(7)
+        edges = {}
+        for element in range(1, 300):
+            for parent in random.sample(range(element), min(element, random.randint(1, 3))):
+                edges[f"e{parent}", f"e{element}"] = 1
+        index = HierarchyIndex(edges=edges)
+
+        children = {}
+        for parent, component in edges:
+            children.setdefault(parent, []).append(component)
+
+        def descendants(name):
+            result, stack = set(), list(children.get(name, []))
+            while stack:
+                node = stack.pop()
+                if node not in result:
+                    result.add(node)
+                    stack.extend(children.get(node, []))
+            return result
+
+        for name in random.sample(index.element_names, 40):
+            expected = descendants(name)
+            self.assertEqual(expected, set(index.descendants(name)))
+            self.assertEqual({e for e in expected if e not in children}, set(index.descendants(name, True)))
+            for other in random.sample(index.element_names, 20):
+                self.assertEqual(other in expected, index.is_ancestor(name, other))
+
+
+if __name__ == "__main__":
+    unittest.main()
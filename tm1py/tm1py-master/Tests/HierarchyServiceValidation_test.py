@@ -0,0 +1,140 @@
+import unittest
+
+from TM1py.Services.HierarchyService import HierarchyService
+from TM1py.Utils.Utils import _has_pandas
+
+if _has_pandas:
+    import pandas as pd
+
+
+@unittest.skipIf(not _has_pandas, "requires pandas")
+class TestValidateEdges(unittest.TestCase):
+
+    def _validate(self, data, weights=None):
+        df = pd.DataFrame(data, columns=["Region", "level002", "level001", "level000"])
+        if weights is not None:
+            weights = pd.DataFrame(weights, columns=["level002_weight", "level001_weight", "level000_weight"])
+        HierarchyService._validate_edges(df, weights=weights)
+
+    def test_valid(self):
+        self._validate(
+            [
+                ["France", "Europe", "World", "Total"],
+                ["Germany", "Europe", "World", "Total"],
+                ["USA", "", "America", "Total"],
+                ["Total", None, None, None],
+            ]
+        )
+
+    def test_repeated_element_in_level_columns_is_ignored(self):
+        self._validate([["France", "France", "Europe", "Europe"]])
+
+    def test_circular_reference(self):
+        with self.assertRaises(ValueError) as error:
+            self._validate([["France", "Europe", "World", None], ["World", "Europe", None, None]])
+
+        self.assertIn("Circular reference found in edges", str(error.exception))
+        self.assertTrue(
+            any(
+                cycle in str(error.exception)
+                for cycle in ("['Europe', 'World', 'Europe']", "['World', 'Europe', 'World']")
+            )
+        )
+
+    def test_circular_reference_is_case_and_space_insensitive(self):
+        with self.assertRaises(ValueError):
+            self._validate([["France", "Europe", "World", None], ["world", "EU rope", None, None]])
+
+    def test_all_circular_references_are_reported(self):
+        with self.assertRaises(ValueError) as error:
+            self._validate(
+                [
+                    ["A", "B", "C", None],
+                    ["C", "A", None, None],
+                    ["X", "Y", None, None],
+                    ["Y", "X", None, None],
+                    ["Z", "Z1", None, None],
+                ]
+            )
+
+        self.assertIn("Circular references found in edges", str(error.exception))
+        self.assertIn("'X'", str(error.exception))
+        self.assertIn("'A'", str(error.exception))
+        self.assertNotIn("'Z'", str(error.exception))
+
+    def test_cycles_sharing_an_element(self):
+        with self.assertRaises(ValueError) as error:
+            self._validate(
+                [
+                    ["A", "B", None, None],
+                    ["B", "A", None, None],
+                    ["B", "C", None, None],
+                    ["C", "B", None, None],
+                ]
+            )
+
+        self.assertIn("Circular references found in edges", str(error.exception))
+        self.assertIn("'A'", str(error.exception))
+        self.assertIn("'C'", str(error.exception))
+
+    def test_deep_hierarchy_does_not_hit_recursion_limit(self):
+        data = [[f"e{i}", f"e{i + 1}", None, None] for i in range(5000)]
+        self._validate(data)
+
+        data.append(["e5000", "e0", None, None])
+        with self.assertRaises(ValueError):
+            self._validate(data)
+
+    def test_conflicting_weights(self):
+        with self.assertRaises(ValueError) as error:
+            self._validate(
+                [["France", "Europe", "World", None], ["Germany", "Europe", "World", None]],
+                weights=[[1, 1, 1], [1, 2, 1]],
+            )
+
+        self.assertIn("Edge 'World' -> 'Europe' found with different weights", str(error.exception))
+
+    def test_same_weights(self):
+        self._validate(
+            [["France", "Europe", "World", None], ["Germany", "Europe", "World", None]],
+            weights=[[1, 1, 1], [1, 1, 0]],
+        )
+
+
+@unittest.skipIf(not _has_pandas, "requires pandas")
+class TestValidateAliasUniqueness(unittest.TestCase):
+
+    def _validate(self, data):
+        HierarchyService._validate_alias_uniqueness(pd.DataFrame(data, columns=["Region", "Alias:a", "Code:a"]))
+
+    def test_valid(self):
+        self._validate(
+            [
+                ["Germany", "Deutschland", "DE"],
+                ["Germany", "Deutschland", "DE"],
+                ["France", "France", ""],
+                ["Italy", None, "IT"],
+            ]
+        )
+
+    def test_duplicate_alias(self):
+        with self.assertRaises(ValueError) as error:
+            self._validate([["Germany", "Deutschland", "DE"], ["Denmark", "Dänemark", "de"]])
+
+        self.assertIn("'de' used by ['Denmark', 'Germany']", str(error.exception))
+
+    def test_alias_equals_other_element_name(self):
+        with self.assertRaises(ValueError):
+            self._validate([["Germany", "France", ""], ["France", "Frankreich", "FR"]])
+
+    def test_all_conflicts_are_reported(self):
+        with self.assertRaises(ValueError) as error:
+            self._validate([["Germany", "X", "Y"], ["France", "x", "y"]])
+
+        self.assertIn("Invalid alias values found", str(error.exception))
+        self.assertIn("'x'", str(error.exception))
+        self.assertIn("'y'", str(error.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
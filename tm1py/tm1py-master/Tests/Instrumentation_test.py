@@ -0,0 +1,201 @@
+import pickle
+import random
+import unittest
+
+from TM1py.Exceptions import TM1pyRestException
+from TM1py.Utils.Instrumentation import Instrumentation, LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_quantiles_within_relative_error(self):
+        histogram = LatencyHistogram(precision_bits=5)
+        random.seed(42)
+        values = sorted(random.lognormvariate(-4, 2) for _ in range(10000))
+        for value in values:
+            histogram.record(value)
+
+        for q in (0.5, 0.9, 0.99):
+            expected = values[int(q * len(values)) - 1]
+            self.assertAlmostEqual(expected, histogram.quantile(q), delta=expected / 32 + 1e-6)
+
+        self.assertEqual(10000, histogram.count)
+        self.assertEqual(values[0], histogram.min)
+        self.assertEqual(values[-1], histogram.max)
+        self.assertEqual(values[-1], histogram.quantile(1))
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+
+        self.assertIsNone(histogram.quantile(0.5))
+        self.assertIsNone(histogram.mean)
+        self.assertEqual([], histogram.cumulative_buckets())
+
+    def test_quantile_invalid(self):
+        with self.assertRaises(ValueError):
+            LatencyHistogram().quantile(1.5)
+
+    def test_merge(self):
+        histogram1, histogram2 = LatencyHistogram(), LatencyHistogram()
+        histogram1.record(0.001)
+        histogram2.record(2)
+        histogram2.record(3)
+
+        histogram1.merge(histogram2)
+
+        self.assertEqual(3, histogram1.count)
+        self.assertEqual(0.001, histogram1.min)
+        self.assertEqual(3, histogram1.max)
+        self.assertEqual(3, histogram1.cumulative_buckets()[-1][1])
+
+    def test_merge_different_precision(self):
+        with self.assertRaises(ValueError):
+            LatencyHistogram(precision_bits=5).merge(LatencyHistogram(precision_bits=7))
+
+    def test_cumulative_buckets(self):
+        histogram = LatencyHistogram()
+        for value in (0.000001, 0.5, 0.5, 10):
+            histogram.record(value)
+
+        buckets = histogram.cumulative_buckets()
+
+        self.assertEqual([1, 3, 4], [count for _, count in buckets])
+        for (upper_bound, _), value in zip(buckets, (0.000001, 0.5, 10)):
+            self.assertGreater(upper_bound, value)
+            self.assertLess(upper_bound, value * 1.04 + 1e-6)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.records = []
+        self.instrumentation = Instrumentation(enabled=True, hooks=[self.records.append])
+
+    def tearDown(self):
+        del self.instrumentation
+
+    def _request(self, method, url, data="", status_code=200, bytes_received=10, server_time=0.0):
+        with self.instrumentation.track(method, url, data=data) as record:
+            record.set_response(status_code=status_code, bytes_received=bytes_received, server_time=server_time)
+
+    def test_track(self):
+        self._request("POST", "/Cubes('Sales')/tm1.Update", data="{'ä': 1}")
+        self._request("post", "http://localhost:8001/api/v1/Cubes('Plan')/tm1.Update?$select=Name")
+
+        endpoint = self.instrumentation.to_dict()["endpoints"]["POST /Cubes('')/tm1.Update"]
+        self.assertEqual(2, endpoint["requests"])
+        self.assertEqual({200: 2}, endpoint["status"])
+        self.assertEqual(len("{'ä': 1}".encode("utf-8")), endpoint["bytes_sent"])
+        self.assertEqual(20, endpoint["bytes_received"])
+        self.assertEqual(2, endpoint["duration"]["count"])
+        self.assertEqual(2, len(self.records))
+        self.assertEqual("POST /Cubes('')/tm1.Update", self.records[0].endpoint)
+
+    def test_server_and_transfer_time(self):
+        self._request("GET", "/Cubes", server_time=10)
+
+        record = self.records[0]
+        self.assertEqual(record.duration, record.server_time)
+        self.assertEqual(0, record.transfer_time)
+
+    def test_async_requests_mode_counts_as_server_time(self):
+        with self.instrumentation.track("POST", "/ExecuteMDX", async_requests_mode=True) as record:
+            record.set_response(status_code=201, server_time=0)
+
+        self.assertEqual(self.records[0].duration, self.records[0].server_time)
+
+    def test_error(self):
+        with self.assertRaises(TM1pyRestException):
+            with self.instrumentation.track("GET", "/Cubes('Nope')"):
+                raise TM1pyRestException("not found", status_code=404, reason="Not Found", headers={})
+
+        endpoint = self.instrumentation.to_dict()["endpoints"]["GET /Cubes('')"]
+        self.assertEqual(1, endpoint["errors"])
+        self.assertEqual({404: 1}, endpoint["status"])
+        self.assertEqual("TM1pyRestException", self.records[0].error)
+
+    def test_retries_and_reconnects(self):
+        with self.instrumentation.track("GET", "/Cubes") as record:
+            with self.instrumentation.track("GET", "/_async('1')"):
+                self.instrumentation.note_reconnect()
+            self.instrumentation.note_retry()
+            self.instrumentation.note_reconnect()
+            record.set_response(status_code=200)
+
+        self.assertEqual((0, 1), (self.records[0].retries, self.records[0].reconnects))
+        self.assertEqual((1, 1), (self.records[1].retries, self.records[1].reconnects))
+        self.assertEqual(1, self.instrumentation.to_dict()["endpoints"]["GET /Cubes"]["retries"])
+
+    def test_note_outside_of_request(self):
+        self.instrumentation.note_retry()
+        self.instrumentation.note_reconnect()
+
+        self.assertEqual({}, self.instrumentation.to_dict()["endpoints"])
+
+    def test_failing_hook_does_not_fail_request(self):
+        def hook(_):
+            raise RuntimeError("broken")
+
+        self.instrumentation.add_hook(hook)
+
+        with self.assertWarns(UserWarning):
+            self._request("GET", "/Cubes")
+        self.assertEqual(1, len(self.records))
+
+    def test_measure(self):
+        with self.instrumentation.measure("json"):
+            pass
+
+        self.assertEqual(1, self.instrumentation.to_dict()["client"]["json"]["count"])
+
+    def test_measure_disabled(self):
+        self.instrumentation.enabled = False
+
+        with self.instrumentation.measure("json"):
+            pass
+
+        self.assertEqual({}, self.instrumentation.to_dict()["client"])
+
+    def test_histogram(self):
+        self._request("GET", "/Cubes")
+
+        self.assertEqual(1, self.instrumentation.histogram("GET /Cubes", "server").count)
+        self.assertIsNone(self.instrumentation.histogram("GET /Dimensions"))
+        with self.assertRaises(ValueError):
+            self.instrumentation.histogram("GET /Cubes", "invalid")
+
+    def test_to_prometheus(self):
+        self._request("GET", "/Cubes('Sales')", status_code=200)
+        with self.instrumentation.measure("json"):
+            pass
+
+        text = self.instrumentation.to_prometheus()
+
+        self.assertIn("# TYPE tm1py_request_duration_seconds histogram", text)
+        self.assertIn('tm1py_request_duration_seconds_bucket{method="GET",endpoint="/Cubes(\'\')",le="+Inf"} 1', text)
+        self.assertIn('tm1py_requests_total{method="GET",endpoint="/Cubes(\'\')",status="200"} 1', text)
+        self.assertIn('tm1py_request_bytes_received_total{method="GET",endpoint="/Cubes(\'\')"} 10', text)
+        self.assertIn('tm1py_client_seconds_count{name="json"} 1', text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_reset(self):
+        self._request("GET", "/Cubes")
+
+        self.instrumentation.reset()
+
+        self.assertEqual({"endpoints": {}, "client": {}}, self.instrumentation.to_dict())
+
+    def test_pickle(self):
+        self._request("GET", "/Cubes")
+
+        instrumentation = pickle.loads(pickle.dumps(self.instrumentation))
+
+        self.assertEqual([], instrumentation.hooks)
+        self.assertEqual(1, instrumentation.to_dict()["endpoints"]["GET /Cubes"]["requests"])
+        with instrumentation.track("GET", "/Cubes") as record:
+            record.set_response(status_code=200)
+        self.assertEqual(2, instrumentation.to_dict()["endpoints"]["GET /Cubes"]["requests"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import gc
+import json
+import pickle
+import unittest
+import weakref
+
+from requests import Response
+
+from TM1py.Utils import Cellset, CellsetCell, JsonDecoder
+from TM1py.Utils.JsonDecoder import _has_msgspec, _has_orjson
+
+CELLSET = {
+    "@odata.context": "$metadata#Cellsets(Cube(Name,Dimensions(Name)),Axes(Tuples(Members(Name))),Cells(Value))/$entity",
+    "ID": "iAAAADrcHd8BMxm4",
+    "Cube": {"Name": "Sales", "Dimensions": [{"Name": "Version"}, {"Name": "Month"}]},
+    "Axes": [
+        {
+            "Ordinal": 0,
+            "Cardinality": 2,
+            "Tuples": [
+                {"Ordinal": 0, "Members": [{"Name": "Jan", "UniqueName": "[Month].[Month].[Jan]"}]},
+                {"Ordinal": 1, "Members": [{"Name": "Feb", "UniqueName": "[Month].[Month].[Feb]"}]},
+            ],
+        },
+        {
+            "Ordinal": 1,
+            "Cardinality": 1,
+            "Tuples": [{"Ordinal": 0, "Members": [{"Name": "Actual", "UniqueName": "[Version].[Version].[Actual]"}]}],
+        },
+    ],
+    "Cells": [
+        {"Ordinal": 0, "Value": 10, "RuleDerived": False},
+        {"Ordinal": 1, "Value": "text", "RuleDerived": True, "Status": "Data"},
+    ],
+}
+
+
+def _response(body: bytes, encoding: str = "utf-8") -> Response:
+    response = Response()
+    response._content = body
+    response.encoding = encoding
+    response.status_code = 200
+    return response
+
+
+class TestJsonDecoder(unittest.TestCase):
+
+    def _decoders(self):
+        installed = {"json": True, "orjson": _has_orjson, "msgspec": _has_msgspec}
+        return [JsonDecoder(library) for library, available in installed.items() if available]
+
+    def test_loads_matches_standard_library(self):
+        body = json.dumps({"value": [{"Name": "Ä €", "Weight": 1.5, "Level": 0, "Attributes": None}]})
+
+        for decoder in self._decoders():
+            self.assertEqual(json.loads(body), decoder.loads(body.encode("utf-8")), decoder.library)
+            self.assertEqual(json.loads(body), decoder.loads(body), decoder.library)
+
+    def test_invalid_json_raises_json_decode_error(self):
+        for decoder in self._decoders():
+            with self.assertRaises(json.JSONDecodeError, msg=decoder.library):
+                decoder.loads(b"{'no json'")
+
+    def test_auto(self):
+        expected = "orjson" if _has_orjson else "msgspec" if _has_msgspec else "json"
+
+        self.assertEqual(expected, JsonDecoder().library)
+
+    def test_invalid_library(self):
+        with self.assertRaises(ValueError):
+            JsonDecoder("simplejson")
+
+    def test_install(self):
+        decoder = JsonDecoder()
+        response = decoder.install(_response('{"value": "Ä"}'.encode("utf-8")))
+
+        self.assertEqual({"value": "Ä"}, response.json())
+        self.assertEqual({"value": "Ä"}, response.json(parse_float=str))
+
+    def test_install_other_encoding(self):
+        decoder = JsonDecoder()
+        response = decoder.install(_response('{"value": "Ä"}'.encode("latin-1"), encoding="latin-1"))
+
+        self.assertEqual({"value": "Ä"}, response.json())
+
+    def test_installed_response_is_not_kept_alive(self):
+        response = JsonDecoder().install(_response(b"{}"))
+        reference = weakref.ref(response)
+
+        del response
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_install_chained_json_call(self):
+        # e.g. `self._rest.POST(url=url).json()`: nothing else references the response
+        for decoder in self._decoders():
+            self.assertEqual({"ID": "1"}, decoder.install(_response(b'{"ID": "1"}')).json())
+
+    def test_installed_response_type(self):
+        decoder = JsonDecoder()
+        response = decoder.install(_response(b"{}"))
+
+        self.assertIsInstance(response, Response)
+        # subclass is created once per decoder
+        self.assertIs(type(response), type(decoder.install(_response(b"{}"))))
+
+    def test_pickle(self):
+        decoder = pickle.loads(pickle.dumps(JsonDecoder("json")))
+
+        self.assertEqual("json", decoder.library)
+        self.assertEqual([1], decoder.loads(b"[1]"))
+
+    def test_decode_cellset(self):
+        for decoder in self._decoders():
+            cellset = decoder.decode_cellset(json.dumps(CELLSET).encode("utf-8"))
+
+            self.assertIsInstance(cellset, Cellset)
+            self.assertEqual("Sales", cellset.Cube["Name"])
+            self.assertEqual(["Jan", "Feb"], [t.Members[0].Name for t in cellset.Axes[0].Tuples])
+            self.assertEqual("[Version].[Version].[Actual]", cellset.Axes[1].Tuples[0].Members[0].UniqueName)
+            self.assertIsNone(cellset.Axes[0].Tuples[0].Members[0].Attributes)
+            self.assertEqual([10, "text"], [cell.Value for cell in cellset.Cells])
+            self.assertEqual([False, True], [cell.RuleDerived for cell in cellset.Cells])
+            self.assertIsInstance(cellset.Cells[0], CellsetCell)
+
+    def test_cellset_pickle(self):
+        cellset = JsonDecoder().decode_cellset(json.dumps(CELLSET))
+
+        self.assertEqual(cellset, pickle.loads(pickle.dumps(cellset)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import json
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+from Tests.MockServer import MockTM1Server
+from TM1py import TM1Service
+from TM1py.Services import CellService
+from TM1py.Utils.LazyImport import LazyModule, is_installed, is_loaded, lazy_import
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_lazy_import_loads_on_attribute_access(self):
+        sys.modules.pop("colorsys", None)
+
+        colorsys = lazy_import("colorsys")
+
+        self.assertIsInstance(colorsys, LazyModule)
+        self.assertFalse(is_loaded("colorsys"))
+        self.assertEqual((0.0, 0.0, 1.0), colorsys.rgb_to_hsv(1, 1, 1))
+        self.assertTrue(is_loaded("colorsys"))
+        # attributes are copied on load
+        self.assertIn("rgb_to_hsv", vars(colorsys))
+
+    def test_lazy_import_returns_imported_module(self):
+        self.assertIs(json, lazy_import("json"))
+
+    def test_lazy_import_missing_module(self):
+        module = lazy_import("tm1py_missing_module")
+
+        with self.assertRaises(ImportError):
+            module.attribute
+
+    def test_is_installed(self):
+        self.assertTrue(is_installed("json"))
+        self.assertFalse(is_installed("tm1py_missing_module"))
+
+    def test_import_tm1py_defers_optional_dependencies(self):
+        script = (
+            "import sys, TM1py; "
+            "print([name for name in ('pandas', 'numpy', 'pyarrow', 'httpx', 'ijson') if name in sys.modules])"
+        )
+
+        output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True, capture_output=True, text=True)
+
+        self.assertEqual("[]", output.stdout.strip())
+
+
+class TestLazyServices(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3).start()
+        self.tm1 = TM1Service(**self.server.connection_parameters)
+
+    def tearDown(self):
+        self.tm1.logout()
+        self.server.stop()
+
+    def test_services_are_constructed_on_first_access(self):
+        self.assertNotIn("cells", vars(self.tm1))
+
+        cells = self.tm1.cells
+
+        self.assertIsInstance(cells, CellService)
+        self.assertIs(cells, self.tm1.cells)
+        self.assertIs(self.tm1.connection, cells._rest)
+
+    def test_services_can_be_replaced(self):
+        self.tm1.cells = "cells"
+
+        self.assertEqual("cells", self.tm1.cells)
+
+    def test_pickle(self):
+        self.tm1.dimensions.exists("Region")
+
+        tm1 = pickle.loads(pickle.dumps(self.tm1))
+
+        self.assertTrue(tm1.dimensions.exists("Region"))
+        self.assertIs(tm1.connection, tm1.cubes._rest)
+
+
+if __name__ == "__main__":
+    unittest.main()
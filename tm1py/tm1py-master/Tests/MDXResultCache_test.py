@@ -0,0 +1,259 @@
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+from Tests.MockServer import MockTM1Server
+from TM1py import TM1Service
+from TM1py.Utils import MDXResultCache
+
+MDX = "SELECT {[Month].[Month].Members} ON 0, {[Region].[Region].Members} ON 1 FROM [Sales]"
+
+
+class TestMDXResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MDXResultCache(max_size=3)
+        self.calls = 0
+
+    def _loader(self, value="value"):
+        def load():
+            self.calls += 1
+            return value
+
+        return load
+
+    def test_load_caches_value(self):
+        self.assertEqual("value", self.cache.load("key", ["Sales"], "t1", self._loader()))
+        self.assertEqual("value", self.cache.load("key", ["Sales"], "t1", self._loader()))
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(0.5, self.cache.hit_rate)
+
+    def test_hit_returns_fresh_object(self):
+        self.cache.load("key", ["Sales"], "t1", self._loader({"a": 1}))
+
+        value = self.cache.load("key", ["Sales"], "t1", self._loader({"a": 1}))
+        value["a"] = 2
+
+        self.assertEqual({"a": 1}, self.cache.load("key", ["Sales"], "t1", self._loader({"a": 1})))
+
+    def test_changed_token_reloads(self):
+        self.cache.load("key", ["Sales"], "t1", self._loader("old"))
+
+        self.assertEqual("new", self.cache.load("key", ["Sales"], "t2", self._loader("new")))
+        self.assertEqual(2, self.calls)
+        self.assertEqual(1, self.cache.stale)
+        self.assertEqual("new", self.cache.load("key", ["Sales"], "t2", self._loader("new")))
+
+    def test_lru_eviction(self):
+        for key in ("a", "b", "c"):
+            self.cache.load(key, ["Sales"], "t1", self._loader(key))
+        # touch a, so b is least recently used
+        self.cache.load("a", ["Sales"], "t1", self._loader("a"))
+        self.cache.load("d", ["Sales"], "t1", self._loader("d"))
+
+        self.assertEqual(3, len(self.cache))
+        self.assertFalse(self.cache.get("b", "t1")[0])
+        self.assertTrue(self.cache.get("a", "t1")[0])
+
+    def test_max_bytes(self):
+        cache = MDXResultCache(max_size=100, max_bytes=1000)
+        cache.set("small", ["Sales"], "t1", "x" * 400)
+        cache.set("other", ["Sales"], "t1", "x" * 400)
+        cache.set("too big", ["Sales"], "t1", "x" * 2000)
+        cache.set("third", ["Sales"], "t1", "x" * 400)
+
+        self.assertFalse(cache.get("too big", "t1")[0])
+        self.assertFalse(cache.get("small", "t1")[0])
+        self.assertLessEqual(cache.size_in_bytes, 1000)
+
+    def test_unpicklable_value_is_not_cached(self):
+        lock = threading.Lock()
+
+        self.assertIs(lock, self.cache.load("key", ["Sales"], "t1", self._loader(lock)))
+        self.assertEqual(0, len(self.cache))
+
+    def test_invalidate_cube(self):
+        self.cache.set("sales", ["Sales"], "t1", 1)
+        self.cache.set("plan", ["Plan"], "t1", 2)
+
+        self.cache.invalidate_cube(" sales")
+
+        self.assertFalse(self.cache.get("sales", "t1")[0])
+        self.assertTrue(self.cache.get("plan", "t1")[0])
+
+    def test_invalidate_from_transaction_log(self):
+        self.cache.set("sales", ["Sales"], "t1", 1)
+        self.cache.set("plan", ["Plan"], "t1", 2)
+
+        self.cache.invalidate_from_transaction_log([{"Cube": "Plan"}])
+        self.assertTrue(self.cache.get("sales", "t1")[0])
+        self.assertFalse(self.cache.get("plan", "t1")[0])
+
+        self.cache.invalidate_from_transaction_log([{"Cube": "}ElementAttributes_Region"}])
+        self.assertEqual(0, len(self.cache))
+
+    def test_invalidate_for_request(self):
+        self.cache.set("sales", ["Sales"], "t1", 1)
+        self.cache.set("plan", ["Plan"], "t1", 2)
+
+        self.cache.invalidate_for_request("GET", "/Cubes('Sales')/tm1.Update")
+        self.cache.invalidate_for_request("POST", "/Cubes('Sales')/Views('Default')/tm1.Execute")
+        self.assertEqual(2, len(self.cache))
+
+        self.cache.invalidate_for_request("POST", "/Cubes('Sales')/tm1.Update")
+        self.assertFalse(self.cache.get("sales", "t1")[0])
+        self.assertTrue(self.cache.get("plan", "t1")[0])
+
+        self.cache.invalidate_for_request("POST", "/Cubes('}ElementAttributes_Region')/tm1.Update")
+        self.assertEqual(0, len(self.cache))
+
+    def test_value_loaded_during_invalidation_is_not_cached(self):
+        def load():
+            self.cache.invalidate_cube("Sales")
+            return "value"
+
+        self.cache.load("key", ["Sales"], None, load)
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_nested_loads_are_bypassed(self):
+        def load():
+            self.assertTrue(self.cache.bypassed)
+            return "value"
+
+        self.assertFalse(self.cache.bypassed)
+        self.cache.load("key", ["Sales"], None, load)
+        self.assertFalse(self.cache.bypassed)
+
+    def test_disabled(self):
+        cache = MDXResultCache(enabled=False)
+        cache.load("key", ["Sales"], "t1", self._loader())
+        cache.load("key", ["Sales"], "t1", self._loader())
+
+        self.assertEqual(2, self.calls)
+        self.assertEqual(0, len(cache))
+
+    def test_normalize_mdx(self):
+        self.assertEqual(
+            MDXResultCache.normalize_mdx("SELECT {[d].[e]} ON 0 FROM [c] WHERE ([d2].[x])"),
+            MDXResultCache.normalize_mdx("\n  SELECT\n\t{[d].[e]}  ON 0\n FROM [c]\r\n WHERE ([d2].[x]) "),
+        )
+        self.assertNotEqual(
+            MDXResultCache.normalize_mdx("FILTER({}, [a].[b] = 'x  y')"),
+            MDXResultCache.normalize_mdx("FILTER({}, [a].[b] = 'x y')"),
+        )
+
+    def test_pickle(self):
+        self.cache.set("key", ["Sales"], "t1", 1)
+
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual((True, 1), cache.get("key", "t1"))
+
+
+class TestMDXResultCacheOnDisk(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = MDXResultCache(max_size=2, directory=self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _files(self):
+        return [file for file in os.listdir(self.directory.name) if file.endswith(MDXResultCache.FILE_SUFFIX)]
+
+    def test_set_and_get(self):
+        self.cache.set(("execute_mdx", "SELECT"), ["Sales"], ("t1", "s1"), {"a": [1, 2, 3]})
+
+        self.assertEqual((True, {"a": [1, 2, 3]}), self.cache.get(("execute_mdx", "SELECT"), ("t1", "s1")))
+        self.assertEqual(1, len(self._files()))
+
+    def test_entries_are_shared_across_instances(self):
+        self.cache.set("key", ["Sales"], "t1", "value")
+
+        cache = MDXResultCache(max_size=2, directory=self.directory.name)
+
+        self.assertEqual((True, "value"), cache.get("key", "t1"))
+        self.assertFalse(cache.get("key", "t2")[0])
+        # stale entry is removed from disk
+        self.assertEqual(0, len(self._files()))
+
+    def test_eviction_removes_files(self):
+        for key in ("a", "b", "c"):
+            self.cache.set(key, ["Sales"], "t1", key)
+
+        self.assertEqual(2, len(self._files()))
+        self.assertFalse(self.cache.get("a", "t1")[0])
+
+    @unittest.skipIf(not hasattr(os, "getuid"), "permission bits are not checked on Windows")
+    def test_shared_directory(self):
+        os.chmod(self.directory.name, 0o777)
+
+        with self.assertRaises(ValueError):
+            MDXResultCache(directory=self.directory.name)
+
+    @unittest.skipIf(not hasattr(os, "getuid"), "permission bits are not checked on Windows")
+    def test_new_directory_is_private(self):
+        directory = os.path.join(self.directory.name, "cache")
+
+        MDXResultCache(directory=directory)
+
+        self.assertEqual(0, os.stat(directory).st_mode & 0o077)
+
+    def test_invalidate_cube_removes_files(self):
+        self.cache.set("a", ["Sales"], "t1", "a")
+
+        self.cache.invalidate_cube("Sales")
+
+        self.assertEqual(0, len(self._files()))
+
+    def test_missing_file_is_a_miss(self):
+        self.cache.set("a", ["Sales"], "t1", "a")
+        for file in self._files():
+            os.remove(os.path.join(self.directory.name, file))
+
+        self.assertFalse(self.cache.get("a", "t1")[0])
+        self.assertEqual(0, len(self.cache))
+
+
+
+class TestMDXResultCacheInvalidation(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3).start()
+        self.tm1 = TM1Service(
+            **self.server.connection_parameters, mdx_result_cache=True, mdx_result_cache_check_cube_state=False
+        )
+        self.cache = self.tm1.mdx_result_cache
+
+    def tearDown(self):
+        self.tm1.logout()
+        self.server.stop()
+
+    def _assert_invalidates(self, write):
+        self.tm1.cells.execute_mdx_values(MDX)
+        self.assertEqual(1, len(self.cache))
+
+        write()
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_write_through_cellset(self):
+        self._assert_invalidates(lambda: self.tm1.cells.write("Sales", {("R0", "P0", "M01"): 5}))
+
+    def test_write_through_unbound_process(self):
+        self._assert_invalidates(lambda: self.tm1.cells.write("Sales", {("R0", "P0", "M01"): 5}, use_ti=True))
+
+    def test_write_values_through_cellset(self):
+        mdx = "SELECT {[Month].[M01]} ON 0, {[Region].[R0]} ON 1 FROM [Sales] WHERE ([Product].[P0])"
+        self._assert_invalidates(lambda: self.tm1.cells.write_values_through_cellset(mdx, [5]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import pickle
+import unittest
+from unittest.mock import patch
+
+from Tests.MockServer import MockTM1Server
+from TM1py import TM1Service
+from TM1py.Utils.MetadataCache import MetadataCache
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MetadataCache(ttl=300, max_size=3)
+        self.loads = 0
+
+    def tearDown(self):
+        del self.cache
+
+    def _loader(self, value):
+        def load():
+            self.loads += 1
+            return value
+
+        return load
+
+    def test_get_or_load(self):
+        key = (MetadataCache.CUBE, "Sales", "dimensions")
+        self.assertEqual(("d1", "d2"), self.cache.get_or_load(key, self._loader(("d1", "d2"))))
+        self.assertEqual(("d1", "d2"), self.cache.get_or_load(key, self._loader(("d1", "d2"))))
+
+        self.assertEqual(1, self.loads)
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_get_or_load_case_and_space_insensitive(self):
+        self.cache.get_or_load((MetadataCache.CUBE, "Sales Cube", "dimensions"), self._loader(1))
+        self.cache.get_or_load((MetadataCache.CUBE, "salescube", "dimensions"), self._loader(1))
+
+        self.assertEqual(1, self.loads)
+
+    def test_get_or_load_disabled(self):
+        cache = MetadataCache(enabled=False)
+        cache.get_or_load((MetadataCache.CUBE, "Sales", "dimensions"), self._loader(1))
+        cache.get_or_load((MetadataCache.CUBE, "Sales", "dimensions"), self._loader(1))
+
+        self.assertEqual(2, self.loads)
+        self.assertEqual(0, len(cache))
+
+    def test_ttl(self):
+        cache = MetadataCache(ttl=0)
+        cache.get_or_load((MetadataCache.CUBE, "Sales", "dimensions"), self._loader(1))
+        cache.get_or_load((MetadataCache.CUBE, "Sales", "dimensions"), self._loader(1))
+
+        self.assertEqual(2, self.loads)
+
+    def test_lru_eviction(self):
+        for cube in ("c1", "c2", "c3"):
+            self.cache.get_or_load((MetadataCache.CUBE, cube, "dimensions"), self._loader(cube))
+        # touch c1 so that c2 is least recently used
+        self.cache.get_or_load((MetadataCache.CUBE, "c1", "dimensions"), self._loader("c1"))
+        self.cache.get_or_load((MetadataCache.CUBE, "c4", "dimensions"), self._loader("c4"))
+
+        self.assertEqual(3, len(self.cache))
+        self.cache.get_or_load((MetadataCache.CUBE, "c1", "dimensions"), self._loader("c1"))
+        self.assertEqual(4, self.loads)
+        self.cache.get_or_load((MetadataCache.CUBE, "c2", "dimensions"), self._loader("c2"))
+        self.assertEqual(5, self.loads)
+
+    def test_invalidate_dimension(self):
+        self.cache.set((MetadataCache.DIMENSION, "Product", "edges", "Product"), {})
+        self.cache.set((MetadataCache.DIMENSION, "Region", "edges", "Region"), {})
+
+        self.cache.invalidate_dimension("PRODUCT")
+
+        self.assertEqual(1, len(self.cache))
+
+    def test_invalidate_for_request(self):
+        self.cache.set((MetadataCache.CUBE, "Sales", "dimensions"), ("Product",))
+        self.cache.set((MetadataCache.DIMENSION, "Product", "edges", "Product"), {})
+        self.cache.set((MetadataCache.DIMENSION, "Region", "edges", "Region"), {})
+
+        self.cache.invalidate_for_request("GET", "/Dimensions('Product')/Hierarchies('Product')")
+        self.cache.invalidate_for_request("POST", "/Cubes('Sales')/tm1.Update")
+        self.assertEqual(3, len(self.cache))
+
+        self.cache.invalidate_for_request("PATCH", "/Dimensions('Product')/Hierarchies('Product')")
+        self.assertEqual(2, len(self.cache))
+
+        self.cache.invalidate_for_request("POST", "/Cubes('}ElementAttributes_Region')/tm1.Update")
+        self.assertEqual(1, len(self.cache))
+
+        self.cache.invalidate_for_request("DELETE", "/Cubes('Sales')")
+        self.assertEqual(0, len(self.cache))
+
+    def test_invalidate_for_request_escaped_name(self):
+        self.cache.set((MetadataCache.DIMENSION, "O'Brien %", "edges", "O'Brien %"), {})
+
+        self.cache.invalidate_for_request("PATCH", "/Dimensions('O''Brien %25')")
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_invalidate_from_transaction_log(self):
+        self.cache.set((MetadataCache.CUBE, "Sales", "dimensions"), ("Product",))
+        self.cache.set((MetadataCache.DIMENSION, "Product", "principal_name", "Product", "p1"), "P1")
+
+        self.cache.invalidate_from_transaction_log([{"Cube": "Sales"}, {"Cube": "}ElementAttributes_Product"}])
+        self.assertEqual(1, len(self.cache))
+
+        self.cache.invalidate_from_transaction_log([{"Cube": "}CubeProperties"}])
+        self.assertEqual(0, len(self.cache))
+
+    def test_no_store_after_concurrent_invalidation(self):
+        key = (MetadataCache.CUBE, "Sales", "dimensions")
+
+        def load():
+            self.cache.invalidate_cube("Sales")
+            return ("Product",)
+
+        self.cache.get_or_load(key, load)
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_pickle(self):
+        self.cache.set((MetadataCache.CUBE, "Sales", "dimensions"), ("Product",))
+
+        cache = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(("Product",), cache.get_or_load((MetadataCache.CUBE, "Sales", "dimensions"), self._loader(1)))
+        self.assertEqual(0, self.loads)
+
+
+class TestMetadataCacheInvalidation(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3).start()
+        self.tm1 = TM1Service(**self.server.connection_parameters, metadata_cache=True)
+
+    def tearDown(self):
+        self.tm1.logout()
+        self.server.stop()
+
+    def test_read_during_write_is_not_cached(self):
+        cache = self.tm1.connection.metadata_cache
+        key = (MetadataCache.DIMENSION, "Region", "element_types")
+        execute = self.tm1.connection._execute_sync_request
+
+        def execute_with_concurrent_read(method, url, **kwargs):
+            if method.lower() == "patch":
+                # read of another thread, before the server applied the change
+                cache.get_or_load(key, lambda: "stale")
+            return execute(method=method, url=url, **kwargs)
+
+        hierarchy = self.tm1.hierarchies.get("Region", "Region")
+        with patch.object(self.tm1.connection, "_execute_sync_request", side_effect=execute_with_concurrent_read):
+            self.tm1.hierarchies.update(hierarchy)
+
+        self.assertEqual("fresh", cache.get_or_load(key, lambda: "fresh"))
+
+    def _assert_dimension_invalidated(self, update):
+        self.tm1.elements.get_element_types("Region", "Region")
+        self.assertEqual(1, len(self.tm1.connection.metadata_cache))
+
+        update()
+
+        self.assertEqual(0, len(self.tm1.connection.metadata_cache))
+
+    def test_add_edges_use_blob(self):
+        self._assert_dimension_invalidated(
+            lambda: self.tm1.elements.add_edges_use_blob("Region", "Region", {("Total Region", "R0"): 1})
+        )
+
+    def test_update_attribute_values_use_blob(self):
+        self._assert_dimension_invalidated(
+            lambda: self.tm1.elements.update_attribute_values_use_blob(
+                "Region", "Region", {("R0", "Description"): "Region 0"}
+            )
+        )
+
+    def test_delete_edges_use_ti(self):
+        self._assert_dimension_invalidated(
+            lambda: self.tm1.elements.delete_edges("Region", "Region", [("Total Region", "R0")], use_ti=True)
+        )
+
+    def test_delete_edges_use_blob(self):
+        self._assert_dimension_invalidated(
+            lambda: self.tm1.elements.delete_edges("Region", "Region", [("Total Region", "R0")], use_blob=True)
+        )
+
+    def test_element_is_ancestor_index(self):
+        edges = {("Total Region", "R0"): 1, ("Total Region", "R1"): 1}
+        with patch.object(self.tm1.elements, "get_edges", return_value=edges) as get_edges:
+            self.assertTrue(self.tm1.elements.element_is_ancestor("Region", "Region", "Total Region", "R0", "Index"))
+            self.assertFalse(self.tm1.elements.element_is_ancestor("Region", "Region", "R0", "R1", "Index"))
+            self.assertEqual(1, get_edges.call_count)
+
+            self.tm1.elements.delete_edges("Region", "Region", [("Total Region", "R0")], use_ti=True)
+            self.assertTrue(self.tm1.elements.element_is_ancestor("Region", "Region", "Total Region", "R0", "Index"))
+            self.assertEqual(2, get_edges.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,652 @@
+"""Offline stand-in for the TM1 REST API
+
+Implements the endpoints that TM1py uses most, so that TM1py can be tested and benchmarked without a TM1 server:
+
+- Login through `/Configuration/ProductVersion/$value`
+- `ExecuteMDX`, view execution and `Cellsets` with `$top`, `$skip` and the `Value ne 0` filter
+- Writes through `tm1.Update` and `Cellsets('id')/Cells`
+- `Contents` blob upload incl. multipart upload (MPU) and gzip encoded uploads
+- `ExecuteProcessWithReturn` and `Processes('name')/tm1.ExecuteWithReturn` (stubs: processes are recorded, not run)
+- `Dimensions`, `Hierarchies`, `Elements` and `ElementAttributes`
+- `Prefer: respond-async` with `_async('id')` polling in the v11 (raw HTTP body) and v12 (`asyncresult` header) flavour
+- OData `$batch` requests in the multipart format
+
+The server holds a single cube 'Sales' with the dimensions 'Region', 'Product' and 'Month'. The MDX is not evaluated:
+every cellset has the products (and their region) on rows and the months on columns.
+
+    with MockTM1Server(rows=10_000, columns=12, latency=0.005) as server:
+        with TM1Service(**server.connection_parameters) as tm1:
+            df = tm1.cells.execute_mdx_dataframe(mdx)
+"""
+
+import gzip
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+
+class MockTM1Model:
+    """State of the mock TM1 server"""
+
+    CUBE = "Sales"
+    ROW_DIMENSIONS = ("Region", "Product")
+    COLUMN_DIMENSION = "Month"
+
+    def __init__(
+        self,
+        rows: int = 100,
+        columns: int = 12,
+        regions: int = 10,
+        version: str = "11.8.02300.1",
+        latency: float = 0.0,
+        async_duration: float = 0.0,
+        zero_every: int = 0,
+        process_status: str = "CompletedSuccessfully",
+        batch: bool = True,
+    ):
+        """
+
+        :param rows: number of row tuples (products) in each cellset
+        :param columns: number of columns (months) in each cellset
+        :param regions: number of regions. Products are assigned to regions round robin
+        :param version: product version reported by the server. Versions >= 12 use `Files` and MPU for blobs
+        :param latency: seconds to wait before each response is sent
+        :param async_duration: seconds before the result of an async request (`Prefer: respond-async`) is ready
+        :param zero_every: every n-th cell is zero. 0 for no zeros
+        :param process_status: `ProcessExecuteStatusCode` returned for process executions
+        :param batch: whether `$batch` requests are supported
+        """
+        self.version = version
+        self.latency = latency
+        self.async_duration = async_duration
+        self.zero_every = zero_every
+        self.process_status = process_status
+        self.batch = batch
+
+        self.rows = [("R%d" % (i % regions), "P%d" % i) for i in range(rows)]
+        self.columns = ["M%02d" % (j + 1) for j in range(columns)]
+        self.hierarchies = {
+            "Region": self._build_hierarchy("Region", ["R%d" % i for i in range(regions)], "Total Region"),
+            "Product": self._build_hierarchy("Product", [product for _, product in self.rows], "Total Product"),
+            "Month": self._build_hierarchy("Month", self.columns, "Year"),
+        }
+
+        self.cellsets: Dict[str, str] = dict()
+        self.files: Dict[str, bytes] = dict()
+        self.uploads: Dict[str, Dict[int, bytes]] = dict()
+        self.async_results: Dict[str, Tuple[float, int, Dict, bytes]] = dict()
+        # recorded requests and payloads
+        self.requests: List[Tuple[str, str]] = list()
+        self.updates: List = list()
+        self.processes: List[Dict] = list()
+        self.logins = 0
+        self.session_expired = False
+
+        self._lock = threading.Lock()
+        self._cellset_bodies: Dict[str, bytes] = dict()
+
+    @staticmethod
+    def _build_hierarchy(name: str, leaves: List[str], consolidation: str) -> Dict:
+        elements = [{"Name": leaf, "Type": "Numeric", "Level": 0} for leaf in leaves]
+        elements.append({"Name": consolidation, "Type": "Consolidated", "Level": 1})
+        return {
+            "Name": name,
+            "UniqueName": f"[{name}].[{name}]",
+            "Elements": elements,
+            "Edges": [{"ParentName": consolidation, "ComponentName": leaf, "Weight": 1} for leaf in leaves],
+            "ElementAttributes": [{"Name": "Description", "Type": "String"}],
+            "Subsets": [],
+            "DefaultMember": None,
+        }
+
+    @property
+    def cells(self) -> int:
+        return len(self.rows) * len(self.columns)
+
+    def value(self, ordinal: int) -> float:
+        if self.zero_every and ordinal % self.zero_every == 0:
+            return 0
+        return ordinal * 1.5
+
+    def expire_session(self):
+        """Answer the next request of a logged in client with 401, like TM1 after a session timeout"""
+        self.session_expired = True
+
+    def cellset_body(self, query: str) -> bytes:
+        """Cellset JSON without the ID. Rendered once per query, so the server is not the bottleneck in benchmarks"""
+        with self._lock:
+            body = self._cellset_bodies.get(query)
+        if body is None:
+            body = json.dumps(self._render_cellset(query), separators=(",", ":")).encode("utf-8")
+            with self._lock:
+                self._cellset_bodies[query] = body
+        return body
+
+    def _render_cellset(self, query: str) -> Dict:
+        cellset = dict()
+        if _segment(query, "Cube") is not None:
+            dimensions = list(self.ROW_DIMENSIONS) + [self.COLUMN_DIMENSION]
+            cellset["Cube"] = {"Name": self.CUBE, "Dimensions": [{"Name": name} for name in dimensions]}
+
+        axes_query = _segment(query, "Axes")
+        if axes_query is not None:
+            tuples_query = _segment(axes_query, "Tuples") or ""
+            members_query = _segment(tuples_query, "Members")
+            if members_query is not None:
+                tuples_query = tuples_query.replace(f"Members({members_query})", "")
+            top_tuples = re.search(r"\$top=(\d+)", tuples_query)
+            axes = list()
+            for ordinal, dimensions, tuples in (
+                (0, [self.COLUMN_DIMENSION], [(column,) for column in self.columns]),
+                (1, list(self.ROW_DIMENSIONS), self.rows),
+            ):
+                axis = {"Ordinal": ordinal, "Cardinality": len(tuples)}
+                if "Hierarchies" in axes_query:
+                    axis["Hierarchies"] = [
+                        {"Name": name, "UniqueName": f"[{name}].[{name}]", "Dimension": {"Name": name}}
+                        for name in dimensions
+                    ]
+                if "Tuples" in axes_query:
+                    if top_tuples:
+                        tuples = tuples[: int(top_tuples.group(1))]
+                    axis["Tuples"] = [
+                        {"Ordinal": i, "Members": [self._member(name, element) for name, element in zip(dimensions, t)]}
+                        for i, t in enumerate(tuples)
+                    ]
+                axes.append(axis)
+            cellset["Axes"] = axes
+
+        cells_query = _segment(query, "Cells")
+        if cells_query is not None:
+            cellset["Cells"] = self.render_cells(cells_query)
+        return cellset
+
+    def _member(self, dimension: str, element: str) -> Dict:
+        unique_name = f"[{dimension}].[{dimension}].[{element}]"
+        return {
+            "Name": element,
+            "UniqueName": unique_name,
+            "Attributes": {"Description": element},
+            "Element": {"Name": element, "UniqueName": unique_name, "Type": "Numeric"},
+        }
+
+    def render_cells(self, cells_query: str) -> List[Dict]:
+        select = re.search(r"\$select=([^;&)]+)", cells_query)
+        properties = select.group(1).split(",") if select else ["Ordinal", "Value"]
+        top = re.search(r"\$top=(\d+)", cells_query)
+        skip = re.search(r"\$skip=(\d+)", cells_query)
+        skip_zeros = "Value ne 0" in cells_query
+
+        start = int(skip.group(1)) if skip else 0
+        stop = min(self.cells, start + int(top.group(1))) if top else self.cells
+        cells = list()
+        for ordinal in range(start, stop):
+            value = self.value(ordinal)
+            if skip_zeros and not value:
+                continue
+            cell = {
+                "Ordinal": ordinal,
+                "Value": value,
+                "FormattedValue": str(value),
+                "Updateable": 258,
+                "RuleDerived": False,
+                "Consolidated": False,
+                "Annotated": False,
+                "HasPicklist": False,
+            }
+            cells.append({name: cell.get(name) for name in properties})
+        return cells
+
+
+def _segment(query: str, name: str) -> Optional[str]:
+    """Content of the parentheses after `name` in an OData $expand, e.g. _segment('Cells($top=2)', 'Cells')"""
+    match = re.search(r"(?<![A-Za-z])" + name + r"\(", query)
+    if not match:
+        return None
+    depth = 0
+    for position in range(match.end() - 1, len(query)):
+        if query[position] == "(":
+            depth += 1
+        elif query[position] == ")":
+            depth -= 1
+            if depth == 0:
+                return query[match.end() : position]
+    return query[match.end() :]
+
+
+def _raw_http_response(status: int, headers: Dict, body: bytes) -> bytes:
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}"]
+    lines += [f"{key}: {value}" for key, value in headers.items()]
+    lines += [f"Content-Length: {len(body)}", "", ""]
+    return "\r\n".join(lines).encode("utf-8") + body
+
+
+_REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found"}
+
+_NAME = r"\('(?P<{}>(?:[^']|'')+)'\)"
+_CONTENTS = r"/Contents\('(?:Blobs|Files)'\)/Contents" + _NAME.format("file")
+_HIERARCHY = r"/Dimensions" + _NAME.format("dimension") + r"/Hierarchies" + _NAME.format("hierarchy")
+
+
+class MockTM1RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately. Without TCP_NODELAY every response waits for the delayed ACK
+    disable_nagle_algorithm = True
+    model: MockTM1Model = None
+
+    # (method, path pattern, handler). Paths are relative to /api/v1 and without query
+    ROUTES = [
+        ("GET", r"/Configuration/ProductVersion/\$value", "get_product_version"),
+        ("POST", r"/ActiveSession/tm1\.Close", "no_content"),
+        ("GET", r"/ActiveUser/Groups", "get_active_user_groups"),
+        ("GET", r"/ActiveConfiguration/Administration/DisableSandboxing", "get_disable_sandboxing"),
+        ("GET", r"/_async" + _NAME.format("id"), "get_async_result"),
+        ("DELETE", r"/_async" + _NAME.format("id"), "delete_async_result"),
+        ("POST", r"/ExecuteMDX", "create_cellset"),
+        (
+            "POST",
+            r"/Cubes" + _NAME.format("cube") + r"/(?:Private)?Views" + _NAME.format("view") + r"/tm1\.Execute",
+            "create_cellset",
+        ),
+        ("GET", r"/Cellsets" + _NAME.format("id") + r"/Cells/\$count", "get_cell_count"),
+        ("GET", r"/Cellsets" + _NAME.format("id"), "get_cellset"),
+        ("PATCH", r"/Cellsets" + _NAME.format("id") + r"/Cells", "update_cells"),
+        ("POST", r"/Cellsets" + _NAME.format("id") + r"/tm1\.Update", "update_cells"),
+        ("DELETE", r"/Cellsets" + _NAME.format("id"), "delete_cellset"),
+        ("POST", r"/Cubes" + _NAME.format("cube") + r"/tm1\.Update", "update_cells"),
+        ("GET", r"/Cubes" + _NAME.format("cube") + r"/Dimensions", "get_cube_dimensions"),
+        ("GET", r"/Dimensions", "get_dimensions"),
+        ("GET", r"/Dimensions" + _NAME.format("dimension"), "get_dimension"),
+        ("GET", r"/Dimensions" + _NAME.format("dimension") + r"/Hierarchies", "get_hierarchies"),
+        ("GET", _HIERARCHY, "get_hierarchy"),
+        ("PATCH", _HIERARCHY, "update_hierarchy"),
+        ("GET", _HIERARCHY + r"/Elements", "get_elements"),
+        ("GET", _HIERARCHY + r"/Elements/\$count", "get_element_count"),
+        ("GET", _HIERARCHY + r"/ElementAttributes", "get_element_attributes"),
+        ("POST", _HIERARCHY + r"/ElementAttributes", "create_element_attribute"),
+        ("DELETE", _HIERARCHY + r"/ElementAttributes" + _NAME.format("attribute"), "delete_element_attribute"),
+        ("POST", r"/Contents\('(?:Blobs|Files)'\)/Contents", "create_file"),
+        ("GET", _CONTENTS, "get_file"),
+        ("DELETE", _CONTENTS, "delete_file"),
+        ("GET", _CONTENTS + r"/Content", "get_file_content"),
+        ("PUT", _CONTENTS + r"/Content", "put_file_content"),
+        ("POST", _CONTENTS + r"/Content/mpu\.CreateMultipartUpload", "create_multipart_upload"),
+        ("POST", _CONTENTS + r"/Content/!uploads" + _NAME.format("upload") + r"/Parts", "upload_part"),
+        ("POST", _CONTENTS + r"/Content/!uploads" + _NAME.format("upload") + r"/mpu\.Complete", "complete_upload"),
+        ("POST", r"/\$batch", "batch"),
+        ("POST", r"/ExecuteProcessWithReturn", "execute_process"),
+        ("POST", r"/Processes" + _NAME.format("process") + r"/tm1\.ExecuteWithReturn", "execute_process"),
+    ]
+    _ROUTES = [(method, re.compile(pattern + "$"), handler) for method, pattern, handler in ROUTES]
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        path, _, query = self.path.partition("?")
+        path = unquote(path)
+        if path.startswith("/api/v1"):
+            path = path[len("/api/v1") :]
+        query = unquote(query)
+        body = self._read_body()
+        self.model.requests.append((method, path + ("?" + query if query else "")))
+
+        if self.model.latency:
+            time.sleep(self.model.latency)
+
+        if self.headers.get("Authorization"):
+            self.model.logins += 1
+            self.model.session_expired = False
+        elif self.model.session_expired:
+            self.model.session_expired = False
+            return self._send(401, {"error": {"code": "401", "message": "Session expired"}})
+
+        handler, status, body, headers = self._route(method, path, query, body)
+        if self.headers.get("Prefer") == "respond-async" and handler and not handler.endswith("async_result"):
+            return self._respond_async(status, headers, body)
+        self._send(status, body, headers)
+
+    def _route(self, method: str, path: str, query: str, body: bytes) -> Tuple[Optional[str], int, object, Dict]:
+        for route_method, pattern, handler in self._ROUTES:
+            match = pattern.match(path) if route_method == method else None
+            if match:
+                arguments = {key: value.replace("''", "'") for key, value in match.groupdict().items()}
+                break
+        else:
+            return None, 404, {"error": {"code": "278", "message": f"Resource '{path}' not found"}}, None
+
+        try:
+            status, body, headers = getattr(self, handler)(query=query, body=body, **arguments)
+        except Exception as e:
+            status, body, headers = 500, {"error": {"code": "500", "message": f"{type(e).__name__}: {e}"}}, None
+        return handler, status, body, headers
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = list()
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+                if not size:
+                    break
+            body = b"".join(chunks)
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+        return body
+
+    @staticmethod
+    def _encode(body, headers: Dict) -> Tuple[bytes, Dict]:
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode("utf-8")
+        headers = dict(headers or {})
+        if body and "Content-Type" not in headers:
+            headers["Content-Type"] = "application/json; charset=utf-8"
+        return body, headers
+
+    def _send(self, status: int, body=b"", headers: Dict = None):
+        body, headers = self._encode(body, headers)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _respond_async(self, status: int, headers: Dict, body):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode("utf-8")
+        async_id = uuid.uuid4().hex
+        self.model.async_results[async_id] = (time.monotonic() + self.model.async_duration, status, headers or {}, body)
+        self._send(202, headers={"Location": f"/api/v1/_async('{async_id}')"})
+
+    def get_async_result(self, id: str, **kwargs):
+        if id not in self.model.async_results:
+            return 404, {"error": {"code": "278", "message": f"Async operation '{id}' not found"}}, None
+        ready_at, status, headers, body = self.model.async_results[id]
+        if time.monotonic() < ready_at:
+            return 202, b"", None
+        del self.model.async_results[id]
+        if self.model.version.startswith("11"):
+            # TM1 11 returns the complete HTTP response of the operation as body
+            headers = {"Content-Type": "application/json; charset=utf-8", **headers} if body else headers
+            return 200, _raw_http_response(status, headers, body), {"Content-Type": "application/octet-stream"}
+        return 200, body, {**headers, "asyncresult": f"{status} {_REASONS.get(status, 'OK')}"}
+
+    def delete_async_result(self, id: str, **kwargs):
+        self.model.async_results.pop(id, None)
+        return 204, b"", None
+
+    def no_content(self, **kwargs):
+        return 204, b"", None
+
+    def get_product_version(self, **kwargs):
+        headers = {"Content-Type": "text/plain"}
+        if "TM1SessionId" not in (self.headers.get("Cookie") or ""):
+            headers["Set-Cookie"] = f"TM1SessionId={uuid.uuid4().hex}; Path=/api/; HttpOnly"
+        return 200, self.model.version.encode("utf-8"), headers
+
+    def get_active_user_groups(self, **kwargs):
+        return 200, {"value": [{"Name": "ADMIN"}]}, None
+
+    def get_disable_sandboxing(self, **kwargs):
+        return 200, {"value": False}, None
+
+    def create_cellset(self, body: bytes, **kwargs):
+        cellset_id = uuid.uuid4().hex[:16]
+        self.model.cellsets[cellset_id] = json.loads(body).get("MDX") if body else kwargs.get("view")
+        return 201, {"ID": cellset_id}, None
+
+    def get_cellset(self, id: str, query: str, **kwargs):
+        if id not in self.model.cellsets:
+            return 404, {"error": {"code": "278", "message": f"Cellset '{id}' not found"}}, None
+        body = self.model.cellset_body(query)
+        return 200, b'{"ID":"' + id.encode("utf-8") + b'"' + (b"," + body[1:] if len(body) > 2 else b"}"), None
+
+    def get_cell_count(self, **kwargs):
+        return 200, str(self.model.cells).encode("utf-8"), {"Content-Type": "text/plain"}
+
+    def delete_cellset(self, id: str, **kwargs):
+        self.model.cellsets.pop(id, None)
+        return 204, b"", None
+
+    def update_cells(self, body: bytes, **kwargs):
+        self.model.updates.append(json.loads(body))
+        return 204, b"", None
+
+    def get_cube_dimensions(self, cube: str, **kwargs):
+        if cube.lower() != self.model.CUBE.lower():
+            return 404, {"error": {"code": "278", "message": f"Cube '{cube}' not found"}}, None
+        dimensions = list(self.model.ROW_DIMENSIONS) + [self.model.COLUMN_DIMENSION]
+        return 200, {"value": [{"Name": name} for name in dimensions]}, None
+
+    def get_dimensions(self, **kwargs):
+        return 200, {"value": [{"Name": name} for name in self.model.hierarchies]}, None
+
+    def _hierarchy(self, dimension: str, hierarchy: str = None) -> Optional[Dict]:
+        hierarchy_body = self.model.hierarchies.get(dimension)
+        if hierarchy_body is None or hierarchy is not None and hierarchy.lower() != dimension.lower():
+            return None
+        return hierarchy_body
+
+    def get_dimension(self, dimension: str, **kwargs):
+        hierarchy = self._hierarchy(dimension)
+        if hierarchy is None:
+            return 404, {"error": {"code": "278", "message": f"Dimension '{dimension}' not found"}}, None
+        return 200, {"Name": dimension, "UniqueName": f"[{dimension}]", "Hierarchies": [hierarchy]}, None
+
+    def get_hierarchies(self, dimension: str, **kwargs):
+        hierarchy = self._hierarchy(dimension)
+        if hierarchy is None:
+            return 404, {"error": {"code": "278", "message": f"Dimension '{dimension}' not found"}}, None
+        return 200, {"value": [{"Name": hierarchy["Name"]}]}, None
+
+    def get_hierarchy(self, dimension: str, hierarchy: str, **kwargs):
+        hierarchy_body = self._hierarchy(dimension, hierarchy)
+        if hierarchy_body is None:
+            return 404, {"error": {"code": "278", "message": f"Hierarchy '{hierarchy}' not found"}}, None
+        return 200, hierarchy_body, None
+
+    def update_hierarchy(self, dimension: str, hierarchy: str, body: bytes, **kwargs):
+        hierarchy_body = self._hierarchy(dimension, hierarchy)
+        if hierarchy_body is None:
+            return 404, {"error": {"code": "278", "message": f"Hierarchy '{hierarchy}' not found"}}, None
+        update = json.loads(body)
+        if "Elements" in update:
+            hierarchy_body["Elements"] = [
+                {
+                    "Name": element["Name"],
+                    "Type": element["Type"],
+                    "Level": 0 if element["Type"] != "Consolidated" else 1,
+                }
+                for element in update["Elements"]
+            ]
+        if "Edges" in update:
+            hierarchy_body["Edges"] = update["Edges"]
+        return 204, b"", None
+
+    def get_elements(self, dimension: str, hierarchy: str, query: str, **kwargs):
+        hierarchy_body = self._hierarchy(dimension, hierarchy)
+        if hierarchy_body is None:
+            return 404, {"error": {"code": "278", "message": f"Hierarchy '{hierarchy}' not found"}}, None
+        select = re.search(r"\$select=([^&]+)", query)
+        elements = hierarchy_body["Elements"]
+        if select:
+            properties = select.group(1).split(",")
+            elements = [{name: element.get(name) for name in properties} for element in elements]
+        return 200, {"value": elements}, None
+
+    def get_element_count(self, dimension: str, hierarchy: str, **kwargs):
+        hierarchy_body = self._hierarchy(dimension, hierarchy)
+        if hierarchy_body is None:
+            return 404, {"error": {"code": "278", "message": f"Hierarchy '{hierarchy}' not found"}}, None
+        return 200, str(len(hierarchy_body["Elements"])).encode("utf-8"), {"Content-Type": "text/plain"}
+
+    def get_element_attributes(self, dimension: str, hierarchy: str, **kwargs):
+        hierarchy_body = self._hierarchy(dimension, hierarchy)
+        if hierarchy_body is None:
+            return 404, {"error": {"code": "278", "message": f"Hierarchy '{hierarchy}' not found"}}, None
+        return 200, {"value": hierarchy_body["ElementAttributes"]}, None
+
+    def create_element_attribute(self, dimension: str, hierarchy: str, body: bytes, **kwargs):
+        attribute = json.loads(body)
+        self._hierarchy(dimension, hierarchy)["ElementAttributes"].append(
+            {"Name": attribute["Name"], "Type": attribute["Type"]}
+        )
+        return 201, b"", None
+
+    def delete_element_attribute(self, dimension: str, hierarchy: str, attribute: str, **kwargs):
+        hierarchy_body = self._hierarchy(dimension, hierarchy)
+        hierarchy_body["ElementAttributes"] = [
+            element_attribute
+            for element_attribute in hierarchy_body["ElementAttributes"]
+            if element_attribute["Name"].lower() != attribute.lower()
+        ]
+        return 204, b"", None
+
+    def create_file(self, body: bytes, **kwargs):
+        self.model.files[json.loads(body)["Name"]] = b""
+        return 201, b"", None
+
+    def get_file(self, file: str, **kwargs):
+        if file not in self.model.files:
+            return 404, {"error": {"code": "278", "message": f"File '{file}' not found"}}, None
+        return 200, {"ID": file, "Name": file}, None
+
+    def delete_file(self, file: str, **kwargs):
+        if self.model.files.pop(file, None) is None:
+            return 404, {"error": {"code": "278", "message": f"File '{file}' not found"}}, None
+        return 204, b"", None
+
+    def get_file_content(self, file: str, **kwargs):
+        if file not in self.model.files:
+            return 404, {"error": {"code": "278", "message": f"File '{file}' not found"}}, None
+        return 200, self.model.files[file], {"Content-Type": "application/octet-stream"}
+
+    def put_file_content(self, file: str, body: bytes, **kwargs):
+        if self.headers.get("Content-Encoding") == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except OSError:
+                return 400, {"error": {"code": "400", "message": "Content is not gzip encoded"}}, None
+        self.model.files[file] = body
+        return 204, b"", None
+
+    def create_multipart_upload(self, file: str, **kwargs):
+        upload_id = uuid.uuid4().hex
+        self.model.uploads[upload_id] = dict()
+        return 201, {"UploadID": upload_id}, None
+
+    def upload_part(self, upload: str, body: bytes, **kwargs):
+        parts = self.model.uploads[upload]
+        with self.model._lock:
+            part_number = len(parts) + 1
+            parts[part_number] = body
+        return 201, {"PartNumber": part_number, "@odata.etag": f'W/"{part_number}"'}, None
+
+    def complete_upload(self, file: str, upload: str, body: bytes, **kwargs):
+        parts = self.model.uploads.pop(upload)
+        self.model.files[file] = b"".join(parts[part["PartNumber"]] for part in json.loads(body)["Parts"])
+        return 204, b"", None
+
+    def batch(self, body: bytes, **kwargs):
+        if not self.model.batch:
+            return 404, {"error": {"code": "278", "message": "Resource '$batch' not found"}}, None
+        boundary = re.search(r'boundary="?([^";]+)"?', self.headers.get("Content-Type", "")).group(1)
+        response_boundary = f"batchresponse_{uuid.uuid4()}"
+
+        parts = list()
+        for part in (b"\r\n" + body).split(b"\r\n--" + boundary.encode("utf-8"))[1:-1]:
+            mime_headers, _, request = part.lstrip(b"\r\n").partition(b"\r\n\r\n")
+            head, _, request_body = request.partition(b"\r\n\r\n")
+            method, target, _ = head.split(b"\r\n")[0].decode("utf-8").split(" ", 2)
+            path, _, query = target.partition("?")
+            path, query = unquote(path), unquote(query)
+            if path.startswith("/api/v1"):
+                path = path[len("/api/v1") :]
+            self.model.requests.append((method, path + ("?" + query if query else "")))
+
+            _, status, response_body, headers = self._route(method, path, query, request_body)
+            response_body, headers = self._encode(response_body, headers)
+            content_id = re.search(rb"(?im)^Content-ID:\s*(\S+)", mime_headers)
+            lines = [f"--{response_boundary}", "Content-Type: application/http", "Content-Transfer-Encoding: binary"]
+            if content_id:
+                lines.append(f"Content-ID: {content_id.group(1).decode('utf-8')}")
+            lines += ["", ""]
+            parts.append("\r\n".join(lines).encode("utf-8") + _raw_http_response(status, headers, response_body))
+
+        body = b"\r\n".join(parts) + f"\r\n--{response_boundary}--\r\n".encode("utf-8")
+        return 200, body, {"Content-Type": f"multipart/mixed; boundary={response_boundary}"}
+
+    def execute_process(self, body: bytes, process: str = None, **kwargs):
+        self.model.processes.append(json.loads(body).get("Process", {"Name": process}) if body else {"Name": process})
+        return 201, {"ProcessExecuteStatusCode": self.model.process_status, "ErrorLogFile": None}, None
+
+
+class _ThreadingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # parallel clients open many connections at once. With the default backlog of 5, connects time out and retry
+    request_queue_size = 128
+
+
+class MockTM1Server:
+    """Runs a `MockTM1RequestHandler` on a free local port in a background thread"""
+
+    def __init__(self, model: MockTM1Model = None, **kwargs):
+        """
+
+        :param model: MockTM1Model. If not provided, a model is built from kwargs
+        :param kwargs: arguments for MockTM1Model
+        """
+        self.model = model or MockTM1Model(**kwargs)
+        self._server = None
+        self._thread = None
+
+    def start(self) -> "MockTM1Server":
+        handler = type("Handler", (MockTM1RequestHandler,), {"model": self.model})
+        self._server = _ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def connection_parameters(self) -> Dict:
+        """Arguments for TM1Service"""
+        return {"address": "127.0.0.1", "port": self.port, "ssl": False, "user": "admin", "password": "apple"}
+
+    def __enter__(self) -> "MockTM1Server":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,197 @@
+import gzip
+import time
+import unittest
+
+import pandas as pd
+
+from Tests.Benchmarks import compare, run_benchmarks
+from Tests.MockServer import MockTM1Server
+from TM1py import TM1Service
+from TM1py.Objects import Process
+
+MDX = (
+    "SELECT {[Month].[Month].Members} ON 0, {[Region].[Region].Members * [Product].[Product].Members} ON 1 FROM [Sales]"
+)
+
+
+class TestMockServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockTM1Server(rows=5, columns=3).start()
+        self.tm1 = TM1Service(**self.server.connection_parameters)
+
+    def tearDown(self):
+        self.tm1.logout()
+        self.server.stop()
+
+    def test_execute_mdx_dataframe(self):
+        df = self.tm1.cells.execute_mdx_dataframe(MDX)
+
+        self.assertEqual(["Region", "Product", "Month", "Value"], list(df.columns))
+        # first cell is 0
+        self.assertEqual(14, len(df))
+        self.assertEqual(["R1", "P1", "M02", 6.0], df.iloc[3].tolist())
+        # cellsets are deleted after use
+        self.assertEqual({}, self.server.model.cellsets)
+
+    def test_execute_mdx_iter_rows(self):
+        rows = self.tm1.cells.execute_mdx_iter_rows(MDX)
+
+        # cellset is created on first iteration
+        self.assertEqual({}, self.server.model.cellsets)
+        self.assertEqual(["Region", "Product", "Month", "Value"], next(rows))
+        self.assertEqual(1, len(self.server.model.cellsets))
+        rows.close()
+        self.assertEqual({}, self.server.model.cellsets)
+
+    def test_execute_view_iter_rows_unused_generator(self):
+        rows = self.tm1.cells.execute_view_iter_rows("Sales", "Default")
+        del rows
+
+        self.assertEqual({}, self.server.model.cellsets)
+        self.assertEqual(15, len(list(self.tm1.cells.execute_view_iter_rows("Sales", "Default"))))
+        self.assertEqual({}, self.server.model.cellsets)
+
+    def test_execute_mdx_top_and_skip(self):
+        cellset_id = self.tm1.cells.create_cellset(MDX)
+
+        cells = self.tm1.cells.extract_cellset_cells_raw(cellset_id, top=4, skip=10)["Cells"]
+
+        self.assertEqual([10, 11, 12, 13], [cell["Ordinal"] for cell in cells])
+        self.assertEqual(15, self.tm1.cells.extract_cellset_cellcount(cellset_id, delete_cellset=False))
+
+    def test_execute_mdx_dataframe_parallel(self):
+        df = self.tm1.cells.execute_mdx_dataframe(MDX, max_workers=4, cells_per_request=4)
+
+        pd.testing.assert_frame_equal(self.tm1.cells.execute_mdx_dataframe(MDX), df)
+
+    def test_execute_mdx_dataframe_parallel_deletes_cellset_once_done(self):
+        start = len(self.server.model.requests)
+
+        self.tm1.cells.execute_mdx_dataframe(MDX, max_workers=4, cells_per_request=2)
+
+        methods = [method for method, _ in self.server.model.requests[start:]]
+        # axes are retrieved alongside the partitions. Only tidy_cellset deletes the cellset, after both
+        self.assertEqual(1, methods.count("DELETE"))
+        self.assertEqual("DELETE", methods[-1])
+
+    def test_latency(self):
+        self.server.model.latency = 0.05
+
+        start = time.perf_counter()
+        self.tm1.dimensions.exists("Region")
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+    def test_write(self):
+        self.tm1.cells.write("Sales", {("R0", "P0", "M01"): 5, ("R1", "P1", "M02"): 6})
+
+        self.assertEqual([{"Ordinal": 0, "Value": 5}, {"Ordinal": 1, "Value": 6}], self.server.model.updates[-1])
+
+    def test_write_dataframe_through_blob(self):
+        df = pd.DataFrame({"Region": ["R0"], "Product": ["P0"], "Month": ["M01"], "Value": [1.5]})
+
+        self.tm1.cells.write_dataframe("Sales", df, use_blob=True, remove_blob=False)
+
+        process = self.server.model.processes[-1]
+        file_name = process["DataSource"]["dataSourceNameForServer"]
+        # element names are lower cased when duplicate intersections are aggregated
+        self.assertEqual(b'"r0","p0","m01","1.5"\r\n', self.server.model.files[file_name[: -len(".blb")]])
+
+    def test_compressed_upload(self):
+        self.tm1.files.create("data.csv", gzip.compress(b"a,b\r\n" * 100), content_encoding="gzip")
+
+        self.assertEqual(b"a,b\r\n" * 100, self.tm1.files.get("data.csv"))
+
+    def test_execute_process_with_return(self):
+        self.server.model.process_status = "Aborted"
+
+        success, status, _ = self.tm1.processes.execute_process_with_return(Process(name=""))
+
+        self.assertFalse(success)
+        self.assertEqual("Aborted", status)
+
+    def test_update_hierarchy(self):
+        hierarchy = self.tm1.hierarchies.get("Region", "Region")
+        hierarchy.add_element("R10", "Numeric")
+        hierarchy.add_edge("Total Region", "R10", 1)
+        hierarchy.add_element_attribute("Code", "String")
+
+        self.tm1.hierarchies.update(hierarchy)
+
+        hierarchy = self.tm1.hierarchies.get("Region", "Region")
+        self.assertIn("R10", hierarchy)
+        self.assertEqual(1, hierarchy.edges[("Total Region", "R10")])
+        self.assertEqual(["Description", "Code"], [attribute.name for attribute in hierarchy.element_attributes])
+
+    def test_metadata(self):
+        self.assertEqual(["Region", "Product", "Month"], self.tm1.cubes.get_dimension_names("Sales"))
+        self.assertEqual(["M01", "M02", "M03", "Year"], self.tm1.elements.get_element_names("Month", "Month"))
+        self.assertEqual(4, self.tm1.elements.get_number_of_elements("Month", "Month"))
+        self.assertFalse(self.tm1.dimensions.exists("Version"))
+
+    def test_reconnect_after_session_timeout(self):
+        logins = self.server.model.logins
+        self.server.model.expire_session()
+
+        self.assertTrue(self.tm1.dimensions.exists("Region"))
+        self.assertEqual(logins + 1, self.server.model.logins)
+
+
+class TestMockServerAsync(unittest.TestCase):
+
+    def _assert_async_requests(self, version: str):
+        with MockTM1Server(rows=5, columns=3, version=version, async_duration=0.05) as server:
+            with TM1Service(**server.connection_parameters, async_requests_mode=True) as tm1:
+                df = tm1.cells.execute_mdx_dataframe(MDX)
+                success, _, _ = tm1.processes.execute_process_with_return(Process(name=""))
+
+            self.assertEqual(14, len(df))
+            self.assertTrue(success)
+            self.assertTrue(any("/_async('" in path for _, path in server.model.requests))
+            self.assertEqual({}, server.model.async_results)
+
+    def test_async_requests_v11(self):
+        self._assert_async_requests("11.8.02300.1")
+
+    def test_async_requests_v12(self):
+        self._assert_async_requests("12.0.0")
+
+    def test_multipart_upload(self):
+        with MockTM1Server(version="12.0.0") as server:
+            with TM1Service(**server.connection_parameters) as tm1:
+                content = bytes(range(256)) * 10_000
+                tm1.files.create("data.bin", content, multi_part_upload=True, max_mb_per_part=1, max_workers=2)
+
+                self.assertEqual(content, tm1.files.get("data.bin"))
+            self.assertEqual(3, sum(path.endswith("/Parts") for _, path in server.model.requests))
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_run_and_compare(self):
+        results = run_benchmarks(
+            names=["execute_mdx_dataframe", "build_dataframe_from_csv_pandas"],
+            rows=10,
+            columns=2,
+            rounds=2,
+            warmup=0,
+            verbose=False,
+        )
+
+        self.assertEqual(["execute_mdx_dataframe", "build_dataframe_from_csv_pandas"], list(results["benchmarks"]))
+        self.assertEqual("extraction", results["benchmarks"]["execute_mdx_dataframe"]["group"])
+        self.assertIsNotNone(results["environment"]["pandas"])
+
+        baseline = {
+            "benchmarks": {
+                "execute_mdx_dataframe": {"median": results["benchmarks"]["execute_mdx_dataframe"]["median"] / 2}
+            }
+        }
+        comparison = compare(results, baseline, threshold=0.5)
+        self.assertEqual(1, len(comparison))
+        self.assertTrue(comparison[0]["regression"])
+
+
+if __name__ == "__main__":
+    unittest.main()
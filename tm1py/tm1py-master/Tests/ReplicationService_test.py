@@ -0,0 +1,233 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from TM1py.Exceptions.Exceptions import TM1pyRestException
+from TM1py.Services.ReplicationService import (
+    ColumnarReplicationTarget,
+    ReplicationCheckpoint,
+    ReplicationService,
+    ReplicationTarget,
+)
+
+
+class _Response:
+    def __init__(self, entries, delta):
+        self._body = {"value": entries}
+        self.text = json.dumps(self._body)[:-1] + f',"@odata.deltaLink":"TransactionLogEntries/!delta(\'{delta}\')"}}'
+
+    def json(self):
+        return self._body
+
+
+class _RestService:
+    """Serves transaction log entries like TM1 11"""
+
+    version = "11.8.02300.3"
+    is_data_admin = True
+
+    def __init__(self):
+        self.entries = []
+        self.delta = 0
+        self.expired = False
+        self.urls = []
+        self.kwargs = []
+
+    def add_http_header(self, key, value):
+        pass
+
+    def remove_http_header(self, key):
+        pass
+
+    def GET(self, url, **kwargs):
+        self.urls.append(url)
+        self.kwargs.append(kwargs)
+        if url.startswith("/TailTransactionLog()"):
+            return _Response([], self.delta)
+        if url.startswith("/TransactionLogEntries/!delta"):
+            if self.expired:
+                raise TM1pyRestException("Not Found", 404, "Not Found", {})
+            entries, self.entries = self.entries, []
+            self.delta += 1
+            return _Response(entries, self.delta)
+        if url.startswith("/TransactionLogEntries?"):
+            return _Response(self.entries, None)
+        raise NotImplementedError(url)
+
+
+class _ReplicationTarget(ReplicationTarget):
+    def __init__(self):
+        self.snapshots = []
+        self.batches = []
+
+    def load_snapshot(self, cube_name, data):
+        self.snapshots.append(data)
+
+    def apply(self, cube_name, cells):
+        self.batches.append(cells)
+
+
+def _entry(coordinates, value, timestamp="2024-03-01T10:00:00.000Z", cube="Sales"):
+    return {"Cube": cube, "Tuple": list(coordinates), "NewValue": value, "TimeStamp": timestamp}
+
+
+class TestReplicationService(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_file = os.path.join(self.directory.name, "sales.json")
+        self.rest = _RestService()
+        self.replication = ReplicationService(self.rest)
+        ReplicationCheckpoint(
+            file_path=self.checkpoint_file,
+            cube_name="Sales",
+            delta_request="TransactionLogEntries/!delta('0')",
+            timestamp="2024-03-01T09:00:00Z",
+        ).save()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_coalesce(self):
+        entries = [
+            _entry(("Actual", "Jan"), 1),
+            _entry(("Actual", "Feb"), 2),
+            _entry(("Actual", "Jan"), 3),
+            _entry(("Actual", "Jan"), 4, cube="Plan"),
+        ]
+
+        cells = ReplicationService.coalesce(entries, cube_name=" sales")
+
+        self.assertEqual({("Actual", "Feb"): 2, ("Actual", "Jan"): 3}, cells)
+        # ordered by last change
+        self.assertEqual([("Actual", "Feb"), ("Actual", "Jan")], list(cells))
+
+    def test_checkpoint_round_trip(self):
+        checkpoint = ReplicationCheckpoint.load(self.checkpoint_file)
+
+        self.assertEqual("Sales", checkpoint.cube_name)
+        self.assertEqual("TransactionLogEntries/!delta('0')", checkpoint.delta_request)
+        self.assertEqual(2024, checkpoint.since.year)
+        self.assertEqual(["sales.json"], os.listdir(self.directory.name))
+
+    def test_sync_applies_batches_and_moves_checkpoint(self):
+        self.rest.entries = [_entry(("Actual", str(month)), month) for month in range(5)]
+        self.rest.entries.append(_entry(("Actual", "0"), 10, timestamp="2024-03-01T10:05:00.000Z"))
+        target = _ReplicationTarget()
+
+        replicated = self.replication.sync("Sales", target, self.checkpoint_file, batch_size=2)
+
+        self.assertEqual(5, replicated)
+        self.assertEqual([2, 2, 1], [len(batch) for batch in target.batches])
+        self.assertEqual(10, target.batches[-1][("Actual", "0")])
+        checkpoint = ReplicationCheckpoint.load(self.checkpoint_file)
+        self.assertEqual("TransactionLogEntries/!delta('1')", checkpoint.delta_request)
+        self.assertEqual("2024-03-01T10:05:00Z", checkpoint.timestamp)
+        self.assertEqual(5, checkpoint.replicated_cells)
+
+    def test_incomplete_target(self):
+        class _IncompleteTarget(ReplicationTarget):
+            def apply(self, cube_name, cells):
+                pass
+
+        with self.assertRaises(TypeError):
+            _IncompleteTarget()
+
+    def test_failed_apply_keeps_checkpoint(self):
+        self.rest.entries = [_entry(("Actual", "Jan"), 1)]
+
+        class _FailingTarget(_ReplicationTarget):
+            def apply(self, cube_name, cells):
+                raise RuntimeError()
+
+        with self.assertRaises(RuntimeError):
+            self.replication.sync("Sales", _FailingTarget(), self.checkpoint_file)
+
+        checkpoint = ReplicationCheckpoint.load(self.checkpoint_file)
+        self.assertEqual("TransactionLogEntries/!delta('0')", checkpoint.delta_request)
+
+    def test_expired_delta_request_replays_since_checkpoint(self):
+        self.rest.expired = True
+        self.rest.entries = [_entry(("Actual", "Jan"), 1)]
+        target = _ReplicationTarget()
+
+        self.assertEqual(1, self.replication.sync("Sales", target, self.checkpoint_file))
+
+        self.assertIn("TimeStamp ge 2024-03-01T09:00:00Z", self.rest.urls[-1])
+        self.assertTrue(self.rest.urls[-2].startswith("/TailTransactionLog()"))
+
+    def test_replicate_ignores_snapshot_arguments(self):
+        self.rest.entries = [_entry(("Actual", str(month)), month) for month in range(3)]
+        target = _ReplicationTarget()
+
+        replicated = self.replication.replicate(
+            "Sales", target, self.checkpoint_file, use_blob=True, max_workers=4, batch_size=2
+        )
+
+        self.assertEqual(3, replicated)
+        self.assertEqual([2, 1], [len(batch) for batch in target.batches])
+        self.assertEqual([{}], self.rest.kwargs)
+
+    def test_sync_other_cube(self):
+        with self.assertRaises(ValueError):
+            self.replication.sync("Plan", _ReplicationTarget(), self.checkpoint_file)
+
+
+class TestColumnarReplicationTarget(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.target = ColumnarReplicationTarget(self.directory.name)
+        self.target.load_snapshot(
+            "Sales",
+            pd.DataFrame(
+                {
+                    "Version": ["Actual", "Actual", "Actual"],
+                    "Measure": ["Revenue", "Cost", "Comment"],
+                    "Value": [10.0, 5.0, "ok"],
+                }
+            ),
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _state(self, target=None):
+        data = (target or self.target).read()
+        return {(row.Version, row.Measure): row.Value for row in data.itertuples()}
+
+    def test_read_snapshot(self):
+        self.assertEqual(
+            {("Actual", "Revenue"): 10.0, ("Actual", "Cost"): 5.0, ("Actual", "Comment"): "ok"}, self._state()
+        )
+
+    def test_later_batches_win(self):
+        self.target.apply("Sales", {("Actual", "Revenue"): 11, ("Actual", "Comment"): "better"})
+        self.target.apply("Sales", {("Actual", "Revenue"): 12, ("Actual", "Cost"): 0})
+
+        self.assertEqual({("Actual", "Revenue"): 12.0, ("Actual", "Comment"): "better"}, self._state())
+
+    def test_compact(self):
+        self.target.apply("Sales", {("Actual", "Cost"): 0, ("Actual", "Margin"): 7})
+
+        self.target.compact()
+
+        self.assertEqual(["snapshot.parquet"], os.listdir(self.directory.name))
+        self.assertEqual(
+            {("Actual", "Revenue"): 10.0, ("Actual", "Margin"): 7.0, ("Actual", "Comment"): "ok"},
+            self._state(ColumnarReplicationTarget(self.directory.name)),
+        )
+
+    def test_new_snapshot_drops_batches(self):
+        self.target.apply("Sales", {("Actual", "Revenue"): 11})
+
+        self.target.load_snapshot("Sales", pd.DataFrame({"Version": ["Plan"], "Measure": ["Revenue"], "Value": [1]}))
+
+        self.assertEqual({("Plan", "Revenue"): 1.0}, self._state())
+
+
+if __name__ == "__main__":
+    unittest.main()
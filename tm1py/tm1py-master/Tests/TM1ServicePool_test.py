@@ -0,0 +1,189 @@
+import threading
+import time
+import unittest
+
+from requests import ConnectionError
+
+from TM1py.Services.TM1ServicePool import TM1ServicePool
+
+
+class _Connection:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+
+class _TM1Service:
+    def __init__(self):
+        self.connection = _Connection()
+        self.re_authentications = 0
+        self.logged_out = False
+
+    def re_authenticate(self):
+        self.re_authentications += 1
+        self.connection.connected = True
+
+    def logout(self):
+        self.logged_out = True
+
+
+class _TM1ServicePool(TM1ServicePool):
+    """Pool that creates fake services instead of connecting to TM1"""
+
+    def __init__(self, *args, **kwargs):
+        self.services = []
+        super().__init__(*args, **kwargs)
+
+    def _create(self):
+        tm1 = _TM1Service()
+        self.services.append(tm1)
+        return tm1
+
+
+class TestTM1ServicePool(unittest.TestCase):
+
+    def setUp(self):
+        TM1ServicePool._server_semaphores.clear()
+
+    def test_sessions_are_created_lazily_and_reused(self):
+        pool = _TM1ServicePool(size=3)
+
+        with pool.lease() as tm1:
+            self.assertEqual(1, pool.leased)
+        with pool.lease() as tm1_again:
+            self.assertIs(tm1, tm1_again)
+
+        self.assertEqual(1, len(pool.services))
+        self.assertEqual(1, pool.idle)
+        self.assertEqual(0, pool.leased)
+
+    def test_concurrent_leases_get_separate_sessions(self):
+        pool = _TM1ServicePool(size=3)
+
+        services = [pool.acquire() for _ in range(3)]
+
+        self.assertEqual(3, len(set(map(id, services))))
+        for tm1 in services:
+            pool.release(tm1)
+
+    def test_lease_blocks_until_session_is_released(self):
+        pool = _TM1ServicePool(size=1)
+        tm1 = pool.acquire()
+        threading.Timer(0.05, pool.release, args=(tm1,)).start()
+
+        with pool.lease(timeout=5) as tm1_again:
+            self.assertIs(tm1, tm1_again)
+
+    def test_lease_timeout(self):
+        pool = _TM1ServicePool(size=1)
+        tm1 = pool.acquire()
+
+        with self.assertRaises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+        pool.release(tm1)
+
+    def test_idle_session_is_re_authenticated(self):
+        pool = _TM1ServicePool(size=1, health_check_interval=0.01)
+        with pool.lease() as tm1:
+            tm1.connection.connected = False
+        time.sleep(0.02)
+
+        with pool.lease() as tm1:
+            self.assertEqual(1, tm1.re_authentications)
+
+    def test_recently_used_session_is_not_checked(self):
+        pool = _TM1ServicePool(size=1, health_check_interval=60)
+        with pool.lease() as tm1:
+            tm1.connection.connected = False
+
+        with pool.lease() as tm1:
+            self.assertEqual(0, tm1.re_authentications)
+
+    def test_session_is_discarded_after_connection_error(self):
+        pool = _TM1ServicePool(size=1)
+
+        with self.assertRaises(ConnectionError):
+            with pool.lease() as tm1:
+                raise ConnectionError()
+
+        self.assertTrue(tm1.logged_out)
+        with pool.lease() as tm1_new:
+            self.assertIsNot(tm1, tm1_new)
+
+    def test_session_is_kept_after_other_errors(self):
+        pool = _TM1ServicePool(size=1)
+
+        with self.assertRaises(ValueError):
+            with pool.lease() as tm1:
+                raise ValueError()
+
+        self.assertFalse(tm1.logged_out)
+        self.assertEqual(1, pool.idle)
+
+    def test_release_foreign_service(self):
+        pool = _TM1ServicePool(size=1)
+
+        with self.assertRaises(ValueError):
+            pool.release(_TM1Service())
+
+    def test_max_sessions_per_server_across_pools(self):
+        pool_a = _TM1ServicePool(size=2, max_sessions_per_server=2, address="localhost", port=12354)
+        pool_b = _TM1ServicePool(size=2, max_sessions_per_server=2, address="LOCALHOST", port=12354)
+        pool_c = _TM1ServicePool(size=2, max_sessions_per_server=2, address="localhost", port=8001)
+
+        tm1_a = pool_a.acquire()
+        tm1_b = pool_b.acquire()
+        with self.assertRaises(TimeoutError):
+            pool_a.acquire(timeout=0.05)
+        # other server
+        pool_c.release(pool_c.acquire(timeout=0.05))
+
+        pool_b.release(tm1_b)
+        pool_a.release(pool_a.acquire(timeout=0.05))
+        pool_a.release(tm1_a)
+
+    def test_map(self):
+        pool = _TM1ServicePool(size=3)
+
+        def _square(tm1, number):
+            time.sleep(0.01)
+            return number**2
+
+        self.assertEqual([n**2 for n in range(20)], pool.map(_square, range(20)))
+        self.assertLessEqual(len(pool.services), 3)
+
+    def test_close(self):
+        pool = _TM1ServicePool(size=2)
+        idle = pool.acquire()
+        leased = pool.acquire()
+        pool.release(idle)
+
+        pool.close()
+
+        self.assertTrue(idle.logged_out)
+        self.assertFalse(leased.logged_out)
+        pool.release(leased)
+        self.assertTrue(leased.logged_out)
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+    def test_session_id_not_allowed(self):
+        with self.assertRaises(ValueError):
+            TM1ServicePool(size=2, session_id="q7O6e1w49AixeuLVxJ1GZg")
+
+    def test_server_key(self):
+        self.assertEqual(
+            TM1ServicePool.server_key(base_url="https://Server/api/v1/"),
+            TM1ServicePool.server_key(base_url="https://server/api/v1"),
+        )
+        self.assertNotEqual(
+            TM1ServicePool.server_key(address="localhost", port=8001),
+            TM1ServicePool.server_key(address="localhost", port=8002),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,12 +16,18 @@ from TM1py.Exceptions.Exceptions import (
 )
 from TM1py.Services import TM1Service
 from TM1py.Utils import (
+    CaseAndSpaceInsensitiveTuplesDict,
     CellUpdateableProperty,
     Utils,
     add_url_parameters,
+    build_arrow_table_from_cellset_dict,
+    build_csv_from_dataframe,
+    build_dataframe_from_cellset_dict,
     build_dataframe_from_csv,
+    build_pandas_dataframe_from_cellset,
     cell_is_updateable,
     drop_dimension_properties,
+    drop_duplicate_intersections,
     extract_cell_properties_from_odata_context,
     extract_cell_updateable_property,
     format_url,
@@ -150,6 +156,45 @@ class TestUtilsMethods(unittest.TestCase):
 
         pd._testing.assert_frame_equal(expected_df, df, check_column_type=False)
 
+    def test_build_csv_from_dataframe(self):
+        df = pd.DataFrame(
+            {
+                "d1": ["e1", "e2", "e3", None],
+                "d2": ["e 1", 'e"2', "e3", "e4"],
+                "Value": [1.5, "multi\r\nline", None, 3],
+            }
+        )
+
+        csv_content = build_csv_from_dataframe(df)
+
+        self.assertEqual(
+            b'"e1","e 1","1.5"\r\n"e2","e""2","multiline"\r\n"e3","e3",""\r\n"","e4","3"\r\n',
+            csv_content,
+        )
+
+    def test_build_csv_from_dataframe_numeric(self):
+        df = pd.DataFrame({"d1": ["e1", "e2"], "d2": [2024, 2025], "Value": [0.1, 1e20]})
+
+        csv_content = build_csv_from_dataframe(df)
+
+        rows = [line.split(",") for line in csv_content.decode("utf-8").splitlines()]
+        self.assertEqual(['"e1"', '"2024"'], rows[0][:2])
+        self.assertEqual(0.1, float(rows[0][2].strip('"')))
+        self.assertEqual(1e20, float(rows[1][2].strip('"')))
+
+    def test_build_csv_from_dataframe_empty(self):
+        df = pd.DataFrame({"d1": [], "d2": [], "Value": []})
+
+        self.assertEqual(b"", build_csv_from_dataframe(df))
+
+    def test_drop_duplicate_intersections(self):
+        df = pd.DataFrame({"d1": ["E 1", "e1", "e2"], "d2": ["x", "X", "x"], "Value": [1, 2, 3]})
+
+        df = drop_duplicate_intersections(df)
+
+        expected_df = pd.DataFrame({"d1": ["e1", "e2"], "d2": ["X", "x"], "Value": [2, 3]})
+        pd._testing.assert_frame_equal(expected_df, df.reset_index(drop=True))
+
     def test_build_dataframe_from_csv_shaped_numbers_and_strings(self):
         raw_csv = "Region~Product~Measure~Value\r\n" "r1~p1~Revenue~1.0\r\n" "r1~p2~Revenue~3.0\r\n" "r1~p1~Comment~Great Product\r\n" "r1~p2~Comment~"
         df = build_dataframe_from_csv(raw_csv, dtype={"Revenue": float}, shaped=True)
@@ -225,6 +270,45 @@ class TestUtilsMethods(unittest.TestCase):
 
         pd._testing.assert_frame_equal(expected_df, df, check_column_type=False, check_dtype=False, check_exact=False)
 
+    def test_build_dataframe_from_csv_use_arrow(self):
+        raw_csv = b"\xef\xbb\xbf" b'"d1"~"d2"~"Value"\r\n' b"e1~e1~1.0\r\n" b"e1~e2~2.0\r\n" b"None~e1~None"
+        df = build_dataframe_from_csv(raw_csv, use_arrow=True)
+
+        self.assertEqual(["d1", "d2", "Value"], list(df.columns))
+        self.assertEqual("double[pyarrow]", str(df["Value"].dtype))
+        self.assertEqual(["e1", "e1", "None"], df["d1"].tolist())
+        self.assertEqual([1.0, 2.0], df["Value"].tolist()[:2])
+        self.assertTrue(pd.isna(df["Value"].iloc[2]))
+
+    def test_build_dataframe_from_csv_use_arrow_mixed_values(self):
+        raw_csv = "d1~Value\r\n" "e1~1.0\r\n" 'e2~""\r\n' "e3~Great Product"
+        df = build_dataframe_from_csv(raw_csv, use_arrow=True)
+
+        self.assertEqual(["1.0", "", "Great Product"], df["Value"].tolist())
+
+    def test_build_dataframe_from_csv_use_arrow_shaped(self):
+        with self.assertRaises(ValueError):
+            build_dataframe_from_csv("d1~d2~Value\r\ne1~e1~1.0", use_arrow=True, shaped=True)
+
+    def test_build_dataframe_from_csv_fillna(self):
+        raw_csv = "Region~Population~Currency~Version~Value\r\n" "US~~~Actual~1\r\n" "DE~83~EUR~Actual~2"
+        attribute_types_by_dimension = {"Region": {"Population": "Numeric", "Currency": "String"}, "Version": {}}
+
+        for use_arrow in (False, True):
+            df = build_dataframe_from_csv(
+                raw_csv,
+                fillna_numeric_attributes=True,
+                fillna_numeric_attributes_value=0,
+                fillna_string_attributes=True,
+                fillna_string_attributes_value="n/a",
+                attribute_types_by_dimension=attribute_types_by_dimension,
+                use_arrow=use_arrow,
+            )
+
+            self.assertEqual([0, 83], [float(value) for value in df["Population"]])
+            self.assertEqual(["n/a", "EUR"], df["Currency"].tolist())
+            self.assertEqual(["Actual", "Actual"], df["Version"].tolist())
+
     def test_get_dimensions_from_where_clause_no_where(self):
         mdx = """
         SELECT {[dim3].[e2]} ON COLUMNS, {[dim4].[e5]} ON ROWS FROM [cube]
@@ -721,5 +805,133 @@ class TestUtilsMethods(unittest.TestCase):
         cls.tm1.logout()
 
 
+class TestCellsetDictBuilders(unittest.TestCase):
+    """Offline tests of the columnar cellset builders"""
+
+    def test_build_dataframe_from_cellset_dict(self):
+        raw_cellset_as_dict = {
+            "Axes": [
+                {
+                    "Ordinal": 0,
+                    "Cardinality": 2,
+                    "Tuples": [
+                        {"Ordinal": 0, "Members": [{"Name": "e1"}]},
+                        {"Ordinal": 1, "Members": [{"Name": "e2"}]},
+                    ],
+                },
+                {
+                    "Ordinal": 1,
+                    "Cardinality": 2,
+                    "Tuples": [
+                        {"Ordinal": 0, "Members": [{"Name": "e1"}]},
+                        {"Ordinal": 1, "Members": [{"Name": "e2"}]},
+                    ],
+                },
+            ],
+            "Cells": [
+                {"Ordinal": 0, "Value": 1.0},
+                {"Ordinal": 1, "Value": 2.0},
+                {"Ordinal": 2, "Value": 3.0},
+                {"Ordinal": 3, "Value": 4.0},
+            ],
+        }
+        df = build_dataframe_from_cellset_dict(
+            row_dimensions=["[d1].[d1]"], column_dimensions=["[d2].[d2]"], raw_cellset_as_dict=raw_cellset_as_dict
+        )
+
+        expected_df = pd.DataFrame(
+            {
+                "d1": pd.Categorical(["e1", "e1", "e2", "e2"]),
+                "d2": pd.Categorical(["e1", "e2", "e1", "e2"]),
+                "Value": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+
+        pd._testing.assert_frame_equal(expected_df, df, check_column_type=False, check_categorical=False)
+
+    def test_build_dataframe_from_cellset_dict_skipped_cells(self):
+        raw_cellset_as_dict = {
+            "Axes": [
+                {
+                    "Ordinal": 0,
+                    "Cardinality": 2,
+                    "Tuples": [
+                        {"Ordinal": 0, "Members": [{"Name": "e1"}]},
+                        {"Ordinal": 1, "Members": [{"Name": "e2"}]},
+                    ],
+                },
+                {
+                    "Ordinal": 1,
+                    "Cardinality": 2,
+                    "Tuples": [
+                        {"Ordinal": 0, "Members": [{"Name": "e1"}]},
+                        {"Ordinal": 1, "Members": [{"Name": "e2"}]},
+                    ],
+                },
+            ],
+            "Cells": [{"Ordinal": 1, "Value": 2.0}, {"Ordinal": 2, "Value": 3.0}],
+        }
+        df = build_dataframe_from_cellset_dict(
+            row_dimensions=["[d1].[d1]"],
+            column_dimensions=["[d2].[d2]"],
+            raw_cellset_as_dict=raw_cellset_as_dict,
+            categorical=False,
+        )
+
+        expected_df = pd.DataFrame({"d1": ["e1", "e2"], "d2": ["e2", "e1"], "Value": [2.0, 3.0]})
+
+        pd._testing.assert_frame_equal(expected_df, df, check_column_type=False, check_dtype=False)
+
+    def test_build_pandas_dataframe_from_cellset(self):
+        cellset = CaseAndSpaceInsensitiveTuplesDict(
+            {
+                ("[d1].[d1].[e1]", "[d2].[d2].[e1]"): {"Value": 1.0},
+                ("[d1].[d1].[e1]", "[d2].[d2].[e2]"): {"Value": 2.0},
+                ("[d1].[d1].[e2]", "[d2].[d2].[e1]"): {"Value": 3.0},
+                ("[d1].[d1].[e2]", "[d2].[d2].[e2]"): None,
+            }
+        )
+        df = build_pandas_dataframe_from_cellset(cellset, multiindex=False)
+
+        expected_df = pd.DataFrame(
+            {
+                "d1": ["e1", "e1", "e2", "e2"],
+                "d2": ["e1", "e2", "e1", "e2"],
+                "Values": [1.0, 2.0, 3.0, None],
+            }
+        )
+
+        pd._testing.assert_frame_equal(expected_df, df, check_column_type=False, check_dtype=False)
+
+    def test_build_dataframe_from_cellset_dict_empty(self):
+        # e.g. zero suppressed cellset without tuples
+        raw_cellset_as_dict = {
+            "Axes": [{"Ordinal": 0, "Cardinality": 0, "Tuples": []}, {"Ordinal": 1, "Cardinality": 0, "Tuples": []}],
+            "Cells": [],
+        }
+
+        for include_attributes in (False, True):
+            df = build_dataframe_from_cellset_dict(
+                row_dimensions=["[d1].[d1]"],
+                column_dimensions=["[d2].[d2]"],
+                raw_cellset_as_dict=raw_cellset_as_dict,
+                include_attributes=include_attributes,
+            )
+
+            self.assertEqual(["d1", "d2", "Value"], list(df.columns))
+            self.assertTrue(df.empty)
+
+    def test_build_arrow_table_from_cellset_dict_empty(self):
+        raw_cellset_as_dict = {"Axes": [{"Ordinal": 0, "Cardinality": 0, "Tuples": []}], "Cells": []}
+
+        table = build_arrow_table_from_cellset_dict(
+            row_dimensions=["[d1].[d1]"], column_dimensions=["[d2].[d2]"], raw_cellset_as_dict=raw_cellset_as_dict
+        )
+
+        self.assertEqual(["d1", "d2", "Value"], table.column_names)
+        self.assertEqual(0, table.num_rows)
+        self.assertEqual("double", str(table.schema.field("Value").type))
+
+
 if __name__ == "__main__":
     unittest.main()
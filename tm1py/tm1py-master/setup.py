@@ -42,6 +42,11 @@ setup(
     ],
     extras_require={
         "pandas": ["pandas"],
+        "pyarrow": ["pandas", "pyarrow"],
+        "async": ["httpx>=0.26"],
+        "opentelemetry": ["opentelemetry-api"],
+        "orjson": ["orjson"],
+        "msgspec": ["msgspec"],
         "dev": [
             "pytest",
             "pytest-xdist",